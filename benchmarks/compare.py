@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+LinuxShorts Pro - Benchmark Karşılaştırma
+İki run.py sonucunu (ör. iki commit) ölçüm ölçüm karşılaştırır
+
+Kullanım:
+    python3 benchmarks/compare.py eski.json yeni.json [--threshold 10]
+
+Medyan süreler karşılaştırılır; eşikten (%) fazla yavaşlayan ölçüm varsa
+çıkış kodu 1'dir. Farklı makinelerde alınmış sonuçlar için uyarı verilir.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from run import RESULT_VERSION
+
+# Makineler arası karşılaştırmayı anlamsız kılan alanlar
+MACHINE_KEYS = ("cpu", "cpu_count", "ffmpeg", "opencv", "numpy", "python")
+
+
+def load(path: Path) -> dict:
+    report = json.loads(Path(path).read_text())
+    if report.get("version") != RESULT_VERSION:
+        raise SystemExit(f"{path}: desteklenmeyen sonuç sürümü {report.get('version')}")
+    return report
+
+
+def compare(old: dict, new: dict, threshold: float) -> List[dict]:
+    """Ortak ölçümler için {key, old, new, change} (change = yeni/eski - 1)"""
+    rows = []
+    for key in sorted(set(old["results"]) | set(new["results"])):
+        before, after = old["results"].get(key), new["results"].get(key)
+        if before is None or after is None:
+            rows.append({"key": key, "old": before and before["seconds"]["median"],
+                         "new": after and after["seconds"]["median"], "change": None})
+            continue
+        a, b = before["seconds"]["median"], after["seconds"]["median"]
+        change = b / a - 1 if a > 0 else 0.0
+        rows.append({"key": key, "old": a, "new": b, "change": change,
+                     "regression": change * 100 > threshold})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sonuçlarını karşılaştır")
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Yavaşlama eşiği (%%, varsayılan 10)")
+    args = parser.parse_args(argv)
+
+    old, new = load(args.old), load(args.new)
+    print(f"Eski: {old['machine'].get('git_commit')} ({old['created']})")
+    print(f"Yeni: {new['machine'].get('git_commit')} ({new['created']})")
+    for key in MACHINE_KEYS:
+        if old["machine"].get(key) != new["machine"].get(key):
+            print(f"⚠️ Farklı ortam: {key}: {old['machine'].get(key)} → {new['machine'].get(key)}")
+    print()
+
+    rows = compare(old, new, args.threshold)
+    width = max((len(r["key"]) for r in rows), default=10)
+    regressions = 0
+    for row in rows:
+        if row["change"] is None:
+            status = "sadece eski" if row["new"] is None else "sadece yeni"
+            print(f"{row['key']:<{width}}  {status}")
+            continue
+        mark = "✗" if row["regression"] else ("✓" if row["change"] < -args.threshold / 100 else " ")
+        regressions += row["regression"]
+        print(f"{row['key']:<{width}}  {row['old']:9.3f} sn → {row['new']:9.3f} sn  "
+              f"{row['change'] * 100:+6.1f}% {mark}")
+
+    for key, error in new.get("errors", {}).items():
+        print(f"Hata (yeni): {key}: {error}")
+
+    print(f"\n{regressions} yavaşlama (eşik %{args.threshold:.0f})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+LinuxShorts Pro - Benchmark Medyası
+ffmpeg lavfi kaynaklarıyla tekrarlanabilir sentetik test videoları
+
+- Görüntü: testsrc2; her sert kesimde negate ile tamamen farklı renk
+  dağılımına geçilir (sahne algılama için net histogram sıçraması)
+- Ses: sine (konuşma yerine ton) + anoisesrc (pembe gürültü); sessiz
+  aralıklarda volume=0 (sessizlik tespiti için bilinen boşluklar)
+- Aynı spec her zaman aynı dosyayı üretir; dosyalar spec adıyla
+  benchmarks/.media altında tutulur ve bir kez üretilir
+"""
+
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+MEDIA_DIR = Path(__file__).parent / ".media"
+
+
+@dataclass(frozen=True)
+class MediaSpec:
+    """Sentetik video tanımı"""
+    name: str
+    width: int
+    height: int
+    duration: float
+    fps: int = 30
+    cuts: Tuple[float, ...] = ()                        # Sert kesim zamanları (sn)
+    silences: Tuple[Tuple[float, float], ...] = ()      # Sessiz aralıklar (başlangıç, bitiş)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _spec(name: str, width: int, height: int, duration: float) -> MediaSpec:
+    """Süreye göre düzenli kesimler ve sessizlikler"""
+    cuts = tuple(float(t) for t in range(10, int(duration), 10))
+    silences = tuple((t + 4.0, t + 5.5) for t in range(0, int(duration) - 6, 15))
+    return MediaSpec(name, width, height, duration, cuts=cuts, silences=silences)
+
+
+# Profil → spec listesi
+PROFILES: Dict[str, List[MediaSpec]] = {
+    "quick": [
+        _spec("sd_60s", 640, 360, 60),
+        _spec("hd_30s", 1920, 1080, 30),
+    ],
+    "full": [
+        _spec("sd_60s", 640, 360, 60),
+        _spec("hd_120s", 1920, 1080, 120),
+        _spec("uhd_30s", 3840, 2160, 30),
+        _spec("hd_600s", 1280, 720, 600),
+    ],
+}
+
+
+def build_command(spec: MediaSpec, output_path: Path, ffmpeg_path: str = "ffmpeg") -> List[str]:
+    """Spec için ffmpeg komutu (tek geçiş, H.264 + AAC)"""
+    size = f"{spec.width}x{spec.height}"
+    bounds = [0.0, *spec.cuts, spec.duration]
+
+    # Kesimler arası parçalar sırayla normal / negatif testsrc2
+    graph = []
+    for i, (start, end) in enumerate(zip(bounds, bounds[1:])):
+        chain = f"testsrc2=size={size}:rate={spec.fps}:duration={end - start:.3f}"
+        if i % 2:
+            chain += ",negate"
+        graph.append(f"{chain}[v{i}]")
+    parts = len(bounds) - 1
+    graph.append("".join(f"[v{i}]" for i in range(parts)) + f"concat=n={parts}:v=1:a=0[v]")
+
+    mute = "+".join(f"between(t,{a},{b})" for a, b in spec.silences) or "0"
+    graph.append(
+        f"sine=frequency=440:sample_rate=48000:duration={spec.duration}[s];"
+        f"anoisesrc=color=pink:amplitude=0.05:sample_rate=48000:duration={spec.duration}[n];"
+        f"[s][n]amix=inputs=2:normalize=0,volume=0:enable='{mute}'[a]"
+    )
+
+    return [
+        ffmpeg_path, "-hide_banner", "-nostdin", "-y", "-v", "error",
+        "-filter_complex", ";".join(graph),
+        "-map", "[v]", "-map", "[a]",
+        "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-g", str(spec.fps * 2),
+        "-c:a", "aac", "-b:a", "128k",
+        "-t", str(spec.duration),
+        str(output_path),
+    ]
+
+
+def ensure_media(spec: MediaSpec, ffmpeg_path: str = "ffmpeg") -> Path:
+    """
+    Spec'in videosunu hazırla (varsa yeniden üretmez)
+
+    Raises:
+        RuntimeError: ffmpeg yoksa veya üretim başarısızsa
+    """
+    output_path = MEDIA_DIR / f"{spec.name}.mp4"
+    if output_path.exists():
+        return output_path
+    if not shutil.which(ffmpeg_path):
+        raise RuntimeError("Sentetik medya için ffmpeg gerekli (sudo apt install ffmpeg)")
+
+    MEDIA_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = output_path.with_suffix(".part.mp4")
+    result = subprocess.run(build_command(spec, tmp, ffmpeg_path), capture_output=True, text=True)
+    if result.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        raise RuntimeError(f"Medya üretilemedi ({spec.name}): {result.stderr.strip()[-300:]}")
+    tmp.replace(output_path)
+    return output_path
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+LinuxShorts Pro - Benchmark Çalıştırıcı
+Çekirdek pipeline'ı sentetik medya üzerinde ölçer, sonucu JSON'a yazar
+
+Kullanım:
+    python3 benchmarks/run.py                      # quick profil
+    python3 benchmarks/run.py --profile full --repeat 5
+    python3 benchmarks/run.py --video ~/Videos/ornek.mp4 --only analysis,preview
+    python3 benchmarks/compare.py eski.json yeni.json
+
+Her ölçüm soğuk cache ile yapılır: ~/.linuxshorts cache kökü her tekrar
+için boş bir geçici dizine yönlendirilir, bellek içi probe/zaman modeli
+cache'leri temizlenir. Sonuçlar benchmarks/results/<tarih>_<commit>.json
+dosyasına makine bilgisiyle birlikte yazılır.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from media import PROFILES, MediaSpec, ensure_media  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Sonuç formatı değişirse compare.py eski dosyaları reddeder
+RESULT_VERSION = 1
+
+BG_MODES = ("black", "blur", "gradient", "color")
+
+
+# ========================================
+# MAKİNE BİLGİSİ
+# ========================================
+
+def _command_output(cmd: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, cwd=PROJECT_ROOT)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _cpu_model() -> str:
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or "bilinmiyor"
+
+
+def _memory_gb() -> Optional[float]:
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemTotal"):
+                return round(int(line.split()[1]) / 1024 / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def machine_info() -> dict:
+    """Sonuçların karşılaştırılabilirliği için ortam bilgisi"""
+    import numpy as np
+
+    info = {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "memory_gb": _memory_gb(),
+        "numpy": np.__version__,
+        "ffmpeg": (_command_output(["ffmpeg", "-version"]) or "yok").splitlines()[0],
+        "git_commit": _command_output(["git", "rev-parse", "--short", "HEAD"]),
+        "git_dirty": bool(_command_output(["git", "status", "--porcelain", "--untracked-files=no"])),
+    }
+    try:
+        import cv2
+        info["opencv"] = cv2.__version__
+    except ImportError:
+        info["opencv"] = None
+    return info
+
+
+# ========================================
+# ÖLÇÜM
+# ========================================
+
+@contextmanager
+def cold_cache():
+    """Disk ve bellek cache'leri boş bir ortamda çalıştır"""
+    import utils.cache
+    from core.media_info import get_media_probe
+    from core import timestamps
+
+    previous = utils.cache.DATA_DIR
+    tmp = Path(tempfile.mkdtemp(prefix="linuxshorts-bench-"))
+    utils.cache.DATA_DIR = tmp
+    get_media_probe().invalidate()
+    with timestamps._memory_lock:
+        timestamps._memory.clear()
+    try:
+        yield tmp
+    finally:
+        utils.cache.DATA_DIR = previous
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def measure(fn: Callable[[Path], Optional[dict]], repeat: int) -> dict:
+    """
+    fn'i repeat kez soğuk cache ile çalıştır
+
+    fn geçici dizini alır; dönen sözlük (ör. kare başına süre) son
+    tekrarın "extra" alanına yazılır.
+    """
+    runs, extra = [], None
+    for _ in range(repeat):
+        with cold_cache() as tmp:
+            start = time.perf_counter()
+            extra = fn(tmp)
+            runs.append(time.perf_counter() - start)
+    return {
+        "seconds": {
+            "min": min(runs),
+            "median": statistics.median(runs),
+            "runs": runs,
+        },
+        "extra": extra or {},
+    }
+
+
+# ========================================
+# ÖLÇÜM SENARYOLARI
+# ========================================
+
+def bench_analysis(video: Path, repeat: int) -> Dict[str, dict]:
+    """SmartVideoAnalyzer.full_analysis (ses + sahne + frame skorları)"""
+    from core.smart_analyzer import SmartVideoAnalyzer
+
+    def run(_tmp):
+        analyzer = SmartVideoAnalyzer()
+        analyzer.load_video(video)
+        result = analyzer.full_analysis(resume=False)
+        return {"scenes": len(result.scene_changes), "silences": len(result.silence_segments)}
+
+    return {"analysis": measure(run, repeat)}
+
+
+def bench_best_frames(video: Path, repeat: int) -> Dict[str, dict]:
+    """ThumbnailGenerator.find_best_frames"""
+    from core.thumbnail_generator import ThumbnailGenerator
+
+    def run(_tmp):
+        generator = ThumbnailGenerator()
+        generator.load_video(video)
+        candidates = generator.find_best_frames(10, 2.0, keep_images=False)
+        return {"candidates": len(candidates)}
+
+    return {"best_frames": measure(run, repeat)}
+
+
+def bench_preview(video: Path, repeat: int, frames: int = 20) -> Dict[str, dict]:
+    """ProVideoEditor.get_preview_image (arka plan modu başına, kare başına süre)"""
+    from core.video_editor import ProVideoEditor
+
+    results = {}
+    for mode in BG_MODES:
+        def run(_tmp, mode=mode):
+            editor = ProVideoEditor()
+            editor.load_video(video)
+            editor.set_background_mode(mode)
+            duration = editor.frame_reader.duration
+            rng = random.Random(0)
+            render = 0.0
+            for _ in range(frames):
+                editor.update_frame(rng.uniform(0, duration))
+                start = time.perf_counter()
+                editor.get_preview_image()
+                render += time.perf_counter() - start
+            editor.close()
+            return {"render_ms_per_frame": render / frames * 1000}
+
+        results[f"preview_{mode}"] = measure(run, repeat)
+    return results
+
+
+def bench_export(video: Path, repeat: int, duration: float = 10.0) -> Dict[str, dict]:
+    """ProVideoEditor.export_short (arka plan modu başına)"""
+    from core.video_editor import ProVideoEditor
+
+    results = {}
+    for mode in BG_MODES:
+        def run(tmp, mode=mode):
+            editor = ProVideoEditor()
+            editor.load_video(video)
+            editor.set_background_mode(mode)
+            length = min(duration, editor.frame_reader.duration)
+            if not editor.export_short(tmp / "short.mp4", 0.0, length):
+                raise RuntimeError("export_short başarısız")
+            editor.close()
+            return {"clip_seconds": length}
+
+        results[f"export_{mode}"] = measure(run, repeat)
+    return results
+
+
+def bench_corrector(repeat: int, words: int = 5000) -> Dict[str, dict]:
+    """SubtitleCorrector.correct_text (hatalı kelimeler karışık uzun metin)"""
+    from core.subtitle_corrector import SubtitleCorrector
+
+    corrector = SubtitleCorrector()
+    rng = random.Random(0)
+    wrong = list(corrector.corrections)
+    filler = ["bu", "video", "için", "bugün", "çok", "güzel", "bir", "konu", "ve", "sonra"]
+    text = " ".join(rng.choice(wrong) if rng.random() < 0.2 else rng.choice(filler)
+                    for _ in range(words))
+
+    def run(_tmp):
+        corrector.correct_text(text)
+        return {"words": words}
+
+    return {"corrector": measure(run, repeat)}
+
+
+def bench_segment_search(repeat: int, duration: float = 3 * 3600.0) -> Dict[str, dict]:
+    """core.segment_search: 3 saatlik sentetik özelliklerden zaman çizelgesi + top-10 arama"""
+    from core.segment_search import FeatureTimeline, find_segments
+
+    rng = random.Random(0)
+    silences, t = [], 0.0
+    while t < duration:
+        t += rng.uniform(2, 20)
+        gap = rng.uniform(0.3, 2.0)
+        silences.append((t, t + gap))
+        t += gap
+    seconds = range(int(duration))
+    motion = [(float(i), rng.uniform(0, 30)) for i in seconds]
+    levels = [(float(i), rng.uniform(-45, -15)) for i in seconds]
+    scenes = sorted(rng.uniform(0, duration) for _ in range(int(duration / 20)))
+
+    def run(_tmp):
+        timeline = FeatureTimeline.build(duration, audio_levels=levels, motion_scores=motion,
+                                         scene_changes=scenes, silences=silences)
+        windows = find_segments(timeline, 30.0, 60.0, count=10)
+        return {"seconds_of_video": duration, "segments": len(windows)}
+
+    return {"segment_search": measure(run, repeat)}
+
+
+VIDEO_CASES = {
+    "analysis": bench_analysis,
+    "best_frames": bench_best_frames,
+    "preview": bench_preview,
+    "export": bench_export,
+}
+
+
+# ========================================
+# ÇALIŞTIRMA
+# ========================================
+
+def run_suite(videos: Dict[str, Path], repeat: int, only: Optional[List[str]] = None) -> dict:
+    """Tüm senaryolar; sonuç anahtarı "<senaryo>/<medya>" """
+    results, errors = {}, {}
+
+    def record(case: str, media: Optional[str], fn: Callable[[], Dict[str, dict]]):
+        print(f"▶ {case}{f' / {media}' if media else ''}", flush=True)
+        try:
+            for name, value in fn().items():
+                key = f"{name}/{media}" if media else name
+                results[key] = value
+                print(f"  {key}: {value['seconds']['median']:.3f} sn "
+                      f"(min {value['seconds']['min']:.3f})", flush=True)
+        except Exception as e:
+            key = f"{case}/{media}" if media else case
+            errors[key] = f"{type(e).__name__}: {e}"
+            print(f"  ✗ {errors[key]}", flush=True)
+            traceback.print_exc()
+
+    for case, fn in VIDEO_CASES.items():
+        if only and case not in only:
+            continue
+        for media, path in videos.items():
+            record(case, media, lambda fn=fn, path=path: fn(path, repeat))
+
+    if not only or "corrector" in only:
+        record("corrector", None, lambda: bench_corrector(repeat))
+    if not only or "segment_search" in only:
+        record("segment_search", None, lambda: bench_segment_search(repeat))
+
+    return {"results": results, "errors": errors}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LinuxShorts Pro benchmark")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--video", action="append", default=[],
+                        help="Sentetik medya yerine/yanında ölçülecek video (tekrarlanabilir)")
+    parser.add_argument("--no-synthetic", action="store_true", help="Sadece --video dosyaları")
+    parser.add_argument("--only", default="", help="Virgülle senaryolar: "
+                        + ",".join([*VIDEO_CASES, "corrector", "segment_search"]))
+    parser.add_argument("--output", type=Path, help="JSON yolu (varsayılan benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    specs: List[MediaSpec] = [] if args.no_synthetic else PROFILES[args.profile]
+    videos: Dict[str, Path] = {}
+    for spec in specs:
+        print(f"Medya hazırlanıyor: {spec.name} ({spec.width}x{spec.height}, {spec.duration:.0f} sn)")
+        try:
+            videos[spec.name] = ensure_media(spec)
+        except RuntimeError as e:
+            print(f"✗ {e}")
+            return 1
+    for path in args.video:
+        videos[Path(path).stem] = Path(path).expanduser().resolve()
+
+    machine = machine_info()
+    started = datetime.now()
+    suite = run_suite(videos, max(1, args.repeat),
+                      [c.strip() for c in args.only.split(",") if c.strip()] or None)
+
+    report = {
+        "version": RESULT_VERSION,
+        "created": started.isoformat(timespec="seconds"),
+        "profile": None if args.no_synthetic else args.profile,
+        "repeat": args.repeat,
+        "machine": machine,
+        "media": {**{s.name: s.to_dict() for s in specs},
+                  **{name: {"path": str(p)} for name, p in videos.items() if name not in
+                     {s.name for s in specs}}},
+        **suite,
+    }
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"{started:%Y%m%d_%H%M%S}_{machine['git_commit'] or 'nogit'}.json"
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\nSonuç: {output} ({len(suite['results'])} ölçüm, {len(suite['errors'])} hata)")
+    return 0 if not suite["errors"] else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+LinuxShorts Pro - Açılış Benchmark'ı
+GUI'nin soğuk açılış maliyetini ölçer ve bütçeyi aşarsa başarısız olur
+
+Kullanım:
+    python3 benchmarks/startup.py                  # import bütçesi (+ ekran varsa ilk çizim)
+    python3 benchmarks/startup.py --repeat 5 --top 15
+    python3 benchmarks/startup.py --module core    # başka bir modülün import maliyeti
+
+Ölçümler:
+- import: `python -X importtime -c "import gui.main_window"` çıktısındaki
+  kümülatif süre (medyan). Açılışta yüklenmemesi gereken ağır modüller
+  (cv2, numpy, torch, whisper) yüklenirse bütçe aşılmış sayılır.
+- ilk çizim: ayrı süreçte MainWindow oluşturulup ilk update() bitene kadar
+  geçen duvar saati (yorumlayıcı açılışı dahil). DISPLAY yoksa atlanır.
+
+Çıkış kodu: 0 bütçe içinde, 1 bütçe aşıldı, 2 ölçülemedi.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Bütçeler (ms); importtime ölçümü kendi ek yükünü de içerir
+IMPORT_BUDGET_MS = 800
+FIRST_PAINT_BUDGET_MS = 2500
+
+# Açılışta hiç yüklenmemesi gerekenler (ilk kullanımda yüklenir)
+FORBIDDEN_MODULES = ("cv2", "numpy", "torch", "whisper")
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+_PAINT_SCRIPT = """
+import sys
+sys.path.insert(0, {src!r})
+from gui.main_window import MainWindow
+app = MainWindow()
+app.update()
+print("PAINTED", flush=True)
+app.destroy()
+"""
+
+
+# ========================================
+# IMPORT SÜRESİ
+# ========================================
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, Tuple[float, float, int]]]:
+    """
+    -X importtime çıktısı → (toplam ms, {modül: (kendi ms, kümülatif ms, derinlik)})
+
+    Toplam, en üst seviyedeki importların kümülatif sürelerinin toplamıdır.
+    """
+    modules: Dict[str, Tuple[float, float, int]] = {}
+    total = 0.0
+    for line in stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        own, cumulative = int(match.group(1)) / 1000, int(match.group(2)) / 1000
+        depth = (len(match.group(3)) - 1) // 2
+        modules[match.group(4)] = (own, cumulative, depth)
+        if depth == 0:
+            total += cumulative
+    return total, modules
+
+
+def measure_imports(module: str) -> Tuple[float, Dict[str, Tuple[float, float, int]]]:
+    """
+    Raises:
+        RuntimeError: Modül içe aktarılamadıysa
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=SRC_DIR, env=env)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "?"
+        raise RuntimeError(f"{module} içe aktarılamadı: {error}")
+    return parse_importtime(result.stderr)
+
+
+# ========================================
+# İLK ÇİZİM
+# ========================================
+
+def measure_first_paint(timeout: float = 60.0) -> Optional[float]:
+    """MainWindow'un ilk çizimine kadar geçen süre (ms); ekran yoksa None"""
+    if not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return None
+
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", _PAINT_SCRIPT.format(src=str(SRC_DIR))],
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                               cwd=PROJECT_ROOT)
+    try:
+        for line in process.stdout:
+            if line.strip() == "PAINTED":
+                return (time.perf_counter() - start) * 1000
+            if time.perf_counter() - start > timeout:
+                break
+        raise RuntimeError("Pencere çizilemedi")
+    finally:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ========================================
+# ÇALIŞTIRMA
+# ========================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LinuxShorts Pro açılış benchmark'ı")
+    parser.add_argument("--module", default="gui.main_window", help="Ölçülecek modül")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="En pahalı kaç import listelensin")
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS, help="Import bütçesi (ms)")
+    parser.add_argument("--paint-budget", type=float, default=FIRST_PAINT_BUDGET_MS,
+                        help="İlk çizim bütçesi (ms)")
+    parser.add_argument("--no-paint", action="store_true", help="İlk çizimi ölçme")
+    args = parser.parse_args(argv)
+
+    failures = []
+    try:
+        runs = [measure_imports(args.module) for _ in range(max(1, args.repeat))]
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        return 2
+
+    totals = [total for total, _ in runs]
+    total = statistics.median(totals)
+    modules = runs[totals.index(total)][1] if total in totals else runs[-1][1]
+    print(f"import {args.module}: {total:.0f} ms (medyan, {len(runs)} tekrar; bütçe {args.budget:.0f} ms)")
+
+    # Modülün kendi süresine göre (alt importlar hariç) en pahalılar
+    heaviest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (own, cumulative, _) in heaviest:
+        print(f"  {name:<40} {own:8.1f} ms  (kümülatif {cumulative:8.1f} ms)")
+
+    if total > args.budget:
+        failures.append(f"import süresi {total:.0f} ms > {args.budget:.0f} ms")
+    loaded = [name for name in FORBIDDEN_MODULES if name in modules]
+    if loaded:
+        failures.append(f"açılışta yüklenmemesi gereken modüller: {', '.join(loaded)}")
+
+    if not args.no_paint and args.module == "gui.main_window":
+        try:
+            paint = measure_first_paint()
+        except RuntimeError as e:
+            print(f"✗ İlk çizim: {e}")
+            return 2
+        if paint is None:
+            print("İlk çizim: ekran yok, atlandı")
+        else:
+            print(f"İlk çizim: {paint:.0f} ms (bütçe {args.paint_budget:.0f} ms)")
+            if paint > args.paint_budget:
+                failures.append(f"ilk çizim {paint:.0f} ms > {args.paint_budget:.0f} ms")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    if not failures:
+        print("✓ Bütçe içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
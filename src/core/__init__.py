@@ -1,36 +1,85 @@
-"""LinuxShorts Pro - Core modules"""
+"""LinuxShorts Pro - Core modules
 
-from .ffmpeg_wrapper import FFmpegWrapper, VideoInfo
-from .subtitle_generator import SubtitleGenerator, SubtitleSegment
-from .video_analyzer import VideoAnalyzer, VideoSegment
-from .hashtag_generator import HashtagGenerator
+Alt modüller ilk erişimde yüklenir: `from core.cancellation import
+CancelToken` artık tüm paketi (cv2, numpy, PIL...) içe aktarmaz;
+`from core import ThumbnailGenerator` sadece thumbnail_generator'ı yükler.
+"""
+
+import importlib
+
+# Dışa açık ad → alt modül
+_EXPORTS = {}
+
+
+def _export(module: str, *names: str):
+    for name in names:
+        _EXPORTS[name] = module
+
+
+_export("ffmpeg_wrapper", "FFmpegWrapper", "VideoInfo")
+_export("subtitle_generator", "SubtitleGenerator", "SubtitleSegment")
+_export("video_analyzer", "VideoAnalyzer", "VideoSegment")
+_export("hashtag_generator", "HashtagGenerator")
 
 # Video Editor
-try:
-    from .video_editor import ProVideoEditor, VideoTransform
-except ImportError:
-    pass
+_export("video_editor", "ProVideoEditor", "VideoTransform")
 
 # Preset Manager
-try:
-    from .preset_manager import PresetManager, VideoPreset
-except ImportError:
-    pass
+_export("preset_manager", "PresetManager")
 
 # Smart Analyzer (Akıllı Kesit, Hook Detector, Sahne Algılama)
-try:
-    from .smart_analyzer import SmartVideoAnalyzer, Segment, AnalysisResult
-except ImportError:
-    pass
+_export("smart_analyzer", "SmartVideoAnalyzer", "Segment", "AnalysisResult")
 
 # SEO Generator
-try:
-    from .seo_generator import SEOGenerator, SEOSuggestion, VideoMetadata
-except ImportError:
-    pass
+_export("seo_generator", "SEOGenerator", "SEOSuggestion", "VideoMetadata")
 
 # Thumbnail Generator
-try:
-    from .thumbnail_generator import ThumbnailGenerator, ThumbnailStyle, FrameCandidate
-except ImportError:
-    pass
+_export("thumbnail_generator", "ThumbnailGenerator", "ThumbnailStyle", "FrameCandidate", "EncoderConfig")
+
+# Image Effects
+_export("image_effects", "EffectParams", "apply_effects")
+
+# Frame Scorer
+_export("frame_scorer", "FrameScorer", "FrameScore", "FrameFeatures", "register_scorer")
+
+# Filmstrip (timeline küçük resimleri)
+_export("filmstrip", "Filmstrip", "FilmstripGenerator")
+
+# Waveform (timeline dalga formu)
+_export("waveform", "Waveform", "WaveformBuilder")
+
+# Cancellation (işbirlikçi iptal)
+_export("cancellation", "CancelToken", "CancelledError")
+
+# Media Info (dosya başına tek ffprobe)
+_export("media_info", "MediaProbe", "AudioStream", "probe_video")
+
+# Timestamps (VFR uyumlu kare ↔ zaman modeli)
+_export("timestamps", "FrameTimeline", "get_timeline")
+
+# Process Runner (ffmpeg/ffprobe/whisper orkestrasyonu)
+_export("process_runner", "ProcessRunner", "ProcessResult", "get_runner", "run_process")
+
+# Proxy (4K/HEVC kaynaklar için önizleme kopyası)
+_export("proxy", "ProxyManager", "get_proxy_manager")
+
+# Capabilities (ffmpeg/ffprobe/whisper yetenek manifesti)
+_export("capabilities", "Capabilities", "get_capabilities", "tool_available")
+
+# Segment Search (özellik zaman çizelgesi üzerinde kesit arama)
+_export("segment_search", "FeatureTimeline", "SegmentSearch", "SegmentWindow", "find_segments")
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
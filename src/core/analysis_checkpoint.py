@@ -0,0 +1,138 @@
+"""
+LinuxShorts Pro - Analysis Checkpoint
+Uzun videolarda parça (chunk) bazlı analiz sonuçlarının disk kaydı
+
+- Her tamamlanan parça ~/.linuxshorts/analysis/<parmak izi>/ altına
+  atomik olarak yazılır (sahne değişiklikleri + frame skor tablosu)
+- Uygulama kapanır veya worker ölürse analiz son tamamlanan parçadan
+  devam eder
+- Analiz parametreleri değişirse eski parçalar geçersiz sayılır
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+from utils.cache import cache_path
+
+logger = get_logger("LinuxShorts.Checkpoint")
+
+try:
+    from .frame_scorer import FrameFeatures
+except ImportError:
+    FrameFeatures = None
+
+
+# Kayıt formatı veya skor hesabı değişirse eski checkpoint'ler yok sayılır
+# (2: batch sınırındaki hareket skoru batch içiyle aynı gri dönüşümünü kullanır)
+CHECKPOINT_VERSION = 2
+
+
+@dataclass
+class AnalysisChunk:
+    """Bir zaman aralığının analiz sonuçları"""
+    index: int
+    start: float
+    end: float
+    scene_changes: List[float] = field(default_factory=list)
+    features: Optional["FrameFeatures"] = None
+
+
+class AnalysisCheckpoint:
+    """Video başına parça kayıtları"""
+
+    def __init__(self, video_path: Path, params: dict):
+        """
+        Args:
+            video_path: Analiz edilen video
+            params: Sonucu etkileyen parametreler (farklıysa kayıtlar silinir)
+        """
+        self.directory = cache_path("analysis", video_path)
+        self.params = {**params, "version": CHECKPOINT_VERSION}
+        self._manifest = self.directory / "manifest.json"
+        self.completed: List[int] = []
+
+        manifest = self._read_manifest()
+        if manifest is not None and manifest.get("params") == self.params:
+            self.completed = sorted(manifest.get("completed", []))
+        else:
+            self.clear()
+
+    def _read_manifest(self) -> Optional[dict]:
+        try:
+            return json.loads(self._manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"params": self.params, "completed": self.completed}), encoding="utf-8")
+        os.replace(tmp, self._manifest)
+
+    def clear(self):
+        """Tüm parça kayıtlarını sil"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.completed = []
+        self._write_manifest()
+
+    def _chunk_file(self, index: int) -> Path:
+        return self.directory / f"chunk_{index:04d}.npz"
+
+    def save(self, chunk: AnalysisChunk):
+        """Parçayı atomik olarak kaydet (önce dosya, sonra manifest)"""
+        arrays = {
+            "range": np.array([chunk.start, chunk.end], dtype=np.float64),
+            "scene_changes": np.asarray(chunk.scene_changes, dtype=np.float64),
+        }
+        if chunk.features is not None:
+            arrays["times"] = chunk.features.times
+            for name, values in chunk.features.scores.items():
+                arrays[f"score__{name}"] = values
+            for name, values in chunk.features.metrics.items():
+                arrays[f"metric__{name}"] = values
+
+        path = self._chunk_file(chunk.index)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+        if chunk.index not in self.completed:
+            self.completed = sorted(self.completed + [chunk.index])
+        self._write_manifest()
+
+    def load(self, index: int) -> Optional[AnalysisChunk]:
+        """Kayıtlı parçayı oku (yoksa/bozuksa None)"""
+        if index not in self.completed:
+            return None
+        try:
+            with np.load(self._chunk_file(index), allow_pickle=False) as data:
+                start, end = data["range"].tolist()
+                features = None
+                if "times" in data.files and FrameFeatures is not None:
+                    features = FrameFeatures(
+                        times=data["times"],
+                        scores={k[7:]: data[k] for k in data.files if k.startswith("score__")},
+                        metrics={k[8:]: data[k] for k in data.files if k.startswith("metric__")},
+                    )
+                return AnalysisChunk(index, start, end, data["scene_changes"].tolist(), features)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Analiz parçası okunamadı ({index}): {e}")
+            self.completed.remove(index)
+            return None
+
+    def load_all(self) -> Dict[int, AnalysisChunk]:
+        """Tamamlanmış tüm parçalar"""
+        chunks = {}
+        for index in list(self.completed):
+            chunk = self.load(index)
+            if chunk is not None:
+                chunks[index] = chunk
+        return chunks
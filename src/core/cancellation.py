@@ -0,0 +1,206 @@
+"""
+LinuxShorts Pro - Cancellation
+Uzun süren işlemler için işbirlikçi iptal (cancel token)
+
+- Worker döngüleri token.raise_if_cancelled() ile kontrol eder
+  (CancelledError, "except Exception" ile yakalanmaz)
+- ffmpeg / whisper alt süreçleri token'a bağlanır (process_runner veya
+  token.popen); iptalde süreç grubu (çocuklarıyla birlikte) SIGTERM,
+  gerekirse SIGKILL alır
+- on_cancel ile cache/buffer temizleme callback'leri kaydedilir
+- İptal → worker'ın gerçekten durması arasındaki gecikme ölçülür
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Callable, List, Optional, Set
+
+from utils.logger import get_logger
+
+logger = get_logger("LinuxShorts.Cancel")
+
+
+# SIGTERM'den sonra SIGKILL'e kadar beklenen süre (ffmpeg çıktıyı kapatabilsin)
+KILL_GRACE = 0.5
+
+
+class CancelledError(BaseException):
+    """
+    İşlem kullanıcı tarafından iptal edildi
+
+    asyncio.CancelledError gibi BaseException'dan türer: core'daki
+    "except Exception" blokları iptali hata sanıp yutmaz, iptal worker'a
+    kadar yükselir.
+    """
+
+
+class CancelToken:
+    """
+    Thread'ler arası paylaşılan iptal bayrağı
+
+    Bir token tek bir işe (analiz, export, altyazı...) aittir; iptal
+    edildikten sonra yeniden kullanılmaz, yeni iş için yeni token oluşturulur.
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: Set[subprocess.Popen] = set()
+        self._callbacks: List[Callable[[], None]] = []
+        self.cancelled_at: Optional[float] = None
+        self.latency: Optional[float] = None
+
+    # ========================================
+    # İPTAL
+    # ========================================
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """İptal et: alt süreçleri öldür, temizlik callback'lerini çalıştır"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.cancelled_at = time.perf_counter()
+            self._event.set()
+            processes = list(self._processes)
+            callbacks = list(self._callbacks)
+
+        logger.info(f"İptal: {self.name or 'iş'} ({len(processes)} alt süreç)")
+        for process in processes:
+            terminate_process_tree(process)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"İptal temizliği hatası: {e}")
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CancelledError(self.name)
+
+    def wait(self, timeout: float) -> bool:
+        """timeout kadar bekle; iptal edilirse hemen True döner"""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback: Callable[[], None]):
+        """İptalde çalışacak temizlik (zaten iptal edildiyse hemen çalışır)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """on_cancel ile kaydedilen callback'i kaldır (iş iptalsiz bittiyse)"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def finished(self):
+        """
+        Worker durduğunda çağrılır; iptal edildiyse gecikmeyi kaydeder
+
+        Gecikme = cancel() çağrısı → worker'ın son alt süreci de bitmiş
+        halde dönmesi (CPU'nun boşa çıkması).
+        """
+        if self.cancelled_at is not None and self.latency is None:
+            self.latency = time.perf_counter() - self.cancelled_at
+            logger.info(f"İptal gecikmesi ({self.name or 'iş'}): {self.latency * 1000:.0f} ms")
+
+    # ========================================
+    # ALT SÜREÇLER
+    # ========================================
+
+    def popen(self, cmd: List[str], **kwargs) -> subprocess.Popen:
+        """
+        İptal edilebilir alt süreç başlat
+
+        Süreç kendi süreç grubunda başlar; iptalde ffmpeg/whisper'ın
+        başlattığı çocuk süreçler de öldürülür. Bitince unregister() ile
+        bırakılmalıdır.
+        """
+        self.raise_if_cancelled()
+        kwargs.setdefault("start_new_session", True)
+        process = subprocess.Popen(cmd, **kwargs)
+        with self._lock:
+            self._processes.add(process)
+            cancelled = self._event.is_set()
+        if cancelled:
+            # cancel() süreç listesini bu kayıttan önce aldıysa
+            terminate_process_tree(process)
+        return process
+
+    def unregister(self, process: subprocess.Popen):
+        with self._lock:
+            self._processes.discard(process)
+
+
+def terminate_process_tree(process: subprocess.Popen, grace: float = KILL_GRACE):
+    """Süreci ve süreç grubunu sonlandır (SIGTERM → SIGKILL)"""
+    if process.poll() is not None:
+        return
+    try:
+        pgid = os.getpgid(process.pid)
+    except (ProcessLookupError, OSError):
+        pgid = None
+
+    def send(sig):
+        try:
+            if pgid is not None and pgid != os.getpgid(0):
+                os.killpg(pgid, sig)
+            else:
+                process.send_signal(sig)
+        except (ProcessLookupError, OSError):
+            pass
+
+    send(signal.SIGTERM)
+    try:
+        process.wait(grace)
+    except subprocess.TimeoutExpired:
+        send(signal.SIGKILL)
+
+
+def _benchmark(runs: int = 5):
+    """İptal → CPU boşa çıkma gecikmesi (çocuk süreç başlatan meşgul süreç)"""
+    import sys
+    # python -m ile çalışırken de runner'ın fırlattığı sınıfı yakala
+    from .cancellation import CancelToken, CancelledError
+    from .process_runner import run_process
+
+    # Ebeveyn kendi çocuğunu başlatır (ffmpeg/whisper yardımcı süreçleri gibi)
+    busy = ("import subprocess, sys;"
+            "subprocess.Popen([sys.executable, '-c', 'while True: pass']);"
+            "exec('while True: pass')")
+    latencies = []
+    for _ in range(runs):
+        token = CancelToken("benchmark")
+
+        def worker():
+            try:
+                run_process([sys.executable, "-c", busy], cancel=token)
+            except CancelledError:
+                pass
+            finally:
+                token.finished()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.3)
+        token.cancel()
+        thread.join()
+        latencies.append(token.latency)
+
+    print(f"İptal gecikmesi: ortalama {sum(latencies) / len(latencies) * 1000:.1f} ms, "
+          f"en kötü {max(latencies) * 1000:.1f} ms ({runs} deneme, süreç grubu + çocuk)")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,357 @@
+"""
+LinuxShorts Pro - Araç Yetenekleri
+ffmpeg / ffprobe / whisper kurulumunun önbelleğe alınmış manifestosu
+
+- ffmpeg: sürüm, derlemede açık filtreler (subtitles, boxblur...) ve encoder'lar
+- ffprobe: sürüm
+- whisper: CLI çalışıyor mu (`whisper --help` torch yükler, saniyeler sürer)
+  ve indirilmiş modeller (~/.cache/whisper/*.pt, her seferinde taranır)
+- Sonuçlar ~/.linuxshorts/capabilities.json dosyasında binary yolu + mtime
+  ile saklanır; araç güncellenmedikçe açılışta yeniden probe edilmez
+- Her araç ayrı kilitle, ilk ihtiyaç anında probe edilir: ffmpeg kontrolü
+  whisper probe'unu beklemez. GUI hepsini probe_in_background() ile ısıtır.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+from utils.config import DATA_DIR
+from .process_runner import run_process
+
+logger = get_logger("LinuxShorts.Capabilities")
+
+
+# Manifest formatı değişirse eski kayıtlar yok sayılır
+MANIFEST_VERSION = 1
+
+MANIFEST_PATH = DATA_DIR / "capabilities.json"
+
+TOOLS = ("ffmpeg", "ffprobe", "whisper")
+
+PROBE_TIMEOUT = 60
+
+_VERSION_RE = re.compile(r"version\s+(\S+)")
+# " TSC boxblur           V->V       Blur the input."
+_FILTER_RE = re.compile(r"^\s*[T.][S.][C.]\s+(\S+)\s+\S*->\S*")
+# " V....D libx264              libx264 H.264 ..."
+_ENCODER_RE = re.compile(r"^\s*[VAS][A-Z.]{5}\s+(\S+)")
+
+
+@dataclass
+class ToolInfo:
+    """Tek aracın probe sonucu"""
+    name: str
+    path: Optional[str] = None              # Çözülmüş gerçek yol (yoksa None)
+    mtime: Optional[float] = None
+    ok: bool = False                        # Bulundu ve çalıştı
+    version: Optional[str] = None
+    filters: Optional[List[str]] = None     # Sadece ffmpeg
+    encoders: Optional[List[str]] = None    # Sadece ffmpeg
+    probe_ms: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolInfo":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class Capabilities:
+    """Tüm araçların yetenekleri"""
+    tools: Dict[str, ToolInfo]
+    whisper_models: List[str] = field(default_factory=list)
+
+    def tool(self, name: str) -> ToolInfo:
+        return self.tools.get(name) or ToolInfo(name)
+
+    @property
+    def ffmpeg_ok(self) -> bool:
+        return self.tool("ffmpeg").ok
+
+    @property
+    def ffprobe_ok(self) -> bool:
+        return self.tool("ffprobe").ok
+
+    @property
+    def whisper_ok(self) -> bool:
+        return self.tool("whisper").ok
+
+    def has_filter(self, name: str) -> bool:
+        """ffmpeg filtresi var mı (filtre listesi alınamadıysa True varsayılır)"""
+        filters = self.tool("ffmpeg").filters
+        return filters is None or name in filters
+
+    def has_encoder(self, name: str) -> bool:
+        """ffmpeg encoder'ı var mı (liste alınamadıysa True varsayılır)"""
+        encoders = self.tool("ffmpeg").encoders
+        return encoders is None or name in encoders
+
+    def summary(self) -> str:
+        parts = []
+        for name in TOOLS:
+            info = self.tool(name)
+            parts.append(f"{name} {info.version or ('var' if info.ok else 'yok')}")
+        if self.whisper_models:
+            parts.append(f"modeller: {', '.join(self.whisper_models)}")
+        return ", ".join(parts)
+
+
+# ========================================
+# PROBE
+# ========================================
+
+def parse_filters(output: str) -> List[str]:
+    """`ffmpeg -filters` çıktısı → filtre adları"""
+    return sorted({m.group(1) for m in map(_FILTER_RE.match, output.splitlines()) if m})
+
+
+def parse_encoders(output: str) -> List[str]:
+    """`ffmpeg -encoders` çıktısı → encoder adları (açıklama bloğundan sonra)"""
+    lines = output.splitlines()
+    for i, line in enumerate(lines):
+        if line.strip().startswith("---"):
+            lines = lines[i + 1:]
+            break
+    return sorted({m.group(1) for m in map(_ENCODER_RE.match, lines) if m})
+
+
+def _run(cmd: List[str]) -> Optional[subprocess.CompletedProcess]:
+    try:
+        result = run_process(cmd, capture_output=True, text=True, timeout=PROBE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning("%s çalıştırılamadı: %s", cmd[0], e)
+        return None
+    return result if result.returncode == 0 else None
+
+
+def _probe_tool(name: str, path: str) -> ToolInfo:
+    info = ToolInfo(name, path=path, mtime=os.stat(path).st_mtime)
+    start = time.perf_counter()
+
+    if name == "whisper":
+        info.ok = _run([path, "--help"]) is not None
+    else:
+        result = _run([path, "-hide_banner", "-version"])
+        if result is not None:
+            info.ok = True
+            match = _VERSION_RE.search(result.stdout)
+            info.version = match.group(1) if match else None
+        if info.ok and name == "ffmpeg":
+            filters = _run([path, "-hide_banner", "-filters"])
+            info.filters = parse_filters(filters.stdout) if filters else None
+            encoders = _run([path, "-hide_banner", "-encoders"])
+            info.encoders = parse_encoders(encoders.stdout) if encoders else None
+
+    info.probe_ms = (time.perf_counter() - start) * 1000
+    return info
+
+
+def whisper_model_dir() -> Path:
+    cache = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache) / "whisper"
+
+
+def whisper_models() -> List[str]:
+    """İndirilmiş whisper modelleri ("medium", "large-v3"...)"""
+    try:
+        return sorted(p.stem for p in whisper_model_dir().glob("*.pt"))
+    except OSError:
+        return []
+
+
+# ========================================
+# MANİFEST
+# ========================================
+
+class CapabilityManifest:
+    """
+    Araç başına probe sonuçları: bellekte, diskte binary yolu + mtime ile
+
+    Thread-safe; aynı araç için eşzamanlı istekler tek probe'u bekler.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = Path(path)
+        self._tools: Dict[str, ToolInfo] = {}
+        self._disk: Optional[Dict[str, dict]] = None
+        self._locks = {name: threading.Lock() for name in TOOLS}
+        self._disk_lock = threading.Lock()
+
+    def _load_disk(self) -> Dict[str, dict]:
+        with self._disk_lock:
+            if self._disk is None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                    self._disk = data.get("tools", {}) if data.get("version") == MANIFEST_VERSION else {}
+                except (OSError, ValueError):
+                    self._disk = {}
+            return self._disk
+
+    def _save(self, info: ToolInfo):
+        with self._disk_lock:
+            self._disk[info.name] = asdict(info)
+            data = {"version": MANIFEST_VERSION, "tools": self._disk}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logger.debug("Yetenek manifestosu yazılamadı: %s", e)
+
+    def tool(self, name: str, refresh: bool = False) -> ToolInfo:
+        """
+        Aracın yetenekleri (gerekirse şimdi probe edilir)
+
+        Args:
+            name: "ffmpeg", "ffprobe" veya "whisper"
+            refresh: Manifesti yok say, yeniden probe et
+        """
+        with self._locks[name]:
+            info = self._tools.get(name)
+            if info is not None and not refresh:
+                return info
+
+            found = shutil.which(name)
+            if found is None:
+                info = ToolInfo(name)
+            else:
+                path = os.path.realpath(found)
+                cached = self._load_disk().get(name)
+                if (not refresh and cached and cached.get("path") == path
+                        and cached.get("mtime") == os.stat(path).st_mtime):
+                    info = ToolInfo.from_dict(cached)
+                else:
+                    info = _probe_tool(name, path)
+                    logger.info("%s probe edildi: %s (%.0f ms)", name,
+                                info.version or ("çalışıyor" if info.ok else "çalışmıyor"), info.probe_ms)
+                    self._save(info)
+            self._tools[name] = info
+            return info
+
+    def capabilities(self, refresh: bool = False) -> Capabilities:
+        """Tüm araçlar (whisper ilk seferde saniyeler sürebilir)"""
+        return Capabilities({name: self.tool(name, refresh) for name in TOOLS}, whisper_models())
+
+    def peek(self) -> Optional[Capabilities]:
+        """Tüm araçlar probe edildiyse sonuç, değilse None (beklemez)"""
+        if any(name not in self._tools for name in TOOLS):
+            return None
+        return Capabilities(dict(self._tools), whisper_models())
+
+    def probe_in_background(self, callback: Optional[Callable[[Capabilities], None]] = None,
+                            refresh: bool = False):
+        """
+        Tüm araçları arka plan thread'inde probe et
+
+        Args:
+            callback: Sonuçla çağrılır (arka plan thread'inde)
+        """
+        def worker():
+            capabilities = self.capabilities(refresh)
+            logger.info("Araçlar: %s", capabilities.summary())
+            if callback:
+                callback(capabilities)
+
+        threading.Thread(target=worker, name="capabilities", daemon=True).start()
+
+
+_manifest: Optional[CapabilityManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_manifest() -> CapabilityManifest:
+    """Uygulama genelinde paylaşılan manifest"""
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = CapabilityManifest()
+        return _manifest
+
+
+def get_capabilities(refresh: bool = False) -> Capabilities:
+    return get_manifest().capabilities(refresh)
+
+
+def tool_available(path: str) -> bool:
+    """
+    Araç kullanılabilir mi
+
+    Varsayılan adlar ("ffmpeg", "ffprobe", "whisper") manifestten okunur;
+    özel bir binary yolu verilmişse sadece varlığına bakılır.
+    """
+    if path in TOOLS:
+        return get_manifest().tool(path).ok
+    return shutil.which(path) is not None
+
+
+def get_capabilities_for(*names: str) -> Capabilities:
+    """Sadece verilen araçları probe eden kısmi Capabilities (whisper'ı beklemez)"""
+    manifest = get_manifest()
+    return Capabilities({name: manifest.tool(name) for name in names})
+
+
+def has_filter(name: str) -> bool:
+    """Varsayılan ffmpeg'de filtre var mı (ffmpeg yoksa True; hata komutta çıkar)"""
+    return get_capabilities_for("ffmpeg").has_filter(name)
+
+
+def has_encoder(name: str) -> bool:
+    return get_capabilities_for("ffmpeg").has_encoder(name)
+
+
+def blur_filter(strength: int, power: int = 2) -> str:
+    """
+    Arka plan bulanıklığı filtresi
+
+    boxblur GPL lisanslıdır; --disable-gpl derlemelerde yoktur. O durumda
+    yaklaşık eşdeğer gblur kullanılır.
+    """
+    if has_filter("boxblur"):
+        return f"boxblur={strength}:{power}"
+    return f"gblur=sigma={strength * power / 2:.1f}"
+
+
+def _benchmark():
+    """Soğuk (probe) ve sıcak (manifest) açılış maliyeti"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "capabilities.json"
+
+        start = time.perf_counter()
+        cold = CapabilityManifest(path).capabilities()
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        warm = CapabilityManifest(path).capabilities()
+        warm_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Soğuk: {cold_ms:.0f} ms, manifestten: {warm_ms:.1f} ms")
+    print(f"  {warm.summary()}")
+    if cold.summary() != warm.summary():
+        print(f"  ✗ Manifest probe sonucundan farklı: {cold.summary()}")
+    ffmpeg = warm.tool("ffmpeg")
+    if ffmpeg.ok:
+        print(f"  {len(ffmpeg.filters or [])} filtre, {len(ffmpeg.encoders or [])} encoder; "
+              f"subtitles={warm.has_filter('subtitles')}, boxblur={warm.has_filter('boxblur')}, "
+              f"libx264={warm.has_encoder('libx264')}")
+
+    sample_filters = " TSC boxblur           V->V       Blur the input.\n ... abench  A->A  x\n"
+    sample_encoders = " V..... = Video\n ------\n V....D libx264   H.264\n A....D aac   AAC\n"
+    assert parse_filters(sample_filters) == ["abench", "boxblur"]
+    assert parse_encoders(sample_encoders) == ["aac", "libx264"]
+    print("✓ Ayrıştırıcılar")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
@@ -4,22 +4,16 @@ Video işleme ve short oluşturma motoru
 """
 
 import subprocess
-import shutil
-import re
 from pathlib import Path
 from typing import Optional, Tuple, Callable
-from dataclasses import dataclass
 
+from utils.logger import get_logger
+from .cancellation import CancelToken, CancelledError
+from .capabilities import tool_available
+from .process_runner import ffmpeg_progress, run_process
+from .media_info import VideoInfo, probe_video
 
-@dataclass
-class VideoInfo:
-    """Video bilgileri"""
-    duration: float  # Saniye cinsinden
-    width: int
-    height: int
-    fps: float
-    codec: str
-    file_path: Path
+logger = get_logger("LinuxShorts.FFmpeg")
 
 
 class FFmpegWrapper:
@@ -34,8 +28,8 @@ class FFmpegWrapper:
         self._check_ffmpeg()
     
     def _check_ffmpeg(self) -> None:
-        """FFmpeg'in sistemde kurulu olup olmadığını kontrol eder"""
-        if not shutil.which(self.ffmpeg_path):
+        """FFmpeg'in sistemde kurulu olup olmadığını kontrol eder (manifestten)"""
+        if not tool_available(self.ffmpeg_path):
             raise FileNotFoundError(
                 "FFmpeg bulunamadı! Lütfen FFmpeg'i kurun:\n"
                 "sudo apt install ffmpeg"
@@ -45,121 +39,34 @@ class FFmpegWrapper:
         """
         Video dosyası hakkında bilgi alır
         
+        Paylaşılan metadata servisini kullanır: dosya başına tek ffprobe
+        çağrısı, sonraki çağrılar cache'ten döner.
+        
         Args:
             video_path: Video dosyasının yolu
             
         Returns:
             VideoInfo objesi
+            
+        Raises:
+            RuntimeError: Video bilgisi alınamadıysa
         """
-        from utils.logger import get_logger
-        logger = get_logger("LinuxShorts.FFmpeg")
-        
-        logger.debug(f"Video analiz ediliyor: {video_path}")
-        logger.debug(f"Dosya var mı? {video_path.exists()}")
-        logger.debug(f"Dosya boyutu: {video_path.stat().st_size if video_path.exists() else 'N/A'}")
-        
-        # Önce video stream bilgilerini al
-        cmd_video = [
-            "ffprobe",
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=width,height,r_frame_rate,codec_name",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        
-        # Sonra format (duration) bilgisini al
-        cmd_format = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        
-        logger.debug(f"Video stream komutu: {' '.join(cmd_video)}")
-        logger.debug(f"Format komutu: {' '.join(cmd_format)}")
+        logger.debug("Video analiz ediliyor: %s", video_path)
         
         try:
-            # Video stream bilgilerini al
-            result_video = subprocess.run(
-                cmd_video,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            video_output = result_video.stdout.strip()
-            logger.debug(f"Video stream çıktısı:\n{video_output}")
-            
-            if not video_output:
-                logger.error("Video stream bulunamadı! Bu dosya sadece ses içeriyor olabilir.")
-                raise RuntimeError("Video stream bulunamadı. Bu dosya video içermiyor olabilir.")
-            
-            # Format bilgilerini al
-            result_format = subprocess.run(
-                cmd_format,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            format_output = result_format.stdout.strip()
-            logger.debug(f"Format çıktısı:\n{format_output}")
-            
-            # Video stream çıktısını parse et
-            # FFprobe çıktı sırası: codec_name\nwidth\nheight\nfps
-            lines = video_output.split('\n')
-            logger.debug(f"Parse edilen satırlar: {lines}")
-            
-            if len(lines) < 4:
-                logger.error(f"Yetersiz video bilgisi! Satır sayısı: {len(lines)}")
-                raise RuntimeError("Video bilgileri eksik. Dosya bozuk olabilir.")
-            
-            try:
-                # Doğru sıralama: codec, width, height, fps
-                codec = lines[0].strip()
-                width = int(lines[1].strip())
-                height = int(lines[2].strip())
-                
-                # FPS parse et
-                fps_str = lines[3].strip()
-                if '/' in fps_str:
-                    fps_parts = fps_str.split('/')
-                    fps = int(fps_parts[0]) / int(fps_parts[1])
-                else:
-                    fps = float(fps_str)
-                
-                # Duration
-                duration = float(format_output) if format_output else 0.0
-                
-            except (ValueError, IndexError) as e:
-                logger.error(f"Parse hatası: {e}")
-                logger.error(f"Video çıktısı: {video_output}")
-                raise RuntimeError(f"Video bilgileri parse edilemedi: {e}")
-            
-            logger.info(f"✓ Video bilgileri başarıyla alındı:")
-            logger.info(f"  Çözünürlük: {width}x{height}")
-            logger.info(f"  Süre: {duration}s")
-            logger.info(f"  FPS: {fps}")
-            logger.info(f"  Codec: {codec}")
-            
-            return VideoInfo(
-                duration=duration,
-                width=width,
-                height=height,
-                fps=fps,
-                codec=codec,
-                file_path=video_path
-            )
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFprobe komutu başarısız: {e.stderr}")
-            raise RuntimeError(f"Video bilgisi alınamadı: {e.stderr}")
-        except Exception as e:
-            logger.error(f"Video bilgisi alma hatası: {e}")
-            logger.exception("Detaylı hata:")
-            raise
+            info = probe_video(Path(video_path))
+        except FileNotFoundError as e:
+            raise RuntimeError(str(e))
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Video bilgisi alınamadı: ffprobe zaman aşımı")
+        
+        # Metadata cache'ten gelir ve sık çağrılır: tek satır, tembel biçimlendirme
+        logger.debug("✓ Video bilgileri: %dx%d (döndürme %d°), %.2fs, %.3f fps%s, %s, "
+                     "keyframe aralığı %.2fs, %d ses akışı",
+                     info.width, info.height, info.rotation, info.duration, info.fps,
+                     " (VFR)" if info.is_vfr else "", info.codec,
+                     info.keyframe_interval or 0.0, len(info.audio_streams))
+        return info
     
     def create_short(
         self,
@@ -171,7 +78,8 @@ class FFmpegWrapper:
         height: int = 1920,
         crf: int = 23,
         preset: str = "medium",
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        cancel: Optional[CancelToken] = None
     ) -> bool:
         """
         Short video oluşturur (9:16 formatında)
@@ -186,9 +94,13 @@ class FFmpegWrapper:
             crf: Kalite (18-28, düşük = yüksek kalite)
             preset: FFmpeg preset (ultrafast, fast, medium, slow)
             progress_callback: İlerleme callback fonksiyonu
+            cancel: İptal token'ı (iptalde ffmpeg öldürülür, yarım çıktı silinir)
             
         Returns:
             Başarılı ise True
+            
+        Raises:
+            CancelledError: Token iptal edildiyse
         """
         # Output dizinini oluştur
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -210,46 +122,29 @@ class FFmpegWrapper:
         ]
         
         try:
-            # Progress tracking için
+            # Progress tracking için (FFmpeg progress'i stderr'de)
+            line_callback = None
             if progress_callback:
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
+                duration_seconds = self._time_to_seconds(duration)
                 
-                # FFmpeg progress'i stderr'de
-                for line in process.stderr:
+                def line_callback(line: str):
                     # time=00:00:10.00 formatını yakala
-                    if "time=" in line:
-                        time_match = re.search(r'time=(\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-                        if time_match:
-                            h, m, s = time_match.groups()
-                            current_time = int(h) * 3600 + int(m) * 60 + float(s)
-                            
-                            # Duration'ı saniyeye çevir
-                            duration_seconds = self._time_to_seconds(duration)
-                            progress = min(100, (current_time / duration_seconds) * 100)
-                            progress_callback(progress)
-                
-                process.wait()
-                
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(
-                        process.returncode,
-                        cmd,
-                        process.stderr.read()
-                    )
-            else:
-                # Progress tracking olmadan
-                subprocess.run(cmd, check=True, capture_output=True)
+                    current_time = ffmpeg_progress(line)
+                    if current_time is not None and duration_seconds > 0:
+                        progress_callback(min(100, (current_time / duration_seconds) * 100))
+            
+            run_process(cmd, cancel=cancel, check=True, capture_output=True, text=True,
+                        line_callback=line_callback)
             
             return True
             
         except subprocess.CalledProcessError as e:
             print(f"FFmpeg hatası: {e.stderr if hasattr(e, 'stderr') else str(e)}")
             return False
+        
+        except CancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
     
     def _time_to_seconds(self, time_str: str) -> float:
         """
@@ -298,7 +193,7 @@ class FFmpegWrapper:
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd, check=True, capture_output=True)
             return True
         except subprocess.CalledProcessError:
             return False
@@ -330,7 +225,7 @@ class FFmpegWrapper:
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd, check=True, capture_output=True)
             return True
         except subprocess.CalledProcessError:
             return False
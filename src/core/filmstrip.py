@@ -0,0 +1,291 @@
+"""
+LinuxShorts Pro - Filmstrip
+Timeline için küçük resim şeridi (sprite sayfaları + index)
+
+- Tek ffmpeg geçişi: fps=1/N → scale → tile=CxR; her sayfa C×R küçük resim
+- Uzun videolarda sadece keyframe'ler decode edilir (-skip_frame nokey)
+- Sonuç video başına ~/.linuxshorts/filmstrips altında cache'lenir
+- Sayfalar timeline kaydırıldıkça ihtiyaç oldukça (lazy) yüklenir
+"""
+
+import json
+import math
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from PIL import Image
+
+from utils.logger import get_logger
+from utils.cache import cache_path
+from .cancellation import CancelToken
+from .process_runner import run_process
+from .capabilities import tool_available
+
+logger = get_logger("LinuxShorts.Filmstrip")
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+
+# Index formatı değişirse eski cache'ler yeniden üretilir
+INDEX_VERSION = 1
+
+# Bu süreden uzun videolarda varsayılan olarak sadece keyframe decode edilir
+KEYFRAME_ONLY_DURATION = 600.0
+
+
+@dataclass
+class FilmstripIndex:
+    """Sprite sayfalarının düzeni"""
+    interval: float             # Küçük resimler arası süre (sn)
+    count: int                  # Toplam küçük resim
+    tile_width: int
+    tile_height: int
+    columns: int
+    rows: int
+    pages: List[str]            # Sayfa dosya adları (sırayla)
+    duration: float
+    keyframes_only: bool = False
+    version: int = INDEX_VERSION
+
+    @property
+    def per_page(self) -> int:
+        return self.columns * self.rows
+
+    def locate(self, index: int) -> Tuple[int, Tuple[int, int, int, int]]:
+        """Küçük resmin sayfası ve sayfa içindeki kutusu"""
+        page, slot = divmod(index, self.per_page)
+        row, col = divmod(slot, self.columns)
+        x, y = col * self.tile_width, row * self.tile_height
+        return page, (x, y, x + self.tile_width, y + self.tile_height)
+
+
+class Filmstrip:
+    """Diskteki sprite sayfalarından küçük resim okuyucu"""
+
+    # Bellekte tutulan sayfa sayısı (10x10 80x45 JPEG sayfası ≈ 1 MB RGB)
+    PAGE_CACHE_SIZE = 4
+
+    def __init__(self, directory: Path, index: FilmstripIndex):
+        self.directory = Path(directory)
+        self.index = index
+        self._pages: "OrderedDict[int, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["Filmstrip"]:
+        """Cache dizininden yükle (yoksa/eskiyse None)"""
+        index_file = Path(directory) / "index.json"
+        try:
+            data = json.loads(index_file.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return None
+            index = FilmstripIndex(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        if not all((Path(directory) / page).exists() for page in index.pages):
+            return None
+        return cls(directory, index)
+
+    def __len__(self) -> int:
+        return self.index.count
+
+    def _page(self, page: int) -> Image.Image:
+        with self._lock:
+            image = self._pages.get(page)
+            if image is not None:
+                self._pages.move_to_end(page)
+                return image
+
+        image = Image.open(self.directory / self.index.pages[page])
+        image.load()
+
+        with self._lock:
+            self._pages[page] = image
+            while len(self._pages) > self.PAGE_CACHE_SIZE:
+                self._pages.popitem(last=False)
+        return image
+
+    def tile(self, index: int) -> Optional[Image.Image]:
+        """index. küçük resim (sayfası gerekiyorsa diskten yüklenir)"""
+        if not 0 <= index < self.index.count:
+            return None
+        page, box = self.index.locate(index)
+        return self._page(page).crop(box)
+
+    def index_at(self, time_sec: float) -> int:
+        """Zamana en yakın küçük resmin indexi"""
+        return max(0, min(self.index.count - 1, int(round(time_sec / self.index.interval))))
+
+    def tile_at(self, time_sec: float) -> Optional[Image.Image]:
+        return self.tile(self.index_at(time_sec))
+
+    def tiles_between(self, start: float, end: float) -> List[Tuple[float, Image.Image]]:
+        """[start, end] aralığındaki küçük resimler (zaman, resim)"""
+        first, last = self.index_at(start), self.index_at(end)
+        return [(i * self.index.interval, self.tile(i)) for i in range(first, last + 1)]
+
+
+class FilmstripGenerator:
+    """Filmstrip üretici (video başına disk cache'li)"""
+
+    def __init__(self, ffmpeg_path: str = "ffmpeg", tile_size: Tuple[int, int] = (80, 45),
+                 columns: int = 10, rows: int = 10, max_tiles: int = 400):
+        """
+        Args:
+            ffmpeg_path: FFmpeg binary'si
+            tile_size: Küçük resim boyutu (genişlik, yükseklik)
+            columns, rows: Sayfa başına küçük resim düzeni
+            max_tiles: Çok uzun videolarda aralık bu sayıya göre büyütülür
+        """
+        self.ffmpeg_path = ffmpeg_path
+        self.tile_size = tile_size
+        self.columns = columns
+        self.rows = rows
+        self.max_tiles = max_tiles
+
+    def get(self, video_path: Path, duration: float, interval: Optional[float] = None,
+            keyframes_only: Optional[bool] = None,
+            progress_callback: Callable[[float], None] = None,
+            cancel: Optional[CancelToken] = None) -> Optional[Filmstrip]:
+        """
+        Filmstrip'i cache'ten al, yoksa üret
+
+        Args:
+            video_path: Kaynak video
+            duration: Video süresi (sn)
+            interval: Küçük resimler arası süre (None ise otomatik)
+            keyframes_only: Sadece keyframe decode (None ise uzun videolarda)
+            progress_callback: İlerleme (0-1)
+            cancel: İptal token'ı (iptalde yarım sayfalar silinir)
+
+        Returns:
+            Filmstrip veya None (üretilemezse)
+
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
+        if duration <= 0:
+            return None
+        if interval is None:
+            interval = max(1.0, duration / self.max_tiles)
+        if keyframes_only is None:
+            keyframes_only = duration > KEYFRAME_ONLY_DURATION
+
+        directory = cache_path("filmstrips", video_path)
+        strip = Filmstrip.load(directory)
+        if (strip is not None and math.isclose(strip.index.interval, interval)
+                and (strip.index.tile_width, strip.index.tile_height) == tuple(self.tile_size)):
+            return strip
+
+        # Aynı video için eşzamanlı get() çağrıları birbirinin dizinini silmesin
+        tmp = Path(tempfile.mkdtemp(prefix=directory.name + ".", suffix=".tmp", dir=directory.parent))
+        try:
+            pages = []
+            if tool_available(self.ffmpeg_path):
+                pages = self._build_with_ffmpeg(video_path, tmp, interval, keyframes_only, cancel)
+            if not pages and OPENCV_AVAILABLE:
+                keyframes_only = False
+                pages = self._build_with_opencv(video_path, tmp, duration, interval,
+                                                progress_callback, cancel)
+            if not pages:
+                return None
+
+            count = min(int(duration / interval) + 1, len(pages) * self.columns * self.rows)
+            index = FilmstripIndex(
+                interval=interval, count=count,
+                tile_width=self.tile_size[0], tile_height=self.tile_size[1],
+                columns=self.columns, rows=self.rows, pages=pages,
+                duration=duration, keyframes_only=keyframes_only,
+            )
+            (tmp / "index.json").write_text(json.dumps(asdict(index)), encoding="utf-8")
+
+            shutil.rmtree(directory, ignore_errors=True)
+            try:
+                tmp.rename(directory)
+            except OSError:
+                # Eşzamanlı bir üretim önce bitirdi: onunkini kullan
+                strip = Filmstrip.load(directory)
+                if strip is None:
+                    raise
+                return strip
+        except Exception as e:
+            logger.error(f"Filmstrip oluşturulamadı: {e}")
+            return None
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        if progress_callback:
+            progress_callback(1.0)
+        logger.info(f"Filmstrip: {count} kare, {len(pages)} sayfa, {interval:.1f} sn aralık"
+                    f"{' (keyframe)' if keyframes_only else ''}")
+        return Filmstrip(directory, index)
+
+    def build_command(self, video_path: Path, output_dir: Path, interval: float,
+                      keyframes_only: bool = False) -> List[str]:
+        """Tek geçişte tüm sprite sayfalarını üreten ffmpeg komutu"""
+        w, h = self.tile_size
+        # pad, yuv420p'de hedefi çift sayıya yuvarlar (45 → 44) ve 80x45 kare
+        # sığmaz; RGB'de her boyut tam olarak doldurulur
+        vf = (f"fps=1/{interval:g},"
+              f"scale={w}:{h}:force_original_aspect_ratio=decrease,format=rgb24,"
+              f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,"
+              f"tile={self.columns}x{self.rows}")
+        cmd = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+        if keyframes_only:
+            cmd += ["-skip_frame", "nokey"]
+        cmd += ["-i", str(video_path), "-an", "-sn", "-vf", vf,
+                "-q:v", "4", "-y", str(Path(output_dir) / "page_%03d.jpg")]
+        return cmd
+
+    def _build_with_ffmpeg(self, video_path: Path, output_dir: Path, interval: float,
+                           keyframes_only: bool, cancel: Optional[CancelToken] = None) -> List[str]:
+        cmd = self.build_command(video_path, output_dir, interval, keyframes_only)
+        result = run_process(cmd, cancel=cancel, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.warning(f"ffmpeg filmstrip hatası: {result.stderr.strip()[-300:]}")
+            return []
+        return sorted(p.name for p in output_dir.glob("page_*.jpg"))
+
+    def _build_with_opencv(self, video_path: Path, output_dir: Path, duration: float,
+                           interval: float, progress_callback: Callable[[float], None] = None,
+                           cancel: Optional[CancelToken] = None) -> List[str]:
+        """ffmpeg yoksa veya başarısızsa: aynı sayfa düzenini OpenCV seek'leri ile üret"""
+        cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            return []
+
+        w, h = self.tile_size
+        per_page = self.columns * self.rows
+        count = int(duration / interval) + 1
+        pages = []
+        sheet = None
+        for i in range(count):
+            if cancel is not None and cancel.cancelled:
+                cap.release()
+                cancel.raise_if_cancelled()
+            slot = i % per_page
+            if slot == 0:
+                sheet = Image.new("RGB", (w * self.columns, h * self.rows))
+            cap.set(cv2.CAP_PROP_POS_MSEC, i * interval * 1000)
+            ret, frame = cap.read()
+            if ret:
+                tile = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (w, h), interpolation=cv2.INTER_AREA)
+                row, col = divmod(slot, self.columns)
+                sheet.paste(Image.fromarray(tile), (col * w, row * h))
+            if slot == per_page - 1 or i == count - 1:
+                name = f"page_{len(pages) + 1:03d}.jpg"
+                sheet.save(output_dir / name, "JPEG", quality=85)
+                pages.append(name)
+            if progress_callback and i % 10 == 0:
+                progress_callback(i / count)
+        cap.release()
+        return pages
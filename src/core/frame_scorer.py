@@ -0,0 +1,679 @@
+"""
+LinuxShorts Pro - Frame Scorer
+Frame kalite puanlaması için birleştirilebilir scorer kaydı
+
+- Scorer'lar tek tek frame yerine yığılmış NumPy batch'leri (N×H×W) alır
+  ve N uzunluğunda 0..1 skor vektörü döndürür
+- Gri ton, bulanık gri gibi ara özellikler batch üzerinde bir kez hesaplanıp
+  scorer'lar arasında paylaşılır
+- Skorlar ağırlıklarla birleştirilir (thumbnail ve hook profilleri)
+- Video taraması FrameFeatures tablosu üretir: thumbnail seçimi ve hook
+  tespiti aynı tabloyu farklı ağırlıklarla kullanır
+- Haar cascade thread başına bir kez yüklenir, metrikler küçültülmüş
+  frame'lerde hesaplanır, batch'ler thread havuzunda puanlanır
+- Scorer ve özellik başına süre dökümü tutulur
+"""
+
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+from utils.tracing import span
+from .cancellation import CancelToken
+from .timestamps import capture_timeline
+
+logger = get_logger("LinuxShorts.FrameScorer")
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+    logger.warning("OpenCV bulunamadı, frame puanlama devre dışı")
+
+
+# Puanlamanın yapıldığı genişlik (yükseklik en-boy oranına göre)
+DEFAULT_ANALYSIS_WIDTH = 480
+
+# Batch başına frame sayısı (480x270 RGB ≈ 390 KB/frame)
+DEFAULT_BATCH_SIZE = 16
+
+FACE_CASCADE = "haarcascade_frontalface_default.xml"
+
+
+# ============================================================
+# BATCH VE PAYLAŞILAN ÖZELLİKLER
+# ============================================================
+
+class FrameBatch:
+    """
+    Yığılmış frame'ler ve tembel hesaplanan ortak özellikler
+
+    Her özellik (gray, gray_u8, blurred) ilk isteyen scorer tarafından
+    bir kez hesaplanır ve batch'te cache'lenir.
+    """
+
+    def __init__(self, frames: np.ndarray, times: Optional[np.ndarray] = None,
+                 audio_levels: Optional[np.ndarray] = None,
+                 prev_frame: Optional[np.ndarray] = None):
+        """
+        Args:
+            frames: N×H×W×3 RGB uint8
+            times: N zaman (saniye)
+            audio_levels: N ses seviyesi (dB), loudness scorer için
+            prev_frame: Batch'ten önceki frame (H×W×3), ilk frame'in hareketi için
+        """
+        self.frames = frames
+        self.times = times if times is not None else np.arange(len(frames), dtype=np.float64)
+        self.audio_levels = audio_levels
+        self.prev_frame = prev_frame
+        self.timings: Dict[str, float] = {}
+        self._features: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def feature(self, name: str) -> np.ndarray:
+        value = self._features.get(name)
+        if value is None:
+            nested_before = self.shared_time()
+            start = time.perf_counter()
+            value = _FEATURES[name](self)
+            elapsed = time.perf_counter() - start
+            # İç içe hesaplanan özellikler kendi satırlarında sayılır
+            self.timings[f"~{name}"] = elapsed - (self.shared_time() - nested_before)
+            self._features[name] = value
+        return value
+
+    def shared_time(self) -> float:
+        """Ortak özelliklere harcanan toplam süre"""
+        return sum(v for k, v in self.timings.items() if k.startswith("~"))
+
+
+def _luma(frames: np.ndarray) -> np.ndarray:
+    """...×H×W×3 RGB → float32 parlaklık (BT.601)"""
+    f = frames.astype(np.float32)
+    return f[..., 0] * 0.299 + f[..., 1] * 0.587 + f[..., 2] * 0.114
+
+
+def _luma_u8(frames: np.ndarray) -> np.ndarray:
+    return np.clip(_luma(frames), 0, 255).astype(np.uint8)
+
+
+def _feature_gray(batch: FrameBatch) -> np.ndarray:
+    """N×H×W float32 parlaklık (BT.601)"""
+    return _luma(batch.frames)
+
+
+def _feature_gray_u8(batch: FrameBatch) -> np.ndarray:
+    return np.clip(batch.feature("gray"), 0, 255).astype(np.uint8)
+
+
+def _feature_blurred(batch: FrameBatch) -> np.ndarray:
+    """Hareket için bulanıklaştırılmış gri (önceki frame dahil, (N+1)×H×W)"""
+    gray = batch.feature("gray_u8")
+    if batch.prev_frame is not None:
+        # Batch içindeki frame'lerle aynı dönüşüm: cv2.cvtColor farklı yuvarlar
+        # ve batch sınırındaki hareket skoru, sınırın nereye düştüğüne bağlı olurdu
+        prev = _luma_u8(batch.prev_frame)
+    else:
+        prev = gray[0]
+    stack = np.concatenate([prev[None], gray])
+    return np.stack([cv2.GaussianBlur(g, (9, 9), 0) for g in stack])
+
+
+_FEATURES: Dict[str, Callable[[FrameBatch], np.ndarray]] = {
+    "gray": _feature_gray,
+    "gray_u8": _feature_gray_u8,
+    "blurred": _feature_blurred,
+}
+
+
+# ============================================================
+# SCORER KAYDI
+# ============================================================
+
+@dataclass
+class ScorerInfo:
+    """Kayıtlı scorer"""
+    name: str
+    func: Callable[[FrameBatch], Tuple[np.ndarray, np.ndarray]]
+    label: str  # Skor >= 0.5 olduğunda açıklamada gösterilir
+
+
+SCORERS: Dict[str, ScorerInfo] = {}
+
+
+def register_scorer(name: str, label: str = ""):
+    """
+    Scorer kaydeder
+
+    Fonksiyon FrameBatch alır ve (skor, ham_metrik) döndürür; ikisi de N
+    uzunluğunda vektördür, skor 0..1 aralığındadır.
+
+    Kullanım:
+        @register_scorer("blueness", "Mavi")
+        def blueness(batch):
+            raw = batch.frames[..., 2].mean(axis=(1, 2))
+            return np.clip(raw / 255, 0, 1), raw
+    """
+    def decorator(func):
+        SCORERS[name] = ScorerInfo(name, func, label)
+        return func
+    return decorator
+
+
+@register_scorer("exposure", "İyi parlaklık")
+def score_exposure(batch: FrameBatch):
+    """Ortalama parlaklık; 130 civarı ideal, 80 ve 180'de 0.5"""
+    brightness = batch.frames.reshape(len(batch), -1).mean(axis=1)
+    return np.clip(1.0 - np.abs(brightness - 130.0) / 100.0, 0.0, 1.0), brightness
+
+
+@register_scorer("contrast", "Yüksek kontrast")
+def score_contrast(batch: FrameBatch):
+    """Tüm piksellerin standart sapması; 50'de 0.5"""
+    std = batch.frames.reshape(len(batch), -1).std(axis=1)
+    return np.clip(std / 100.0, 0.0, 1.0), std
+
+
+@register_scorer("colorfulness", "Renkli")
+def score_colorfulness(batch: FrameBatch):
+    """Hasler-Süsstrunk renklilik metriği; 50'de 0.5"""
+    f = batch.frames.astype(np.float32)
+    rg = f[..., 0] - f[..., 1]
+    yb = 0.5 * (f[..., 0] + f[..., 1]) - f[..., 2]
+    axes = (1, 2)
+    colorfulness = (np.sqrt(rg.std(axis=axes) ** 2 + yb.std(axis=axes) ** 2)
+                    + 0.3 * np.sqrt(rg.mean(axis=axes) ** 2 + yb.mean(axis=axes) ** 2))
+    return np.clip(colorfulness / 100.0, 0.0, 1.0), colorfulness
+
+
+@register_scorer("sharpness", "Keskin")
+def score_sharpness(batch: FrameBatch):
+    """Laplacian varyansı (4-komşu, batch üzerinde vektörel); 100'de 0.5"""
+    g = batch.feature("gray")
+    lap = (g[:, :-2, 1:-1] + g[:, 2:, 1:-1] + g[:, 1:-1, :-2] + g[:, 1:-1, 2:]
+           - 4.0 * g[:, 1:-1, 1:-1])
+    variance = lap.reshape(len(batch), -1).var(axis=1)
+    return variance / (variance + 100.0), variance
+
+
+_cascade_local = threading.local()
+_cascade_warned = False
+
+
+def _load_cascade():
+    """Yüz cascade'ini yükler (OpenCV derlemesinde yoksa None)"""
+    global _cascade_warned
+    try:
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + FACE_CASCADE)
+        if not cascade.empty():
+            return cascade
+    except (AttributeError, cv2.error):
+        pass
+    if not _cascade_warned:
+        _cascade_warned = True
+        logger.warning(f"Yüz cascade'i yüklenemedi ({FACE_CASCADE}), yüz puanı devre dışı")
+    return None
+
+
+def _thread_cascade():
+    """Thread'e özel cascade (CascadeClassifier thread-safe değil)"""
+    cascade = getattr(_cascade_local, "cascade", False)
+    if cascade is False:
+        cascade = _load_cascade()
+        _cascade_local.cascade = cascade
+    return cascade
+
+
+@register_scorer("faces", "Yüz")
+def score_faces(batch: FrameBatch):
+    """Haar yüz sayısı; 1 yüz = 0.5, 2 yüz = 0.75"""
+    counts = np.zeros(len(batch), dtype=np.float64)
+    cascade = _thread_cascade()
+    if cascade is not None:
+        gray = batch.feature("gray_u8")
+        for i in range(len(batch)):
+            try:
+                counts[i] = len(cascade.detectMultiScale(gray[i], 1.1, 4))
+            except cv2.error:
+                pass
+    return 1.0 - 0.5 ** counts, counts
+
+
+@register_scorer("text_density", "Yazı")
+def score_text_density(batch: FrameBatch):
+    """Yatay gradyan yoğunluğu (yazı/arayüz ekranları); %15'te 1.0"""
+    g = batch.feature("gray")
+    dx = np.abs(g[:, :, 1:] - g[:, :, :-1])
+    density = (dx > 60.0).reshape(len(batch), -1).mean(axis=1)
+    return np.clip(density / 0.15, 0.0, 1.0), density * 100.0
+
+
+@register_scorer("motion", "Hareket")
+def score_motion(batch: FrameBatch):
+    """Önceki örneğe göre değişen piksel yüzdesi (analyze_motion ile aynı eşik); %20'de 1.0"""
+    blurred = batch.feature("blurred")
+    diff = np.abs(blurred[1:].astype(np.int16) - blurred[:-1].astype(np.int16))
+    motion = (diff > 25).reshape(len(batch), -1).mean(axis=1) * 100.0
+    return np.clip(motion / 20.0, 0.0, 1.0), motion
+
+
+@register_scorer("loudness", "Yüksek ses")
+def score_loudness(batch: FrameBatch):
+    """Ses seviyesi (dB); -50 dB = 0, -10 dB = 1"""
+    if batch.audio_levels is None:
+        zeros = np.zeros(len(batch))
+        return zeros, zeros
+    levels = np.asarray(batch.audio_levels, dtype=np.float64)
+    return np.clip((levels + 50.0) / 40.0, 0.0, 1.0), levels
+
+
+# Profiller: ağırlık = skor 1.0 olduğunda eklenen puan
+THUMBNAIL_WEIGHTS = {
+    "exposure": 15.0,
+    "contrast": 15.0,
+    "colorfulness": 10.0,
+    "sharpness": 15.0,
+    "faces": 20.0,
+}
+
+HOOK_WEIGHTS = {
+    "motion": 50.0,
+    "loudness": 25.0,
+    "faces": 15.0,
+    "contrast": 5.0,
+    "text_density": 5.0,
+}
+
+
+# ============================================================
+# SONUÇLAR
+# ============================================================
+
+@dataclass
+class FrameScore:
+    """Tek frame'in puanı ve ham metrikleri"""
+    score: float
+    reason: str
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class FrameFeatures:
+    """Video taramasının sonucu: her örnek zaman için scorer skorları ve ham metrikler"""
+    times: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    scores: Dict[str, np.ndarray] = field(default_factory=dict)
+    metrics: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def combine(self, weights: Dict[str, float], base: float = 0.0) -> np.ndarray:
+        """Ağırlıklı toplam skor (tabloda olmayan scorer'lar atlanır)"""
+        total = np.full(len(self.times), base, dtype=np.float64)
+        for name, weight in weights.items():
+            if name in self.scores:
+                total += weight * self.scores[name]
+        return total
+
+    def reason(self, index: int, weights: Dict[str, float]) -> str:
+        reasons = []
+        for name in weights:
+            if name in self.scores and self.scores[name][index] >= 0.5:
+                label = SCORERS[name].label
+                if name == "faces":
+                    label = f"{int(self.metrics[name][index])} yüz"
+                reasons.append(label)
+        return ", ".join(reasons) if reasons else "Normal"
+
+    @staticmethod
+    def concat(parts: Sequence['FrameFeatures']) -> 'FrameFeatures':
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return FrameFeatures()
+        names = parts[0].scores.keys()
+        return FrameFeatures(
+            times=np.concatenate([p.times for p in parts]),
+            scores={n: np.concatenate([p.scores[n] for p in parts]) for n in names},
+            metrics={n: np.concatenate([p.metrics[n] for p in parts]) for n in names},
+        )
+
+
+# ============================================================
+# PUANLAYICI
+# ============================================================
+
+class FrameScorer:
+    """
+    Ağırlıklı scorer birleşimi
+
+    Kullanım:
+        scorer = FrameScorer()                       # thumbnail profili
+        result = scorer.score(rgb_frame)
+        features = scorer.scan(video_path, 1.0)      # tüm video, tek geçiş
+        hooks = features.combine(HOOK_WEIGHTS)
+        print(scorer.timing_report())
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, base: float = 50.0,
+                 analysis_width: int = DEFAULT_ANALYSIS_WIDTH,
+                 workers: Optional[int] = None, detect_faces: bool = True):
+        """
+        Args:
+            weights: Scorer ağırlıkları (None = THUMBNAIL_WEIGHTS)
+            base: Toplam skora eklenen sabit (eski puanlama 50'den başlar)
+            analysis_width: Metriklerin hesaplandığı genişlik (0 = orijinal boyut)
+            workers: Thread sayısı (None = CPU sayısı, en fazla 8)
+            detect_faces: Yüz algılamayı çalıştır
+        """
+        self.weights = dict(weights if weights is not None else THUMBNAIL_WEIGHTS)
+        if not detect_faces:
+            self.weights.pop("faces", None)
+        self.base = base
+        self.analysis_width = analysis_width
+        self.workers = workers or min(8, os.cpu_count() or 2)
+
+        unknown = [name for name in self.weights if name not in SCORERS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen scorer: {', '.join(unknown)}")
+
+        self._timing_lock = threading.Lock()
+        self.timings: Dict[str, float] = {}
+        self.frames_scored = 0
+
+    # ========================================
+    # BATCH
+    # ========================================
+
+    def prepare(self, frame: np.ndarray) -> np.ndarray:
+        """Frame'i analiz boyutuna küçültür"""
+        h, w = frame.shape[:2]
+        if self.analysis_width and w > self.analysis_width:
+            scale = self.analysis_width / w
+            frame = cv2.resize(frame, (self.analysis_width, max(1, int(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        return frame
+
+    def _evaluate_traced(self, batch: FrameBatch, names: Optional[Sequence[str]]) -> FrameFeatures:
+        with span("score", "score", frames=len(batch.frames)):
+            return self.evaluate_batch(batch, names)
+
+    def evaluate_batch(self, batch: FrameBatch,
+                       names: Optional[Sequence[str]] = None) -> FrameFeatures:
+        """
+        Scorer'ları batch üzerinde çalıştırır
+
+        Args:
+            batch: FrameBatch (frame'ler analiz boyutunda)
+            names: Çalıştırılacak scorer'lar (None = ağırlığı olanlar)
+
+        Returns:
+            FrameFeatures
+        """
+        names = list(names if names is not None else self.weights)
+        result = FrameFeatures(times=np.asarray(batch.times, dtype=np.float64))
+        for name in names:
+            shared_before = batch.shared_time()
+            start = time.perf_counter()
+            scores, raw = SCORERS[name].func(batch)
+            elapsed = time.perf_counter() - start
+            # İlk kez hesaplanan ortak özelliklerin süresi ~özellik satırında raporlanır
+            shared = batch.shared_time() - shared_before
+            batch.timings[name] = batch.timings.get(name, 0.0) + elapsed - shared
+            result.scores[name] = np.asarray(scores, dtype=np.float64)
+            result.metrics[name] = np.asarray(raw, dtype=np.float64)
+        self._record(batch.timings, len(batch))
+        return result
+
+    def _record(self, timings: Dict[str, float], count: int):
+        with self._timing_lock:
+            for name, elapsed in timings.items():
+                self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            self.frames_scored += count
+
+    def _to_scores(self, features: FrameFeatures) -> List[FrameScore]:
+        totals = features.combine(self.weights, self.base)
+        results = []
+        for i in range(len(features)):
+            metrics = {name: float(values[i]) for name, values in features.metrics.items()}
+            results.append(FrameScore(float(totals[i]), features.reason(i, self.weights), metrics))
+        return results
+
+    # ========================================
+    # FRAME LİSTESİ
+    # ========================================
+
+    def score(self, frame: np.ndarray) -> FrameScore:
+        """Tek frame puanla"""
+        return self.score_many([frame])[0]
+
+    def score_many(self, frames: List[np.ndarray]) -> List[FrameScore]:
+        """
+        Frame'leri batch'ler halinde thread havuzunda puanla
+
+        Args:
+            frames: RGB frame listesi (aynı boyutta)
+
+        Returns:
+            Aynı sırada FrameScore listesi
+        """
+        if not frames:
+            return []
+        start = time.perf_counter()
+        small = [self.prepare(frame) for frame in frames]
+        self._record({"~resize": time.perf_counter() - start}, 0)
+
+        chunk = max(1, -(-len(small) // self.workers))
+        batches = [FrameBatch(np.stack(small[i:i + chunk])) for i in range(0, len(small), chunk)]
+        if len(batches) == 1:
+            parts = [self.evaluate_batch(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+                parts = list(pool.map(self.evaluate_batch, batches))
+        return self._to_scores(FrameFeatures.concat(parts))
+
+    # ========================================
+    # VİDEO TARAMA
+    # ========================================
+
+    def scan(self, video_path: Path, sample_interval: float = 1.0,
+             names: Optional[Sequence[str]] = None,
+             audio_levels: Optional[Sequence[Tuple[float, float]]] = None,
+             batch_size: int = DEFAULT_BATCH_SIZE,
+             progress_callback: Optional[Callable[[float], None]] = None,
+             start: float = 0.0, end: Optional[float] = None,
+             cancel: Optional["CancelToken"] = None) -> FrameFeatures:
+        """
+        Videoyu bir kez decode edip örnek frame'leri batch'ler halinde puanlar
+
+        Decode sıralı ilerler, batch'ler thread havuzunda puanlanır (en fazla
+        workers kadar batch bekler, bellek video uzunluğundan bağımsızdır).
+        start/end ile sadece bir aralık taranabilir; örnek zamanları tüm
+        videoyla aynı ızgaraya oturur ve aralığın ilk örneğinin hareket
+        skoru bir önceki örneğe göre hesaplanır. Batch ve parça sınırlarında
+        önceki frame batch içiyle aynı şekilde griye çevrilir; parça parça
+        tarama tam taramayla (ve farklı batch_size'larla) aynı diziyi verir.
+
+        Args:
+            video_path: Video dosyası
+            sample_interval: Örnekleme aralığı (saniye)
+            names: Çalıştırılacak scorer'lar (None = ağırlığı olanlar)
+            audio_levels: [(zaman, dB), ...] loudness scorer için
+            batch_size: Batch başına frame
+            progress_callback: 0..1 ilerleme
+            start: Aralık başlangıcı (saniye)
+            end: Aralık sonu (saniye, hariç; None = video sonu)
+            cancel: İptal token'ı (iptalde bekleyen batch'ler atılır)
+
+        Returns:
+            FrameFeatures
+
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
+        if not OPENCV_AVAILABLE:
+            return FrameFeatures()
+
+        level_times = level_values = None
+        if audio_levels:
+            level_times = np.array([t for t, _ in audio_levels], dtype=np.float64)
+            level_values = np.array([v for _, v in audio_levels], dtype=np.float64)
+
+        cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            return FrameFeatures()
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        timeline = capture_timeline(video_path, fps, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+        total_frames = len(timeline)
+        frame_interval = max(1, int(fps * sample_interval))
+
+        parts: List = []
+        pending: List = []
+        frames: List[np.ndarray] = []
+        times: List[float] = []
+        prev_frame = None
+        frame_idx = 0
+
+        # İlk örnek: start'tan sonraki ilk ızgara noktası (0 ise baştan, önceki frame yok)
+        first_frame = -(-timeline.frame_bound(start) // frame_interval) * frame_interval if start > 0 else 0
+        if first_frame > 0:
+            frame_idx = first_frame - frame_interval
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            ret, frame = cap.read()
+            if ret:
+                prev_frame = self.prepare(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            frame_idx += 1
+        end_frame = timeline.frame_bound(end) if end is not None else None
+        if end_frame is not None:
+            total_frames = min(total_frames, end_frame)
+        total_frames -= first_frame
+
+        def submit(pool):
+            nonlocal prev_frame
+            batch_times = np.array(times, dtype=np.float64)
+            levels = None
+            if level_times is not None:
+                levels = np.interp(batch_times, level_times, level_values)
+            batch = FrameBatch(np.stack(frames), batch_times, levels, prev_frame)
+            prev_frame = frames[-1]
+            # copy_context: havuzdaki score span'leri aynı işin trace'ine yazılır
+            pending.append(pool.submit(contextvars.copy_context().run, self._evaluate_traced, batch, names))
+            frames.clear()
+            times.clear()
+            # Bellek sınırı: bekleyen batch sayısı worker sayısını geçmez
+            while len(pending) > self.workers:
+                parts.append(pending.pop(0).result())
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while end_frame is None or frame_idx < end_frame:
+                if cancel is not None and cancel.cancelled:
+                    break
+                if frame_idx % frame_interval != 0:
+                    if not cap.grab():
+                        break
+                    frame_idx += 1
+                    continue
+
+                with span("decode", "decode"):
+                    ret, frame = cap.read()
+                if not ret:
+                    break
+
+                t0 = time.perf_counter()
+                frames.append(self.prepare(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)))
+                self._record({"~resize": time.perf_counter() - t0}, 0)
+                times.append(timeline.time_of(frame_idx))
+                if len(frames) >= batch_size:
+                    submit(pool)
+                    if progress_callback and total_frames > 0:
+                        progress_callback(min(1.0, (frame_idx - first_frame) / total_frames))
+                frame_idx += 1
+
+            if cancel is not None and cancel.cancelled:
+                for future in pending:
+                    future.cancel()
+                frames.clear()
+            else:
+                if frames:
+                    submit(pool)
+                parts.extend(f.result() for f in pending)
+
+        cap.release()
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        return FrameFeatures.concat(parts)
+
+    # ========================================
+    # RAPOR
+    # ========================================
+
+    def reset_timings(self):
+        with self._timing_lock:
+            self.timings.clear()
+            self.frames_scored = 0
+
+    def timing_report(self) -> str:
+        """Scorer / ortak özellik (~) başına toplam ve frame başına ortalama süre"""
+        with self._timing_lock:
+            timings = dict(self.timings)
+            count = self.frames_scored
+        if not count:
+            return "Puanlanan frame yok"
+
+        total = sum(timings.values())
+        lines = [f"{count} frame, toplam {total * 1000:.1f} ms (thread süreleri)"]
+        for name, elapsed in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            share = elapsed / total * 100 if total else 0
+            lines.append(f"  {name:<13} {elapsed * 1000:9.1f} ms  "
+                         f"{elapsed / count * 1000:7.3f} ms/frame  %{share:4.1f}")
+        return "\n".join(lines)
+
+
+def _benchmark(frame_count: int = 200):
+    """Eski (frame başına cascade, tam çözünürlük) ve batch puanlama karşılaştırması"""
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 255, (1080, 1920, 3), dtype=np.uint8) for _ in range(8)]
+    frames = [frames[i % len(frames)] for i in range(frame_count)]
+
+    def legacy(frame):
+        np.mean(frame)
+        np.std(frame)
+        hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
+        np.mean(hsv[:, :, 1])
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        cv2.Laplacian(gray, cv2.CV_64F).var()
+        cascade = _load_cascade()
+        if cascade is not None:
+            cascade.detectMultiScale(gray, 1.1, 4)
+
+    count = min(20, frame_count)
+    start = time.perf_counter()
+    for frame in frames[:count]:
+        legacy(frame)
+    legacy_per_frame = (time.perf_counter() - start) / count
+
+    scorer = FrameScorer(weights={**THUMBNAIL_WEIGHTS, **HOOK_WEIGHTS})
+    start = time.perf_counter()
+    scorer.score_many(frames)
+    new_per_frame = (time.perf_counter() - start) / frame_count
+
+    print(f"Eski:  {legacy_per_frame * 1000:.1f} ms/frame (5 metrik)")
+    print(f"Yeni:  {new_per_frame * 1000:.1f} ms/frame ({len(scorer.weights)} scorer, "
+          f"{scorer.workers} thread, {legacy_per_frame / new_per_frame:.1f}x)")
+    print(scorer.timing_report())
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
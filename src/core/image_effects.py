@@ -0,0 +1,192 @@
+"""
+LinuxShorts Pro - Image Effects
+Thumbnail efektleri için birleşik (fused) uint8 işlem hattı
+
+- Parlaklık, kontrast, doygunluk ve renk katmanı tek bir 3x4 renk
+  matrisine indirgenir ve cv2.transform ile tek geçişte uygulanır
+- Vignette maskesi boyut başına bir kez hesaplanıp cache'lenir ve
+  cv2.multiply ile uygulanır (float64 meshgrid ve kanal döngüsü yok)
+- Sonuç PIL ImageEnhance zinciriyle (Brightness → Contrast → Color →
+  overlay → vignette) aynıdır; tek fark ara adımlardaki 0-255 kırpmasının
+  sadece sonda yapılmasıdır
+"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger("LinuxShorts.ImageEffects")
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+    logger.warning("OpenCV bulunamadı, efektler devre dışı")
+
+
+# ITU-R 601-2 luma (PIL "L" dönüşümü ile aynı)
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+@dataclass
+class EffectParams:
+    """Efekt ayarları (1.0 = değişiklik yok)"""
+    brightness: float = 1.0
+    contrast: float = 1.0
+    saturation: float = 1.0
+    overlay_color: str = ""
+    overlay_opacity: float = 0.0
+    vignette: bool = False
+    vignette_strength: float = 0.5
+
+    @property
+    def is_identity(self) -> bool:
+        return (self.brightness == 1.0 and self.contrast == 1.0 and self.saturation == 1.0
+                and not (self.overlay_color and self.overlay_opacity > 0) and not self.vignette)
+
+
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        return (0, 0, 0)
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def color_matrix(params: EffectParams, mean_luma: float) -> np.ndarray:
+    """
+    Parlaklık + kontrast + doygunluk + renk katmanı için 3x4 afin matris
+
+    PIL zinciri:
+        Brightness(b):  x → b·x
+        Contrast(c):    x → c·x + (1 - c)·m     (m = görüntünün ortalama lumasi)
+        Color(s):       x → s·x + (1 - s)·luma(x)
+        Overlay(a, k):  x → (1 - a)·x + a·k
+
+    Doygunluk matrisinin satır toplamı 1 olduğu için sabitler matristen
+    geçerken değişmez; hepsi out = A·x + t biçiminde birleşir.
+
+    Args:
+        params: Efekt ayarları
+        mean_luma: Orijinal görüntünün ortalama lumasi (0-255)
+
+    Returns:
+        3x4 float32 matris (cv2.transform için)
+    """
+    b, c, s = params.brightness, params.contrast, params.saturation
+
+    saturation = s * np.eye(3, dtype=np.float32) + (1.0 - s) * np.tile(LUMA, (3, 1))
+    linear = (c * b) * saturation
+    # PIL Contrast ortalamayı parlaklık uygulanmış görüntüden alır
+    offset = np.full(3, (1.0 - c) * b * mean_luma, dtype=np.float32)
+
+    if params.overlay_color and params.overlay_opacity > 0:
+        a = float(params.overlay_opacity)
+        linear *= (1.0 - a)
+        offset = offset * (1.0 - a) + a * np.array(_hex_to_rgb(params.overlay_color), dtype=np.float32)
+
+    return np.hstack([linear, offset[:, None]]).astype(np.float32)
+
+
+@lru_cache(maxsize=16)
+def vignette_mask(width: int, height: int, strength: float = 0.5) -> np.ndarray:
+    """
+    Vignette maskesi (boyut başına bir kez hesaplanır)
+
+    Returns:
+        HxWx3 uint8, 255 = değişiklik yok (cv2.multiply scale=1/255 ile)
+    """
+    x = np.linspace(-1, 1, width, dtype=np.float32)
+    y = np.linspace(-1, 1, height, dtype=np.float32)
+    radius = np.sqrt(x[None, :] ** 2 + y[:, None] ** 2)
+    mask = 1.0 - np.clip(radius * 0.7, 0, 1) * strength
+    mask = np.round(mask * 255).astype(np.uint8)
+    mask = np.repeat(mask[:, :, None], 3, axis=2)
+    mask.setflags(write=False)
+    return mask
+
+
+def mean_luma(image: np.ndarray) -> float:
+    """RGB görüntünün ortalama lumasi (PIL Contrast'ın kullandığı değer)"""
+    means = cv2.mean(image)[:3]
+    return float(np.dot(LUMA, means))
+
+
+def apply_effects(image: np.ndarray, params: EffectParams, out: np.ndarray = None) -> np.ndarray:
+    """
+    Efektleri uint8 RGB görüntüye uygular
+
+    Args:
+        image: HxWx3 uint8 RGB
+        params: Efekt ayarları
+        out: Sonucun yazılacağı dizi (None ise yeni dizi)
+
+    Returns:
+        HxWx3 uint8 RGB
+    """
+    if params.is_identity:
+        if out is None:
+            return image.copy()
+        np.copyto(out, image)
+        return out
+
+    matrix = color_matrix(params, mean_luma(image) if params.contrast != 1.0 else 0.0)
+    result = cv2.transform(image, matrix, dst=out)
+
+    if params.vignette:
+        h, w = result.shape[:2]
+        cv2.multiply(result, vignette_mask(w, h, params.vignette_strength), dst=result, scale=1 / 255)
+
+    return result
+
+
+def _benchmark(iterations: int = 30):
+    """Eski PIL zinciri ile birleşik işlem hattının karşılaştırması (1280x720)"""
+    from PIL import Image, ImageEnhance
+
+    rng = np.random.default_rng(0)
+    image = rng.integers(40, 200, (720, 1280, 3), dtype=np.uint8)
+    params = EffectParams(brightness=1.1, contrast=1.2, saturation=1.3,
+                          overlay_color="#FF0000", overlay_opacity=0.3, vignette=True)
+
+    def legacy(arr):
+        pil = Image.fromarray(arr)
+        pil = ImageEnhance.Brightness(pil).enhance(params.brightness)
+        pil = ImageEnhance.Contrast(pil).enhance(params.contrast)
+        pil = ImageEnhance.Color(pil).enhance(params.saturation)
+        overlay = Image.new('RGBA', pil.size, params.overlay_color)
+        overlay.putalpha(int(255 * params.overlay_opacity))
+        pil = Image.alpha_composite(pil.convert('RGBA'), overlay).convert('RGB')
+        w, h = pil.size
+        x, y = np.meshgrid(np.linspace(-1, 1, w), np.linspace(-1, 1, h))
+        vignette = 1 - np.clip(np.sqrt(x**2 + y**2) * 0.7, 0, 1) * 0.5
+        out = np.array(pil).astype(float)
+        for i in range(3):
+            out[:, :, i] *= vignette
+        return np.clip(out, 0, 255).astype(np.uint8)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        expected = legacy(image)
+    legacy_ms = (time.perf_counter() - start) / iterations * 1000
+
+    out = np.empty_like(image)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        apply_effects(image, params, out=out)
+    fused_ms = (time.perf_counter() - start) / iterations * 1000
+
+    diff = np.abs(expected.astype(np.int16) - out.astype(np.int16))
+    print(f"Eski (PIL):  {legacy_ms:.1f} ms/görüntü")
+    print(f"Birleşik:    {fused_ms:.1f} ms/görüntü ({legacy_ms / fused_ms:.1f}x)")
+    print(f"Fark:        maks {diff.max()}, ortalama {diff.mean():.2f} (0-255)")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
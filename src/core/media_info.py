@@ -0,0 +1,426 @@
+"""
+LinuxShorts Pro - Media Info
+Dosya başına tek ffprobe çağrısıyla video metadata servisi
+
+- Tek süreç: -show_streams -show_format -of json (+ ilk saniyelerin video
+  paketleri; keyframe aralığı için)
+- Sonuç dosya parmak izine göre bellekte ve ~/.linuxshorts/probes altında
+  saklanır; aynı video için ikinci ffprobe çalışmaz
+- Değiştirilemez (frozen) VideoInfo: ses akışları, döndürme, VFR tespiti,
+  keyframe aralığı
+- ffprobe yoksa OpenCV ile temel bilgiler (genişlik, yükseklik, fps, süre)
+"""
+
+import importlib.util
+import json
+import os
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional, Tuple
+
+from utils.logger import get_logger
+from utils.cache import cache_path, file_fingerprint
+from .process_runner import run_process
+from .capabilities import tool_available
+
+logger = get_logger("LinuxShorts.MediaInfo")
+
+# cv2 sadece ffprobe yoksa gerekir: içe aktarmayı (~200 ms) o ana bırak
+OPENCV_AVAILABLE = importlib.util.find_spec("cv2") is not None
+
+
+# Keyframe aralığı için okunacak süre (sn) - tüm dosyayı okumamak için
+KEYFRAME_PROBE_SECONDS = 30
+
+# Ortalama ve nominal fps bu orandan fazla farklıysa VFR kabul edilir
+VFR_TOLERANCE = 0.01
+
+# Bellekte tutulan probe sonucu
+MEMORY_CACHE_SIZE = 32
+
+# Disk kaydı formatı değişirse eski kayıtlar yok sayılır
+PROBE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class AudioStream:
+    """Ses akışı bilgileri"""
+    index: int
+    codec: str
+    sample_rate: int
+    channels: int
+    channel_layout: str = ""
+    language: str = ""
+    bit_rate: int = 0
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """
+    Video bilgileri (değiştirilemez)
+
+    width/height döndürme uygulanmış (ekranda görünen) boyutlardır;
+    OpenCV ve ffmpeg frame'leri de bu boyutta verir.
+    """
+    duration: float  # Saniye cinsinden
+    width: int
+    height: int
+    fps: float
+    codec: str
+    file_path: Path
+    coded_width: int = 0
+    coded_height: int = 0
+    rotation: int = 0               # Saat yönünde derece (0/90/180/270)
+    pix_fmt: str = ""
+    bit_rate: int = 0
+    frame_count: int = 0
+    nominal_fps: float = 0.0        # r_frame_rate (fps = avg_frame_rate)
+    is_vfr: bool = False
+    keyframe_interval: Optional[float] = None   # Medyan keyframe aralığı (sn)
+    start_time: float = 0.0
+    container: str = ""
+    size: int = 0
+    audio_streams: Tuple[AudioStream, ...] = ()
+    source: str = "ffprobe"         # ffprobe / opencv
+
+    @property
+    def has_audio(self) -> bool:
+        return bool(self.audio_streams)
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self.width / self.height if self.height else 0.0
+
+    @property
+    def frame_duration(self) -> float:
+        return 1.0 / self.fps if self.fps > 0 else 0.0
+
+
+# ========================================
+# PARSE
+# ========================================
+
+def _parse_rate(value: Optional[str]) -> float:
+    """"30000/1001" → 29.97 ("0/0" → 0)"""
+    if not value:
+        return 0.0
+    try:
+        if "/" in value:
+            num, den = value.split("/", 1)
+            return float(num) / float(den) if float(den) else 0.0
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _to_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _rotation(stream: dict) -> int:
+    """Display matrix veya eski 'rotate' etiketinden saat yönünde döndürme"""
+    degrees = 0.0
+    for side_data in stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            # Display matrix açısı saat yönünün tersine
+            degrees = -_to_float(side_data["rotation"])
+            break
+    else:
+        degrees = _to_float(stream.get("tags", {}).get("rotate"))
+    return int(round(degrees / 90.0)) % 4 * 90
+
+
+def _keyframe_interval(packets: list, stream_index: int) -> Optional[float]:
+    """Okunan paketlerdeki keyframe'ler arası medyan süre"""
+    times = sorted(
+        _to_float(p["pts_time"]) for p in packets
+        if p.get("stream_index") == stream_index and "K" in p.get("flags", "") and "pts_time" in p
+    )
+    gaps = [b - a for a, b in zip(times, times[1:]) if b > a]
+    return statistics.median(gaps) if gaps else None
+
+
+def parse_ffprobe(data: dict, video_path: Path) -> VideoInfo:
+    """
+    ffprobe JSON çıktısından VideoInfo
+
+    Raises:
+        RuntimeError: Video akışı yoksa
+    """
+    streams = data.get("streams", [])
+    fmt = data.get("format", {})
+    video = next((s for s in streams if s.get("codec_type") == "video"
+                  and not s.get("disposition", {}).get("attached_pic")), None)
+    if video is None:
+        raise RuntimeError("Video stream bulunamadı. Bu dosya video içermiyor olabilir.")
+
+    coded_w, coded_h = _to_int(video.get("width")), _to_int(video.get("height"))
+    rotation = _rotation(video)
+    width, height = (coded_h, coded_w) if rotation in (90, 270) else (coded_w, coded_h)
+
+    nominal = _parse_rate(video.get("r_frame_rate"))
+    average = _parse_rate(video.get("avg_frame_rate"))
+    fps = average or nominal or 30.0
+    is_vfr = bool(nominal and average and abs(nominal - average) / nominal > VFR_TOLERANCE)
+
+    duration = _to_float(fmt.get("duration")) or _to_float(video.get("duration"))
+    frame_count = _to_int(video.get("nb_frames")) or int(round(duration * fps))
+
+    audio = tuple(
+        AudioStream(
+            index=_to_int(s.get("index")),
+            codec=s.get("codec_name", ""),
+            sample_rate=_to_int(s.get("sample_rate")),
+            channels=_to_int(s.get("channels")),
+            channel_layout=s.get("channel_layout", ""),
+            language=s.get("tags", {}).get("language", ""),
+            bit_rate=_to_int(s.get("bit_rate")),
+        )
+        for s in streams if s.get("codec_type") == "audio"
+    )
+
+    return VideoInfo(
+        duration=duration,
+        width=width,
+        height=height,
+        fps=fps,
+        codec=video.get("codec_name", ""),
+        file_path=Path(video_path),
+        coded_width=coded_w,
+        coded_height=coded_h,
+        rotation=rotation,
+        pix_fmt=video.get("pix_fmt", ""),
+        bit_rate=_to_int(video.get("bit_rate")) or _to_int(fmt.get("bit_rate")),
+        frame_count=frame_count,
+        nominal_fps=nominal,
+        is_vfr=is_vfr,
+        keyframe_interval=_keyframe_interval(data.get("packets", []), _to_int(video.get("index"))),
+        start_time=_to_float(fmt.get("start_time")),
+        container=fmt.get("format_name", ""),
+        size=_to_int(fmt.get("size")),
+        audio_streams=audio,
+    )
+
+
+# ========================================
+# SERVİS
+# ========================================
+
+class MediaProbe:
+    """Parmak izi ile memoize edilen ffprobe servisi (thread-safe)"""
+
+    def __init__(self, ffprobe_path: str = "ffprobe", use_disk_cache: bool = True):
+        self.ffprobe_path = ffprobe_path
+        self.use_disk_cache = use_disk_cache
+        self._memory: "OrderedDict[str, VideoInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.probe_count = 0    # Gerçekten çalıştırılan ffprobe sayısı
+
+    def build_command(self, video_path: Path) -> list:
+        """Akışlar + format + ilk KEYFRAME_PROBE_SECONDS saniyenin paketleri"""
+        return [
+            self.ffprobe_path, "-v", "error",
+            "-show_streams", "-show_format",
+            "-show_entries", "packet=stream_index,pts_time,flags",
+            "-read_intervals", f"%+{KEYFRAME_PROBE_SECONDS}",
+            "-of", "json",
+            str(video_path),
+        ]
+
+    def get(self, video_path: Path) -> VideoInfo:
+        """
+        Video bilgileri (cache'te yoksa tek ffprobe çağrısı)
+
+        Args:
+            video_path: Video dosyası
+
+        Returns:
+            VideoInfo
+
+        Raises:
+            FileNotFoundError: Dosya yoksa
+            RuntimeError: Bilgi alınamadıysa
+        """
+        video_path = Path(video_path)
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video bulunamadı: {video_path}")
+
+        key = file_fingerprint(video_path)
+        with self._lock:
+            info = self._memory.get(key)
+            if info is not None:
+                self._memory.move_to_end(key)
+                return self._with_path(info, video_path)
+
+        info = self._load(video_path)
+        if info is None:
+            info = self._probe(video_path)
+
+        with self._lock:
+            self._memory[key] = info
+            while len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+        return info
+
+    def invalidate(self, video_path: Optional[Path] = None):
+        """Bellek cache'ini temizle (None ise tümü)"""
+        with self._lock:
+            if video_path is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(file_fingerprint(video_path), None)
+
+    @staticmethod
+    def _with_path(info: VideoInfo, video_path: Path) -> VideoInfo:
+        # Aynı dosyaya farklı yolla (symlink, göreli yol) erişilmiş olabilir
+        if info.file_path == video_path:
+            return info
+        return replace(info, file_path=video_path)
+
+    def _load(self, video_path: Path) -> Optional[VideoInfo]:
+        """Diskteki ham ffprobe çıktısından (parser değişse de geçerli kalır)"""
+        if not self.use_disk_cache:
+            return None
+        try:
+            data = json.loads(cache_path("probes", video_path, ".json").read_text(encoding="utf-8"))
+            if data.get("version") != PROBE_VERSION:
+                return None
+            return parse_ffprobe(data, video_path)
+        except (OSError, ValueError, RuntimeError):
+            return None
+
+    def _save(self, video_path: Path, data: dict):
+        if not self.use_disk_cache:
+            return
+        path = cache_path("probes", video_path, ".json")
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps({**data, "version": PROBE_VERSION}), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Probe kaydı yazılamadı: {e}")
+
+    def _probe(self, video_path: Path) -> VideoInfo:
+        if not tool_available(self.ffprobe_path):
+            if OPENCV_AVAILABLE:
+                return _probe_opencv(video_path)
+            raise RuntimeError("ffprobe bulunamadı (sudo apt install ffmpeg)")
+
+        start = time.perf_counter()
+        result = run_process(self.build_command(video_path), capture_output=True, text=True, timeout=60)
+        self.probe_count += 1
+        if result.returncode != 0:
+            raise RuntimeError(f"Video bilgisi alınamadı: {result.stderr.strip()}")
+        try:
+            data = json.loads(result.stdout)
+        except ValueError as e:
+            raise RuntimeError(f"ffprobe çıktısı okunamadı: {e}")
+
+        # Paket listesi sadece keyframe'ler için gerekli; diske küçük yaz
+        data["packets"] = [p for p in data.get("packets", []) if "K" in p.get("flags", "")]
+        info = parse_ffprobe(data, video_path)
+        self._save(video_path, data)
+
+        logger.debug("ffprobe: %s (%.0f ms)", video_path.name, (time.perf_counter() - start) * 1000)
+        return info
+
+
+def _probe_opencv(video_path: Path) -> VideoInfo:
+    """ffprobe yoksa: OpenCV'nin verebildiği temel bilgiler"""
+    import cv2
+
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        if not cap.isOpened():
+            raise RuntimeError(f"Video açılamadı: {video_path}")
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    finally:
+        cap.release()
+
+    codec = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ").lower()
+    return VideoInfo(
+        duration=frame_count / fps if fps > 0 else 0.0,
+        width=width,
+        height=height,
+        fps=fps,
+        codec=codec,
+        file_path=Path(video_path),
+        coded_width=width,
+        coded_height=height,
+        frame_count=frame_count,
+        nominal_fps=fps,
+        size=Path(video_path).stat().st_size,
+        source="opencv",
+    )
+
+
+# ========================================
+# PAYLAŞILAN SERVİS
+# ========================================
+
+_default_probe: Optional[MediaProbe] = None
+_default_lock = threading.Lock()
+
+
+def get_media_probe() -> MediaProbe:
+    """Uygulama genelinde tek MediaProbe (tüm modüller aynı cache'i kullanır)"""
+    global _default_probe
+    with _default_lock:
+        if _default_probe is None:
+            _default_probe = MediaProbe()
+        return _default_probe
+
+
+def probe_video(video_path: Path) -> VideoInfo:
+    """Paylaşılan servis üzerinden video bilgileri"""
+    return get_media_probe().get(video_path)
+
+
+def _benchmark(video_path: str = None, repeats: int = 20):
+    """İlk probe ile memoize edilmiş çağrıların karşılaştırması"""
+    import sys
+
+    if video_path is None:
+        if len(sys.argv) < 2:
+            print("Kullanım: python -m core.media_info <video>")
+            return
+        video_path = sys.argv[1]
+    probe = MediaProbe(use_disk_cache=False)
+
+    start = time.perf_counter()
+    info = probe.get(Path(video_path))
+    first_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        probe.get(Path(video_path))
+    cached_ms = (time.perf_counter() - start) / repeats * 1000
+
+    print(f"{info.width}x{info.height} {info.fps:.2f}fps {info.duration:.1f}s codec={info.codec} "
+          f"rot={info.rotation} vfr={info.is_vfr} gop={info.keyframe_interval} "
+          f"ses={len(info.audio_streams)} ({info.source})")
+    print(f"İlk probe:  {first_ms:.1f} ms ({probe.probe_count} ffprobe süreci)")
+    print(f"Cache'ten:  {cached_ms:.3f} ms/çağrı")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,466 @@
+"""
+LinuxShorts Pro - Process Runner
+ffmpeg / ffprobe / whisper süreçleri için asyncio tabanlı orkestrasyon
+
+- Tüm harici araçlar tek bir arka plan event loop'unda çalışır
+  (GUI'den açılan her iş için ayrı bekleyen thread yok)
+- Araç sınıfı başına semaphore: aynı anda en fazla N ffmpeg, M ffprobe,
+  1 whisper; fazlası sırada bekler
+- stderr satırları (ffmpeg'in \\r ile yazdığı ilerleme satırları dahil)
+  async olarak okunur; callback veya async iterator ile alınır
+- İş başına timeout ve CancelToken desteği (süreç grubu öldürülür)
+- Sonuç: ProcessResult (dönüş kodu, çıktılar, süre, timeout/iptal bilgisi)
+- Mevcut senkron çağıranlar için run_process() cephesi
+  (subprocess.run ile aynı imza ve istisnalar)
+"""
+
+import asyncio
+import os
+import re
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+
+from utils.logger import get_logger
+from utils.tracing import span
+from .cancellation import KILL_GRACE, CancelToken, CancelledError
+
+logger = get_logger("LinuxShorts.Process")
+
+
+# Araç sınıfı başına eşzamanlı süreç sınırı
+DEFAULT_LIMITS: Dict[str, int] = {
+    "ffmpeg": max(1, (os.cpu_count() or 2) // 2),   # Her ffmpeg zaten çok thread'li
+    "ffprobe": 4,
+    "whisper": 1,                                   # Model belleği büyük
+    "proxy": 1,                                     # Uzun proxy transcode'u ffmpeg slotlarını tutmaz
+    "default": 2,
+}
+
+# stderr satır ayırıcıları (ffmpeg ilerlemeyi \r ile günceller)
+_LINE_SPLIT = re.compile(rb"[\r\n]+")
+
+_TIME_RE = re.compile(r"time=(-?\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
+def tool_class(cmd: List[str]) -> str:
+    """Komutun araç sınıfı (binary adına göre)"""
+    name = Path(str(cmd[0])).name.lower() if cmd else ""
+    for tool in ("ffprobe", "ffmpeg", "whisper"):
+        if name.startswith(tool):
+            return tool
+    return "default"
+
+
+def ffmpeg_progress(line: str) -> Optional[float]:
+    """ffmpeg stderr satırındaki "time=HH:MM:SS.xx" değeri (saniye)"""
+    match = _TIME_RE.search(line)
+    if not match:
+        return None
+    h, m, s = match.groups()
+    return int(h) * 3600 + int(m) * 60 + float(s)
+
+
+@dataclass
+class ProcessResult:
+    """Harici süreç sonucu"""
+    args: List[str]
+    returncode: Optional[int]
+    stdout: Union[str, bytes, None] = None
+    stderr: Union[str, bytes, None] = None
+    elapsed: float = 0.0
+    tool: str = "default"
+    timed_out: bool = False
+    cancelled: bool = False
+    queued: float = 0.0         # Semaphore'da bekleme süresi (sn)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def completed(self) -> subprocess.CompletedProcess:
+        return subprocess.CompletedProcess(self.args, self.returncode, self.stdout, self.stderr)
+
+    def check(self) -> "ProcessResult":
+        """Sıfırdan farklı çıkışta CalledProcessError"""
+        if self.returncode != 0:
+            raise subprocess.CalledProcessError(self.returncode, self.args, self.stdout, self.stderr)
+        return self
+
+
+class ProcessRunner:
+    """
+    Tek event loop'lu süreç orkestratörü
+
+    Loop ilk kullanımda daemon bir thread'de başlar. Coroutine'ler
+    submit() ile her thread'den gönderilebilir; run() senkron cephedir.
+    line_callback'ler loop thread'inde çağrılır (GUI'ye after() ile geçilmeli).
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    # ========================================
+    # EVENT LOOP
+    # ========================================
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=serve, name="LinuxShorts-ProcessLoop", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro) -> Future:
+        """Coroutine'i loop'ta çalıştır (concurrent.futures.Future döner)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(tool)
+        if semaphore is None:
+            limit = self.limits.get(tool, self.limits["default"])
+            semaphore = self._semaphores[tool] = asyncio.Semaphore(limit)
+        return semaphore
+
+    @asynccontextmanager
+    async def _slot(self, tool: str):
+        semaphore = self._semaphore(tool)
+        await semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @contextmanager
+    def slot(self, tool: str):
+        """
+        Senkron kod için araç slotu (kendi Popen'ını yöneten streaming işler)
+
+        Slot süresince aynı sınıftaki diğer işler sınır aşılırsa bekler.
+        """
+        semaphore_future = self.submit(self._acquire(tool))
+        semaphore = semaphore_future.result()
+        try:
+            yield
+        finally:
+            self.loop.call_soon_threadsafe(semaphore.release)
+
+    async def _acquire(self, tool: str) -> asyncio.Semaphore:
+        semaphore = self._semaphore(tool)
+        await semaphore.acquire()
+        return semaphore
+
+    # ========================================
+    # SÜREÇ ÇALIŞTIRMA
+    # ========================================
+
+    async def run_async(self, cmd: List[str], tool: Optional[str] = None,
+                        timeout: Optional[float] = None, cancel: Optional[CancelToken] = None,
+                        line_callback: Optional[Callable[[str], None]] = None,
+                        capture_output: bool = True, text: bool = True,
+                        input: Optional[bytes] = None, **kwargs) -> ProcessResult:
+        """
+        Süreci çalıştır ve bitmesini bekle
+
+        Args:
+            cmd: Komut
+            tool: Araç sınıfı (None ise binary adından)
+            timeout: Saniye (aşılırsa süreç grubu öldürülür, timed_out=True)
+            cancel: İptal token'ı (iptalde süreç grubu öldürülür, cancelled=True)
+            line_callback: Her stderr satırı için (loop thread'inde çağrılır)
+            capture_output: stdout/stderr'i sonuca al
+            text: Çıktıları str olarak çöz
+            input: stdin'e yazılacak veri
+            **kwargs: cwd, env, stdout, stderr (capture_output=False iken)
+
+        Returns:
+            ProcessResult
+        """
+        tool = tool or tool_class(cmd)
+        queued_at = time.perf_counter()
+        async with self._slot(tool):
+            if cancel is not None and cancel.cancelled:
+                return ProcessResult(list(cmd), None, tool=tool, cancelled=True)
+            queued = time.perf_counter() - queued_at
+
+            stdout = kwargs.pop("stdout", None)
+            stderr = kwargs.pop("stderr", None)
+            if capture_output:
+                stdout = stderr = subprocess.PIPE
+            elif line_callback is not None:
+                stderr = subprocess.PIPE
+            start = time.perf_counter()
+            process = await asyncio.create_subprocess_exec(
+                *[str(c) for c in cmd],
+                stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                stdout=stdout, stderr=stderr, start_new_session=True, **kwargs,
+            )
+            self._processes.add(process)
+
+            # İptal thread'den gelir; loop'a event olarak aktarılır
+            stop = asyncio.Event()
+            on_cancel = None
+            if cancel is not None:
+                loop = asyncio.get_running_loop()
+                on_cancel = lambda: loop.call_soon_threadsafe(stop.set)
+                cancel.on_cancel(on_cancel)
+
+            io_task = asyncio.ensure_future(self._communicate(process, input, line_callback, text))
+            stop_task = asyncio.ensure_future(stop.wait())
+            try:
+                done, _ = await asyncio.wait({io_task, stop_task}, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                timed_out = not done
+                cancelled = stop_task in done and io_task not in done
+                if timed_out or cancelled:
+                    await self._terminate(process)
+                out, err = await io_task
+            finally:
+                stop_task.cancel()
+                if not io_task.done():
+                    io_task.cancel()
+                if process.returncode is None:
+                    await self._terminate(process)
+                self._processes.discard(process)
+                if on_cancel is not None:
+                    cancel.remove_callback(on_cancel)
+
+        if text:
+            out = out.decode("utf-8", "replace") if out is not None else None
+            err = err.decode("utf-8", "replace") if err is not None else None
+        return ProcessResult(
+            args=list(cmd), returncode=process.returncode, stdout=out, stderr=err,
+            elapsed=time.perf_counter() - start, tool=tool,
+            timed_out=timed_out, cancelled=cancelled, queued=queued,
+        )
+
+    async def _communicate(self, process, input: Optional[bytes],
+                           line_callback: Optional[Callable[[str], None]], text: bool):
+        """stdin yaz, stdout'u topla, stderr'i satır satır oku, çıkışı bekle"""
+        async def feed():
+            if input is not None:
+                process.stdin.write(input if isinstance(input, bytes) else input.encode())
+                await process.stdin.drain()
+                process.stdin.close()
+
+        async def read_stdout():
+            return await process.stdout.read() if process.stdout is not None else None
+
+        async def read_stderr():
+            if process.stderr is None:
+                return None
+            chunks = []
+            async for line in _iter_lines(process.stderr):
+                chunks.append(line)
+                if line_callback is not None:
+                    try:
+                        line_callback(line.decode("utf-8", "replace"))
+                    except Exception as e:
+                        logger.warning(f"Satır callback hatası: {e}")
+            return b"\n".join(chunks) + (b"\n" if chunks else b"")
+
+        _, out, err = await asyncio.gather(feed(), read_stdout(), read_stderr())
+        await process.wait()
+        return out, err
+
+    async def _terminate(self, process, grace: float = KILL_GRACE):
+        """Süreç grubuna SIGTERM, gerekirse SIGKILL"""
+        if process.returncode is not None:
+            return
+
+        def send(sig):
+            try:
+                os.killpg(process.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+        send(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), grace)
+        except asyncio.TimeoutError:
+            send(signal.SIGKILL)
+            await process.wait()
+
+    async def iter_lines(self, cmd: List[str], check: bool = True, **kwargs) -> AsyncIterator[str]:
+        """
+        stderr satırlarını async olarak üret (ilerleme takibi için)
+
+        Kullanım:
+            async for line in runner.iter_lines(cmd):
+                seconds = ffmpeg_progress(line)
+
+        Raises:
+            CalledProcessError: check=True ve süreç başarısızsa
+            CancelledError: Token iptal edildiyse
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(self.run_async(cmd, line_callback=queue.put_nowait, **kwargs))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                yield line
+            result = await task
+        finally:
+            if not task.done():
+                task.cancel()
+        if result.cancelled:
+            raise CancelledError(" ".join(cmd[:1]))
+        if check:
+            result.check()
+
+    def run(self, cmd: List[str], **kwargs) -> ProcessResult:
+        """Senkron cephe: run_async'i loop'ta çalıştırıp sonucu bekle"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("ProcessRunner.run loop thread'inden çağrılamaz (run_async kullanın)")
+        return self.submit(self.run_async(cmd, **kwargs)).result()
+
+    def shutdown(self):
+        """Çalışan tüm süreçleri öldür ve loop'u durdur (uygulama kapanırken)"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None or loop.is_closed():
+            return
+
+        async def stop_all():
+            await asyncio.gather(*(self._terminate(p) for p in list(self._processes)),
+                                 return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(stop_all(), loop).result(timeout=KILL_GRACE * 4)
+        except Exception as e:
+            logger.warning(f"Süreçler durdurulamadı: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._semaphores.clear()
+
+
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """\\r veya \\n ile biten satırlar (boş satırlar atlanır)"""
+    buffer = b""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            break
+        parts = _LINE_SPLIT.split(buffer + chunk)
+        buffer = parts.pop()
+        for part in parts:
+            if part:
+                yield part
+    if buffer:
+        yield buffer
+
+
+# ========================================
+# PAYLAŞILAN RUNNER + SENKRON CEPHE
+# ========================================
+
+_default_runner: Optional[ProcessRunner] = None
+_default_lock = threading.Lock()
+
+
+def get_runner() -> ProcessRunner:
+    """Uygulama genelinde tek ProcessRunner"""
+    global _default_runner
+    with _default_lock:
+        if _default_runner is None:
+            _default_runner = ProcessRunner()
+        return _default_runner
+
+
+def run_process(cmd: List[str], cancel: Optional[CancelToken] = None,
+                timeout: Optional[float] = None, check: bool = False,
+                capture_output: bool = False, text: bool = False,
+                line_callback: Optional[Callable[[str], None]] = None,
+                **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run karşılığı (paylaşılan runner üzerinden)
+
+    Args:
+        cmd: Komut
+        cancel: İptal token'ı
+        timeout: Saniye (aşılırsa süreç grubu öldürülür, TimeoutExpired)
+        check: Sıfırdan farklı çıkışta CalledProcessError
+        capture_output, text: subprocess.run ile aynı
+        line_callback: Her stderr satırı için (loop thread'inde)
+
+    Returns:
+        CompletedProcess
+
+    Raises:
+        CancelledError: Token iptal edildiyse
+        subprocess.TimeoutExpired: Zaman aşımında
+        FileNotFoundError: Binary bulunamazsa
+    """
+    tool = kwargs.pop("tool", None) or tool_class(cmd)
+    # Çağıran thread'in beklediği süre (kuyruk + süreç); işin trace'ine yazılır
+    with span(f"subprocess.{tool}", "subprocess") as wait:
+        result = get_runner().run(cmd, tool=tool, cancel=cancel, timeout=timeout,
+                                  line_callback=line_callback, capture_output=capture_output,
+                                  text=text, **kwargs)
+        wait.set(queued_ms=round(result.queued * 1000, 1), returncode=result.returncode)
+    if result.cancelled:
+        raise CancelledError(cancel.name if cancel is not None else "")
+    if result.timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout, result.stdout, result.stderr)
+    if check:
+        result.check()
+    return result.completed()
+
+
+def _benchmark(jobs: int = 12, job_seconds: float = 0.2):
+    """Sınırlı eşzamanlılık: 12 iş, 'ffmpeg' sınıfında N slot"""
+    import sys
+
+    runner = ProcessRunner(limits={"default": 3})
+    cmd = [sys.executable, "-c", f"import time, sys; time.sleep({job_seconds}); "
+                                 f"sys.stderr.write('time=00:00:01.00\\rdone\\n')"]
+
+    async def all_jobs():
+        return await asyncio.gather(*(runner.run_async(cmd) for _ in range(jobs)))
+
+    start = time.perf_counter()
+    results = runner.submit(all_jobs()).result()
+    elapsed = time.perf_counter() - start
+    assert all(r.ok for r in results)
+    lines = results[0].stderr.splitlines()
+    print(f"{jobs} iş, 3 slot: {elapsed:.2f} sn (sırayla {jobs * job_seconds:.1f} sn, "
+          f"sınırsız ~{job_seconds:.1f} sn); stderr satırları: {lines}")
+    print(f"En uzun kuyruk bekleme: {max(r.queued for r in results):.2f} sn")
+
+    result = runner.run([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.3)
+    print(f"Timeout: timed_out={result.timed_out}, {result.elapsed:.2f} sn")
+
+    token = CancelToken("benchmark")
+    threading.Timer(0.2, token.cancel).start()
+    result = runner.run([sys.executable, "-c", "import time; time.sleep(10)"], cancel=token)
+    print(f"İptal: cancelled={result.cancelled}, {result.elapsed:.2f} sn")
+    runner.shutdown()
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
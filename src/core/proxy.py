@@ -0,0 +1,283 @@
+"""
+LinuxShorts Pro - Proxy (Mezzanine) Videolar
+4K / HEVC / uzun GOP kaynaklarda akıcı önizleme için düşük çözünürlüklü kopya
+
+- Kaynak bir kez 640 px'e (uzun kenar), sadece I-frame'li x264'e çevrilir
+  (-g 1): her seek tek kare decode eder, GOP başından başlamaz
+- Kare zamanları aynen korunur (-vsync passthrough); kare indexleri ve
+  FrameTimeline kaynak ile proxy arasında birebir geçerlidir
+- Proxy'ler ~/.linuxshorts/proxies altında kaynak parmak iziyle cache'lenir
+- Editör, thumbnail ve analiz önizlemeleri proxy hazırsa onu okur;
+  final export her zaman orijinal dosyayı kullanır
+- Seek gecikmesi kaynak/proxy ayrımıyla ölçülür (SeekStats)
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+from utils.logger import get_logger
+from utils.cache import cache_path
+from .cancellation import CancelToken, CancelledError
+from .process_runner import ffmpeg_progress, run_process
+from .capabilities import tool_available
+
+logger = get_logger("LinuxShorts.Proxy")
+
+try:
+    from .media_info import VideoInfo, probe_video
+except ImportError:
+    VideoInfo = None
+    probe_video = None
+
+
+# Proxy formatı değişirse eski proxy'ler yeniden üretilir
+PROXY_VERSION = 1
+
+# Proxy'nin uzun kenarı (px)
+PROXY_SIZE = 640
+
+# Decode'u pahalı codec'ler (yazılım decode'da kare başına yavaş)
+HEAVY_CODECS = {"hevc", "h265", "av1", "vp9"}
+
+# Bu çözünürlüğün üstü (uzun kenar) proxy ile düzenlenir
+MAX_DIRECT_SIZE = 1920
+
+# Bu aralıktan seyrek keyframe'li (sn) kaynaklarda seek uzun sürer
+LONG_GOP_SECONDS = 2.0
+
+
+def proxy_reason(info: "VideoInfo") -> Optional[str]:
+    """
+    Video için proxy gerekip gerekmediği
+
+    Returns:
+        Gerekçe metni (ör. "hevc", "3840x2160") veya gerekmiyorsa None
+    """
+    reasons = []
+    if (info.codec or "").lower() in HEAVY_CODECS:
+        reasons.append(info.codec.lower())
+    if max(info.width, info.height) > MAX_DIRECT_SIZE:
+        reasons.append(f"{info.width}x{info.height}")
+    if info.keyframe_interval and info.keyframe_interval > LONG_GOP_SECONDS:
+        reasons.append(f"GOP {info.keyframe_interval:.1f} sn")
+    return ", ".join(reasons) or None
+
+
+class SeekStats:
+    """Rastgele seek gecikmeleri (kaynak ve proxy ayrı, son N örnek)"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Dict[str, Deque[float]] = {
+            "source": deque(maxlen=window),
+            "proxy": deque(maxlen=window),
+        }
+
+    def record(self, kind: str, seconds: float):
+        self._samples[kind].append(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """{"source"|"proxy": {"count", "mean_ms", "p95_ms"}} (örneği olanlar)"""
+        result = {}
+        for kind, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[kind] = {
+                "count": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered) * 1000,
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            }
+        return result
+
+
+class ProxyManager:
+    """
+    Proxy üretimi ve cache'i
+
+    Aynı kaynak için eşzamanlı ensure() çağrıları tek ffmpeg çalıştırır;
+    ikinci çağıran ilkini bekler ve hazır proxy'yi alır (ilki iptal
+    edildiyse kendisi üretir).
+    """
+
+    def __init__(self, ffmpeg_path: str = "ffmpeg"):
+        self.ffmpeg_path = ffmpeg_path
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path_for(self, video_path: Path) -> Path:
+        return cache_path("proxies", video_path, f".v{PROXY_VERSION}.mp4")
+
+    def ready(self, video_path: Path) -> Optional[Path]:
+        """Hazır proxy yolu (yoksa None; hiçbir zaman üretmez)"""
+        try:
+            path = self.path_for(video_path)
+        except OSError:
+            return None
+        return path if path.exists() else None
+
+    def build_command(self, video_path: Path, output_path: Path) -> List[str]:
+        # Yatay videoda genişlik, dikeyde yükseklik PROXY_SIZE'a iner (büyütülmez)
+        scale = (f"scale=w='if(gte(iw,ih),min({PROXY_SIZE},iw),-2)'"
+                 f":h='if(gte(iw,ih),-2,min({PROXY_SIZE},ih))'")
+        return [
+            self.ffmpeg_path, "-hide_banner", "-nostdin", "-y",
+            "-i", str(video_path),
+            "-map", "0:v:0", "-map", "0:a:0?",
+            "-vf", scale,
+            "-vsync", "passthrough",
+            "-c:v", "libx264", "-preset", "ultrafast", "-tune", "fastdecode",
+            "-g", "1", "-crf", "26", "-pix_fmt", "yuv420p",
+            "-c:a", "aac", "-b:a", "96k",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+
+    def ensure(self, video_path: Path, info: Optional["VideoInfo"] = None, force: bool = False,
+               progress_callback: Callable[[float], None] = None,
+               cancel: Optional[CancelToken] = None) -> Optional[Path]:
+        """
+        Proxy'yi hazırla (varsa cache'ten)
+
+        Args:
+            video_path: Kaynak video
+            info: Hazır VideoInfo (None ise probe edilir)
+            force: proxy_reason() None olsa da üret
+            progress_callback: 0-1 arası ilerleme (runner loop thread'inde çağrılır)
+            cancel: İptal token'ı (iptalde yarım proxy silinir)
+
+        Returns:
+            Proxy yolu; gerekmiyorsa veya üretilemediyse None
+
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
+        video_path = Path(video_path)
+        existing = self.ready(video_path)
+        if existing is not None:
+            return existing
+
+        if info is None and probe_video is not None:
+            info = probe_video(video_path)
+        reason = proxy_reason(info) if info is not None else None
+        if reason is None and not force:
+            return None
+        if not tool_available(self.ffmpeg_path):
+            logger.warning("Proxy için ffmpeg bulunamadı")
+            return None
+
+        output_path = self.path_for(video_path)
+        with self._locks_guard:
+            lock = self._locks.setdefault(output_path.name, threading.Lock())
+        with lock:
+            if output_path.exists():
+                return output_path
+            return self._build(video_path, output_path, reason or "zorunlu",
+                               info.duration if info is not None else 0.0,
+                               progress_callback, cancel)
+
+    def _build(self, video_path: Path, output_path: Path, reason: str, duration: float,
+               progress_callback: Optional[Callable[[float], None]],
+               cancel: Optional[CancelToken]) -> Optional[Path]:
+        tmp = output_path.with_name(output_path.stem + ".part.mp4")
+        line_callback = None
+        if progress_callback is not None and duration > 0:
+            def line_callback(line: str):
+                seconds = ffmpeg_progress(line)
+                if seconds is not None:
+                    progress_callback(min(1.0, seconds / duration))
+
+        logger.info(f"Proxy üretiliyor ({reason}): {video_path.name}")
+        start = time.perf_counter()
+        try:
+            # Ayrı araç sınıfı: transcode boyunca export/filmstrip/analiz ffmpeg'leri beklemez
+            run_process(self.build_command(video_path, tmp), cancel=cancel, check=True,
+                        capture_output=True, text=True, line_callback=line_callback, tool="proxy")
+            os.replace(tmp, output_path)
+        except CancelledError:
+            tmp.unlink(missing_ok=True)
+            raise
+        except (subprocess.CalledProcessError, OSError) as e:
+            tmp.unlink(missing_ok=True)
+            stderr = getattr(e, "stderr", None) or str(e)
+            logger.warning(f"Proxy üretilemedi: {stderr.strip()[-200:]}")
+            return None
+
+        logger.info(f"Proxy hazır: {output_path.stat().st_size / 1024 / 1024:.1f} MB, "
+                    f"{time.perf_counter() - start:.1f} sn")
+        return output_path
+
+    def remove(self, video_path: Path):
+        """Kaynağın proxy'sini sil"""
+        path = self.ready(video_path)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+
+def preview_path(video_path: Path) -> Path:
+    """Önizleme için okunacak dosya (hazırsa proxy, değilse kaynak)"""
+    return get_proxy_manager().ready(video_path) or Path(video_path)
+
+
+_manager: Optional[ProxyManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_proxy_manager() -> ProxyManager:
+    """Uygulama genelinde tek ProxyManager"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ProxyManager()
+        return _manager
+
+
+def measure_seeks(path: Path, duration: float, seeks: int = 30, seed: int = 0) -> List[float]:
+    """Rastgele zamanlara seek + tek kare okuma süreleri (sn)"""
+    import random
+    import cv2
+
+    rng = random.Random(seed)
+    cap = cv2.VideoCapture(str(path))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    latencies = []
+    for _ in range(seeks):
+        start = time.perf_counter()
+        cap.set(cv2.CAP_PROP_POS_FRAMES, int(rng.uniform(0, duration) * fps))
+        cap.read()
+        latencies.append(time.perf_counter() - start)
+    cap.release()
+    return latencies
+
+
+def _benchmark(video_path: str = None):
+    """Kaynak ve proxy arasında rastgele seek gecikmesi"""
+    import sys
+
+    if video_path is None:
+        if len(sys.argv) < 2:
+            print("Kullanım: python -m core.proxy <video>")
+            return
+        video_path = sys.argv[1]
+    video_path = Path(video_path)
+    info = probe_video(video_path)
+    print(f"Kaynak: {info.width}x{info.height} {info.codec}, GOP {info.keyframe_interval} sn, "
+          f"proxy gerekçesi: {proxy_reason(info)}")
+
+    proxy = get_proxy_manager().ensure(video_path, info, force=True)
+    for name, path in (("kaynak", video_path), ("proxy", proxy)):
+        if path is None:
+            print(f"{name}: yok (ffmpeg gerekli)")
+            continue
+        latencies = sorted(measure_seeks(path, info.duration))
+        print(f"{name}: ortalama {sum(latencies) / len(latencies) * 1000:.1f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,480 @@
+"""
+LinuxShorts Pro - Segment Search
+Saniye başına özellik dizileri üzerinde en iyi Short kesitlerini arar
+
+- Ses yüksekliği, hareket, sahne yoğunluğu ve konuşma kapsamı saniyelik
+  dizilere (0-1) indirgenir; ağırlıklı toplamın prefix toplamı alınır,
+  herhangi bir pencerenin skoru O(1)'de hesaplanır
+- Kesit sınırları sessizliklere oturtulur: sessizlik içinde kesmek
+  ücretsiz, konuşmanın ortasında kesmek cezalıdır
+- Her başlangıç için [min, max] süre aralığındaki en iyi bitiş sparse
+  table (aralık maksimumu) ile bulunur: O(m log m)
+- En fazla K örtüşmeyen pencere, toplam değeri en büyükleyen dinamik
+  programlama ile seçilir: O(K·m), her adım tek numpy geçişi
+
+3 saatlik videoda (10 800 sn) arama 100 ms'nin altındadır.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger("LinuxShorts.SegmentSearch")
+
+
+# Özellik ağırlıkları (toplam 100; eksik özelliklerde kalanlar yeniden ölçeklenir)
+SEGMENT_WEIGHTS = {
+    "speech": 35.0,
+    "motion": 30.0,
+    "loudness": 20.0,
+    "scenes": 15.0,
+}
+
+FEATURE_LABELS = {
+    "speech": "Sürekli konuşma",
+    "motion": "Yoğun hareket",
+    "loudness": "Yüksek ses",
+    "scenes": "Dinamik içerik",
+}
+
+SCENE_RADIUS = 5.0       # Sahne yoğunluğu: ±5 sn içindeki kesme sayısı
+SCENE_SATURATION = 3.0   # Bu kadar kesme = yoğunluk 1.0
+CUT_PENALTY = 15.0       # Konuşma ortasında kesmenin bedeli (bu kadar saniyelik iyi içerik)
+BASELINE_QUANTILE = 0.25 # Bu yüzdelikten düşük saniyeler pencere değerini düşürür
+BASELINE_MARGIN = 1.0    # Tekdüze içerikte de (tüm skorlar eşit) pencere seçilebilsin
+
+
+Interval = Tuple[float, float]
+
+
+# ========================================
+# ÖZELLİK ZAMAN ÇİZELGESİ
+# ========================================
+
+def _bin_mean(times: np.ndarray, values: np.ndarray, count: int, step: float) -> np.ndarray:
+    """Zaman damgalı örnekleri saniye kutularına ortala; boş kutular enterpolasyonla dolar"""
+    index = np.clip((times / step).astype(np.int64), 0, count - 1)
+    sums = np.bincount(index, weights=values, minlength=count)
+    hits = np.bincount(index, minlength=count)
+    filled = hits > 0
+    if not filled.any():
+        return np.zeros(count)
+    centers = np.arange(count)
+    return np.interp(centers, centers[filled], sums[filled] / hits[filled])
+
+
+def _coverage(intervals: Sequence[Interval], edges: np.ndarray) -> np.ndarray:
+    """
+    Her [edges[i], edges[i+1]) kutusunun aralıklarla kaplanan oranı
+
+    Aralıklar sıralı ve örtüşmesiz varsayılır; O((n + m) log m).
+    """
+    if not len(intervals):
+        return np.zeros(len(edges) - 1)
+    starts = np.array([s for s, _ in intervals], dtype=np.float64)
+    ends = np.array([e for _, e in intervals], dtype=np.float64)
+    lengths = np.concatenate([[0.0], np.cumsum(ends - starts)])
+
+    # t anına kadar kaplanan toplam süre
+    k = np.searchsorted(starts, edges, side="right")
+    covered = lengths[k].copy()
+    open_ = k > 0
+    last = k[open_] - 1
+    covered[open_] -= np.maximum(ends[last] - edges[open_], 0.0)
+    return np.clip(np.diff(covered) / np.diff(edges), 0.0, 1.0)
+
+
+def _inside(intervals: Sequence[Interval], times: np.ndarray) -> np.ndarray:
+    """Her zamanın bir aralığın içinde (sınırlar dahil) olup olmadığı"""
+    if not len(intervals):
+        return np.zeros(len(times), dtype=bool)
+    starts = np.array([s for s, _ in intervals], dtype=np.float64)
+    ends = np.array([e for _, e in intervals], dtype=np.float64)
+    k = np.searchsorted(starts, times, side="right") - 1
+    valid = k >= 0
+    result = np.zeros(len(times), dtype=bool)
+    result[valid] = times[valid] <= ends[k[valid]]
+    return result
+
+
+@dataclass
+class FeatureTimeline:
+    """
+    Saniye başına özellik dizileri (0-1) ve kesit sınırları için sessizlikler
+
+    Sadece verisi olan özellikler features'ta bulunur.
+    """
+    duration: float
+    step: float = 1.0
+    features: Dict[str, np.ndarray] = field(default_factory=dict)
+    silences: List[Interval] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return max(1, int(np.ceil(self.duration / self.step)))
+
+    @property
+    def edges(self) -> np.ndarray:
+        edges = np.arange(self.count + 1, dtype=np.float64) * self.step
+        edges[-1] = max(self.duration, edges[-2] + 1e-6) if self.count > 0 else self.duration
+        return edges
+
+    @classmethod
+    def build(cls, duration: float, step: float = 1.0,
+              audio_levels: Optional[Sequence[Tuple[float, float]]] = None,
+              waveform=None,
+              motion_scores: Optional[Sequence[Tuple[float, float]]] = None,
+              scene_changes: Optional[Sequence[float]] = None,
+              speech: Optional[Sequence[Interval]] = None,
+              silences: Optional[Sequence[Interval]] = None) -> "FeatureTimeline":
+        """
+        Analiz çıktılarından zaman çizelgesi oluştur
+
+        Args:
+            duration: Video süresi (sn)
+            step: Kutu genişliği (sn)
+            audio_levels: [(zaman, dB)]; waveform varsa kullanılmaz
+            waveform: Waveform (core.waveform); saniyelik tepe seviyesinden ses yüksekliği
+            motion_scores: [(zaman, hareket yüzdesi)]
+            scene_changes: Sahne değişim zamanları
+            speech: Konuşma aralıkları; yoksa sessizliklerin tersi kullanılır
+            silences: Sessizlik aralıkları (kesit sınırları da bunlara oturur)
+        """
+        timeline = cls(float(duration), step, silences=sorted(silences or []))
+        count = timeline.count
+        edges = timeline.edges
+
+        if waveform is not None:
+            timeline.features["loudness"] = _waveform_loudness(waveform.pyramid, count, step)
+        elif audio_levels:
+            times, levels = np.asarray(audio_levels, dtype=np.float64).T
+            # frame_scorer.score_loudness ile aynı ölçek: -50 dB = 0, -10 dB = 1
+            timeline.features["loudness"] = np.clip((_bin_mean(times, levels, count, step) + 50.0) / 40.0, 0, 1)
+
+        if motion_scores:
+            times, motion = np.asarray(motion_scores, dtype=np.float64).T
+            # frame_scorer.score_motion ile aynı ölçek: %20 hareket = 1
+            timeline.features["motion"] = np.clip(_bin_mean(times, motion, count, step) / 20.0, 0, 1)
+
+        if scene_changes is not None and len(scene_changes) and duration > 0:
+            cuts = np.bincount(np.clip((np.asarray(scene_changes, dtype=np.float64) / step).astype(np.int64),
+                                       0, count - 1), minlength=count)
+            prefix = np.concatenate([[0], np.cumsum(cuts)])
+            radius = max(1, int(round(SCENE_RADIUS / step)))
+            centers = np.arange(count)
+            nearby = prefix[np.minimum(centers + radius + 1, count)] - prefix[np.maximum(centers - radius, 0)]
+            timeline.features["scenes"] = np.clip(nearby / SCENE_SATURATION, 0, 1)
+
+        if speech:
+            timeline.features["speech"] = _coverage(sorted(speech), edges)
+        elif silences is not None:
+            timeline.features["speech"] = 1.0 - _coverage(timeline.silences, edges)
+
+        return timeline
+
+    def combined(self, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Saniye başına 0-100 skor (eksik özelliklerin ağırlığı dağıtılır)"""
+        weights = {n: w for n, w in (weights or SEGMENT_WEIGHTS).items() if n in self.features}
+        total = np.zeros(self.count)
+        scale = sum(weights.values())
+        if scale <= 0:
+            return total
+        for name, weight in weights.items():
+            total += self.features[name] * (weight * 100.0 / scale)
+        return total
+
+
+def _waveform_loudness(pyramid, count: int, step: float) -> np.ndarray:
+    """Dalga formu seviye 0 min/max'ından saniyelik ortalama tepe seviyesi (0-1)"""
+    base = pyramid.level(0).astype(np.float64)
+    if not len(base):
+        return np.zeros(count)
+    peaks = np.maximum(np.abs(base[:, 0]), np.abs(base[:, 1])) / 32768.0
+    times = np.arange(len(base)) * pyramid.bin_duration(0)
+    db = 20.0 * np.log10(np.maximum(_bin_mean(times, peaks, count, step), 1e-5))
+    return np.clip((db + 50.0) / 40.0, 0, 1)
+
+
+# ========================================
+# ARAMA
+# ========================================
+
+@dataclass
+class SegmentWindow:
+    """Bulunan kesit"""
+    start: float
+    end: float
+    score: float                    # Penceredeki ortalama skor (0-100)
+    value: float = 0.0              # Seçimde kullanılan değer (taban üstü skor·sn − kesme cezaları)
+    means: Dict[str, float] = field(default_factory=dict)  # Özellik ortalamaları (0-1)
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class _RangeArgMax:
+    """Sparse table: O(m log m) hazırlık, O(1) aralık argmax (vektörel sorgu)"""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        index = np.arange(len(values))
+        self.table = [index]
+        width = 1
+        while width * 2 <= len(values):
+            prev = self.table[-1]
+            left, right = prev[:-width], prev[width:]
+            self.table.append(np.where(values[right] > values[left], right, left))
+            width *= 2
+
+    def query(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """[lo, hi) aralıklarının argmax'ı (lo < hi olmalı)"""
+        length = hi - lo
+        level = np.floor(np.log2(np.maximum(length, 1))).astype(np.int64)
+        result = np.empty(len(lo), dtype=np.int64)
+        for k in np.unique(level):
+            rows = level == k
+            table = self.table[k]
+            left = table[lo[rows]]
+            right = table[hi[rows] - (1 << k)]
+            result[rows] = np.where(self.values[right] > self.values[left], right, left)
+        return result
+
+
+def _suffix_argmax(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Her i için values[i:] maksimumu ve (ilk) konumu"""
+    reversed_ = values[::-1]
+    best = np.maximum.accumulate(reversed_)
+    record = np.where(reversed_ >= best, np.arange(len(values)), 0)
+    position = len(values) - 1 - np.maximum.accumulate(record)
+    return best[::-1], position[::-1]
+
+
+class SegmentSearch:
+    """
+    Zaman çizelgesi üzerinde en iyi kesit arama
+
+    Pencere değeri = Σ(skor − taban) − kesme cezaları. Taban, videonun
+    BASELINE_QUANTILE yüzdelik skorudur; böylece pencere vasat
+    bölümleri içine almak için uzamaz. Kesme cezası skor ölçeğine
+    bağlıdır: cut_penalty saniyelik iyi (90. yüzdelik) içeriğe eşittir.
+    """
+
+    def __init__(self, timeline: FeatureTimeline, weights: Optional[Dict[str, float]] = None,
+                 cut_penalty: float = CUT_PENALTY, baseline_quantile: float = BASELINE_QUANTILE):
+        self.timeline = timeline
+        self.weights = weights or SEGMENT_WEIGHTS
+        self.cut_penalty = cut_penalty
+
+        self.edges = timeline.edges
+        self.scores = timeline.combined(self.weights)
+        widths = np.diff(self.edges)
+        self.baseline = float(np.quantile(self.scores, baseline_quantile)) - BASELINE_MARGIN
+        self._cut_cost = cut_penalty * max(float(np.quantile(self.scores, 0.9)) - self.baseline,
+                                           BASELINE_MARGIN)
+
+        # Prefix toplamlar: skor ve her özellik için (pencere ortalamaları O(1))
+        self._prefix = np.concatenate([[0.0], np.cumsum(self.scores * widths)])
+        self._feature_prefix = {
+            name: np.concatenate([[0.0], np.cumsum(values * widths)])
+            for name, values in timeline.features.items()
+        }
+        self._means = {name: float(p[-1] / max(timeline.duration, 1e-9))
+                       for name, p in self._feature_prefix.items()}
+
+    # ---- Prefix değerlendirme ----
+
+    def _integral(self, prefix: np.ndarray, times: np.ndarray) -> np.ndarray:
+        # Kutu içinde skor sabit: prefix toplamın doğrusal enterpolasyonu kesin
+        return np.interp(times, self.edges, prefix)
+
+    def window_score(self, start: float, end: float) -> float:
+        """[start, end] ortalama skoru (0-100)"""
+        if end <= start:
+            return 0.0
+        a, b = self._integral(self._prefix, np.array([start, end]))
+        return float((b - a) / (end - start))
+
+    def window_means(self, start: float, end: float) -> Dict[str, float]:
+        """Penceredeki özellik ortalamaları (0-1)"""
+        if end <= start:
+            return {}
+        times = np.array([start, end])
+        return {name: float(np.diff(self._integral(p, times))[0] / (end - start))
+                for name, p in self._feature_prefix.items()}
+
+    def _penalty(self, times: np.ndarray) -> np.ndarray:
+        """Konuşma ortasındaki sınırlara ceza; sessizlik içi ve video uçları ücretsiz"""
+        if not self.timeline.silences:
+            # Oturtulacak sessizlik yok (ör. müzik, ses analizi başarısız)
+            return np.zeros(len(times))
+        penalty = np.where(_inside(self.timeline.silences, times), 0.0, self._cut_cost)
+        penalty[(times <= 0.0) | (times >= self.timeline.duration)] = 0.0
+        return penalty
+
+    def _candidates(self, until: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Başlangıç ve bitiş adayları: saniye ızgarası + sessizlik kenarları"""
+        grid = self.edges[self.edges <= until]
+        silences = self.timeline.silences
+        starts = np.unique(np.concatenate([grid, [e for _, e in silences if e <= until]]))
+        ends = np.unique(np.concatenate([grid, [s for s, _ in silences if s <= until], [until]]))
+        return starts, ends
+
+    def search(self, min_duration: float, max_duration: float, count: int = 5,
+               until: Optional[float] = None) -> List[SegmentWindow]:
+        """
+        En fazla count örtüşmeyen kesit bul
+
+        Args:
+            min_duration: En kısa kesit (sn)
+            max_duration: En uzun kesit (sn)
+            count: En fazla kesit sayısı (K)
+            until: Bu andan sonrası aranmaz (kısmi analiz sonuçları için)
+
+        Returns:
+            Skora göre (yüksekten düşüğe) sıralı kesitler
+        """
+        duration = self.timeline.duration
+        until = duration if until is None else min(until, duration)
+        if until <= 0 or count < 1:
+            return []
+        max_duration = min(max_duration, until)
+        min_duration = min(min_duration, max_duration)
+
+        starts, ends = self._candidates(until)
+        excess = self._prefix - self.baseline * self.edges
+        open_value = self._integral(excess, starts) + self._penalty(starts)
+        close_value = self._integral(excess, ends) - self._penalty(ends)
+
+        # Her başlangıç için süre sınırları içindeki en iyi bitiş
+        lo = np.searchsorted(ends, starts + min_duration - 1e-9, side="left")
+        hi = np.searchsorted(ends, starts + max_duration + 1e-9, side="right")
+        valid = lo < hi
+        if not valid.any():
+            return []
+        starts, lo, hi, open_value = starts[valid], lo[valid], hi[valid], open_value[valid]
+        best_end = _RangeArgMax(close_value).query(lo, hi)
+        stops = ends[best_end]
+        values = close_value[best_end] - open_value
+
+        chosen = self._select(starts, stops, values, count)
+        windows = []
+        for i in chosen:
+            start, end = float(starts[i]), float(stops[i])
+            means = self.window_means(start, end)
+            windows.append(SegmentWindow(
+                start=start, end=end, score=self.window_score(start, end),
+                value=float(values[i]), means=means, reasons=self._reasons(means)
+            ))
+        windows.sort(key=lambda w: w.score, reverse=True)
+        return windows
+
+    @staticmethod
+    def _select(starts: np.ndarray, stops: np.ndarray, values: np.ndarray, count: int) -> List[int]:
+        """
+        Toplam değeri en büyük, en fazla count örtüşmeyen aday
+
+        dp[k][i]: i. adaydan itibaren en fazla k pencereyle ulaşılan değer.
+        dp[k][i] = max(dp[k-1][i], max_{j>=i}(values[j] + dp[k-1][next[j]]))
+        İç maksimum ters kümülatif maksimumdur; her k tek vektörel geçiş.
+        """
+        m = len(starts)
+        following = np.searchsorted(starts, stops - 1e-9, side="left")
+        layers = [np.zeros(m + 1)]
+        picks = []
+        for _ in range(count):
+            prev = layers[-1]
+            take = values + prev[following]
+            best, position = _suffix_argmax(take)
+            layer = np.append(np.maximum(best, prev[:-1]), 0.0)
+            layers.append(layer)
+            picks.append(position)
+
+        # Geri izleme
+        chosen, i, k = [], 0, count
+        while k > 0 and i < m:
+            if layers[k][i] <= layers[k - 1][i] or layers[k][i] <= 0:
+                k -= 1
+                continue
+            j = int(picks[k - 1][i])
+            chosen.append(j)
+            i, k = int(following[j]), k - 1
+        return chosen
+
+    def _reasons(self, means: Dict[str, float]) -> List[str]:
+        """Video ortalamasının belirgin üstündeki özellikler"""
+        reasons = []
+        for name in self.weights:
+            if name in means and means[name] >= 0.5 and means[name] >= self._means.get(name, 0.0) * 1.2:
+                reasons.append(FEATURE_LABELS.get(name, name))
+        return reasons
+
+
+def find_segments(timeline: FeatureTimeline, min_duration: float, max_duration: float,
+                  count: int = 5, until: Optional[float] = None,
+                  weights: Optional[Dict[str, float]] = None) -> List[SegmentWindow]:
+    """SegmentSearch(timeline, weights).search(...) kısayolu"""
+    return SegmentSearch(timeline, weights).search(min_duration, max_duration, count, until)
+
+
+def _benchmark(duration: float = 3 * 3600.0):
+    """Sentetik 3 saatlik analiz: zaman çizelgesi + arama süresi, kaba kuvvetle doğrulama"""
+    import time
+
+    rng = np.random.default_rng(0)
+    # Konuşma: 2-20 sn bloklar, aralarında 0.3-2 sn sessizlik
+    silences, t = [], 0.0
+    while t < duration:
+        t += rng.uniform(2, 20)
+        gap = rng.uniform(0.3, 2.0)
+        if t + gap < duration:
+            silences.append((t, t + gap))
+        t += gap
+    times = np.arange(0, duration, 1.0)
+    motion = np.clip(rng.gamma(2, 4, len(times)) * (1 + np.sin(times / 400)), 0, 100)
+    levels = -30 + 10 * np.sin(times / 90) + rng.normal(0, 3, len(times))
+    scenes = np.sort(rng.uniform(0, duration, int(duration / 20)))
+
+    start = time.perf_counter()
+    timeline = FeatureTimeline.build(
+        duration, audio_levels=list(zip(times, levels)), motion_scores=list(zip(times, motion)),
+        scene_changes=scenes, silences=silences
+    )
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    search = SegmentSearch(timeline)
+    windows = search.search(30.0, 60.0, count=10)
+    search_ms = (time.perf_counter() - start) * 1000
+    print(f"{duration / 3600:.0f} saat, {len(silences)} sessizlik: zaman çizelgesi {build_ms:.1f} ms, "
+          f"arama {search_ms:.1f} ms")
+    for w in windows[:5]:
+        print(f"  {w.start:8.1f} - {w.end:8.1f} ({w.duration:4.1f} sn) skor {w.score:5.1f}  "
+              f"{', '.join(w.reasons) or '-'}")
+
+    # Küçük örnekte tek pencere için kaba kuvvetle karşılaştır
+    small = FeatureTimeline.build(
+        600.0, audio_levels=list(zip(times[:600], levels[:600])),
+        motion_scores=list(zip(times[:600], motion[:600])),
+        silences=[s for s in silences if s[1] < 600]
+    )
+    fast = SegmentSearch(small)
+    best = fast.search(30.0, 60.0, count=1)[0]
+    starts, ends = fast._candidates(600.0)
+    excess = fast._prefix - fast.baseline * fast.edges
+    brute = max(
+        (fast._integral(excess, np.array([e]))[0] - fast._penalty(np.array([e]))[0])
+        - (fast._integral(excess, np.array([s]))[0] + fast._penalty(np.array([s]))[0])
+        for s in starts for e in ends if 30.0 - 1e-9 <= e - s <= 60.0 + 1e-9
+    )
+    print(f"Kaba kuvvet doğrulaması: {'✓' if abs(brute - best.value) < 1e-6 else '✗'} "
+          f"({best.value:.3f} / {brute:.3f})")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
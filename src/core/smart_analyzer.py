@@ -3,20 +3,29 @@ LinuxShorts Pro - Smart Video Analyzer
 Akıllı video analizi: Sessizlik algılama, Hook detection, Sahne değişikliği
 """
 
-import subprocess
-import json
+import logging
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Tuple
 import numpy as np
 
 from utils.logger import get_logger
+from utils.tracing import span
+from .waveform import (SILENCE_MIN_DURATION, SILENCE_THRESHOLD_DB, Waveform, WaveformBuilder,
+                       parse_silencedetect)
+from .analysis_checkpoint import AnalysisChunk, AnalysisCheckpoint
+from .cancellation import CancelToken, CancelledError
+from .process_runner import run_process
+from .media_info import VideoInfo, probe_video
+from .timestamps import capture_timeline
+from .segment_search import FeatureTimeline, find_segments
 
 logger = get_logger("LinuxShorts.SmartAnalyzer")
 
 # OpenCV kontrolü
 try:
     import cv2
+    from .frame_scorer import FrameScorer, FrameFeatures, HOOK_WEIGHTS, THUMBNAIL_WEIGHTS
     OPENCV_AVAILABLE = True
 except ImportError:
     OPENCV_AVAILABLE = False
@@ -55,6 +64,13 @@ class AnalysisResult:
     best_segments: List[Segment] = field(default_factory=list)
     audio_levels: List[Tuple[float, float]] = field(default_factory=list)
     motion_scores: List[Tuple[float, float]] = field(default_factory=list)
+    frame_features: Optional["FrameFeatures"] = None  # Hook ve thumbnail için ortak tablo
+    waveform: Optional[Waveform] = None  # Sessizlik analiziyle aynı decode'dan
+    analyzed_until: float = 0.0  # Görüntü analizinin tamamlandığı an (kısmi sonuçlarda < duration)
+    
+    @property
+    def is_partial(self) -> bool:
+        return self.analyzed_until < self.duration
 
 
 class SmartVideoAnalyzer:
@@ -66,14 +82,20 @@ class SmartVideoAnalyzer:
         self.fps: float = 30.0
         self.width: int = 0
         self.height: int = 0
+        self.info: Optional[VideoInfo] = None
         self.result: Optional[AnalysisResult] = None
         
-        self.silence_threshold_db: float = -35.0
-        self.silence_min_duration: float = 0.3
+        self.silence_threshold_db: float = SILENCE_THRESHOLD_DB
+        self.silence_min_duration: float = SILENCE_MIN_DURATION
         self.hook_window: float = 15.0
         self.scene_threshold: float = 30.0
         self.min_segment_duration: float = 15.0
         self.target_duration: float = 60.0
+        self.chunk_duration: float = 300.0  # Checkpoint aralığı (görüntü analizi)
+        self.max_scenes: int = 50
+        
+        # full_analysis süresince geçerli iptal token'ı
+        self._cancel: Optional[CancelToken] = None
     
     def load_video(self, video_path: Path) -> bool:
         """Video yükle"""
@@ -84,27 +106,10 @@ class SmartVideoAnalyzer:
             return False
         
         try:
-            cmd = [
-                "ffprobe", "-v", "quiet",
-                "-print_format", "json",
-                "-show_format", "-show_streams",
-                str(self.video_path)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            info = json.loads(result.stdout)
-            
-            for stream in info.get("streams", []):
-                if stream.get("codec_type") == "video":
-                    self.width = int(stream.get("width", 0))
-                    self.height = int(stream.get("height", 0))
-                    fps_str = stream.get("r_frame_rate", "30/1")
-                    if "/" in fps_str:
-                        num, den = map(int, fps_str.split("/"))
-                        self.fps = num / den if den > 0 else 30.0
-                    break
-            
-            self.duration = float(info.get("format", {}).get("duration", 0))
+            self.info = info = probe_video(self.video_path)
+            self.width, self.height = info.width, info.height
+            self.fps = info.fps
+            self.duration = info.duration
             logger.info(f"Video: {self.width}x{self.height}, {self.fps:.1f}fps, {self.duration:.1f}s")
             return True
             
@@ -120,35 +125,31 @@ class SmartVideoAnalyzer:
         logger.info("Ses analizi başlıyor...")
         
         try:
-            cmd = [
-                "ffmpeg", "-i", str(self.video_path),
-                "-af", f"silencedetect=noise={self.silence_threshold_db}dB:d={self.silence_min_duration}",
-                "-f", "null", "-"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            output = result.stderr
+            # Dalga formu ile tek decode (cache'te varsa hiç decode edilmez)
+            waveform = WaveformBuilder().get(
+                self.video_path, self.silence_threshold_db, self.silence_min_duration,
+                duration=self.duration, cancel=self._cancel
+            )
+            if waveform is not None:
+                silences = waveform.silences
+                if self.result is not None:
+                    self.result.waveform = waveform
+            else:
+                cmd = [
+                    "ffmpeg", "-i", str(self.video_path),
+                    "-af", f"silencedetect=noise={self.silence_threshold_db}dB:d={self.silence_min_duration}",
+                    "-f", "null", "-"
+                ]
+                result = run_process(cmd, cancel=self._cancel, capture_output=True, text=True, timeout=300)
+                silences = parse_silencedetect(result.stderr)
             
-            silence_segments = []
-            silence_start = None
-            
-            for line in output.split("\n"):
-                if "silence_start:" in line:
-                    try:
-                        silence_start = float(line.split("silence_start:")[1].split()[0])
-                    except:
-                        pass
-                elif "silence_end:" in line and silence_start is not None:
-                    try:
-                        silence_end = float(line.split("silence_end:")[1].split()[0])
-                        duration = silence_end - silence_start
-                        silence_segments.append(Segment(
-                            start=silence_start, end=silence_end, duration=duration,
-                            segment_type="silence", label=f"Sessizlik ({duration:.1f}s)"
-                        ))
-                        silence_start = None
-                    except:
-                        pass
+            silence_segments = [
+                Segment(
+                    start=start, end=end, duration=end - start,
+                    segment_type="silence", label=f"Sessizlik ({end - start:.1f}s)"
+                )
+                for start, end in silences
+            ]
             
             # Konuşma bölümleri
             speech_segments = []
@@ -190,7 +191,7 @@ class SmartVideoAnalyzer:
                 "-af", f"volumedetect",
                 "-f", "null", "-"
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = run_process(cmd, cancel=self._cancel, capture_output=True, text=True, timeout=120)
             
             # Basit ses seviyesi tahmini
             levels = []
@@ -201,8 +202,17 @@ class SmartVideoAnalyzer:
         except:
             return []
     
-    def detect_scene_changes(self, threshold: float = None, max_scenes: int = 50) -> List[float]:
-        """Sahne değişikliklerini tespit et"""
+    def detect_scene_changes(self, threshold: float = None, max_scenes: int = 50,
+                             start: float = 0.0, end: Optional[float] = None) -> List[float]:
+        """
+        Sahne değişikliklerini tespit et
+        
+        Args:
+            threshold: Histogram farkı eşiği (None ise self.scene_threshold)
+            max_scenes: En fazla sahne değişikliği
+            start: Aralık başlangıcı (sn); önceki örnek ile karşılaştırılır
+            end: Aralık sonu (sn, hariç; None = video sonu)
+        """
         if not OPENCV_AVAILABLE or not self.video_path:
             return []
         
@@ -217,6 +227,7 @@ class SmartVideoAnalyzer:
                 return []
             
             fps = cap.get(cv2.CAP_PROP_FPS)
+            timeline = capture_timeline(self.video_path, fps, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
             sample_interval = int(fps * 0.5)
             if sample_interval < 1:
                 sample_interval = 1
@@ -225,20 +236,31 @@ class SmartVideoAnalyzer:
             prev_hist = None
             frame_idx = 0
             
-            while True:
-                ret, frame = cap.read()
+            if start > 0:
+                # Tam taramayla aynı örnek ızgarası; bir önceki örnekten başla
+                first = -(-timeline.frame_bound(start) // sample_interval) * sample_interval
+                frame_idx = first - sample_interval
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            end_frame = timeline.frame_bound(end) if end is not None else None
+            
+            while end_frame is None or frame_idx < end_frame:
+                if self._cancel is not None and self._cancel.cancelled:
+                    break
+                with span("decode", "decode"):
+                    ret, frame = cap.read()
                 if not ret:
                     break
                 
                 if frame_idx % sample_interval == 0:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-                    hist = cv2.normalize(hist, hist).flatten()
+                    with span("score.scene", "score"):
+                        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                        hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
+                        hist = cv2.normalize(hist, hist).flatten()
                     
                     if prev_hist is not None:
                         diff = cv2.compareHist(prev_hist, hist, cv2.HISTCMP_CHISQR)
                         if diff > threshold:
-                            scene_changes.append(frame_idx / fps)
+                            scene_changes.append(timeline.time_of(frame_idx))
                             if len(scene_changes) >= max_scenes:
                                 break
                     
@@ -246,6 +268,8 @@ class SmartVideoAnalyzer:
                 frame_idx += 1
             
             cap.release()
+            if self._cancel is not None:
+                self._cancel.raise_if_cancelled()
             logger.info(f"Sahne analizi: {len(scene_changes)} sahne değişikliği")
             return scene_changes
             
@@ -254,46 +278,35 @@ class SmartVideoAnalyzer:
             return []
     
     def analyze_motion(self, sample_interval: float = 1.0) -> List[Tuple[float, float]]:
-        """Hareket yoğunluğu analizi"""
+        """
+        Hareket yoğunluğu analizi
+        
+        Örnek frame'ler tek geçişte batch scorer'lardan geçirilir; hook ve
+        thumbnail scorer'larının sonuçları result.frame_features'ta saklanır,
+        detect_hooks ve ThumbnailGenerator aynı tabloyu kullanır.
+        """
         if not OPENCV_AVAILABLE or not self.video_path:
             return []
         
         logger.info("Hareket analizi başlıyor...")
         
         try:
-            cap = cv2.VideoCapture(str(self.video_path))
-            if not cap.isOpened():
-                return []
-            
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_interval = int(fps * sample_interval)
-            if frame_interval < 1:
-                frame_interval = 1
+            scorer = FrameScorer(weights=HOOK_WEIGHTS)
+            names = self._feature_names()
+            audio_levels = self.result.audio_levels if self.result else None
             
-            motion_scores = []
-            prev_frame = None
-            frame_idx = 0
+            features = scorer.scan(self.video_path, sample_interval, names=names,
+                                   audio_levels=audio_levels, cancel=self._cancel)
+            if self.result is not None:
+                self.result.frame_features = features
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                if frame_idx % frame_interval == 0:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    gray = cv2.GaussianBlur(gray, (21, 21), 0)
-                    
-                    if prev_frame is not None:
-                        diff = cv2.absdiff(prev_frame, gray)
-                        thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)[1]
-                        motion = np.sum(thresh > 0) / thresh.size * 100
-                        motion_scores.append((frame_idx / fps, motion))
-                    
-                    prev_frame = gray
-                frame_idx += 1
+            # İlk örneğin önceki frame'i yok (eski çıktıyla aynı şekilde atlanır)
+            motion = features.metrics.get("motion", [])
+            motion_scores = [(float(t), float(m)) for t, m in zip(features.times[1:], motion[1:])]
             
-            cap.release()
             logger.info(f"Hareket analizi: {len(motion_scores)} örnek")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Frame scorer süreleri:\n%s", scorer.timing_report())
             return motion_scores
             
         except Exception as e:
@@ -301,103 +314,204 @@ class SmartVideoAnalyzer:
             return []
     
     def detect_hooks(self, audio_levels: List, motion_scores: List) -> List[Segment]:
-        """Hook (dikkat çekici an) tespit et"""
+        """
+        Hook (dikkat çekici an) tespit et
+        
+        Frame tablosu varsa hareket, ses, yüz, kontrast ve yazı skorları
+        HOOK_WEIGHTS ile birleştirilir; yoksa sadece hareket kullanılır.
+        """
         logger.info("Hook analizi başlıyor...")
         
         hooks = []
         hook_window = min(self.hook_window, self.duration)
+        features = self.result.frame_features if self.result else None
         
-        # Hareket skorlarını kullan
         scored_times = []
-        for time, motion in motion_scores:
-            if time <= hook_window:
-                scored_times.append((time, motion))
+        if features is not None and len(features) > 1:
+            # Skor 0-100 ölçeğinde; %5 hareket (eski eşik) ≈ 12.5 puan
+            totals = features.combine(HOOK_WEIGHTS)
+            threshold = 12.5
+            for i in range(1, len(features)):
+                time = float(features.times[i])
+                if time <= hook_window:
+                    scored_times.append((time, float(totals[i]), features.reason(i, HOOK_WEIGHTS)))
+        else:
+            threshold = 5
+            for time, motion in motion_scores:
+                if time <= hook_window:
+                    scored_times.append((time, motion, f"Hareket: {motion:.0f}%"))
         
         scored_times.sort(key=lambda x: x[1], reverse=True)
         
-        for i, (time, score) in enumerate(scored_times[:5]):
-            if score > 5:
+        for i, (time, score, reason) in enumerate(scored_times[:5]):
+            if score > threshold:
                 hooks.append(Segment(
                     start=max(0, time - 2),
                     end=min(hook_window, time + 3),
                     duration=5, score=score,
                     segment_type="hook",
-                    label=f"Hook #{i+1} (Hareket: {score:.0f}%)"
+                    label=f"Hook #{i+1} ({reason})"
                 ))
         
         logger.info(f"Hook analizi: {len(hooks)} potansiyel hook")
         return hooks
     
-    def find_best_segments(self, target_duration: float = 60.0) -> List[Segment]:
-        """En iyi Short segmentlerini bul"""
+    def find_best_segments(self, target_duration: float = 60.0, count: int = 10) -> List[Segment]:
+        """
+        En iyi Short segmentlerini bul
+        
+        Ses yüksekliği, hareket, sahne yoğunluğu ve konuşma kapsamı saniyelik
+        zaman çizelgesinde birleştirilir; min_segment_duration ile
+        target_duration arasındaki en iyi örtüşmeyen pencereler sessizlik
+        sınırlarına oturtularak seçilir (bkz. core.segment_search).
+        """
         if not self.result:
             return []
         
-        segments = []
+        result = self.result
+        timeline = FeatureTimeline.build(
+            self.duration,
+            audio_levels=result.audio_levels,
+            waveform=result.waveform,
+            motion_scores=result.motion_scores,
+            scene_changes=result.scene_changes,
+            speech=[(s.start, s.end) for s in result.speech_segments],
+            silences=[(s.start, s.end) for s in result.silence_segments],
+        )
+        # Kısmi sonuç: görüntüsü henüz analiz edilmemiş kısımlar sonra puanlanır
+        windows = find_segments(timeline, self.min_segment_duration, target_duration,
+                                count=count, until=result.analyzed_until)
         
-        for speech in self.result.speech_segments:
-            if speech.duration < self.min_segment_duration:
-                continue
-            
-            score = 50.0
-            
-            for hook in self.result.hook_candidates:
-                if speech.start <= hook.start <= speech.end:
-                    score += 20
-                    break
-            
-            for scene_time in self.result.scene_changes:
-                if abs(speech.start - scene_time) < 1.0:
-                    score += 15
-                    break
-            
-            if speech.start < self.duration * 0.3:
-                score += 10
-            
-            segments.append(Segment(
-                start=speech.start,
-                end=min(speech.start + target_duration, speech.end),
-                duration=min(speech.duration, target_duration),
-                score=score, segment_type="best",
-                label=f"Önerilen (Skor: {score:.0f})"
-            ))
-        
-        segments.sort(key=lambda x: x.score, reverse=True)
-        return segments[:10]
+        return [
+            Segment(
+                start=w.start, end=w.end, duration=w.duration,
+                score=w.score, segment_type="best",
+                label=f"Önerilen (Skor: {w.score:.0f})" + (f" - {', '.join(w.reasons)}" if w.reasons else "")
+            )
+            for w in windows
+        ]
     
-    def full_analysis(self, progress_callback=None) -> AnalysisResult:
-        """Tam analiz"""
+    def _feature_names(self) -> List[str]:
+        """Hook ve thumbnail için tek taramada çalıştırılan scorer'lar"""
+        return list(dict.fromkeys([*HOOK_WEIGHTS, *THUMBNAIL_WEIGHTS]))
+    
+    def _analyze_chunk(self, index: int, start: float, end: float,
+                       scorer: Optional["FrameScorer"]) -> AnalysisChunk:
+        """Bir zaman aralığının sahne + frame analizi"""
+        with span("analysis.scenes", chunk=index):
+            scene_changes = self.detect_scene_changes(max_scenes=self.max_scenes, start=start, end=end)
+        features = None
+        if scorer is not None:
+            with span("analysis.frames", chunk=index):
+                features = scorer.scan(self.video_path, 1.0, names=self._feature_names(),
+                                       audio_levels=self.result.audio_levels, start=start, end=end,
+                                       cancel=self._cancel)
+        return AnalysisChunk(index, start, end, scene_changes, features)
+    
+    def _merge_chunks(self, chunks: List[AnalysisChunk]):
+        """Tamamlanan parçalardan (baştan itibaren) sonucu yeniden oluştur"""
+        self.result.analyzed_until = chunks[-1].end
+        self.result.scene_changes = [t for c in chunks for t in c.scene_changes][:self.max_scenes]
+        
+        parts = [c.features for c in chunks if c.features is not None and len(c.features)]
+        features = FrameFeatures.concat(parts) if parts else None
+        self.result.frame_features = features
+        if features is not None:
+            # İlk örneğin önceki frame'i yok (eski çıktıyla aynı şekilde atlanır)
+            motion = features.metrics.get("motion", [])
+            self.result.motion_scores = [(float(t), float(m)) for t, m in zip(features.times[1:], motion[1:])]
+        
+        self.result.hook_candidates = self.detect_hooks(
+            self.result.audio_levels, self.result.motion_scores
+        )
+        self.result.best_segments = self.find_best_segments(self.target_duration)
+    
+    def full_analysis(self, progress_callback=None, partial_callback=None,
+                      resume: bool = True, cancel: Optional[CancelToken] = None) -> AnalysisResult:
+        """
+        Tam analiz
+        
+        Görüntü analizi (sahne + hareket/frame skorları) chunk_duration'lık
+        parçalar halinde yapılır ve her parça diskte checkpoint'lenir; yarıda
+        kalan analiz son tamamlanan parçadan devam eder. Ses analizi tek
+        decode'dur ve dalga formu cache'inde saklanır.
+        
+        Args:
+            progress_callback: (yüzde, mesaj)
+            partial_callback: Her parçadan sonra o ana kadarki AnalysisResult
+                (analyzed_until'a kadar geçerli; son parçada çağrılmaz)
+            resume: False ise kayıtlı parçalar silinip baştan başlanır
+            cancel: İptal token'ı; iptalde ffmpeg süreçleri öldürülür, bellekteki
+                sonuç bırakılır (tamamlanan parçalar diskte kalır)
+        
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
         if not self.video_path:
             return AnalysisResult()
         
+        self._cancel = cancel
+        try:
+            return self._run_analysis(progress_callback, partial_callback, resume)
+        except CancelledError:
+            logger.info("Analiz iptal edildi")
+            self.result = None
+            raise
+        finally:
+            self._cancel = None
+    
+    def _run_analysis(self, progress_callback, partial_callback, resume: bool) -> AnalysisResult:
         self.result = AnalysisResult(duration=self.duration)
         
         if progress_callback:
             progress_callback(10, "Ses analizi...")
-        silence, speech = self.analyze_audio()
+        with span("analysis.audio"):
+            silence, speech = self.analyze_audio()
         self.result.silence_segments = silence
         self.result.speech_segments = speech
         
         if progress_callback:
             progress_callback(30, "Ses seviyeleri...")
-        self.result.audio_levels = self.analyze_audio_levels()
+        with span("analysis.levels"):
+            self.result.audio_levels = self.analyze_audio_levels()
         
-        if progress_callback:
-            progress_callback(50, "Sahne analizi...")
-        self.result.scene_changes = self.detect_scene_changes()
+        checkpoint = AnalysisCheckpoint(self.video_path, {
+            "chunk_duration": self.chunk_duration,
+            "scene_threshold": self.scene_threshold,
+            "max_scenes": self.max_scenes,
+            "features": self._feature_names() if OPENCV_AVAILABLE else [],
+        })
+        if not resume:
+            checkpoint.clear()
+        saved = checkpoint.load_all()
+        if saved:
+            logger.info(f"Analiz checkpoint'i bulundu: {len(saved)} parça tamamlanmış")
         
-        if progress_callback:
-            progress_callback(70, "Hareket analizi...")
-        self.result.motion_scores = self.analyze_motion()
+        scorer = FrameScorer(weights=HOOK_WEIGHTS) if OPENCV_AVAILABLE else None
+        count = max(1, int(np.ceil(self.duration / self.chunk_duration)))
+        chunks: List[AnalysisChunk] = []
         
-        if progress_callback:
-            progress_callback(85, "Hook tespiti...")
-        self.result.hook_candidates = self.detect_hooks(
-            self.result.audio_levels, self.result.motion_scores
-        )
+        for index in range(count):
+            start = index * self.chunk_duration
+            end = min(self.duration, start + self.chunk_duration)
+            if progress_callback:
+                progress_callback(30 + int(65 * index / count),
+                                  f"Görüntü analizi {self._format_time(start)} / {self._format_time(self.duration)}...")
+            
+            chunk = saved.get(index)
+            if chunk is None:
+                if self._cancel is not None:
+                    self._cancel.raise_if_cancelled()
+                chunk = self._analyze_chunk(index, start, end, scorer)
+                checkpoint.save(chunk)
+            chunks.append(chunk)
+            
+            self._merge_chunks(chunks)
+            if partial_callback and index < count - 1:
+                partial_callback(replace(self.result))
         
-        if progress_callback:
-            progress_callback(95, "Segment önerileri...")
+        # Son parça video sonunu tam kapsamayabilir (süre yuvarlaması)
+        self.result.analyzed_until = self.duration
         self.result.best_segments = self.find_best_segments(self.target_duration)
         
         if progress_callback:
@@ -405,6 +519,10 @@ class SmartVideoAnalyzer:
         
         return self.result
     
+    @staticmethod
+    def _format_time(seconds: float) -> str:
+        return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+    
     def get_summary(self) -> dict:
         """Analiz özeti"""
         if not self.result:
@@ -4,13 +4,57 @@ Whisper altyazılarını akıllıca düzeltir (Türkçe + Linux terimleri)
 """
 
 import re
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 from pathlib import Path
+from dataclasses import dataclass
 
 from utils.logger import get_logger
 
 logger = get_logger("LinuxShorts.SubtitleCorrector")
 
+# Segment metinlerini tek buffer'da birleştirirken kullanılan ayraç.
+# Hiçbir kural \x00 içermediği için eşleşmeler segment sınırını aşamaz.
+SEGMENT_SENTINEL = "\x00"
+
+
+@dataclass
+class CorrectionChange:
+    """Tek bir düzeltmenin kaynağı (provenance)"""
+    rule_id: int        # SubtitleCorrector.get_rule() ile çözülür
+    segment_index: int  # Düzeltilen segmentin sırası
+    start: int          # Orijinal segment metnindeki başlangıç offset'i
+    end: int            # Orijinal segment metnindeki bitiş offset'i
+
+
+def _fold(word: str) -> str:
+    """re.IGNORECASE'in Türkçe i/ı/İ/I eşdeğerliğine uygun karşılaştırma anahtarı"""
+    return word.replace("İ", "i").replace("ı", "i").replace("I", "i").lower()
+
+
+def _expand_sources(pattern: str, sources: Dict[str, List[str]], ignore_case: bool) -> str:
+    """
+    Kural pattern'indeki kelimelere, sözlük düzeltmesiyle o kelimeye
+    dönüşen kaynak yazılışları ekler ("apt" → "(?:apt|\\bapete\\b|...)")
+    
+    Kaçış dizileri, karakter sınıfları ve grup başları olduğu gibi kalır.
+    """
+    if ignore_case:
+        folded: Dict[str, List[str]] = {}
+        for result, alternatives in sources.items():
+            folded.setdefault(_fold(result), []).extend(alternatives)
+        lookup = lambda word: folded.get(_fold(word))
+    else:
+        lookup = sources.get
+    
+    def expand(match: re.Match) -> str:
+        word = match.group(1)
+        alternatives = lookup(word) if word else None
+        if not alternatives:
+            return match.group()
+        return "(?:" + "|".join([word, *alternatives]) + ")"
+    
+    return re.sub(r'\\.|\[[^\]]*\]|\(\?[^:)]*[:)]?|([^\W\d_]+)', expand, pattern)
+
 
 class SubtitleCorrector:
     """Altyazı düzeltme sınıfı"""
@@ -19,6 +63,17 @@ class SubtitleCorrector:
         """Düzeltme kurallarını yükle"""
         self.corrections = self._load_correction_rules()
         self.tech_terms = self._load_tech_terms()
+        self.special_rules = self._load_special_rules()
+        
+        # Derlenmiş düzeltme otomatı (kurallar değişince yeniden derlenir)
+        self._automaton: Optional[re.Pattern] = None
+        self._automaton_key: Optional[tuple] = None
+        self._rules: List[Tuple[str, str, str]] = []
+        self._group_to_rule: Dict[int, int] = {}
+        # Eski sıralı zincir (sözlük → teknik terimler → özel kurallar) ve
+        # eşleşme metni → (zincir sonucu, ilk uygulanan kural) cache'i
+        self._cascade: List[Tuple[re.Pattern, str, int]] = []
+        self._composed: Dict[str, Tuple[str, int]] = {}
         logger.info("Subtitle Corrector hazır")
     
     def _load_correction_rules(self) -> Dict[str, str]:
@@ -124,65 +179,231 @@ class SubtitleCorrector:
             r'\bdependencies\b': 'dependencies',
         }
     
-    def correct_text(self, text: str) -> str:
+    def _load_special_rules(self) -> List[Tuple[str, str, bool]]:
         """
-        Metni düzelt
+        Özel düzeltme kuralları
         
-        Args:
-            text: Düzeltilecek metin
+        Returns:
+            [(pattern, doğru_yazılış, büyük/küçük harf duyarsız mı)]
+        """
+        return [
+            # "apt komutu" gibi ifadelerde apt küçük, APT büyük olmalı
+            (r'\bapt komutu\b', 'apt komutu', True),
+            (r'\bdpkg komutu\b', 'dpkg komutu', True),
+            
+            # "APT ile" → "APT ile" (büyük harf)
+            (r'\bapt ile\b', 'APT ile', True),
+            (r'\bdpkg ile\b', 'DPKG ile', True),
             
+            # "apt vs dpkg" → "APT vs DPKG"
+            (r'\bapt vs dpkg\b', 'APT vs DPKG', True),
+            
+            # ".deb dosyası" → ".deb dosyası"
+            (r'\.?deb dosyası', '.deb dosyası', True),
+        ]
+    
+    def _build_automaton(self) -> re.Pattern:
+        """
+        Tüm kuralları tek bir alternation regex'ine derler
+        
+        Öncelik sırası: özel kurallar (çok kelimeli ifadeler), sözlük
+        (uzundan kısaya) ve teknik terimler. Otomat yalnızca eşleşmeleri
+        bulur; her eşleşmenin sonucu eski sıralı zincirden (sözlük →
+        teknik terimler → özel kurallar) geçirilerek hesaplanır, böylece
+        zincirleme düzeltmeler ("apete ile" → "apt ile" → "APT ile") ve
+        sözlük sırasına bağlı yazılışlar ("izlemenizde" → "İzlemenizi de")
+        korunur. Özel kurallara, sözlük düzeltmesinden sonra onlara uyan
+        kaynak yazılışlar da eklenir. Derlenen otomat kurallar değişene
+        kadar cache'lenir.
+        
         Returns:
-            Düzeltilmiş metin
+            Derlenmiş regex
         """
-        original = text
+        key = (
+            tuple(self.corrections.items()),
+            tuple(self.tech_terms.items()),
+            tuple(self.special_rules),
+        )
+        if self._automaton is not None and key == self._automaton_key:
+            return self._automaton
+        
+        rules = []
+        for pattern, replacement, ignore_case in self.special_rules:
+            rules.append(("special", pattern, replacement))
         
-        # 1. Basit kelime değiştirmeleri (case-insensitive)
-        for wrong, correct in self.corrections.items():
-            # Kelime sınırlarını kontrol et
-            pattern = r'\b' + re.escape(wrong) + r'\b'
-            text = re.sub(pattern, correct, text, flags=re.IGNORECASE)
+        # Sözlük: uzun ifadeler önce ("paket yöneticesi" > "yöneticesi")
+        words = sorted((w for w in self.corrections if w), key=len, reverse=True)
+        dictionary_ids = {}
+        for wrong in words:
+            rules.append(("dictionary", r'\b' + re.escape(wrong) + r'\b', self.corrections[wrong]))
+            dictionary_ids[wrong] = len(rules) - 1
         
-        # 2. Teknik terimleri düzelt (case-sensitive)
+        tech_ids = {}
         for pattern, replacement in self.tech_terms.items():
-            text = re.sub(pattern, replacement, text)
+            rules.append(("tech", pattern, replacement))
+            tech_ids[pattern] = len(rules) - 1
         
-        # 3. Özel kurallar
-        text = self._apply_special_rules(text)
+        # Eski correct_text'in sırası: sözlük (ekleme sırasıyla), teknik terimler, özel kurallar
+        cascade = [
+            (re.compile(rules[dictionary_ids[wrong]][1], re.IGNORECASE), correct, dictionary_ids[wrong])
+            for wrong, correct in self.corrections.items() if wrong
+        ]
+        cascade += [(re.compile(pattern), replacement, tech_ids[pattern])
+                    for pattern, replacement in self.tech_terms.items()]
+        special_start = len(cascade)
+        cascade += [(re.compile(pattern, re.IGNORECASE if ignore_case else 0), replacement, i)
+                    for i, (pattern, replacement, ignore_case) in enumerate(self.special_rules)]
+        self._cascade = cascade
+        self._composed = {}
         
-        # Log (sadece değişiklik varsa)
-        if text != original:
-            logger.debug(f"Düzeltme: '{original}' → '{text}'")
+        # Sözlük + teknik terimlerden sonra tek kelimeye dönüşen kaynaklar
+        sources: Dict[str, List[str]] = {}
+        for wrong in self.corrections:
+            if wrong:
+                result, _ = self._run_cascade(wrong, cascade[:special_start])
+                if re.fullmatch(r'\w+', result) and result != wrong:
+                    sources.setdefault(result, []).append(r'\b' + re.escape(wrong) + r'\b')
         
-        return text
+        parts = []
+        group_to_rule = {}
+        group_index = 1
+        
+        def add_group(pattern: str, ignore_case: bool, rule_id: int):
+            nonlocal group_index
+            body = f"(?i:{pattern})" if ignore_case else f"(?:{pattern})"
+            parts.append(f"({body})")
+            group_to_rule[group_index] = rule_id
+            # İç grupları atla (lastindex dış grubu gösterir)
+            group_index += 1 + re.compile(pattern).groups
+        
+        for rule_id, (pattern, _, ignore_case) in enumerate(self.special_rules):
+            add_group(_expand_sources(pattern, sources, ignore_case), ignore_case, rule_id)
+        
+        if words:
+            alternation = "|".join(re.escape(w) for w in words)
+            add_group(r'\b(?:' + alternation + r')\b', True, -1)
+        
+        for pattern, replacement in self.tech_terms.items():
+            add_group(pattern, False, tech_ids[pattern])
+        
+        # Ön filtre: eşleşmeler yalnızca bu karakterlerde başlayabilir
+        first_chars = {re.escape(w[0]) for w in words if not (w[0].isalnum() or w[0] in "._")}
+        prefilter = r"(?=[\w." + "".join(sorted(first_chars)) + "])"
+        
+        self._automaton = re.compile(prefilter + "(?:" + "|".join(parts) + ")")
+        self._automaton_key = key
+        self._rules = rules
+        self._group_to_rule = group_to_rule
+        
+        logger.debug("Düzeltme otomatı derlendi: %d kural", len(rules))
+        return self._automaton
+    
+    @staticmethod
+    def _run_cascade(text: str, cascade: List[Tuple[re.Pattern, str, int]]) -> Tuple[str, int]:
+        """Kuralları sırayla uygular → (sonuç, metni ilk değiştiren kural veya -1)"""
+        first = -1
+        for regex, replacement, rule_id in cascade:
+            changed = regex.sub(replacement, text)
+            if first < 0 and changed != text:
+                first = rule_id
+            text = changed
+        return text, first
+    
+    def _compose(self, matched: str) -> Tuple[str, int]:
+        """Eşleşen metnin tüm zincirden geçmiş hali (metin başına bir kez hesaplanır)"""
+        composed = self._composed.get(matched)
+        if composed is None:
+            composed = self._composed[matched] = self._run_cascade(matched, self._cascade)
+        return composed
     
-    def _apply_special_rules(self, text: str) -> str:
+    def get_rule(self, rule_id: int) -> Tuple[str, str, str]:
         """
-        Özel düzeltme kuralları
+        Kural ID'sini çözer
         
         Args:
-            text: Metin
+            rule_id: CorrectionChange.rule_id
             
         Returns:
-            Düzeltilmiş metin
+            (kaynak, pattern, doğru_yazılış) - kaynak: special/dictionary/tech
+        """
+        self._build_automaton()
+        return self._rules[rule_id]
+    
+    def correct_batch(self, texts: List[str]) -> Tuple[List[str], List[CorrectionChange]]:
+        """
+        Birden fazla metni tek geçişte düzeltir
+        
+        Metinler ayraçla tek bir buffer'da birleştirilir, otomat buffer
+        üzerinde bir kez çalışır ve sonuç segmentlere geri bölünür.
+        
+        Args:
+            texts: Düzeltilecek metinler (segment sırasıyla)
+            
+        Returns:
+            (düzeltilmiş metinler, değişiklik kaydı)
         """
-        # "apt komutu" gibi ifadelerde apt küçük, APT büyük olmalı
-        text = re.sub(r'\bapt komutu\b', 'apt komutu', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bdpkg komutu\b', 'dpkg komutu', text, flags=re.IGNORECASE)
+        if not texts:
+            return [], []
+        
+        automaton = self._build_automaton()
+        group_to_rule = self._group_to_rule
         
-        # "APT ile" → "APT ile" (büyük harf)
-        text = re.sub(r'\bapt ile\b', 'APT ile', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bdpkg ile\b', 'DPKG ile', text, flags=re.IGNORECASE)
+        buffer = SEGMENT_SENTINEL.join(t.replace(SEGMENT_SENTINEL, "") for t in texts)
+        
+        # Segment başlangıç offset'leri (buffer → segment offset dönüşümü)
+        segment_starts = []
+        offset = 0
+        for text in texts:
+            segment_starts.append(offset)
+            offset += len(text.replace(SEGMENT_SENTINEL, "")) + 1
+        
+        changes: List[CorrectionChange] = []
+        out = []
+        last = 0
+        segment_index = 0
+        
+        for match in automaton.finditer(buffer):
+            matched = match.group()
+            replacement, first_rule = self._compose(matched)
+            if replacement == matched:
+                continue
+            rule_id = group_to_rule[match.lastindex]
+            if rule_id < 0:
+                rule_id = first_rule
+            
+            start, end = match.span()
+            while segment_index + 1 < len(segment_starts) and segment_starts[segment_index + 1] <= start:
+                segment_index += 1
+            
+            base = segment_starts[segment_index]
+            changes.append(CorrectionChange(rule_id, segment_index, start - base, end - base))
+            out.append(buffer[last:start])
+            out.append(replacement)
+            last = end
         
-        # "apt vs dpkg" → "APT vs DPKG"
-        text = re.sub(r'\bapt vs dpkg\b', 'APT vs DPKG', text, flags=re.IGNORECASE)
+        out.append(buffer[last:])
         
-        # ".deb dosyası" → ".deb dosyası"
-        text = re.sub(r'\.?deb dosyası', '.deb dosyası', text, flags=re.IGNORECASE)
+        # Gereksiz boşlukları temizle (ayraç \s ile eşleşmez)
+        corrected = re.sub(r'\s+', ' ', "".join(out)).split(SEGMENT_SENTINEL)
+        return [t.strip() for t in corrected], changes
+    
+    def correct_text(self, text: str) -> str:
+        """
+        Metni düzelt
+        
+        Args:
+            text: Düzeltilecek metin
+            
+        Returns:
+            Düzeltilmiş metin
+        """
+        corrected, changes = self.correct_batch([text])
         
-        # Gereksiz boşlukları temizle
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Log (sadece değişiklik varsa)
+        if changes:
+            logger.debug("Düzeltme: '%s' → '%s'", text, corrected[0])
         
-        return text
+        return corrected[0]
     
     def correct_subtitle_segments(self, segments: List) -> List:
         """
@@ -194,19 +415,36 @@ class SubtitleCorrector:
         Returns:
             Düzeltilmiş segment listesi
         """
-        corrected_count = 0
+        self.correct_segments_batch(segments)
+        return segments
+    
+    def correct_segments_batch(self, segments: List) -> List[CorrectionChange]:
+        """
+        Segmentleri tek geçişte yerinde düzeltir
         
-        for segment in segments:
-            original_text = segment.text
-            corrected_text = self.correct_text(original_text)
+        Kelime zamanları olan segmentlerde zamanlar düzeltilmiş metne
+        yeniden eşlenir (WordTimings.align).
+        
+        Args:
+            segments: SubtitleSegment listesi (text alanı güncellenir)
             
-            if corrected_text != original_text:
-                segment.text = corrected_text
+        Returns:
+            Değişiklik kaydı (kural, segment, offset)
+        """
+        corrected, changes = self.correct_batch([seg.text for seg in segments])
+        
+        corrected_count = 0
+        for segment, text in zip(segments, corrected):
+            if text != segment.text:
+                segment.text = text
+                words = getattr(segment, 'words', None)
+                if words:
+                    segment.words = words.align(text)
                 corrected_count += 1
         
-        logger.info(f"✓ {corrected_count}/{len(segments)} segment düzeltildi")
+        logger.info(f"✓ {corrected_count}/{len(segments)} segment düzeltildi ({len(changes)} değişiklik)")
         
-        return segments
+        return changes
     
     def add_custom_correction(self, wrong: str, correct: str):
         """
@@ -247,6 +485,30 @@ class SubtitleCorrector:
             logger.error(f"Sözlük yükleme hatası: {e}")
 
 
+def _self_check(count: int = 5000):
+    """Tek geçişli otomat, eski sıralı zincirle (kural kural re.sub) aynı sonucu vermeli"""
+    import random
+    
+    corrector = SubtitleCorrector()
+    corrector._build_automaton()
+    vocab = sorted({w for pair in corrector.corrections.items() for text in pair for w in [text, *text.split()]}
+                   | {"apt", "dpkg", "ile", "ıle", "komutu", "vs", "deb", ".deb", "dosyası", "paketi", "video"})
+    rng = random.Random(0)
+    
+    def variant(word: str) -> str:
+        return rng.choice([word, word, word.upper(), word.capitalize(), word.replace("i", "ı")])
+    
+    texts = [" ".join(variant(rng.choice(vocab)) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+    corrected, _ = corrector.correct_batch(texts)
+    mismatches = [
+        (text, got) for text, got in zip(texts, corrected)
+        if got != re.sub(r'\s+', ' ', corrector._run_cascade(text, corrector._cascade)[0]).strip()
+    ]
+    print(f"Zincir karşılaştırması: {count - len(mismatches)}/{count} aynı")
+    for text, got in mismatches[:5]:
+        print(f"  ✗ {text!r} → {got!r}")
+
+
 # Test kodu
 if __name__ == "__main__":
     corrector = SubtitleCorrector()
@@ -266,3 +528,5 @@ if __name__ == "__main__":
         print(f"Önce : {text}")
         print(f"Sonra: {corrected}")
         print()
+    
+    _self_check()
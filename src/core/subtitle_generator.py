@@ -12,14 +12,20 @@ SORUN GİDERME:
 """
 
 import subprocess
+from array import array
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Tuple
 from dataclasses import dataclass
 import json
 import time
 import re
 
 from utils.logger import get_logger
+from utils.tracing import span
+from .cancellation import CancelToken, CancelledError
+from .process_runner import run_process
+from .capabilities import get_manifest, has_encoder, has_filter, whisper_models
 
 logger = get_logger("LinuxShorts.Subtitle")
 
@@ -33,12 +39,128 @@ except ImportError:
     logger.warning("SubtitleCorrector bulunamadı, düzeltme devre dışı")
 
 
+class WordTimings:
+    """
+    Segmentteki kelimelerin zamanları (struct-of-arrays)
+
+    Kelime başına nesne yerine tek bir kelime tuple'ı ve iki float dizisi
+    (array('d')) tutulur: 10 kelimelik segment ~200 byte.
+    """
+
+    __slots__ = ("words", "starts", "ends")
+
+    def __init__(self, words: Iterable[str], starts: Iterable[float], ends: Iterable[float]):
+        self.words = tuple(words)
+        self.starts = array('d', starts)
+        self.ends = array('d', ends)
+
+    @classmethod
+    def from_whisper(cls, items: List[dict]) -> Optional['WordTimings']:
+        """
+        Whisper JSON'daki segments[].words listesinden oluşturur
+
+        Args:
+            items: [{"word": " Merhaba", "start": 0.0, "end": 0.4}, ...]
+
+        Returns:
+            WordTimings (kelime yoksa None)
+        """
+        words, starts, ends = [], [], []
+        for item in items or ():
+            word = item.get('word', '').strip()
+            if not word or 'start' not in item or 'end' not in item:
+                continue
+            words.append(word)
+            starts.append(float(item['start']))
+            ends.append(max(float(item['start']), float(item['end'])))
+        return cls(words, starts, ends) if words else None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self) -> str:
+        return f"WordTimings({len(self.words)} kelime)"
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.words)
+
+    def slice(self, i: int, j: int) -> 'WordTimings':
+        return WordTimings(self.words[i:j], self.starts[i:j], self.ends[i:j])
+
+    def shifted(self, offset: float, start: float = 0.0,
+                end: float = float('inf')) -> Optional['WordTimings']:
+        """
+        Zamanları kaydırır, [start, end] dışında kalan kelimeleri atar
+
+        Args:
+            offset: Eklenecek süre (zaman aralığı filtrelemesinde -başlangıç)
+            start, end: Kaydırılmış zamanlarda tutulacak aralık
+        """
+        keep = [i for i in range(len(self.words))
+                if self.ends[i] + offset > start and self.starts[i] + offset < end]
+        if not keep:
+            return None
+        return WordTimings(
+            (self.words[i] for i in keep),
+            (max(start, self.starts[i] + offset) for i in keep),
+            (min(end, self.ends[i] + offset) for i in keep)
+        )
+
+    def align(self, text: str) -> 'WordTimings':
+        """
+        Düzeltilmiş metnin kelimelerini mevcut zamanlara eşler
+
+        Düzeltme kelime sayısını değiştirmediyse zamanlar aynen korunur.
+        Aksi halde eşleşen kelimeler zamanlarını tutar, değişen bloklar
+        (ör. "a p t" → "apt") eski bloğun süresini yeni kelimelere paylaştırır.
+
+        Args:
+            text: Düzeltilmiş segment metni
+
+        Returns:
+            Yeni WordTimings
+        """
+        tokens = text.split()
+        if len(tokens) == len(self.words):
+            return WordTimings(tokens, self.starts, self.ends)
+
+        starts = array('d')
+        ends = array('d')
+        old = [w.lower() for w in self.words]
+        new = [t.lower() for t in tokens]
+        matcher = SequenceMatcher(None, old, new, autojunk=False)
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            count = j2 - j1
+            if count == 0:
+                continue
+            if tag == 'equal':
+                starts.extend(self.starts[i1:i2])
+                ends.extend(self.ends[i1:i2])
+                continue
+
+            # Değişen/eklenen blok: eski bloğun (yoksa komşuların) zaman aralığı
+            if i2 > i1:
+                span_start, span_end = self.starts[i1], self.ends[i2 - 1]
+            else:
+                span_start = self.ends[i1 - 1] if i1 > 0 else self.starts[0]
+                span_end = self.starts[i1] if i1 < len(self.words) else self.ends[-1]
+            step = max(0.0, span_end - span_start) / count
+            for k in range(count):
+                starts.append(span_start + k * step)
+                ends.append(span_start + (k + 1) * step)
+
+        return WordTimings(tokens, starts, ends)
+
+
 @dataclass
 class SubtitleSegment:
     """Tek bir altyazı segmenti"""
     start: float  # Başlangıç zamanı (saniye)
     end: float    # Bitiş zamanı (saniye)
     text: str     # Altyazı metni
+    words: Optional[WordTimings] = None  # Kelime zamanları (whisper word_timestamps)
 
 
 class SubtitleGenerator:
@@ -48,8 +170,15 @@ class SubtitleGenerator:
         """
         Args:
             enable_correction: Akıllı düzeltmeyi aktif et
+        
+        Whisper kontrolü (alt süreçte torch yükler, saniyeler sürer) burada
+        yapılmaz; check_whisper() ile ayrıca, tercihen arka planda çağrılır.
         """
-        self._check_whisper()
+        # None: henüz kontrol edilmedi
+        self.whisper_available: Optional[bool] = None
+        
+        # Son düzeltme geçişinin değişiklik kaydı (CorrectionChange listesi)
+        self.last_corrections = []
         
         # Corrector'ı başlat
         self.enable_correction = enable_correction and CORRECTOR_AVAILABLE
@@ -60,27 +189,29 @@ class SubtitleGenerator:
             self.corrector = None
             logger.info("Akıllı düzeltme devre dışı")
     
-    def _check_whisper(self) -> bool:
-        """Whisper'ın kurulu olup olmadığını kontrol eder"""
-        try:
-            result = subprocess.run(
-                ["whisper", "--help"],
-                capture_output=True,
-                text=True
-            )
-            logger.info("✓ Whisper kurulu ve hazır")
-            return True
-        except FileNotFoundError:
+    def check_whisper(self) -> bool:
+        """
+        Whisper'ın kurulu olup olmadığını kontrol eder (sonuç whisper_available'da)
+        
+        Sonuç araç manifestinden gelir; `whisper --help` sadece whisper
+        kurulduğunda/güncellendiğinde bir kez çalıştırılır.
+        """
+        self.whisper_available = get_manifest().tool("whisper").ok
+        if self.whisper_available:
+            models = whisper_models()
+            logger.info("✓ Whisper kurulu ve hazır (indirilmiş modeller: %s)", ", ".join(models) or "yok")
+        else:
             logger.warning("⚠️ Whisper bulunamadı!")
             logger.info("Kurulum: pip install -U openai-whisper")
-            return False
+        return self.whisper_available
     
     def generate_subtitles(
         self,
         video_path: Path,
         language: str = "tr",
         model: str = "medium",
-        apply_correction: bool = True
+        apply_correction: bool = True,
+        cancel: Optional[CancelToken] = None
     ) -> List[SubtitleSegment]:
         """
         Video'dan altyazı üretir - ULTIMATE VERSION
@@ -90,9 +221,13 @@ class SubtitleGenerator:
             language: Dil kodu (tr)
             model: Whisper modeli (medium önerilen)
             apply_correction: Akıllı düzeltme uygula
+            cancel: İptal token'ı (iptalde whisper süreç grubu öldürülür)
         
         Returns:
             Altyazı segmentleri listesi
+        
+        Raises:
+            CancelledError: Token iptal edildiyse
         """
         logger.info("="*70)
         logger.info("🚀 WHISPER ALTYAZI ÜRETİMİ")
@@ -103,6 +238,9 @@ class SubtitleGenerator:
         logger.info(f"🔧 Düzeltme: {apply_correction and self.enable_correction}")
         logger.info("="*70)
         
+        if model not in whisper_models():
+            logger.info("Whisper %s modeli indirilmemiş; ilk kullanımda indirilecek", model)
+        
         start_time = time.time()
         output_dir = video_path.parent
         
@@ -130,16 +268,21 @@ class SubtitleGenerator:
             
             logger.info("⏳ Whisper çalışıyor...")
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # JSON oku
             json_file = output_dir / f"{video_path.stem}.json"
+            try:
+                result = run_process(
+                    cmd,
+                    cancel=cancel,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+            except CancelledError:
+                logger.info("Whisper iptal edildi")
+                json_file.unlink(missing_ok=True)
+                raise
             
+            # JSON oku
             if not json_file.exists():
                 raise FileNotFoundError(f"Whisper JSON çıktısı bulunamadı: {json_file}")
             
@@ -148,21 +291,27 @@ class SubtitleGenerator:
             
             # Segmentleri parse et
             segments = []
+            # --word_timestamps çıktısı aynı geçişte segments[].words olarak gelir
             for seg in data.get('segments', []):
                 segments.append(SubtitleSegment(
                     start=seg['start'],
                     end=seg['end'],
-                    text=seg['text'].strip()
+                    text=seg['text'].strip(),
+                    words=WordTimings.from_whisper(seg.get('words'))
                 ))
             
             whisper_time = time.time() - start_time
-            logger.info(f"✓ {len(segments)} segment oluşturuldu ({whisper_time:.1f}s)")
+            word_count = sum(len(seg.words) for seg in segments if seg.words)
+            logger.info(f"✓ {len(segments)} segment, {word_count} kelime zamanı ({whisper_time:.1f}s)")
             
             # Akıllı düzeltme
+            if cancel is not None and cancel.cancelled:
+                json_file.unlink(missing_ok=True)
+                cancel.raise_if_cancelled()
             if apply_correction and self.enable_correction and self.corrector:
                 logger.info("🔧 Akıllı düzeltme uygulanıyor...")
                 correction_start = time.time()
-                segments = self.corrector.correct_subtitle_segments(segments)
+                self.last_corrections = self.corrector.correct_segments_batch(segments)
                 correction_time = time.time() - correction_start
                 logger.info(f"✓ Düzeltme tamamlandı ({correction_time:.1f}s)")
             
@@ -201,20 +350,32 @@ class SubtitleGenerator:
         Returns:
             Satırlara bölünmüş metin
         """
-        words = text.split()
-        lines = []
+        from .subtitle_renderer import wrap_lines
         
-        # Her X kelimede bir satır kır
-        for i in range(0, len(words), max_words_per_line):
-            line = ' '.join(words[i:i + max_words_per_line])
-            lines.append(line)
+        # Önizleme ve ASS export ile aynı satır kırma kuralı
+        lines = wrap_lines(text, max_words_per_line)
         
         result = '\n'.join(lines)
         
-        logger.debug(f"wrap_text: '{text}' → '{result}' (max={max_words_per_line} kelime/satır)")
+        logger.debug("wrap_text: '%s' → '%s' (max=%d kelime/satır)", text, result, max_words_per_line)
         
         return result
     
+    def wrap_segment(self, segment: SubtitleSegment, max_words_per_line: int = 4) -> str:
+        """
+        Segmenti satırlara böler (kelime zamanları varsa duraklamalara göre)
+        
+        Args:
+            segment: Altyazı segmenti
+            max_words_per_line: HER SATIRDA maksimum kelime sayısı
+            
+        Returns:
+            Satırlara bölünmüş metin
+        """
+        from .subtitle_renderer import segment_lines
+        
+        return '\n'.join(segment_lines(segment, max_words_per_line))
+    
     def create_srt_file(
         self,
         segments: List[SubtitleSegment],
@@ -241,25 +402,11 @@ class SubtitleGenerator:
         logger.info("="*70)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for i, seg in enumerate(segments, 1):
-                    start_time = self._format_time_srt(seg.start)
-                    end_time = self._format_time_srt(seg.end)
-                    
-                    # Metni wrap et
-                    wrapped_text = self.wrap_text(seg.text, max_words_per_line)
-                    
-                    # SRT formatı
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{wrapped_text}\n\n")
-                    
-                    # İlk 3 segmenti logla (debug için)
-                    if i <= 3:
-                        logger.debug(f"Segment #{i}:")
-                        logger.debug(f"  Zaman: {start_time} --> {end_time}")
-                        logger.debug(f"  Orijinal: '{seg.text}'")
-                        logger.debug(f"  Wrapped: '{wrapped_text}'")
+            from .subtitle_io import SubtitleWriter
+            
+            with SubtitleWriter(output_path, "srt") as writer:
+                for seg in segments:
+                    writer.write(seg, self.wrap_segment(seg, max_words_per_line))
             
             logger.info(f"✅ SRT dosyası oluşturuldu: {output_path}")
             logger.info("="*70)
@@ -269,9 +416,42 @@ class SubtitleGenerator:
             logger.error(f"SRT oluşturma hatası: {e}")
             return False
     
+    def create_ass_file(
+        self,
+        segments: List[SubtitleSegment],
+        output_path: Path,
+        max_words_per_line: int = 4,
+        style=None,
+        karaoke: bool = True
+    ) -> bool:
+        """
+        ASS dosyası oluşturur (kelime zamanlarıyla karaoke vurgulama)
+        
+        Args:
+            segments: Altyazı segmentleri (words alanı whisper'dan gelir)
+            output_path: Çıktı ASS dosyası
+            max_words_per_line: Her satırda MAX kelime
+            style: SubtitleStyle (None ise varsayılan)
+            karaoke: Kelimeleri konuşma zamanında vurgula (\\k)
+            
+        Returns:
+            Başarılı ise True
+        """
+        try:
+            from .subtitle_renderer import SubtitleRenderer, SubtitleStyle
+            
+            style = style or SubtitleStyle()
+            style.max_words_per_line = max_words_per_line
+            SubtitleRenderer(style).write_ass(segments, output_path, karaoke=karaoke)
+            return True
+            
+        except Exception as e:
+            logger.error(f"ASS oluşturma hatası: {e}")
+            return False
+    
     def read_srt_file(self, srt_path: Path) -> List[SubtitleSegment]:
         """
-        SRT dosyasını okur
+        SRT dosyasını okur (VTT / ASS uzantıları da desteklenir)
         
         Args:
             srt_path: SRT dosyası yolu
@@ -282,34 +462,9 @@ class SubtitleGenerator:
         logger.info(f"SRT dosyası okunuyor: {srt_path}")
         
         try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            from .subtitle_io import read_subtitles
             
-            segments = []
-            blocks = content.strip().split('\n\n')
-            
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if len(lines) < 3:
-                    continue
-                
-                # Zaman satırı
-                time_line = lines[1]
-                times = time_line.split(' --> ')
-                if len(times) != 2:
-                    continue
-                
-                start = self._parse_time_srt(times[0])
-                end = self._parse_time_srt(times[1])
-                
-                # Metin
-                text = '\n'.join(lines[2:])
-                
-                segments.append(SubtitleSegment(
-                    start=start,
-                    end=end,
-                    text=text
-                ))
+            segments = list(read_subtitles(srt_path))
             
             logger.info(f"✓ {len(segments)} segment okundu")
             return segments
@@ -320,22 +475,13 @@ class SubtitleGenerator:
     
     def _format_time_srt(self, seconds: float) -> str:
         """Saniye → SRT format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        from .subtitle_io import format_srt_time
+        return format_srt_time(seconds)
     
     def _parse_time_srt(self, time_str: str) -> float:
         """SRT format → Saniye"""
-        time_str = time_str.strip().replace(',', '.')
-        parts = time_str.split(':')
-        if len(parts) != 3:
-            return 0.0
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        seconds = float(parts[2])
-        return hours * 3600 + minutes * 60 + seconds
+        from .subtitle_io import parse_timestamp
+        return parse_timestamp(time_str)
     
     def burn_subtitles(
         self,
@@ -344,15 +490,18 @@ class SubtitleGenerator:
         output_path: Path,
         fontsize: int = 20,
         style: str = "tiktok",
-        position: str = "bottom"
+        position: str = "bottom",
+        cancel: Optional[CancelToken] = None
     ) -> bool:
         """
         Altyazıları videoya yazar - v6.0 ULTIMATE
         
         ✅ POZISYON TAM ÇALIŞIYOR:
            - bottom = ALT (MarginV=100, Alignment=2)
-           - center = ORTA (MarginV=500, Alignment=5)
-           - top = ÜST (MarginV=50, Alignment=8)
+           - center = ORTA (MarginV=0, Alignment=5)
+           - top = ÜST (MarginV=100, Alignment=8)
+        
+        ✅ Önizlemeyle aynı ASS dosyası (SubtitleRenderer) kullanılır
         
         ✅ FONT BOYUTU slider'dan alınıyor
         ✅ DETAYLI LOGLAMA (her şey görünür)
@@ -361,9 +510,10 @@ class SubtitleGenerator:
             video_path: Kaynak video
             srt_path: SRT dosyası
             output_path: Çıktı videosu
-            fontsize: Font boyutu (14-32px)
+            fontsize: Font boyutu (14-32px, 288p ölçeğinde)
             style: Stil (tiktok/youtube/minimal)
             position: Pozisyon (bottom/center/top)
+            cancel: İptal token'ı (iptalde yarım çıktı silinir)
             
         Returns:
             Başarılı ise True
@@ -383,79 +533,46 @@ class SubtitleGenerator:
             logger.error(f"SRT dosyası bulunamadı: {srt_path}")
             return False
         
-        # Stil ayarları
-        styles = {
-            "tiktok": {
-                "font": "Arial-Bold",
-                "fontcolor": "yellow",
-                "bordercolor": "black",
-                "borderw": 3,
-            },
-            "youtube": {
-                "font": "Arial",
-                "fontcolor": "white",
-                "bordercolor": "black",
-                "borderw": 2,
-            },
-            "minimal": {
-                "font": "Arial",
-                "fontcolor": "white",
-                "bordercolor": "black",
-                "borderw": 1,
-            }
-        }
-        
-        s = styles.get(style, styles["youtube"])
-        
-        # 🔥 POZİSYON AYARLARI (ASS Alignment sistemi)
+        # ASS dosyası yazılmadan önce: erken dönüşlerde geride dosya kalmaz
+        # libass'sız ffmpeg derlemelerinde subtitles filtresi yoktur
+        if not has_filter("subtitles"):
+            logger.error("ffmpeg 'subtitles' filtresi olmadan derlenmiş (libass gerekli)")
+            return False
+        if not has_encoder("libx264"):
+            logger.error("ffmpeg libx264 encoder'ı olmadan derlenmiş")
+            return False
+        
+        from .subtitle_io import read_subtitles
+        from .subtitle_renderer import SubtitleRenderer, SubtitleStyle
+        
+        # 🔥 Önizlemeyle aynı yerleşim motoru: stil ve satırlar ASS dosyasına
+        # yazılır (PlayRes = 1080x1920), force_style ile tahmin yapılmaz.
         # ASS Alignment numaraları:
         # 1-3: Alt (sol-orta-sağ)
         # 4-6: Orta (sol-orta-sağ)
         # 7-9: Üst (sol-orta-sağ)
+        sub_style = SubtitleStyle.from_preset(style, fontsize, position)
+        renderer = SubtitleRenderer(sub_style)
         
-        # MarginV: Y ekseninde pozisyon (piksel)
-        # Video: 1920px yükseklik (9:16)
-        
-        position_settings = {
-            "bottom": {
-                "alignment": 2,    # Alt orta
-                "marginv": 100     # Alttan 100px yukarıda
-            },
-            "center": {
-                "alignment": 5,    # Tam orta
-                "marginv": 960     # Ortada (1920/2)
-            },
-            "top": {
-                "alignment": 8,    # Üst orta
-                "marginv": 100     # Üstten 100px aşağıda
-            }
-        }
-        
-        pos = position_settings.get(position, position_settings["bottom"])
+        ass_path = output_path.with_suffix(".ass")
+        try:
+            renderer.write_ass(read_subtitles(srt_path), ass_path)
+        except Exception as e:
+            ass_path.unlink(missing_ok=True)
+            logger.error(f"ASS oluşturma hatası: {e}")
+            return False
         
         logger.info("FFmpeg Parametreleri:")
-        logger.info(f"  Font: {s['font']}")
-        logger.info(f"  FontSize: {fontsize}px")
-        logger.info(f"  Renk: {s['fontcolor']}")
-        logger.info(f"  Border: {s['borderw']}px {s['bordercolor']}")
-        logger.info(f"  Alignment: {pos['alignment']} ({position})")
-        logger.info(f"  MarginV: {pos['marginv']}px")
+        logger.info(f"  Font: {renderer.font_name} ({sub_style.font_path})")
+        logger.info(f"  FontSize: {sub_style.font_size}px @ {sub_style.play_res[1]}p")
+        logger.info(f"  Renk: {sub_style.primary_color}")
+        logger.info(f"  Border: {sub_style.outline}px {sub_style.outline_color}")
+        logger.info(f"  Alignment: {sub_style.alignment} ({position})")
+        logger.info(f"  MarginV: {sub_style.margin_v}px")
         logger.info("="*70)
         
         # FFmpeg subtitle filter
-        subtitle_filter = (
-            f"subtitles={srt_path}:"
-            f"force_style='"
-            f"FontName={s['font']},"
-            f"FontSize={fontsize},"
-            f"PrimaryColour=&H00{self._color_to_hex(s['fontcolor'])},"
-            f"OutlineColour=&H00{self._color_to_hex(s['bordercolor'])},"
-            f"BorderStyle=1,"
-            f"Outline={s['borderw']},"
-            f"Alignment={pos['alignment']},"
-            f"MarginV={pos['marginv']}"
-            f"'"
-        )
+        subtitle_filter = renderer.subtitles_filter(ass_path)
         
         cmd = [
             "ffmpeg",
@@ -473,19 +590,21 @@ class SubtitleGenerator:
             logger.info("⏳ FFmpeg çalışıyor...")
             logger.debug(f"Komut: {' '.join(cmd)}")
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            with span("encode", "encode", output=output_path.name, subtitles=True):
+                result = run_process(
+                    cmd,
+                    cancel=cancel,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
             
             logger.info("="*70)
             logger.info("✅ BAŞARILI!")
             logger.info("="*70)
             logger.info(f"📁 Çıktı: {output_path.name}")
             logger.info(f"📦 Boyut: {output_path.stat().st_size / (1024*1024):.1f} MB")
-            logger.info(f"📍 Altyazı pozisyonu: {position} ({pos['alignment']}, {pos['marginv']}px)")
+            logger.info(f"📍 Altyazı pozisyonu: {position} ({sub_style.alignment}, {sub_style.margin_v}px)")
             logger.info("="*70)
             
             return True
@@ -497,18 +616,13 @@ class SubtitleGenerator:
             logger.error(f"Çıktı: {e.stderr}")
             logger.error("="*70)
             return False
-    
-    def _color_to_hex(self, color: str) -> str:
-        """Renk → Hex (BGR formatı)"""
-        colors = {
-            "white": "FFFFFF",
-            "black": "000000",
-            "yellow": "00FFFF",
-            "red": "0000FF",
-            "blue": "FF0000",
-            "green": "00FF00"
-        }
-        return colors.get(color.lower(), "FFFFFF")
+        
+        except CancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
+        
+        finally:
+            ass_path.unlink(missing_ok=True)
 
 
 # Test kodu
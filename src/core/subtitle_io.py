@@ -0,0 +1,499 @@
+"""
+LinuxShorts Pro - Subtitle I/O
+SRT / VTT / ASS için akışlı okuyucu ve tamponlu yazıcılar
+
+- Okuyucular dosyayı satır satır işler ve SubtitleSegment'leri tek tek
+  üretir (generator). Bellekte sadece o anki cue tutulur.
+- CRLF / CR satır sonları ve cue içindeki boş satırlar desteklenir.
+- Yazıcılar cue'ları tamponda biriktirip toplu halde diske yazar.
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Union
+
+from utils.logger import get_logger
+
+from .subtitle_generator import SubtitleSegment
+
+logger = get_logger("LinuxShorts.SubtitleIO")
+
+PathOrFile = Union[str, Path, TextIO]
+
+SUPPORTED_FORMATS = ("srt", "vtt", "ass")
+
+# "00:00:01,000 --> 00:00:02,500" (VTT'de sonda cue ayarları olabilir)
+_TIMING_RE = re.compile(r'^\s*(\d[\d:.,]*)\s*-->\s*(\d[\d:.,]*)')
+_ASS_OVERRIDE_RE = re.compile(r'\{[^}]*\}')
+
+# Yazıcı tamponu: bu kadar cue birikince diske yazılır
+DEFAULT_BUFFER_CUES = 512
+FILE_BUFFER_SIZE = 1 << 16
+
+DEFAULT_ASS_HEADER = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: 1080\n"
+    "PlayResY: 1920\n"
+    "WrapStyle: 2\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+    "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+    "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+    "Style: Default,DejaVu Sans,60,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,"
+    "-1,0,0,0,100,100,0,0,1,3,0,2,50,50,100,1\n"
+    "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
+
+# ============================================================
+# ZAMAN FORMATLARI
+# ============================================================
+
+def parse_timestamp(value: str) -> float:
+    """
+    SRT / VTT / ASS zaman damgasını saniyeye çevirir
+
+    "01:02:03,456", "02:03.456", "1:02:03.45" formatlarını kabul eder.
+    """
+    parts = value.strip().replace(',', '.').split(':')
+    try:
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return 0.0
+
+
+def _split_millis(seconds: float):
+    total_ms = max(0, int(round(seconds * 1000)))
+    hours, rest = divmod(total_ms, 3600000)
+    minutes, rest = divmod(rest, 60000)
+    secs, millis = divmod(rest, 1000)
+    return hours, minutes, secs, millis
+
+
+def format_srt_time(seconds: float) -> str:
+    """Saniye → SRT format (HH:MM:SS,mmm)"""
+    h, m, s, ms = _split_millis(seconds)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+def format_vtt_time(seconds: float) -> str:
+    """Saniye → VTT format (HH:MM:SS.mmm)"""
+    h, m, s, ms = _split_millis(seconds)
+    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+
+
+def format_ass_time(seconds: float) -> str:
+    """Saniye → ASS format (H:MM:SS.cc)"""
+    total_cs = max(0, int(round(seconds * 100)))
+    h, rest = divmod(total_cs, 360000)
+    m, rest = divmod(rest, 6000)
+    s, cs = divmod(rest, 100)
+    return f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
+
+
+# ============================================================
+# OKUYUCULAR
+# ============================================================
+
+def _iter_lines(source: PathOrFile) -> Iterator[str]:
+    """Dosyayı satır satır okur (CRLF / CR normalize edilir)"""
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8-sig', newline=None,
+                  buffering=FILE_BUFFER_SIZE) as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+    else:
+        first = True
+        for line in source:
+            if first:
+                line = line.lstrip('\ufeff')
+                first = False
+            yield line.rstrip('\r\n')
+
+
+def _finish_cue(start: float, end: float, lines: List[str]) -> SubtitleSegment:
+    # Baştaki ve sondaki boş satırları at
+    while lines and not lines[-1].strip():
+        lines.pop()
+    first = 0
+    while first < len(lines) and not lines[first].strip():
+        first += 1
+    return SubtitleSegment(start=start, end=end, text='\n'.join(lines[first:]))
+
+
+def iter_srt(source: PathOrFile) -> Iterator[SubtitleSegment]:
+    """
+    SRT dosyasını akışlı okur
+
+    Cue sınırı boş satırla değil, zaman satırıyla belirlenir; bu sayede cue
+    içindeki boş satırlar metnin parçası olarak kalır. Zaman satırından hemen
+    önceki sayı satırı bir sonraki cue'nun numarasıdır.
+
+    Args:
+        source: Dosya yolu veya açık metin dosyası
+
+    Yields:
+        SubtitleSegment
+    """
+    start = end = 0.0
+    lines: Optional[List[str]] = None
+
+    for line in _iter_lines(source):
+        match = _TIMING_RE.match(line) if '-->' in line else None
+        if match:
+            if lines is not None:
+                # Önceki cue'nun son satırı bu cue'nun numarası
+                while lines and not lines[-1].strip():
+                    lines.pop()
+                if lines and lines[-1].strip().isdigit():
+                    lines.pop()
+                yield _finish_cue(start, end, lines)
+            start = parse_timestamp(match.group(1))
+            end = parse_timestamp(match.group(2))
+            lines = []
+        elif lines is not None:
+            lines.append(line)
+
+    if lines is not None:
+        yield _finish_cue(start, end, lines)
+
+
+def iter_vtt(source: PathOrFile) -> Iterator[SubtitleSegment]:
+    """
+    WebVTT dosyasını akışlı okur
+
+    VTT'de cue'lar boş satırla biter; NOTE / STYLE / REGION blokları atlanır.
+
+    Args:
+        source: Dosya yolu veya açık metin dosyası
+
+    Yields:
+        SubtitleSegment
+    """
+    start = end = 0.0
+    lines: Optional[List[str]] = None
+    skipping = False
+
+    for line in _iter_lines(source):
+        if not line.strip():
+            if lines is not None:
+                yield _finish_cue(start, end, lines)
+                lines = None
+            skipping = False
+            continue
+
+        if lines is not None:
+            lines.append(line)
+            continue
+
+        if skipping:
+            continue
+
+        match = _TIMING_RE.match(line)
+        if match:
+            start = parse_timestamp(match.group(1))
+            end = parse_timestamp(match.group(2))
+            lines = []
+        elif line.startswith(("WEBVTT", "NOTE", "STYLE", "REGION")):
+            skipping = True
+        # Diğer satırlar cue kimliğidir
+
+    if lines is not None:
+        yield _finish_cue(start, end, lines)
+
+
+def _ass_text(text: str) -> str:
+    """ASS metnini düz metne çevirir (override tag'leri atılır)"""
+    text = _ASS_OVERRIDE_RE.sub('', text)
+    return text.replace('\\N', '\n').replace('\\n', '\n').replace('\\h', ' ')
+
+
+def iter_ass(source: PathOrFile) -> Iterator[SubtitleSegment]:
+    """
+    ASS / SSA dosyasını akışlı okur ([Events] bölümündeki Dialogue satırları)
+
+    Args:
+        source: Dosya yolu veya açık metin dosyası
+
+    Yields:
+        SubtitleSegment
+    """
+    in_events = False
+    fields = ["layer", "start", "end", "style", "name",
+              "marginl", "marginr", "marginv", "effect", "text"]
+
+    for line in _iter_lines(source):
+        stripped = line.strip()
+        if stripped.startswith('['):
+            in_events = stripped.lower() == '[events]'
+            continue
+        if not in_events:
+            continue
+
+        key, _, value = stripped.partition(':')
+        key = key.strip().lower()
+        if key == 'format':
+            fields = [f.strip().lower() for f in value.split(',')]
+        elif key == 'dialogue':
+            values = value.split(',', len(fields) - 1)
+            if len(values) < len(fields):
+                continue
+            row = dict(zip(fields, values))
+            yield SubtitleSegment(
+                start=parse_timestamp(row.get('start', '0')),
+                end=parse_timestamp(row.get('end', '0')),
+                text=_ass_text(row.get('text', '')).strip()
+            )
+
+
+def detect_format(path: Path) -> str:
+    """Uzantıdan altyazı formatını belirler"""
+    suffix = Path(path).suffix.lower().lstrip('.')
+    if suffix == 'ssa':
+        return 'ass'
+    return suffix if suffix in SUPPORTED_FORMATS else 'srt'
+
+
+_READERS = {
+    "srt": iter_srt,
+    "vtt": iter_vtt,
+    "ass": iter_ass,
+}
+
+
+def read_subtitles(source: PathOrFile, fmt: Optional[str] = None) -> Iterator[SubtitleSegment]:
+    """
+    Altyazı dosyasını formatına göre akışlı okur
+
+    Args:
+        source: Dosya yolu veya açık metin dosyası
+        fmt: srt / vtt / ass (None ise uzantıdan belirlenir)
+
+    Yields:
+        SubtitleSegment
+    """
+    if fmt is None:
+        fmt = detect_format(source) if isinstance(source, (str, Path)) else "srt"
+    reader = _READERS.get(fmt)
+    if reader is None:
+        raise ValueError(f"Desteklenmeyen altyazı formatı: {fmt}")
+    return reader(source)
+
+
+# ============================================================
+# YAZICILAR
+# ============================================================
+
+class SubtitleWriter:
+    """
+    Tamponlu altyazı yazıcı
+
+    Kullanım:
+        with SubtitleWriter(path, "srt") as writer:
+            for seg in segments:
+                writer.write(seg)
+    """
+
+    def __init__(
+        self,
+        target: PathOrFile,
+        fmt: str = "srt",
+        wrap: Optional[Callable[[str], str]] = None,
+        buffer_cues: int = DEFAULT_BUFFER_CUES,
+        ass_header: Optional[str] = None,
+        ass_style: str = "Default"
+    ):
+        """
+        Args:
+            target: Çıktı dosya yolu veya açık metin dosyası
+            fmt: srt / vtt / ass
+            wrap: Metni satırlara bölen fonksiyon (ör. SubtitleGenerator.wrap_text)
+            buffer_cues: Diske yazmadan önce biriktirilecek cue sayısı
+            ass_header: ASS başlığı ([Script Info] ... [Events] Format satırı)
+            ass_style: Dialogue satırlarında kullanılacak stil adı
+        """
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Desteklenmeyen altyazı formatı: {fmt}")
+
+        self.fmt = fmt
+        self.wrap = wrap
+        self.buffer_cues = max(1, buffer_cues)
+        self.ass_style = ass_style
+        self.count = 0
+
+        self._owns_file = isinstance(target, (str, Path))
+        if self._owns_file:
+            self._file = open(target, 'w', encoding='utf-8', newline='\n',
+                              buffering=FILE_BUFFER_SIZE)
+        else:
+            self._file = target
+
+        self._buffer: List[str] = []
+
+        if fmt == "vtt":
+            self._buffer.append("WEBVTT\n\n")
+        elif fmt == "ass":
+            self._buffer.append(ass_header or DEFAULT_ASS_HEADER)
+
+    def format_cue(self, segment: SubtitleSegment, text: Optional[str] = None) -> str:
+        """Tek bir cue'yu hedef formatta metne çevirir"""
+        if text is None:
+            text = self.wrap(segment.text) if self.wrap else segment.text
+
+        if self.fmt == "srt":
+            return (f"{self.count}\n"
+                    f"{format_srt_time(segment.start)} --> {format_srt_time(segment.end)}\n"
+                    f"{text}\n\n")
+        if self.fmt == "vtt":
+            return (f"{format_vtt_time(segment.start)} --> {format_vtt_time(segment.end)}\n"
+                    f"{text}\n\n")
+
+        text = text.replace('\n', '\\N')
+        return (f"Dialogue: 0,{format_ass_time(segment.start)},{format_ass_time(segment.end)},"
+                f"{self.ass_style},,0,0,0,,{text}\n")
+
+    def write(self, segment: SubtitleSegment, text: Optional[str] = None):
+        """
+        Cue ekler
+
+        Args:
+            segment: Altyazı segmenti
+            text: Hazır cue metni (None ise segment.text + wrap kullanılır)
+        """
+        self.count += 1
+        self._buffer.append(self.format_cue(segment, text))
+        if len(self._buffer) >= self.buffer_cues:
+            self.flush()
+
+    def write_all(self, segments: Iterable[SubtitleSegment]) -> int:
+        """Tüm segmentleri yazar, yazılan cue sayısını döndürür"""
+        for segment in segments:
+            self.write(segment)
+        return self.count
+
+    def flush(self):
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> 'SubtitleWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_subtitles(
+    segments: Iterable[SubtitleSegment],
+    target: PathOrFile,
+    fmt: Optional[str] = None,
+    wrap: Optional[Callable[[str], str]] = None
+) -> int:
+    """
+    Segmentleri dosyaya yazar
+
+    Args:
+        segments: Altyazı segmentleri (generator olabilir)
+        target: Dosya yolu veya açık metin dosyası
+        fmt: srt / vtt / ass (None ise uzantıdan belirlenir)
+        wrap: Metni satırlara bölen fonksiyon
+
+    Returns:
+        Yazılan cue sayısı
+    """
+    if fmt is None:
+        fmt = detect_format(target) if isinstance(target, (str, Path)) else "srt"
+    with SubtitleWriter(target, fmt, wrap=wrap) as writer:
+        return writer.write_all(segments)
+
+
+def format_subtitles(segments: Iterable[SubtitleSegment], fmt: str = "srt",
+                     wrap: Optional[Callable[[str], str]] = None) -> str:
+    """Segmentleri bellekte altyazı metnine çevirir (GUI metin kutusu için)"""
+    buffer = io.StringIO()
+    write_subtitles(segments, buffer, fmt, wrap)
+    return buffer.getvalue()
+
+
+def _benchmark(cue_count: int = 100_000):
+    """Akışlı okuma / tamponlu yazma ile eski yöntemleri karşılaştırır"""
+    import tempfile
+    import time
+    import tracemalloc
+
+    segments = (
+        SubtitleSegment(start=i * 2.0, end=i * 2.0 + 1.5, text=f"Altyazı satırı {i}\nikinci satır")
+        for i in range(cue_count)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.srt"
+
+        t0 = time.perf_counter()
+        write_subtitles(segments, path)
+        write_time = time.perf_counter() - t0
+
+        # Eski yöntem: += ile string birleştirme
+        t0 = time.perf_counter()
+        text = ""
+        for i in range(cue_count):
+            text += (f"{i + 1}\n{format_srt_time(i * 2.0)} --> {format_srt_time(i * 2.0 + 1.5)}\n"
+                     f"Altyazı satırı {i}\nikinci satır\n\n")
+        concat_time = time.perf_counter() - t0
+        del text
+
+        t0 = time.perf_counter()
+        count = sum(1 for _ in read_subtitles(path))
+        read_time = time.perf_counter() - t0
+
+        # Bellek ölçümü ayrı (tracemalloc süreyi yavaşlatır)
+        tracemalloc.start()
+        for _ in read_subtitles(path):
+            pass
+        _, read_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Eski yöntem: tüm dosyayı oku + '\n\n' ile böl
+        def legacy_read():
+            with open(path, 'r', encoding='utf-8') as f:
+                blocks = f.read().strip().split('\n\n')
+            return [SubtitleSegment(parse_timestamp(b.split('\n')[1].split(' --> ')[0]),
+                                    parse_timestamp(b.split('\n')[1].split(' --> ')[1]),
+                                    '\n'.join(b.split('\n')[2:])) for b in blocks]
+
+        t0 = time.perf_counter()
+        legacy_count = len(legacy_read())
+        legacy_time = time.perf_counter() - t0
+
+        tracemalloc.start()
+        legacy_read()
+        _, legacy_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+    print(f"📄 {cue_count} cue, {size_mb:.1f} MB")
+    print(f"✍️  Yazma (tamponlu) : {write_time:.2f}s")
+    print(f"✍️  Yazma (+= eski)  : {concat_time:.2f}s")
+    print(f"📖 Okuma (akışlı)   : {read_time:.2f}s, {count} cue, tepe bellek {read_peak / 1024:.0f} KB")
+    print(f"📖 Okuma (eski)     : {legacy_time:.2f}s, {legacy_count} blok, tepe bellek {legacy_peak / 1024:.0f} KB")
+
+
+# Test kodu (100k cue benchmark): cd src && python -m core.subtitle_io
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,620 @@
+"""
+LinuxShorts Pro - Subtitle Renderer
+Önizleme ve export için ortak altyazı yerleşim motoru
+
+- Satır kırma wrap_text ile aynı kuralları kullanır (kelime sayısına göre)
+- Glyph bitmap'leri (font, boyut, kontur) başına bir kez rasterize edilir
+- Önizlemede NumPy ile frame üzerine birleştirilir
+- Export için aynı stil ve satırlarla ASS dosyası üretilir (PlayRes = çıktı
+  çözünürlüğü), böylece ffmpeg/libass aynı yerleşimi çizer
+- Kelime zamanları varsa satırlar konuşmadaki duraklamalardan kırılır ve
+  isteğe bağlı olarak ASS karaoke (\\k) etiketleri yazılır
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+from utils.logger import get_logger
+from utils.tracing import span
+
+logger = get_logger("LinuxShorts.SubtitleRenderer")
+
+try:
+    from PIL import Image, ImageDraw
+    from utils.fonts import load_font, default_font_path
+    IMAGING_AVAILABLE = True
+except ImportError:
+    IMAGING_AVAILABLE = False
+    logger.warning("PIL bulunamadı, altyazı önizlemesi devre dışı")
+
+
+# ASS Alignment (numpad düzeni): 2 = alt orta, 5 = tam orta, 8 = üst orta
+POSITIONS = {
+    "bottom": {"alignment": 2, "margin_v": 100},
+    "center": {"alignment": 5, "margin_v": 0},
+    "top": {"alignment": 8, "margin_v": 100},
+}
+
+# burn_subtitles stil önayarları
+STYLE_PRESETS = {
+    "tiktok": {"primary_color": "#FFFF00", "outline_color": "#000000", "outline": 3},
+    "youtube": {"primary_color": "#FFFFFF", "outline_color": "#000000", "outline": 2},
+    "minimal": {"primary_color": "#FFFFFF", "outline_color": "#000000", "outline": 1},
+}
+
+# Bu süreden uzun kelime arası duraklamalar satır sonu için tercih edilir (saniye)
+LINE_BREAK_PAUSE = 0.3
+
+# SRT + force_style ile libass'ın varsayılan PlayResY değeri (eski font boyutları bu ölçekte)
+LEGACY_PLAY_RES_Y = 288
+
+
+def wrap_lines(text: str, max_words_per_line: int = 4) -> List[str]:
+    """
+    Metni kelime bazlı satırlara böler (SubtitleGenerator.wrap_text kuralı)
+
+    Metindeki mevcut satır sonları korunur, her satır ayrıca max_words_per_line
+    kelimelik parçalara bölünür.
+
+    Args:
+        text: Metin
+        max_words_per_line: Her satırda maksimum kelime (<= 0 ise bölme yok)
+
+    Returns:
+        Satırlar
+    """
+    lines = []
+    for paragraph in text.splitlines():
+        words = paragraph.split()
+        if not words:
+            continue
+        if max_words_per_line <= 0:
+            lines.append(' '.join(words))
+            continue
+        for i in range(0, len(words), max_words_per_line):
+            lines.append(' '.join(words[i:i + max_words_per_line]))
+    return lines
+
+
+def break_word_lines(words, max_words_per_line: int = 4,
+                     min_pause: float = LINE_BREAK_PAUSE) -> List[Tuple[int, int]]:
+    """
+    Kelime zamanlarına göre satır aralıklarını belirler
+
+    Her satır en fazla max_words_per_line kelimedir; bu pencere içinde
+    min_pause'dan uzun bir duraklama varsa satır en uzun duraklamada kırılır.
+
+    Args:
+        words: WordTimings
+        max_words_per_line: Her satırda maksimum kelime
+        min_pause: Satır sonu sayılacak minimum duraklama (saniye)
+
+    Returns:
+        [(başlangıç_index, bitiş_index), ...] (bitiş hariç)
+    """
+    count = len(words)
+    if max_words_per_line <= 0:
+        return [(0, count)] if count else []
+
+    starts, ends = words.starts, words.ends
+    ranges = []
+    i = 0
+    while i < count:
+        limit = min(count, i + max_words_per_line)
+        cut = limit
+        best_pause = min_pause
+        # Pencere içindeki en uzun duraklama
+        for j in range(i + 1, limit):
+            pause = starts[j] - ends[j - 1]
+            if pause >= best_pause:
+                best_pause = pause
+                cut = j
+        ranges.append((i, cut))
+        i = cut
+    return ranges
+
+
+def _timed_words(segment):
+    """Segment metniyle hizalı kelime zamanları (yoksa None)"""
+    words = getattr(segment, 'words', None)
+    if not words or len(words) != len(segment.text.split()):
+        return None
+    return words
+
+
+def segment_lines(segment, max_words_per_line: int = 4) -> List[str]:
+    """
+    Segmenti satırlara böler (kelime zamanları varsa duraklamalara göre)
+
+    Önizleme (layout) ve ASS export aynı satır sonlarını bu fonksiyondan alır.
+
+    Args:
+        segment: SubtitleSegment veya düz metin
+        max_words_per_line: Her satırda maksimum kelime
+
+    Returns:
+        Satırlar
+    """
+    if isinstance(segment, str):
+        return wrap_lines(segment, max_words_per_line)
+    words = _timed_words(segment)
+    if words is None:
+        return wrap_lines(segment.text, max_words_per_line)
+    tokens = segment.text.split()
+    return [' '.join(tokens[i:j]) for i, j in break_word_lines(words, max_words_per_line)]
+
+
+def karaoke_text(segment, max_words_per_line: int = 4) -> str:
+    """
+    Segmenti ASS karaoke etiketleriyle yazar ({\\kNN}kelime, NN santisaniye)
+
+    Süreler segment başlangıcına göre yuvarlanmış konumların farkıdır, bu
+    yüzden uzun segmentlerde yuvarlama hatası birikmez. Kelime arası
+    duraklamalar boş bir \\k bloğu olarak yazılır.
+
+    Args:
+        segment: SubtitleSegment (words alanı olmalı)
+        max_words_per_line: Her satırda maksimum kelime
+
+    Returns:
+        '\\n' ile ayrılmış satırlar (kelime zamanı yoksa düz metin)
+    """
+    words = _timed_words(segment)
+    if words is None:
+        return '\n'.join(segment_lines(segment, max_words_per_line))
+
+    tokens = segment.text.split()
+    origin = segment.start
+
+    def cs(t: float) -> int:
+        return max(0, round((t - origin) * 100))
+
+    cursor = 0
+    lines = []
+    for i, j in break_word_lines(words, max_words_per_line):
+        parts = []
+        for k in range(i, j):
+            start, end = cs(words.starts[k]), cs(words.ends[k])
+            if start > cursor:
+                parts.append(f"{{\\k{start - cursor}}}")
+                cursor = start
+            end = max(end, cursor)
+            token = tokens[k].replace('{', '(').replace('}', ')')
+            parts.append(f"{{\\k{end - cursor}}}{token}" + (' ' if k < j - 1 else ''))
+            cursor = end
+        lines.append(''.join(parts))
+    return '\n'.join(lines)
+
+
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        return (255, 255, 255)
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _karaoke_color(hex_color: str) -> str:
+    """Ana renkten ayırt edilebilen karaoke rengi (açık renk koyulaşır, koyu renk açılır)"""
+    r, g, b = _hex_to_rgb(hex_color)
+    if 0.299 * r + 0.587 * g + 0.114 * b >= 128:
+        r, g, b = (round(c * 0.45) for c in (r, g, b))
+    else:
+        r, g, b = (round(c + (255 - c) * 0.55) for c in (r, g, b))
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def _ass_color(hex_color: str, alpha: int = 0) -> str:
+    """#RRGGBB → &HAABBGGRR (ASS, alpha 0 = opak)"""
+    r, g, b = _hex_to_rgb(hex_color)
+    return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}"
+
+
+@dataclass
+class SubtitleStyle:
+    """Altyazı stili (tüm ölçüler çıktı çözünürlüğü / PlayRes cinsinden)"""
+    font_size: int = 60
+    font_path: Optional[str] = None
+    primary_color: str = "#FFFFFF"
+    karaoke_color: Optional[str] = None    # Karaoke: henüz söylenmemiş kelimelerin rengi (None = ana rengin soluk hali)
+    outline_color: str = "#000000"
+    outline: int = 3
+    background: bool = False
+    background_opacity: float = 0.5
+    alignment: int = 2
+    margin_v: int = 100
+    margin_h: int = 50
+    max_words_per_line: int = 4
+    play_res: Tuple[int, int] = (1080, 1920)
+
+    @classmethod
+    def from_options(cls, font_size: int, color: str = "#FFFFFF", position: str = "bottom",
+                     background: bool = False, **kwargs) -> 'SubtitleStyle':
+        """GUI seçeneklerinden stil oluşturur"""
+        pos = POSITIONS.get(position, POSITIONS["bottom"])
+        return cls(
+            font_size=int(font_size),
+            primary_color=color,
+            background=background,
+            alignment=pos["alignment"],
+            margin_v=pos["margin_v"],
+            **kwargs
+        )
+
+    @classmethod
+    def from_preset(cls, preset: str, fontsize: int, position: str = "bottom",
+                    **kwargs) -> 'SubtitleStyle':
+        """
+        burn_subtitles önayarından stil oluşturur
+
+        fontsize eski force_style ölçeğindedir (PlayResY=288), çıktı
+        çözünürlüğüne çevrilir.
+        """
+        options = dict(STYLE_PRESETS.get(preset, STYLE_PRESETS["youtube"]))
+        options.update(kwargs)
+        play_res = options.get("play_res", cls.play_res)
+        size = round(fontsize * play_res[1] / LEGACY_PLAY_RES_Y)
+        pos = POSITIONS.get(position, POSITIONS["bottom"])
+        return cls(font_size=size, alignment=pos["alignment"], margin_v=pos["margin_v"], **options)
+
+
+@dataclass
+class Glyph:
+    """Rasterize edilmiş tek karakter"""
+    advance: float
+    dx: int = 0                            # Baseline/pen noktasına göre sol ofset
+    dy: int = 0                            # Baseline'a göre üst ofset
+    outer: Optional[np.ndarray] = None     # Kontur dahil kaplama maskesi (uint8)
+    inner: Optional[np.ndarray] = None     # Sadece dolgu maskesi (uint8)
+
+
+class GlyphAtlas:
+    """
+    (font, boyut, kontur) başına glyph bitmap cache'i
+
+    Aynı atlas tüm önizleme karelerinde tekrar kullanılır; her karakter
+    ilk kullanımda bir kez rasterize edilir.
+    """
+
+    _atlases: Dict[Tuple[Optional[str], int, int], 'GlyphAtlas'] = {}
+
+    def __init__(self, font_path: Optional[str], size: int, stroke: int):
+        self.font_path = font_path
+        self.size = size
+        self.stroke = stroke
+        self.font = _ass_font(size, font_path)
+        ascent, descent = self.font.getmetrics()
+        self.ascent = ascent
+        self.line_height = ascent + descent
+        self.glyphs: Dict[str, Glyph] = {}
+
+    @classmethod
+    def get(cls, font_path: Optional[str], size: int, stroke: int) -> 'GlyphAtlas':
+        key = (font_path, max(1, int(size)), max(0, int(stroke)))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls(*key)
+            cls._atlases[key] = atlas
+        return atlas
+
+    def glyph(self, char: str) -> Glyph:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self._rasterize(char)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def _rasterize(self, char: str) -> Glyph:
+        advance = self.font.getlength(char)
+        left, top, right, bottom = self.font.getbbox(char, anchor="ls", stroke_width=self.stroke)
+        width, height = right - left, bottom - top
+        if width <= 0 or height <= 0 or not char.strip():
+            return Glyph(advance=advance)
+
+        origin = (-left, -top)
+        outer = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(outer).text(origin, char, font=self.font, fill=255, anchor="ls",
+                                   stroke_width=self.stroke, stroke_fill=255)
+        inner = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(inner).text(origin, char, font=self.font, fill=255, anchor="ls")
+
+        return Glyph(advance=advance, dx=left, dy=top,
+                     outer=np.asarray(outer), inner=np.asarray(inner))
+
+    def measure(self, line: str) -> float:
+        return sum(self.glyph(ch).advance for ch in line)
+
+
+def _ass_font(size: int, font_path: Optional[str]):
+    """
+    libass ile aynı boyutta font yükler
+
+    libass'ta Fontsize, fontun (ascent + descent) yüksekliğidir; Pillow'da ise
+    em boyutudur. Bu yüzden boyut metriklere göre düzeltilir.
+    """
+    font = load_font(size, font_path)
+    try:
+        ascent, descent = font.getmetrics()
+    except AttributeError:
+        return font
+    if ascent + descent <= 0:
+        return font
+    return load_font(max(1, round(size * size / (ascent + descent))), font_path)
+
+
+@dataclass
+class LayoutLine:
+    """Yerleşimi hesaplanmış satır (hedef piksel koordinatları)"""
+    text: str
+    x: float
+    y: float          # Satırın üst kenarı
+    width: float
+
+
+@dataclass
+class SubtitleLayout:
+    """Bir altyazı metninin yerleşimi"""
+    lines: List[LayoutLine] = field(default_factory=list)
+    line_height: int = 0
+    ascent: int = 0
+    atlas: Optional[GlyphAtlas] = None
+
+
+class SubtitleRenderer:
+    """Önizleme ve ASS export için tek yerleşim motoru"""
+
+    def __init__(self, style: Optional[SubtitleStyle] = None):
+        self.style = style or SubtitleStyle()
+        if not self.style.font_path and IMAGING_AVAILABLE:
+            self.style.font_path = default_font_path()
+
+    # ========================================
+    # YERLEŞİM
+    # ========================================
+
+    def layout(self, text, width: int, height: int) -> SubtitleLayout:
+        """
+        Metnin satırlarını ve konumlarını hesaplar
+
+        Satır sonları write_ass ile aynıdır (segment_lines).
+
+        Args:
+            text: Altyazı metni veya SubtitleSegment (kelime zamanlarıyla)
+            width, height: Hedef yüzey boyutu (PlayRes'e göre ölçeklenir)
+
+        Returns:
+            SubtitleLayout
+        """
+        style = self.style
+        play_w, play_h = style.play_res
+        sx, sy = width / play_w, height / play_h
+
+        atlas = GlyphAtlas.get(style.font_path, round(style.font_size * sy),
+                               0 if style.background else round(style.outline * sy))
+        lines = segment_lines(text, style.max_words_per_line)
+        line_height = atlas.line_height
+        block_height = line_height * len(lines)
+
+        margin_v = style.margin_v * sy
+        vertical = (style.alignment - 1) // 3  # 0 = alt, 1 = orta, 2 = üst
+        if vertical == 0:
+            top = height - margin_v - block_height
+        elif vertical == 1:
+            top = (height - block_height) / 2
+        else:
+            top = margin_v
+
+        margin_h = style.margin_h * sx
+        horizontal = (style.alignment - 1) % 3  # 0 = sol, 1 = orta, 2 = sağ
+        layout = SubtitleLayout(line_height=line_height, ascent=atlas.ascent, atlas=atlas)
+        for i, line in enumerate(lines):
+            line_width = atlas.measure(line)
+            if horizontal == 0:
+                x = margin_h
+            elif horizontal == 2:
+                x = width - margin_h - line_width
+            else:
+                x = (width - line_width) / 2
+            layout.lines.append(LayoutLine(text=line, x=x, y=top + i * line_height, width=line_width))
+        return layout
+
+    # ========================================
+    # ÖNİZLEME (NumPy compositing)
+    # ========================================
+
+    def render(self, frame: np.ndarray, text) -> np.ndarray:
+        """
+        Altyazıyı RGB frame üzerine çizer (frame yerinde değiştirilir)
+
+        Frame çıktı çerçevesinin (PlayRes) ölçeklenmiş hali kabul edilir.
+
+        Args:
+            frame: HxWx3 uint8 RGB
+            text: Altyazı metni veya SubtitleSegment
+
+        Returns:
+            Aynı frame
+        """
+        content = text if isinstance(text, str) else text.text
+        if not IMAGING_AVAILABLE or not content.strip():
+            return frame
+
+        with span("composite.subtitle", "composite"):
+            height, width = frame.shape[:2]
+            layout = self.layout(text, width, height)
+            atlas = layout.atlas
+            style = self.style
+
+            primary = np.array(_hex_to_rgb(style.primary_color), dtype=np.float32)
+            outline = np.array(_hex_to_rgb(style.outline_color), dtype=np.float32)
+
+            for line in layout.lines:
+                if style.background:
+                    pad = round(style.outline * height / style.play_res[1]) + 2
+                    self._blend_box(frame, line.x - pad, line.y - pad,
+                                    line.x + line.width + pad, line.y + layout.line_height + pad,
+                                    style.background_opacity)
+
+                outer, inner, ox, oy = self._rasterize_line(line, layout)
+                if outer is None:
+                    continue
+                if atlas.stroke > 0:
+                    self._blend_mask(frame, outer, ox, oy, outline)
+                self._blend_mask(frame, inner, ox, oy, primary)
+
+        return frame
+
+    def _rasterize_line(self, line: LayoutLine, layout: SubtitleLayout):
+        """Satırdaki glyph maskelerini tek kaplama dizisinde birleştirir"""
+        atlas = layout.atlas
+        pad = atlas.stroke + 2
+        w = int(np.ceil(line.width)) + 2 * pad
+        h = layout.line_height + 2 * pad
+        outer = np.zeros((h, w), dtype=np.uint8)
+        inner = np.zeros((h, w), dtype=np.uint8)
+
+        pen = float(pad)
+        baseline = pad + layout.ascent
+        drawn = False
+        for ch in line.text:
+            glyph = atlas.glyph(ch)
+            if glyph.outer is not None:
+                gx = int(round(pen)) + glyph.dx
+                gy = baseline + glyph.dy
+                gh, gw = glyph.outer.shape
+                x0, y0 = max(0, gx), max(0, gy)
+                x1, y1 = min(w, gx + gw), min(h, gy + gh)
+                if x1 > x0 and y1 > y0:
+                    src = (slice(y0 - gy, y1 - gy), slice(x0 - gx, x1 - gx))
+                    np.maximum(outer[y0:y1, x0:x1], glyph.outer[src], out=outer[y0:y1, x0:x1])
+                    np.maximum(inner[y0:y1, x0:x1], glyph.inner[src], out=inner[y0:y1, x0:x1])
+                    drawn = True
+            pen += glyph.advance
+
+        if not drawn:
+            return None, None, 0, 0
+        return outer, inner, int(round(line.x)) - pad, int(round(line.y)) - pad
+
+    @staticmethod
+    def _blend_mask(frame: np.ndarray, mask: np.ndarray, x: int, y: int, color: np.ndarray):
+        fh, fw = frame.shape[:2]
+        mh, mw = mask.shape
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(fw, x + mw), min(fh, y + mh)
+        if x1 <= x0 or y1 <= y0:
+            return
+        alpha = mask[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.float32)[..., None] * (1.0 / 255.0)
+        region = frame[y0:y1, x0:x1].astype(np.float32)
+        region += (color - region) * alpha
+        frame[y0:y1, x0:x1] = region.astype(np.uint8)
+
+    @staticmethod
+    def _blend_box(frame: np.ndarray, x0: float, y0: float, x1: float, y1: float, opacity: float):
+        fh, fw = frame.shape[:2]
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(fw, int(np.ceil(x1))), min(fh, int(np.ceil(y1)))
+        if x1 > x0 and y1 > y0:
+            region = frame[y0:y1, x0:x1].astype(np.float32)
+            frame[y0:y1, x0:x1] = (region * (1.0 - opacity)).astype(np.uint8)
+
+    # ========================================
+    # ASS EXPORT
+    # ========================================
+
+    @property
+    def font_name(self) -> str:
+        """ASS Fontname (font dosyasının aile adı)"""
+        if IMAGING_AVAILABLE and self.style.font_path:
+            try:
+                return load_font(self.style.font_size, self.style.font_path).getname()[0]
+            except Exception:
+                pass
+        return "DejaVu Sans"
+
+    @property
+    def font_dir(self) -> Optional[str]:
+        """ffmpeg subtitles filtresi için fontsdir"""
+        if self.style.font_path:
+            return str(Path(self.style.font_path).parent)
+        return None
+
+    def ass_header(self) -> str:
+        """Stilden ASS başlığı üretir"""
+        style = self.style
+        play_w, play_h = style.play_res
+        bold = -1
+        if IMAGING_AVAILABLE and style.font_path:
+            try:
+                bold = -1 if "bold" in load_font(style.font_size, style.font_path).getname()[1].lower() else 0
+            except Exception:
+                pass
+
+        if style.background:
+            # BorderStyle=3: kutu rengi OutlineColour, kenar boşluğu Outline
+            border_style = 3
+            outline_colour = _ass_color("#000000", round(255 * (1 - style.background_opacity)))
+            outline = style.outline + 2
+        else:
+            border_style = 1
+            outline_colour = _ass_color(style.outline_color)
+            outline = style.outline
+
+        return (
+            "[Script Info]\n"
+            "ScriptType: v4.00+\n"
+            f"PlayResX: {play_w}\n"
+            f"PlayResY: {play_h}\n"
+            "WrapStyle: 2\n"
+            "ScaledBorderAndShadow: yes\n"
+            "\n"
+            "[V4+ Styles]\n"
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+            "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+            "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+            f"Style: Default,{self.font_name},{style.font_size},{_ass_color(style.primary_color)},"
+            f"{_ass_color(style.karaoke_color or _karaoke_color(style.primary_color))},{outline_colour},&H80000000,{bold},0,0,0,100,100,0,0,"
+            f"{border_style},{outline},0,{style.alignment},{style.margin_h},{style.margin_h},"
+            f"{style.margin_v},1\n"
+            "\n"
+            "[Events]\n"
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        )
+
+    def write_ass(self, segments: Iterable, output_path: Path, karaoke: bool = False) -> int:
+        """
+        Segmentleri önizlemeyle aynı satırlara bölünmüş ASS dosyasına yazar
+
+        Args:
+            segments: SubtitleSegment listesi / generator
+            output_path: .ass dosyası
+            karaoke: Kelime zamanlarından \\k etiketleri yaz (kelimeler
+                karaoke_color'dan primary_color'a geçer)
+
+        Returns:
+            Yazılan cue sayısı
+        """
+        from .subtitle_io import SubtitleWriter
+
+        max_words = self.style.max_words_per_line
+        with SubtitleWriter(output_path, "ass", ass_header=self.ass_header()) as writer:
+            for segment in segments:
+                if karaoke:
+                    text = karaoke_text(segment, max_words)
+                else:
+                    text = '\n'.join(segment_lines(segment, max_words))
+                writer.write(segment, text)
+            count = writer.count
+
+        logger.info(f"ASS dosyası yazıldı: {output_path} ({count} cue{', karaoke' if karaoke else ''})")
+        return count
+
+    def subtitles_filter(self, ass_path: Path) -> str:
+        """ASS dosyası için ffmpeg subtitles filtresi (force_style gerekmez)"""
+        def escape(value: str) -> str:
+            return value.replace('\\', '/').replace(':', '\\:').replace("'", "\\'")
+
+        filter_str = f"subtitles=filename='{escape(str(ass_path))}'"
+        if self.font_dir:
+            filter_str += f":fontsdir='{escape(self.font_dir)}'"
+        return filter_str
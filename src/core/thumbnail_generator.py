@@ -3,18 +3,33 @@ LinuxShorts Pro - Thumbnail Generator
 Otomatik ve özelleştirilebilir thumbnail oluşturma
 """
 
+import heapq
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
 import numpy as np
 
 from utils.logger import get_logger
+from utils.fonts import default_font_path, load_font
+from utils.tracing import span
 
 logger = get_logger("LinuxShorts.Thumbnail")
 
 try:
     import cv2
-    from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+    from PIL import Image, ImageDraw
+    from .frame_scorer import FrameScorer, FrameFeatures
+    from .image_effects import EffectParams, apply_effects
+    from .cancellation import CancelToken
+    from .media_info import probe_video
+    from .timestamps import FrameTimeline, get_timeline
+    from .proxy import preview_path
     IMAGING_AVAILABLE = True
 except ImportError:
     IMAGING_AVAILABLE = False
@@ -41,6 +56,103 @@ class ThumbnailStyle:
     border_width: int = 0
     border_color: str = "#FF0000"
 
+    def effect_params(self) -> "EffectParams":
+        """Görüntü efektleri (yazı hariç)"""
+        return EffectParams(
+            brightness=self.brightness,
+            contrast=self.contrast,
+            saturation=self.saturation,
+            overlay_color=self.overlay_color,
+            overlay_opacity=self.overlay_opacity if self.overlay_color else 0.0,
+            vignette=self.vignette,
+        )
+
+
+@dataclass(frozen=True)
+class TitleMask:
+    """Önceden rasterize edilmiş başlık (dolgu + kontur maskeleri)"""
+    fill: "Image.Image"
+    stroke: "Image.Image"
+    offset: Tuple[int, int]
+    text_size: Tuple[int, int]
+
+
+@lru_cache(maxsize=64)
+def render_title_mask(text: str, font_size: int, stroke_width: int,
+                      font_path: Optional[str] = None) -> TitleMask:
+    """
+    Başlığı bir kez maskeye çizer (text, font, boyut, kontur başına cache'li)
+
+    Kontur Pillow'un yerel stroke_width desteğiyle tek çizimde oluşur;
+    (2w+1)² kaydırılmış çizim yapılmaz.
+
+    Args:
+        text: Başlık metni
+        font_size: Font boyutu
+        stroke_width: Kontur kalınlığı (piksel)
+        font_path: Font dosyası (None ise varsayılan)
+
+    Returns:
+        TitleMask (offset: maskenin metin orijinine göre konumu)
+    """
+    font = load_font(font_size, font_path)
+    left, top, right, bottom = font.getbbox(text, stroke_width=stroke_width)
+    size = (max(1, right - left), max(1, bottom - top))
+    origin = (-left, -top)
+
+    stroke = Image.new("L", size, 0)
+    if stroke_width > 0:
+        ImageDraw.Draw(stroke).text(origin, text, font=font, fill=255,
+                                    stroke_width=stroke_width, stroke_fill=255)
+    fill = Image.new("L", size, 0)
+    ImageDraw.Draw(fill).text(origin, text, font=font, fill=255)
+
+    text_left, text_top, text_right, text_bottom = font.getbbox(text)
+    return TitleMask(fill, stroke, (left, top), (text_right - text_left, text_bottom - text_top))
+
+
+@dataclass
+class EncoderConfig:
+    """Thumbnail dosya formatı ayarları"""
+    format: str = "jpeg"          # jpeg | webp
+    quality: int = 95
+    progressive: bool = False     # sadece JPEG
+    webp_method: int = 4          # 0 (hızlı) - 6 (küçük dosya)
+
+    @property
+    def extension(self) -> str:
+        return ".webp" if self.format.lower() == "webp" else ".jpg"
+
+    def save(self, image: "Image.Image", path: Path):
+        """Görüntüyü bu ayarlarla kaydet"""
+        if self.format.lower() == "webp":
+            image.save(str(path), "WEBP", quality=self.quality, method=self.webp_method)
+        else:
+            image.save(str(path), "JPEG", quality=self.quality,
+                       progressive=self.progressive, optimize=self.progressive)
+
+
+@dataclass
+class BatchReport:
+    """generate_batch throughput raporu"""
+    count: int = 0
+    workers: int = 1
+    elapsed: float = 0.0
+    decode_time: float = 0.0      # decode + ölçekleme + başlık maskeleri
+    style_time: float = 0.0       # efekt + yazı (thread süreleri toplamı)
+    encode_time: float = 0.0      # dosyaya yazma (thread süreleri toplamı)
+    total_bytes: int = 0
+
+    @property
+    def per_second(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.count} thumbnail, {self.elapsed:.2f} sn ({self.per_second:.1f}/sn, "
+                f"{self.workers} thread) | hazırlık {self.decode_time * 1000:.0f} ms, "
+                f"stil {self.style_time * 1000:.0f} ms, encode {self.encode_time * 1000:.0f} ms, "
+                f"{self.total_bytes / 1024:.0f} KB")
+
 
 @dataclass
 class FrameCandidate:
@@ -54,13 +166,19 @@ class FrameCandidate:
 class ThumbnailGenerator:
     """Thumbnail oluşturucu"""
     
+    # Önizlemede slider değişikliklerinde yeniden decode edilmeyen frame sayısı
+    FRAME_CACHE_SIZE = 8
+    
     def __init__(self):
         self.video_path: Optional[Path] = None
         self.duration: float = 0.0
         self.fps: float = 30.0
         self.width: int = 0
         self.height: int = 0
+        self.timeline: Optional["FrameTimeline"] = None
         self.candidates: List[FrameCandidate] = []
+        self.scorer = FrameScorer() if IMAGING_AVAILABLE else None
+        self._frame_cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
     
     def load_video(self, video_path: Path) -> bool:
         """Video yükle"""
@@ -68,31 +186,47 @@ class ThumbnailGenerator:
             return False
         
         self.video_path = Path(video_path)
+        self._frame_cache.clear()
+        self.timeline = None
         if not self.video_path.exists():
             return False
         
         try:
-            cap = cv2.VideoCapture(str(self.video_path))
-            if not cap.isOpened():
-                return False
-            
-            self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            self.fps = cap.get(cv2.CAP_PROP_FPS)
-            self.duration = cap.get(cv2.CAP_PROP_FRAME_COUNT) / self.fps
-            cap.release()
+            info = probe_video(self.video_path)
+            self.width, self.height = info.width, info.height
+            self.fps = info.fps
+            self.duration = info.duration
+            self.timeline = get_timeline(self.video_path, info)
             return True
         except:
             return False
     
-    def get_frame_at(self, time_sec: float) -> Optional[np.ndarray]:
-        """Belirli zamandaki frame'i al"""
+    def frame_index(self, time_sec: float) -> int:
+        """Zamandaki frame indexi (VFR videolarda gerçek PTS'lerden)"""
+        if self.timeline is not None:
+            return self.timeline.frame_at(time_sec)
+        return int(time_sec * self.fps)
+    
+    def frame_time(self, index: int) -> float:
+        """Frame indexinin zamanı"""
+        if self.timeline is not None:
+            return self.timeline.time_of(index)
+        return index / self.fps
+    
+    def get_frame_at(self, time_sec: float, preview: bool = False) -> Optional[np.ndarray]:
+        """
+        Belirli zamandaki frame'i al
+        
+        Args:
+            time_sec: Frame zamanı
+            preview: True ise hazır proxy'den (düşük çözünürlük, hızlı seek)
+        """
         if not IMAGING_AVAILABLE or not self.video_path:
             return None
         
         try:
-            cap = cv2.VideoCapture(str(self.video_path))
-            frame_num = int(time_sec * self.fps)
+            cap = cv2.VideoCapture(str(preview_path(self.video_path) if preview else self.video_path))
+            frame_num = self.frame_index(time_sec)
             cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
             ret, frame = cap.read()
             cap.release()
@@ -102,118 +236,209 @@ class ThumbnailGenerator:
     
     def calculate_frame_score(self, frame: np.ndarray) -> Tuple[float, str]:
         """Frame kalitesini değerlendir"""
-        score = 50.0
-        reasons = []
-        
-        brightness = np.mean(frame)
-        if 80 < brightness < 180:
-            score += 15
-            reasons.append("İyi parlaklık")
-        
-        contrast = np.std(frame)
-        if contrast > 50:
-            score += 15
-            reasons.append("Yüksek kontrast")
-        
-        if len(frame.shape) == 3:
-            hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
-            if np.mean(hsv[:, :, 1]) > 80:
-                score += 10
-                reasons.append("Renkli")
-        
-        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-        if cv2.Laplacian(gray, cv2.CV_64F).var() > 100:
-            score += 15
-            reasons.append("Keskin")
+        result = self.scorer.score(frame)
+        return result.score, result.reason
+    
+    def find_best_frames(self, num_candidates: int = 10, sample_interval: float = 2.0,
+                         keep_images: bool = True,
+                         features: Optional["FrameFeatures"] = None,
+                         cancel: Optional["CancelToken"] = None) -> List[FrameCandidate]:
+        """
+        En iyi frame'leri bul
         
-        try:
-            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-            faces = cascade.detectMultiScale(gray, 1.1, 4)
-            if len(faces) > 0:
-                score += 20
-                reasons.append(f"{len(faces)} yüz")
-        except:
-            pass
+        Adaylar num_candidates boyutlu bir min-heap'te tutulur; en düşük skorlu
+        aday her yeni frame ile karşılaştırılır. Bellekte en fazla
+        num_candidates frame (+ puanlanmayı bekleyen küçük grup) bulunur,
+        video uzunluğundan bağımsızdır.
         
-        return score, ", ".join(reasons) if reasons else "Normal"
-    
-    def find_best_frames(self, num_candidates: int = 10, sample_interval: float = 2.0) -> List[FrameCandidate]:
-        """En iyi frame'leri bul"""
+        Args:
+            num_candidates: Döndürülecek aday sayısı
+            sample_interval: Örnekleme aralığı (saniye)
+            keep_images: False ise sadece zaman ve skor tutulur, görüntüler
+                gerektiğinde get_candidate_image ile yeniden decode edilir
+            features: Aynı video için hazır frame tablosu (ör. SmartVideoAnalyzer
+                result.frame_features); verilirse video tekrar decode edilmez
+            cancel: İptal token'ı (iptalde heap'teki frame'ler bırakılır)
+            
+        Returns:
+            Skora göre azalan sırada adaylar
+        
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
         if not IMAGING_AVAILABLE or not self.video_path:
             return []
         
-        candidates = []
+        num_candidates = max(1, num_candidates)
+        
+        if features is not None and len(features):
+            return self._best_from_features(features, num_candidates)
+        
+        # (skor, -sıra, aday): eşit skorda önce gelen frame kalır (stabil sıralama ile aynı)
+        heap: List[Tuple[float, int, FrameCandidate]] = []
+        # Örneklenen frame'ler küçük gruplar halinde thread havuzunda puanlanır
+        batch_size = max(1, self.scorer.workers * 2)
+        batch: List[Tuple[int, np.ndarray]] = []
+        
+        def flush():
+            with span("score", "score", frames=len(batch)):
+                results = self.scorer.score_many([rgb for _, rgb in batch])
+            for (idx, rgb), result in zip(batch, results):
+                key = (result.score, -idx)
+                if len(heap) >= num_candidates and key <= heap[0][:2]:
+                    continue
+                candidate = FrameCandidate(
+                    time=self.frame_time(idx),
+                    score=result.score,
+                    image=rgb if keep_images else None,
+                    reason=result.reason
+                )
+                if len(heap) < num_candidates:
+                    heapq.heappush(heap, (result.score, -idx, candidate))
+                else:
+                    heapq.heapreplace(heap, (result.score, -idx, candidate))
+            batch.clear()
+        
         try:
             cap = cv2.VideoCapture(str(self.video_path))
             frame_interval = max(1, int(self.fps * sample_interval))
             frame_idx = 0
+            self.scorer.reset_timings()
             
             while True:
-                ret, frame = cap.read()
+                if cancel is not None and cancel.cancelled:
+                    # Bellekteki aday frame'leri hemen bırak
+                    cap.release()
+                    heap.clear()
+                    batch.clear()
+                    self._frame_cache.clear()
+                    cancel.raise_if_cancelled()
+                
+                # Örneklenmeyen frame'ler decode edilip RGB'ye çevrilmez
+                if frame_idx % frame_interval != 0:
+                    if not cap.grab():
+                        break
+                    frame_idx += 1
+                    continue
+                
+                with span("decode", "decode"):
+                    ret, frame = cap.read()
                 if not ret:
                     break
                 
-                if frame_idx % frame_interval == 0:
-                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    score, reason = self.calculate_frame_score(rgb)
-                    candidates.append(FrameCandidate(
-                        time=frame_idx / self.fps,
-                        score=score, image=rgb, reason=reason
-                    ))
+                batch.append((frame_idx, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)))
+                if len(batch) >= batch_size:
+                    flush()
+                
                 frame_idx += 1
             
+            if batch:
+                flush()
             cap.release()
-            candidates.sort(key=lambda x: x.score, reverse=True)
-            self.candidates = candidates[:num_candidates]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Frame puanlama süreleri:\n%s", self.scorer.timing_report())
+            self.candidates = [c for _, _, c in sorted(heap, key=lambda item: item[:2], reverse=True)]
             return self.candidates
-        except:
+        except Exception:
             return []
     
-    def apply_style(self, image: np.ndarray, style: ThumbnailStyle) -> Image.Image:
-        """Stil uygula"""
-        pil = Image.fromarray(image).resize((style.width, style.height), Image.LANCZOS)
+    def _best_from_features(self, features: "FrameFeatures", num_candidates: int) -> List[FrameCandidate]:
+        """Hazır frame tablosundan en iyi adaylar (görüntüsüz)"""
+        weights = self.scorer.weights
+        totals = features.combine(weights, self.scorer.base)
+        best = heapq.nlargest(num_candidates, range(len(totals)), key=lambda i: (totals[i], -i))
+        self.candidates = [
+            FrameCandidate(time=float(features.times[i]), score=float(totals[i]),
+                           reason=features.reason(i, weights))
+            for i in best
+        ]
+        return self.candidates
+    
+    def get_candidate_image(self, candidate: FrameCandidate) -> Optional[np.ndarray]:
+        """Adayın görüntüsü (keep_images=False ile bulunduysa yeniden decode edilir)"""
+        if candidate.image is not None:
+            return candidate.image
+        return self.get_frame_at(candidate.time)
+    
+    def get_cached_frame(self, time_sec: float) -> Optional[np.ndarray]:
+        """
+        Frame'i cache'ten al (yoksa decode edip cache'le)
         
-        if style.brightness != 1.0:
-            pil = ImageEnhance.Brightness(pil).enhance(style.brightness)
-        if style.contrast != 1.0:
-            pil = ImageEnhance.Contrast(pil).enhance(style.contrast)
-        if style.saturation != 1.0:
-            pil = ImageEnhance.Color(pil).enhance(style.saturation)
+        Aynı frame üzerinde sadece efekt ayarları değiştiğinde
+        (önizleme slider'ları) videoyu tekrar açıp seek etmeyi önler.
+        Sadece önizleme içindir: proxy hazırsa kareler proxy'den okunur.
+        """
+        key = self.frame_index(time_sec)
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            self._frame_cache.move_to_end(key)
+            return frame
         
-        if style.overlay_color:
-            overlay = Image.new('RGBA', pil.size, style.overlay_color)
-            overlay.putalpha(int(255 * style.overlay_opacity))
-            pil = Image.alpha_composite(pil.convert('RGBA'), overlay).convert('RGB')
+        frame = self.get_frame_at(time_sec, preview=True)
+        if frame is not None:
+            frame.setflags(write=False)
+            self._frame_cache[key] = frame
+            if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return frame
+    
+    def get_preview(self, time_sec: float, style: ThumbnailStyle = None,
+                    size: Tuple[int, int] = (320, 180)) -> Optional[Image.Image]:
+        """
+        Küçük boyutlu stil önizlemesi
+        
+        Args:
+            time_sec: Frame zamanı
+            style: Thumbnail stili (yazı boyutları önizleme boyutuna ölçeklenir)
+            size: Önizleme boyutu (genişlik, yükseklik)
         
-        if style.vignette:
-            pil = self._apply_vignette(pil)
+        Returns:
+            PIL görüntüsü veya None
+        """
+        if style is None:
+            style = ThumbnailStyle()
         
-        if style.title_text:
-            pil = self._add_text(pil, style)
+        frame = self.get_cached_frame(time_sec)
+        if frame is None:
+            return None
         
-        return pil
+        scale = size[1] / style.height
+        preview_style = replace(
+            style,
+            width=size[0],
+            height=size[1],
+            title_font_size=max(8, int(style.title_font_size * scale)),
+            title_stroke_width=max(1, round(style.title_stroke_width * scale)) if style.title_stroke_width else 0,
+        )
+        return self.apply_style(frame, preview_style)
     
-    def _apply_vignette(self, image: Image.Image) -> Image.Image:
-        """Vignette efekti"""
-        w, h = image.size
-        x, y = np.meshgrid(np.linspace(-1, 1, w), np.linspace(-1, 1, h))
-        vignette = 1 - np.clip(np.sqrt(x**2 + y**2) * 0.7, 0, 1) * 0.5
-        arr = np.array(image).astype(float)
-        for i in range(3):
-            arr[:, :, i] *= vignette
-        return Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8))
+    @staticmethod
+    def _fit(image: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Thumbnail boyutuna ölçekle (boyut aynıysa kopyalamadan döner)"""
+        h, w = image.shape[:2]
+        if (w, h) == (width, height):
+            return image
+        shrinking = width < w and height < h
+        return cv2.resize(image, (width, height),
+                          interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4)
+    
+    def apply_style(self, image: np.ndarray, style: ThumbnailStyle) -> Image.Image:
+        """Stil uygula"""
+        with span("composite", "composite", size=f"{style.width}x{style.height}"):
+            image = self._fit(image, style.width, style.height)
+            
+            # Parlaklık/kontrast/doygunluk/overlay tek renk matrisi + cache'li vignette
+            pil = Image.fromarray(apply_effects(image, style.effect_params()))
+            
+            if style.title_text:
+                pil = self._add_text(pil, style)
+            
+            return pil
     
     def _add_text(self, image: Image.Image, style: ThumbnailStyle) -> Image.Image:
         """Metin ekle"""
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", style.title_font_size)
-        except:
-            font = ImageFont.load_default()
-        
-        bbox = draw.textbbox((0, 0), style.title_text, font=font)
-        tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        mask = render_title_mask(style.title_text, style.title_font_size, style.title_stroke_width)
+        tw, th = mask.text_size
         x = (image.width - tw) // 2
         
         if style.title_position == "top":
@@ -223,16 +448,14 @@ class ThumbnailGenerator:
         else:
             y = (image.height - th) // 2
         
-        # Stroke
-        for dx in range(-style.title_stroke_width, style.title_stroke_width + 1):
-            for dy in range(-style.title_stroke_width, style.title_stroke_width + 1):
-                draw.text((x + dx, y + dy), style.title_text, font=font, fill=style.title_stroke_color)
-        
-        draw.text((x, y), style.title_text, font=font, fill=style.title_color)
+        box = (x + mask.offset[0], y + mask.offset[1])
+        if style.title_stroke_width > 0:
+            image.paste(style.title_stroke_color, box, mask.stroke)
+        image.paste(style.title_color, box, mask.fill)
         return image
     
     def generate_thumbnail(self, time_sec: float = None, style: ThumbnailStyle = None,
-                          output_path: Path = None) -> Optional[Path]:
+                          output_path: Path = None, encoder: EncoderConfig = None) -> Optional[Path]:
         """Thumbnail oluştur"""
         if style is None:
             style = ThumbnailStyle()
@@ -240,7 +463,7 @@ class ThumbnailGenerator:
         if time_sec is None:
             if not self.candidates:
                 self.find_best_frames(5)
-            frame = self.candidates[0].image if self.candidates else self.get_frame_at(self.duration * 0.25)
+            frame = self.get_candidate_image(self.candidates[0]) if self.candidates else self.get_frame_at(self.duration * 0.25)
         else:
             frame = self.get_frame_at(time_sec)
         
@@ -249,10 +472,11 @@ class ThumbnailGenerator:
         
         thumbnail = self.apply_style(frame, style)
         
+        encoder = encoder or EncoderConfig()
         if output_path is None:
-            output_path = self.video_path.parent / f"{self.video_path.stem}_thumbnail.jpg"
+            output_path = self.video_path.parent / f"{self.video_path.stem}_thumbnail{encoder.extension}"
         
-        thumbnail.save(str(output_path), "JPEG", quality=95)
+        encoder.save(thumbnail, output_path)
         return Path(output_path)
     
     def generate_multiple(self, count: int = 5, style: ThumbnailStyle = None,
@@ -261,17 +485,158 @@ class ThumbnailGenerator:
         if not self.candidates:
             self.find_best_frames(count)
         
+        paths, _ = self.generate_batch([style or ThumbnailStyle()], self.candidates[:count], output_dir)
+        return paths
+    
+    def generate_batch(self, styles: List[ThumbnailStyle], candidates: List[FrameCandidate] = None,
+                       output_dir: Path = None, encoder: EncoderConfig = None,
+                       workers: Optional[int] = None,
+                       progress_callback: Callable[[float], None] = None) -> Tuple[List[Path], BatchReport]:
+        """
+        Stil × frame kombinasyonlarını paralel üret (A/B varyantları)
+        
+        Her frame bir kez decode edilir, her (frame, boyut) için bir kez
+        ölçeklenir; başlık maskeleri varyantlar arasında paylaşılır. Stil
+        uygulama ve dosya yazma worker thread'lerinde yapılır.
+        
+        Args:
+            styles: Denenecek stiller
+            candidates: Frame adayları (None ise self.candidates)
+            output_dir: Çıktı klasörü (None ise video yanında "thumbnails")
+            encoder: Dosya formatı ayarları (None ise JPEG, kalite 95)
+            workers: Thread sayısı (None = CPU sayısı, en fazla 8)
+            progress_callback: İlerleme (0-1)
+        
+        Returns:
+            (Sıralı dosya yolları - frame başına stiller, BatchReport)
+        """
+        encoder = encoder or EncoderConfig()
+        candidates = self.candidates if candidates is None else candidates
+        workers = workers or min(8, os.cpu_count() or 2)
+        report = BatchReport(workers=workers)
+        if not styles or not candidates:
+            return [], report
+        
         if output_dir is None:
             output_dir = self.video_path.parent / "thumbnails"
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        started = time.perf_counter()
         
-        Path(output_dir).mkdir(exist_ok=True)
+        # Ortak hazırlık: decode + boyut başına ölçekleme + başlık maskeleri
+        sizes = {(st.width, st.height) for st in styles}
+        frames: Dict[Tuple[int, Tuple[int, int]], np.ndarray] = {}
+        for i, c in enumerate(candidates):
+            image = self.get_candidate_image(c)
+            if image is None:
+                continue
+            for size in sizes:
+                frames[i, size] = self._fit(image, *size)
+        for st in styles:
+            if st.title_text:
+                render_title_mask(st.title_text, st.title_font_size, st.title_stroke_width)
+        report.decode_time = time.perf_counter() - started
+        
+        jobs = []
+        for i, c in enumerate(candidates):
+            for j, st in enumerate(styles):
+                frame = frames.get((i, (st.width, st.height)))
+                if frame is None:
+                    continue
+                suffix = f"_s{j + 1}" if len(styles) > 1 else ""
+                jobs.append((frame, st, output_dir / f"thumb_{i+1}_{c.time:.1f}s{suffix}{encoder.extension}"))
+        
+        def render(job) -> Tuple[Path, float, float, int]:
+            frame, st, path = job
+            start = time.perf_counter()
+            image = self.apply_style(frame, st)
+            styled = time.perf_counter()
+            encoder.save(image, path)
+            return path, styled - start, time.perf_counter() - styled, path.stat().st_size
         
         results = []
-        for i, c in enumerate(self.candidates[:count]):
-            path = Path(output_dir) / f"thumb_{i+1}_{c.time:.1f}s.jpg"
-            if style is None:
-                style = ThumbnailStyle()
-            self.apply_style(c.image, style).save(str(path), "JPEG", quality=95)
-            results.append(path)
-        
-        return results
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for done, (path, style_time, encode_time, size) in enumerate(pool.map(render, jobs), 1):
+                results.append(path)
+                report.style_time += style_time
+                report.encode_time += encode_time
+                report.total_bytes += size
+                if progress_callback:
+                    progress_callback(done / len(jobs))
+        
+        report.count = len(results)
+        report.elapsed = time.perf_counter() - started
+        logger.info(f"Batch thumbnail: {report.summary()}")
+        return results, report
+
+def _benchmark_title(iterations: int = 20):
+    """Eski (81 çizimlik kontur) ve maske cache'li başlık çiziminin karşılaştırması"""
+    from PIL import ImageFont
+
+    style = ThumbnailStyle(title_text="EN İYİ ANLAR 🔥 Bölüm 12")
+    base = Image.new("RGB", (style.width, style.height), (40, 80, 120))
+    generator = ThumbnailGenerator()
+
+    def legacy(image):
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.truetype(default_font_path(), style.title_font_size)
+        bbox = draw.textbbox((0, 0), style.title_text, font=font)
+        x = (image.width - (bbox[2] - bbox[0])) // 2
+        y = (image.height - (bbox[3] - bbox[1])) // 2
+        w = style.title_stroke_width
+        for dx in range(-w, w + 1):
+            for dy in range(-w, w + 1):
+                draw.text((x + dx, y + dy), style.title_text, font=font, fill=style.title_stroke_color)
+        draw.text((x, y), style.title_text, font=font, fill=style.title_color)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy(base.copy())
+    legacy_ms = (time.perf_counter() - start) / iterations * 1000
+
+    render_title_mask.cache_clear()
+    start = time.perf_counter()
+    generator._add_text(base.copy(), style)
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        generator._add_text(base.copy(), style)
+    warm_ms = (time.perf_counter() - start) / iterations * 1000
+
+    print(f"Eski (81 çizim):   {legacy_ms:.1f} ms/thumbnail")
+    print(f"Yeni (ilk çizim):  {cold_ms:.1f} ms ({legacy_ms / cold_ms:.1f}x)")
+    print(f"Yeni (cache'li):   {warm_ms:.1f} ms/thumbnail ({legacy_ms / warm_ms:.1f}x)")
+
+
+def _benchmark_batch(frame_count: int = 5):
+    """Seri ve paralel A/B varyant üretimi (3 stil × frame_count frame)"""
+    import tempfile
+
+    rng = np.random.default_rng(0)
+    generator = ThumbnailGenerator()
+    candidates = [FrameCandidate(time=float(i), score=0.0,
+                                 image=rng.integers(0, 255, (1080, 1920, 3), dtype=np.uint8))
+                  for i in range(frame_count)]
+    styles = [
+        ThumbnailStyle(title_text="A varyantı"),
+        ThumbnailStyle(title_text="B VARYANTI", title_position="bottom", vignette=False),
+        ThumbnailStyle(title_text="C", overlay_color="#000000", saturation=1.0),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, encoder in (("JPEG", EncoderConfig()),
+                               ("JPEG progressive", EncoderConfig(quality=85, progressive=True)),
+                               ("WebP", EncoderConfig(format="webp", quality=85))):
+            _, serial = generator.generate_batch(styles, candidates, Path(tmp) / "serial", encoder, workers=1)
+            _, parallel = generator.generate_batch(styles, candidates, Path(tmp) / "parallel", encoder)
+            print(f"{label}")
+            print(f"  Seri:    {serial.summary()}")
+            print(f"  Paralel: {parallel.summary()} ({serial.elapsed / parallel.elapsed:.1f}x)")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark_title()
+    _benchmark_batch()
@@ -0,0 +1,465 @@
+"""
+LinuxShorts Pro - Timestamps
+Gerçek paket PTS listesinden kare ↔ zaman modeli (VFR uyumlu)
+
+- int(time * fps) ve FRAME_COUNT / fps hesapları sabit kare hızı varsayar;
+  telefon ve ekran kayıtlarında (VFR) önizleme ile export kayar
+- PTS listesi tek ffprobe geçişiyle okunur, delta kodlanmış en küçük
+  tamsayı tipinde saklanır (30 dk 60fps video ≈ 220 KB)
+- Her ANCHOR_EVERY karede bir mutlak PTS (anchor) tutulur: zaman → kare
+  ve kare → zaman dönüşümleri O(log n) (anchor'larda ikili arama + tek blok)
+- Sonuç parmak izine göre ~/.linuxshorts/timestamps altında saklanır;
+  okuyucular ve analizciler aynı modeli paylaşır
+- ffprobe yoksa VideoInfo'dan sabit kare hızlı model üretilir
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from fractions import Fraction
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+from utils.cache import cache_path, file_fingerprint
+from .process_runner import run_process
+from .capabilities import tool_available
+
+logger = get_logger("LinuxShorts.Timestamps")
+
+try:
+    from .media_info import VideoInfo, probe_video
+except ImportError:
+    VideoInfo = None
+    probe_video = None
+
+
+# Anchor aralığı (kare); blok içi arama en fazla bu kadar delta toplar
+ANCHOR_EVERY = 256
+
+# Kare süreleri medyandan bu orandan fazla saparsa VFR kabul edilir
+VFR_TOLERANCE = 0.02
+
+# Bellekte tutulan model sayısı
+MEMORY_CACHE_SIZE = 16
+
+# Disk kaydı formatı değişirse eski kayıtlar yok sayılır
+TIMELINE_VERSION = 1
+
+
+def _compact_dtype(max_value: int) -> np.dtype:
+    """Deltaları tutabilen en küçük işaretsiz tamsayı tipi"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class FrameTimeline:
+    """
+    Sunum sırasındaki kare zaman damgaları
+
+    Kare indexi decode sırası değil sunum sırasıdır (OpenCV/ffmpeg'in
+    sırayla döndürdüğü kareler); zamanlar ilk karenin PTS'ine göredir.
+    """
+
+    def __init__(self, first_pts: int, deltas: np.ndarray, time_base: Fraction,
+                 source: str = "ffprobe"):
+        """
+        Args:
+            first_pts: İlk karenin PTS'i (time_base biriminde)
+            deltas: Ardışık kareler arası PTS farkları (n-1 eleman)
+            time_base: PTS birimi (saniye)
+            source: ffprobe / constant
+        """
+        deltas = np.asarray(deltas)
+        self.first_pts = int(first_pts)
+        self.deltas = deltas.astype(_compact_dtype(int(deltas.max()) if deltas.size else 0))
+        self.time_base = Fraction(time_base)
+        self.source = source
+        self._tb = float(self.time_base)
+        self._median_delta = float(np.median(self.deltas)) if self.deltas.size else 0.0
+
+        # Anchor'lar: 0, K, 2K... karelerinin mutlak PTS'i
+        block_sums = np.zeros(0, dtype=np.int64)
+        if self.deltas.size:
+            starts = np.arange(0, self.deltas.size, ANCHOR_EVERY)
+            block_sums = np.add.reduceat(self.deltas.astype(np.int64), starts)
+        anchors = self.first_pts + np.concatenate([[0], np.cumsum(block_sums)])
+        self._anchors = anchors[:(len(self) - 1) // ANCHOR_EVERY + 1].astype(np.int64)
+        self.last_pts = self.pts(len(self) - 1)
+
+    # ========================================
+    # OLUŞTURMA
+    # ========================================
+
+    @classmethod
+    def from_pts(cls, pts, time_base: Fraction, source: str = "ffprobe") -> "FrameTimeline":
+        """Herhangi sıradaki PTS listesinden (decode sırası da olabilir)"""
+        pts = np.sort(np.asarray(pts, dtype=np.int64))
+        if pts.size == 0:
+            raise ValueError("Boş PTS listesi")
+        return cls(int(pts[0]), np.diff(pts), time_base, source)
+
+    @classmethod
+    def from_times(cls, times, time_base: Fraction = Fraction(1, 90000)) -> "FrameTimeline":
+        """Saniye cinsinden zamanlardan (testler ve sentetik modeller için)"""
+        ticks = np.round(np.asarray(times, dtype=np.float64) / float(time_base)).astype(np.int64)
+        return cls.from_pts(ticks, time_base, source="times")
+
+    @classmethod
+    def constant(cls, fps: float, frame_count: int) -> "FrameTimeline":
+        """Sabit kare hızlı model (PTS okunamadığında)"""
+        rate = Fraction(fps).limit_denominator(1001000) if fps > 0 else Fraction(30)
+        deltas = np.ones(max(0, frame_count - 1), dtype=np.uint8)
+        return cls(0, deltas, 1 / rate, source="constant")
+
+    # ========================================
+    # SORGULAR
+    # ========================================
+
+    def __len__(self) -> int:
+        return self.deltas.size + 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.deltas.nbytes + self._anchors.nbytes
+
+    def pts(self, index: int) -> int:
+        """index. karenin mutlak PTS'i"""
+        index = max(0, min(int(index), len(self) - 1))
+        anchor = index // ANCHOR_EVERY
+        start = anchor * ANCHOR_EVERY
+        return int(self._anchors[anchor]) + int(self.deltas[start:index].sum(dtype=np.int64))
+
+    def _block(self, anchor: int) -> np.ndarray:
+        """anchor bloğundaki karelerin mutlak PTS'leri"""
+        start = anchor * ANCHOR_EVERY
+        stop = min(start + ANCHOR_EVERY, len(self))
+        offsets = np.cumsum(self.deltas[start:stop - 1], dtype=np.int64)
+        return np.concatenate([[0], offsets]) + self._anchors[anchor]
+
+    def time_of(self, index: int) -> float:
+        """Karenin zamanı (saniye, ilk kareye göre)"""
+        return (self.pts(index) - self.first_pts) * self._tb
+
+    def _target(self, time_sec: float) -> float:
+        """Saniye → mutlak PTS (time_base biriminde)"""
+        ticks = time_sec / self._tb
+        # time_of() çıktısı float yuvarlamasıyla bir önceki kareye düşmesin
+        if abs(ticks - round(ticks)) <= 1e-9 * max(1.0, abs(ticks)):
+            ticks = round(ticks)
+        return self.first_pts + ticks
+
+    def frame_at(self, time_sec: float, mode: str = "floor") -> int:
+        """
+        Zamandaki kare indexi
+
+        Args:
+            time_sec: Saniye (ilk kareye göre)
+            mode: floor (o anda ekranda olan kare) / nearest (en yakın kare)
+
+        Returns:
+            0..len-1 arası kare indexi
+        """
+        target = self._target(time_sec)
+        anchor = max(0, int(np.searchsorted(self._anchors, target, side="right")) - 1)
+        block = self._block(anchor)
+        offset = max(0, int(np.searchsorted(block, target, side="right")) - 1)
+        index = anchor * ANCHOR_EVERY + offset
+
+        if mode == "nearest" and index + 1 < len(self):
+            if self.pts(index + 1) - target < target - self.pts(index):
+                index += 1
+        return index
+
+    def frame_bound(self, time_sec: float) -> int:
+        """
+        time_sec anındaki veya sonrasındaki ilk kare (yoksa len)
+
+        Aralıkları [start, end) kare dilimlerine çevirmek için: ardışık
+        aralıklar her kareyi tam olarak bir kez kapsar.
+        """
+        index = self.frame_at(time_sec)
+        if self.pts(index) < self._target(time_sec):
+            index += 1
+        return index
+
+    def frame_duration(self, index: int) -> float:
+        """Karenin ekranda kalma süresi (son kare için medyan süre)"""
+        if index < self.deltas.size:
+            return float(self.deltas[max(0, index)]) * self._tb
+        return self.median_frame_duration
+
+    @property
+    def median_frame_duration(self) -> float:
+        return self._median_delta * self._tb
+
+    @property
+    def duration(self) -> float:
+        """İlk karenin başından son karenin sonuna"""
+        return (self.last_pts - self.first_pts) * self._tb + self.median_frame_duration
+
+    @property
+    def average_fps(self) -> float:
+        span = (self.last_pts - self.first_pts) * self._tb
+        return self.deltas.size / span if span > 0 else 0.0
+
+    @property
+    def is_vfr(self) -> bool:
+        if self.deltas.size < 2:
+            return False
+        median = self._median_delta
+        spread = int(self.deltas.max()) - int(self.deltas.min())
+        # Kaba time_base'lerde (ör. 1/1000) 33/34 yuvarlaması VFR sayılmaz
+        return spread > max(1.0, median * VFR_TOLERANCE)
+
+    # ========================================
+    # KAYIT
+    # ========================================
+
+    def save(self, path: Path):
+        """Atomik .npz kaydı"""
+        path = Path(path)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, deltas=self.deltas,
+                     header=np.array([self.first_pts, self.time_base.numerator,
+                                      self.time_base.denominator, TIMELINE_VERSION], dtype=np.int64))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["FrameTimeline"]:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                first_pts, num, den, version = data["header"].tolist()
+                if version != TIMELINE_VERSION:
+                    return None
+                return cls(first_pts, data["deltas"], Fraction(num, den))
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+# ========================================
+# FFPROBE
+# ========================================
+
+def build_command(video_path: Path, ffprobe_path: str = "ffprobe") -> list:
+    """İlk video akışının tüm paket PTS'leri + time_base (tek geçiş, decode yok)"""
+    return [
+        ffprobe_path, "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=time_base:packet=pts",
+        "-of", "compact",
+        str(video_path),
+    ]
+
+
+def parse_compact(output: str):
+    """
+    "packet|pts=1234" / "stream|time_base=1/15360" satırlarını ayrıştır
+
+    Returns:
+        (pts int64 dizisi, time_base)
+    """
+    time_base = None
+    values = []
+    for line in output.splitlines():
+        section, _, fields = line.partition("|")
+        key, _, value = fields.partition("=")
+        if section == "packet" and key == "pts":
+            if value.lstrip("-").isdigit():
+                values.append(int(value))
+        elif section == "stream" and key == "time_base":
+            num, _, den = value.partition("/")
+            time_base = Fraction(int(num), int(den))
+    return np.array(values, dtype=np.int64), time_base
+
+
+def timeline_from_ffprobe(video_path: Path, ffprobe_path: str = "ffprobe",
+                          timeout: float = 300) -> Optional[FrameTimeline]:
+    """ffprobe ile gerçek PTS listesinden model (başarısızsa None)"""
+    result = run_process(build_command(video_path, ffprobe_path),
+                         capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        logger.warning(f"PTS okunamadı: {result.stderr.strip()[-200:]}")
+        return None
+    pts, time_base = parse_compact(result.stdout)
+    if pts.size == 0 or time_base is None:
+        return None
+    return FrameTimeline.from_pts(pts, time_base)
+
+
+# ========================================
+# PAYLAŞILAN MODEL
+# ========================================
+
+_memory: "OrderedDict[str, FrameTimeline]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def get_timeline(video_path: Path, info: Optional["VideoInfo"] = None,
+                 ffprobe_path: str = "ffprobe") -> FrameTimeline:
+    """
+    Videonun kare zaman modeli (bellek → disk → ffprobe → sabit fps)
+
+    Args:
+        video_path: Video dosyası
+        info: Hazır VideoInfo (sabit fps yedeği için; None ise probe edilir)
+        ffprobe_path: ffprobe binary'si
+
+    Returns:
+        FrameTimeline
+    """
+    video_path = Path(video_path)
+    key = file_fingerprint(video_path)
+    with _memory_lock:
+        timeline = _memory.get(key)
+        if timeline is not None:
+            _memory.move_to_end(key)
+            return timeline
+
+    disk = cache_path("timestamps", video_path, ".npz")
+    timeline = FrameTimeline.load(disk) if disk.exists() else None
+
+    if timeline is None and tool_available(ffprobe_path):
+        start = time.perf_counter()
+        try:
+            timeline = timeline_from_ffprobe(video_path, ffprobe_path)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"PTS okuma zaman aşımı: {video_path.name}")
+        if timeline is not None:
+            timeline.save(disk)
+            logger.debug(f"Zaman modeli: {len(timeline)} kare, {timeline.nbytes} bayt, "
+                         f"{'VFR' if timeline.is_vfr else 'CFR'} "
+                         f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    if timeline is None:
+        if info is None and probe_video is not None:
+            info = probe_video(video_path)
+        fps = info.fps if info is not None else 30.0
+        count = info.frame_count if info is not None else 0
+        timeline = FrameTimeline.constant(fps, max(1, count))
+
+    with _memory_lock:
+        _memory[key] = timeline
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+    return timeline
+
+
+def capture_timeline(video_path: Path, fps: float, frame_count: int) -> FrameTimeline:
+    """
+    Açık bir VideoCapture için zaman modeli
+
+    Model alınamazsa (probe hatası) OpenCV'nin fps/kare sayısıyla sabit fps
+    modeli döner; analiz döngüleri hiçbir durumda modelsiz kalmaz.
+    """
+    try:
+        return get_timeline(video_path)
+    except Exception as e:
+        logger.debug(f"Zaman modeli alınamadı, sabit fps kullanılıyor: {e}")
+        return FrameTimeline.constant(fps, max(1, frame_count))
+
+
+# ========================================
+# SELF-CHECK
+# ========================================
+
+def _synthetic_vfr_times(rng: np.random.Generator, count: int) -> np.ndarray:
+    """30fps ve 60fps bölümleri + rastgele takılmalar (ekran kaydı benzeri)"""
+    durations = np.where((np.arange(count) // 500) % 2 == 0, 1 / 30, 1 / 60)
+    stalls = rng.random(count) < 0.01
+    durations = durations + stalls * rng.uniform(0.05, 0.4, count)
+    return np.concatenate([[0.0], np.cumsum(durations[:-1])])
+
+
+def _check_model(timeline: FrameTimeline, times: np.ndarray, tolerance: float):
+    """Modeli kaba kuvvet searchsorted ile karşılaştır"""
+    assert len(timeline) == len(times), (len(timeline), len(times))
+    for i in range(0, len(times), max(1, len(times) // 997)):
+        assert abs(timeline.time_of(i) - (times[i] - times[0])) <= tolerance, i
+
+    queries = np.linspace(-0.5, times[-1] + 1.0, 2000)
+    expected = np.clip(np.searchsorted(times - times[0], queries + 1e-9, side="right") - 1, 0, len(times) - 1)
+    got = np.array([timeline.frame_at(q) for q in queries])
+    mismatches = int(np.count_nonzero(got != expected))
+    # time_base yuvarlaması kare sınırına denk gelen sorguları kaydırabilir
+    assert mismatches <= len(queries) * 0.002, mismatches
+
+    for i in range(0, len(times), max(1, len(times) // 499)):
+        assert timeline.frame_at(timeline.time_of(i)) == i
+        assert timeline.frame_at(timeline.time_of(i), mode="nearest") == i
+
+
+def _make_vfr_file(path: Path) -> np.ndarray:
+    """
+    ffmpeg ile sentetik VFR dosyası: 2 sn 30fps, 2 sn 10fps, 2 sn 60fps
+
+    Returns:
+        Beklenen kare zamanları (saniye)
+    """
+    # Her kaynak kare 60fps ızgarasında; select ile bölümler seyreltilir
+    expr = "lt(t,2)*not(mod(n,2))+gte(t,2)*lt(t,4)*not(mod(n,6))+gte(t,4)"
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-y",
+        "-f", "lavfi", "-i", "testsrc2=size=160x90:rate=60:duration=6",
+        "-vf", f"select='{expr}'", "-fps_mode", "passthrough",
+        "-c:v", "libx264", "-g", "30", "-bf", "2", str(path),
+    ], check=True, capture_output=True)
+    n = np.arange(360)
+    keep = np.where(n < 120, n % 2 == 0, np.where(n < 240, n % 6 == 0, True))
+    return n[keep] / 60.0
+
+
+def _self_check():
+    """Sentetik VFR modelleri (ve ffmpeg varsa gerçek VFR dosyası) üzerinde doğrulama"""
+    rng = np.random.default_rng(0)
+
+    times = _synthetic_vfr_times(rng, 50_000)
+    timeline = FrameTimeline.from_times(times)
+    _check_model(timeline, times, tolerance=1 / 90000)
+    assert timeline.is_vfr
+    dense_bytes = times.astype(np.float64).nbytes
+    print(f"Sentetik VFR: {len(timeline)} kare, {timeline.nbytes} bayt "
+          f"(float64 liste {dense_bytes} bayt), {timeline.average_fps:.2f} fps ort.")
+
+    cfr = FrameTimeline.constant(30000 / 1001, 1800)
+    assert not cfr.is_vfr and cfr.frame_at(1.0) == int(1.0 * 30000 / 1001)
+    assert abs(cfr.duration - 1800 * 1001 / 30000) < 1e-9
+
+    # Decode sırası (B-frame) ile gelen PTS'ler de doğru sıralanmalı
+    shuffled = FrameTimeline.from_pts(np.array([0, 3, 1, 2, 6, 4, 5]) * 3003, Fraction(1, 90000))
+    assert [shuffled.frame_at(k * 3003 / 90000) for k in range(7)] == list(range(7))
+
+    start = time.perf_counter()
+    for q in rng.uniform(0, times[-1], 10_000):
+        timeline.frame_at(q)
+    lookup_us = (time.perf_counter() - start) / 10_000 * 1e6
+    print(f"frame_at: {lookup_us:.1f} µs/sorgu")
+
+    if shutil.which("ffmpeg") and shutil.which("ffprobe"):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "vfr.mkv"
+            expected = _make_vfr_file(path)
+            real = timeline_from_ffprobe(path)
+            _check_model(real, expected, tolerance=0.002)
+            assert real.is_vfr
+            naive = int(3.0 * (len(expected) / 6.0))
+            print(f"ffmpeg VFR dosyası: {len(real)} kare, 3.0 sn → kare {real.frame_at(3.0)} "
+                  f"(sabit fps varsayımıyla {naive})")
+    else:
+        print("ffmpeg/ffprobe yok: gerçek VFR dosyası testi atlandı")
+
+    print("✓ Zaman modeli doğrulandı")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _self_check()
@@ -3,17 +3,20 @@ LinuxShorts Generator - Video Analyzer
 Akıllı kesit önerisi için video analizi
 """
 
-import subprocess
-import json
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
-import statistics
 
 from utils.logger import get_logger
+from .process_runner import run_process
+from .segment_search import FeatureTimeline, SegmentWindow, find_segments
+from .waveform import SILENCE_MIN_DURATION, SILENCE_THRESHOLD_DB, WaveformBuilder, parse_silencedetect
 
 logger = get_logger("LinuxShorts.Analyzer")
 
+# Öneriler hedef sürenin en az bu oranı kadar uzun olur (sessizliğe oturtma payı)
+MIN_SEGMENT_RATIO = 0.5
+
 
 @dataclass
 class VideoSegment:
@@ -54,15 +57,10 @@ class VideoAnalyzer:
         ]
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                stderr=subprocess.STDOUT
-            )
+            result = run_process(cmd, capture_output=True, text=True)
             
-            # FFmpeg çıktısından ses bilgilerini parse et
-            output = result.stdout
+            # FFmpeg istatistikleri stderr'e yazar
+            output = result.stderr
             
             # mean_volume ve max_volume bul
             mean_volume = -30.0  # Default
@@ -81,12 +79,13 @@ class VideoAnalyzer:
             logger.error(f"Ses analizi hatası: {e}")
             return []
     
-    def detect_scene_changes(self, video_path: Path) -> List[float]:
+    def detect_scene_changes(self, video_path: Path, limit: Optional[int] = 20) -> List[float]:
         """
         Sahne değişikliklerini tespit eder
         
         Args:
             video_path: Video dosyası
+            limit: En fazla kaç değişim döndürülsün (None = hepsi)
             
         Returns:
             Sahne değişimi zamanları (saniye)
@@ -102,14 +101,9 @@ class VideoAnalyzer:
         ]
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                stderr=subprocess.STDOUT
-            )
+            result = run_process(cmd, capture_output=True, text=True)
             
-            output = result.stdout
+            output = result.stderr
             scene_times = []
             
             # showinfo çıktısından zamanları parse et
@@ -122,18 +116,25 @@ class VideoAnalyzer:
                         pass
             
             logger.info(f"✓ {len(scene_times)} sahne değişimi tespit edildi")
-            return scene_times[:20]  # İlk 20'si
+            return scene_times[:limit]
             
         except Exception as e:
             logger.error(f"Sahne tespiti hatası: {e}")
             return []
     
-    def detect_silence(self, video_path: Path) -> List[Tuple[float, float]]:
+    def detect_silence(self, video_path: Path,
+                       threshold_db: float = SILENCE_THRESHOLD_DB,
+                       min_duration: float = SILENCE_MIN_DURATION) -> List[Tuple[float, float]]:
         """
         Sessiz bölümleri tespit eder
         
+        Varsayılan parametreler WaveformBuilder ile aynıdır; kesit sınırları
+        hangi yoldan gelirse gelsin aynı sessizliklere oturur.
+        
         Args:
             video_path: Video dosyası
+            threshold_db: silencedetect eşiği (dB)
+            min_duration: Minimum sessizlik süresi (saniye)
             
         Returns:
             [(başlangıç, bitiş)] sessiz bölümler
@@ -143,36 +144,14 @@ class VideoAnalyzer:
         cmd = [
             "ffmpeg",
             "-i", str(video_path),
-            "-af", "silencedetect=noise=-30dB:d=1",
+            "-af", f"silencedetect=noise={threshold_db}dB:d={min_duration}",
             "-f", "null",
             "/dev/null"
         ]
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                stderr=subprocess.STDOUT
-            )
-            
-            output = result.stdout
-            silences = []
-            
-            silence_start = None
-            for line in output.split('\n'):
-                if 'silence_start:' in line:
-                    try:
-                        silence_start = float(line.split('silence_start:')[1].strip())
-                    except:
-                        pass
-                elif 'silence_end:' in line and silence_start is not None:
-                    try:
-                        silence_end = float(line.split('silence_end:')[1].split('|')[0].strip())
-                        silences.append((silence_start, silence_end))
-                        silence_start = None
-                    except:
-                        pass
+            result = run_process(cmd, capture_output=True, text=True)
+            silences = parse_silencedetect(result.stderr)
             
             logger.info(f"✓ {len(silences)} sessiz bölüm tespit edildi")
             return silences
@@ -201,91 +180,39 @@ class VideoAnalyzer:
         logger.info(f"Video analiz ediliyor: {video_path.name}")
         logger.info(f"Süre: {video_duration}s, Hedef: {target_duration}s")
         
-        segments = []
-        
-        # 1. Sahne değişimlerini tespit et
-        scene_changes = self.detect_scene_changes(video_path)
+        # 1. Sahne değişimlerini tespit et (yoğunluk için hepsi)
+        scene_changes = self.detect_scene_changes(video_path, limit=None)
         
-        # 2. Sessiz bölümleri tespit et
-        silences = self.detect_silence(video_path)
+        # 2. Ses yüksekliği + sessizlikler tek decode'da (SmartVideoAnalyzer ile aynı cache)
+        waveform = WaveformBuilder().get(video_path, SILENCE_THRESHOLD_DB, SILENCE_MIN_DURATION,
+                                         duration=video_duration)
+        if waveform is not None:
+            silences = waveform.silences
+        else:
+            silences = self.detect_silence(video_path, SILENCE_THRESHOLD_DB, SILENCE_MIN_DURATION)
         
-        # 3. Segmentleri oluştur
-        num_segments = int(video_duration / target_duration)
+        # 3. Saniyelik zaman çizelgesinde en iyi örtüşmeyen pencereler (en fazla 5 öneri)
+        timeline = FeatureTimeline.build(
+            video_duration, waveform=waveform,
+            scene_changes=scene_changes, silences=silences
+        )
+        windows = find_segments(timeline, target_duration * MIN_SEGMENT_RATIO, target_duration, count=5)
         
-        for i in range(min(num_segments, 5)):  # En fazla 5 öneri
-            # Eşit aralıklarla böl
-            start = i * (video_duration / num_segments)
-            end = start + target_duration
-            
-            # Video sonunu aşma
-            if end > video_duration:
-                end = video_duration
-                start = max(0, end - target_duration)
-            
-            # Skor hesapla
-            score = self._calculate_score(
-                start, end, scene_changes, silences
+        segments = [
+            VideoSegment(
+                start_time=self._seconds_to_time(w.start),
+                end_time=self._seconds_to_time(w.end),
+                duration=w.duration,
+                score=max(0, min(100, w.score)),
+                reason=self._generate_reason(w, scene_changes),
+                category=self._categorize_segment(w.score)
             )
-            
-            # Kategorize et
-            category = self._categorize_segment(score)
-            reason = self._generate_reason(score, scene_changes, silences, start, end)
-            
-            segments.append(VideoSegment(
-                start_time=self._seconds_to_time(start),
-                end_time=self._seconds_to_time(end),
-                duration=end - start,
-                score=score,
-                reason=reason,
-                category=category
-            ))
-        
-        # Skora göre sırala (en yüksek önce)
-        segments.sort(key=lambda x: x.score, reverse=True)
+            for w in windows
+        ]
         
         logger.info(f"✓ {len(segments)} segment önerisi oluşturuldu")
         return segments
     
-    def _calculate_score(
-        self,
-        start: float,
-        end: float,
-        scene_changes: List[float],
-        silences: List[Tuple[float, float]]
-    ) -> float:
-        """
-        Segment için viral potansiyel skoru hesaplar
-        
-        Returns:
-            Skor (0-100)
-        """
-        score = 50.0  # Başlangıç skoru
-        
-        # Sahne değişimi sayısı (daha fazla = daha ilgi çekici)
-        scenes_in_segment = [s for s in scene_changes if start <= s <= end]
-        scene_score = min(len(scenes_in_segment) * 5, 25)
-        score += scene_score
-        
-        # Sessizlik oranı (daha az = daha iyi)
-        silence_duration = sum(
-            min(se, end) - max(ss, start)
-            for ss, se in silences
-            if not (se < start or ss > end)
-        )
-        silence_ratio = silence_duration / (end - start)
-        silence_penalty = silence_ratio * 30
-        score -= silence_penalty
-        
-        # Video başı bonusu (ilk 2 dakika daha değerli)
-        if start < 120:
-            score += 10
-        
-        # Video sonu bonusu (son özet kısımları)
-        if start > (end * 0.8):
-            score += 5
-        
-        return max(0, min(100, score))
-    
     def _categorize_segment(self, score: float) -> str:
         """Skora göre kategori belirler"""
         if score >= 75:
@@ -297,31 +224,16 @@ class VideoAnalyzer:
         else:
             return "📊 Düşük Potansiyel"
     
-    def _generate_reason(
-        self,
-        score: float,
-        scene_changes: List[float],
-        silences: List[Tuple[float, float]],
-        start: float,
-        end: float
-    ) -> str:
+    def _generate_reason(self, window: SegmentWindow, scene_changes: List[float]) -> str:
         """Öneri sebebini açıklar"""
-        reasons = []
+        reasons = list(window.reasons)
         
-        scenes_in_segment = [s for s in scene_changes if start <= s <= end]
+        scenes_in_segment = [s for s in scene_changes if window.start <= s <= window.end]
         if len(scenes_in_segment) > 2:
+            reasons = [r for r in reasons if r != "Dinamik içerik"]
             reasons.append(f"Dinamik içerik ({len(scenes_in_segment)} sahne)")
         
-        silence_duration = sum(
-            min(se, end) - max(ss, start)
-            for ss, se in silences
-            if not (se < start or ss > end)
-        )
-        
-        if silence_duration < 5:
-            reasons.append("Sürekli konuşma/aksiyon")
-        
-        if start < 120:
+        if window.start < 120:
             reasons.append("Video başı (hook bölgesi)")
         
         if not reasons:
@@ -5,6 +5,9 @@ YouTube Shorts için profesyonel video düzenleme motoru
 
 import cv2
 import numpy as np
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple, Callable, List
 from dataclasses import dataclass, field
@@ -12,6 +15,14 @@ from PIL import Image, ImageDraw, ImageFilter
 import subprocess
 
 from utils.logger import get_logger
+from utils.tracing import span
+from .filmstrip import Filmstrip, FilmstripGenerator
+from .cancellation import CancelToken, CancelledError
+from .capabilities import blur_filter
+from .process_runner import run_process
+from .media_info import VideoInfo, probe_video
+from .timestamps import FrameTimeline, get_timeline
+from .proxy import SeekStats, get_proxy_manager
 
 logger = get_logger("LinuxShorts.VideoEditor")
 
@@ -44,6 +55,64 @@ class VideoTransform:
     fps: Optional[float] = None  # None = orijinal FPS
 
 
+@dataclass
+class ExportJob:
+    """Tek kaynaktan üretilecek bir short"""
+    output_path: Path
+    start: float
+    duration: float
+    transform: Optional[VideoTransform] = None  # None = editörün mevcut dönüşümü
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+@dataclass
+class ExportCostModel:
+    """
+    Çoklu export için maliyet modeli (saniye)
+
+    Encode işi iki modda da aynıdır, bu yüzden sadece farklı olan kısımlar
+    karşılaştırılır:
+    - Tek geçiş: kapsanan aralığın tamamı (boşluklar dahil) bir kez decode edilir
+    - Bağımsız işler: her iş kendi aralığını decode eder, her biri süreç
+      başlatma + seek maliyeti öder (workers kadar paralel)
+
+    Varsayılan değerler `python -m core.video_editor` benchmark'ından
+    (1080p H.264 kaynak) alınmıştır; calibrate() ile yeniden ölçülebilir.
+    """
+    decode_speed: float = 12.0      # Kaynak saniyesi / duvar saniyesi (sadece decode)
+    process_overhead: float = 0.35  # Süreç başlatma + seek + muxer kurulumu (s)
+    workers: int = 2                # Bağımsız modda paralel ffmpeg süreci
+
+    def single_pass_cost(self, jobs: List[ExportJob]) -> float:
+        covered = max(j.end for j in jobs) - min(j.start for j in jobs)
+        return covered / self.decode_speed + self.process_overhead
+
+    def independent_cost(self, jobs: List[ExportJob]) -> float:
+        total = sum(j.duration for j in jobs)
+        workers = max(1, min(self.workers, len(jobs)))
+        return total / self.decode_speed + len(jobs) * self.process_overhead / workers
+
+    def plan(self, jobs: List[ExportJob]) -> List[List[ExportJob]]:
+        """
+        İşleri gruplar: her grup tek ffmpeg sürecinde, tekil gruplar bağımsız
+
+        İşler başlangıca göre sıralanır; bir sonraki iş gruba eklendiğinde tek
+        geçiş maliyeti bağımsız maliyetten büyük olmuyorsa gruba katılır.
+        """
+        groups: List[List[ExportJob]] = []
+        for job in sorted(jobs, key=lambda j: j.start):
+            if groups:
+                candidate = groups[-1] + [job]
+                if self.single_pass_cost(candidate) <= self.independent_cost(candidate):
+                    groups[-1] = candidate
+                    continue
+            groups.append([job])
+        return groups
+
+
 @dataclass 
 class SafeZone:
     """YouTube güvenli alan tanımları"""
@@ -56,40 +125,86 @@ class SafeZone:
 class VideoFrameReader:
     """Video frame okuyucu (OpenCV tabanlı)"""
     
-    def __init__(self, video_path: Path):
+    # İstenen frame bu kadar ilerideyse seek yerine grab() ile ilerlenir
+    SEQUENTIAL_SKIP = 8
+    
+    def __init__(self, video_path: Path, use_proxy: bool = True):
         self.video_path = video_path
+        self.read_path = video_path    # Kare okunan dosya (proxy hazırsa proxy)
         self.cap: Optional[cv2.VideoCapture] = None
         self.total_frames = 0
         self.fps = 0.0
         self.width = 0
         self.height = 0
         self.duration = 0.0
-        self._open()
+        self.info: Optional[VideoInfo] = None
+        self.timeline: Optional[FrameTimeline] = None
+        self._position = -1    # cap.read()'in döndüreceği sonraki frame
+        self._filmstrip: Optional[Filmstrip] = None
+        self._filmstrip_failed = False
+        self.seek_stats = SeekStats()
+        self._open(use_proxy)
     
-    def _open(self):
+    def _open(self, use_proxy: bool):
         """Video dosyasını aç"""
-        self.cap = cv2.VideoCapture(str(self.video_path))
+        proxy = get_proxy_manager().ready(self.video_path) if use_proxy else None
+        self.cap = cv2.VideoCapture(str(proxy or self.video_path))
         if not self.cap.isOpened():
             raise RuntimeError(f"Video açılamadı: {self.video_path}")
+        self.read_path = proxy or self.video_path
         
-        self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
-        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        self.duration = self.total_frames / self.fps if self.fps > 0 else 0
+        # Metadata her zaman kaynaktan (proxy kareleri aynı zamanlara sahip)
+        self.info = probe_video(self.video_path)
+        self.timeline = get_timeline(self.video_path, self.info)
+        self.total_frames = len(self.timeline)
+        self.fps = self.info.fps
+        self.width = self.info.width
+        self.height = self.info.height
+        self.duration = self.info.duration
+        self._position = 0
         
-        logger.info(f"Video açıldı: {self.width}x{self.height}, {self.duration:.1f}s, {self.fps:.1f}fps")
+        logger.info(f"Video açıldı: {self.width}x{self.height}, {self.duration:.1f}s, {self.fps:.1f}fps"
+                    f"{' (proxy)' if self.is_proxy else ''}")
+    
+    @property
+    def is_proxy(self) -> bool:
+        return self.read_path != self.video_path
+    
+    def attach_proxy(self, proxy_path: Path) -> bool:
+        """Hazır proxy'ye geç (önizleme kareleri artık proxy'den okunur)"""
+        cap = cv2.VideoCapture(str(proxy_path))
+        if not cap.isOpened():
+            logger.warning(f"Proxy açılamadı: {proxy_path}")
+            return False
+        if self.cap is not None:
+            self.cap.release()
+        self.cap = cap
+        self.read_path = proxy_path
+        self._position = 0
+        logger.info(f"Önizleme proxy'ye geçti: {proxy_path.name}")
+        return True
     
     def get_frame(self, time_seconds: float) -> Optional[np.ndarray]:
         """Belirli zamandaki frame'i al"""
         if self.cap is None:
             return None
         
-        frame_number = int(time_seconds * self.fps)
-        frame_number = max(0, min(frame_number, self.total_frames - 1))
+        frame_number = self.timeline.frame_at(time_seconds)
         
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        ret, frame = self.cap.read()
+        # Oynatma/ileri kaydırmada seek yerine sıradaki frame'lere ilerle
+        skip = frame_number - self._position
+        sequential = self._position >= 0 and 0 <= skip <= self.SEQUENTIAL_SKIP
+        start = time.perf_counter()
+        with span("decode", "decode", seek=not sequential, proxy=self.is_proxy):
+            if sequential:
+                for _ in range(skip):
+                    self.cap.grab()
+            else:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = self.cap.read()
+        self._position = frame_number + 1 if ret else -1
+        if not sequential:
+            self.seek_stats.record("proxy" if self.is_proxy else "source", time.perf_counter() - start)
         
         return frame if ret else None
     
@@ -101,11 +216,31 @@ class VideoFrameReader:
             return Image.fromarray(rgb_frame)
         return None
     
+    def get_filmstrip(self, progress_callback: Callable[[float], None] = None,
+                      cancel: Optional[CancelToken] = None) -> Optional[Filmstrip]:
+        """
+        Timeline küçük resim şeridi
+        
+        İlk çağrıda tek ffmpeg geçişiyle üretilir (veya diskteki cache'ten
+        okunur); sonraki çağrılar aynı nesneyi döndürür. Üretilemezse
+        tekrar denenmez (get_thumbnails seek'lere düşer).
+        """
+        if self._filmstrip is None and not self._filmstrip_failed:
+            self._filmstrip = FilmstripGenerator().get(
+                self.video_path, self.duration, progress_callback=progress_callback, cancel=cancel
+            )
+            self._filmstrip_failed = self._filmstrip is None
+        return self._filmstrip
+    
     def get_thumbnails(self, count: int = 10) -> List[Image.Image]:
         """Timeline için thumbnail'ler oluştur"""
-        thumbnails = []
         interval = self.duration / count
         
+        strip = self.get_filmstrip()
+        if strip is not None:
+            return [strip.tile_at(i * interval) for i in range(count)]
+        
+        thumbnails = []
         for i in range(count):
             time_sec = i * interval
             frame = self.get_frame_as_pil(time_sec)
@@ -169,6 +304,15 @@ class ProVideoEditor:
             logger.error(f"Video yükleme hatası: {e}")
             return False
     
+    def attach_proxy(self, video_path: Path, proxy_path: Path) -> bool:
+        """Yüklü video hâlâ video_path ise önizlemeyi proxy'ye geçir"""
+        if self.frame_reader is None or self.frame_reader.video_path != video_path:
+            return False
+        if not self.frame_reader.attach_proxy(proxy_path):
+            return False
+        self.update_frame(self.current_time)
+        return True
+    
     def update_frame(self, time_seconds: float) -> Optional[Image.Image]:
         """Frame güncelle"""
         if self.frame_reader is None:
@@ -186,7 +330,10 @@ class ProVideoEditor:
         if self.current_frame is None or self.frame_reader is None:
             return None
         
-        frame = self.current_frame
+        with span("composite", "composite", mode=self.transform.bg_mode):
+            return self._compose_preview(self.current_frame)
+    
+    def _compose_preview(self, frame: Image.Image) -> Image.Image:
         vw, vh = frame.size  # Video boyutları (1920x1080)
         pw, ph = self.preview_width, self.preview_height  # Preview boyutları (360x640)
         
@@ -410,18 +557,30 @@ class ProVideoEditor:
     # FFmpeg EXPORT
     # ========================================
     
-    def build_ffmpeg_filter(self) -> str:
+    def build_ffmpeg_filter(
+        self,
+        transform: Optional[VideoTransform] = None,
+        duration: Optional[float] = None,
+        tag: str = ""
+    ) -> str:
         """
         FFmpeg filter string oluştur
         
         16:9 yatay video → 9:16 dikey Short
         Video genişliğe sığdırılır, üst/alt boşluk arka plan ile doldurulur
+        
+        Args:
+            transform: Dönüşüm (None ise editörün mevcut dönüşümü)
+            duration: Çıktı süresi (renk arka planı bu kadar üretilir)
+            tag: Ara etiketlere eklenecek sonek (tek filter_complex içinde
+                birden fazla zincir için benzersiz etiketler)
         """
         if self.frame_reader is None:
             return ""
         
+        transform = transform or self.transform
         vw, vh = self.frame_reader.width, self.frame_reader.height
-        ow, oh = self.transform.output_width, self.transform.output_height  # 1080x1920
+        ow, oh = transform.output_width, transform.output_height  # 1080x1920
         
         # 16:9 videoyu 9:16 çerçeveye sığdırma stratejisi:
         # Video GENİŞLİĞE göre scale edilir (1080px genişlik)
@@ -431,7 +590,7 @@ class ProVideoEditor:
         video_ratio = vw / vh  # 16:9 = 1.777
         
         # Scale faktörü (%30-300)
-        scale_factor = self.transform.scale / 100.0
+        scale_factor = transform.scale / 100.0
         
         # Video genişliği = output genişliği * scale
         final_w = int(ow * scale_factor)
@@ -450,8 +609,8 @@ class ProVideoEditor:
         center_x = (ow - final_w) // 2
         center_y = (oh - final_h) // 2
         
-        pos_x = center_x + self.transform.pos_x
-        pos_y = center_y + self.transform.pos_y
+        pos_x = center_x + transform.pos_x
+        pos_y = center_y + transform.pos_y
         
         # Sınırları kontrol et
         # Video çerçeveden küçükse:  0 .. (ow-final_w)
@@ -464,43 +623,45 @@ class ProVideoEditor:
         pos_x = max(min_x, min(max_x, pos_x))
         pos_y = max(min_y, min(max_y, pos_y))
         
-        mode = self.transform.bg_mode
+        mode = transform.bg_mode
+        bg_duration = f"{duration:.3f}" if duration else "1"
+        t = tag
         
         if mode == "blur":
             # Blur arka plan - video'yu blur edip arka plana koy
-            blur = self.transform.bg_blur_strength
+            blur = transform.bg_blur_strength
             filter_str = (
-                f"split[bg][fg];"
-                f"[bg]scale={ow}:{oh}:force_original_aspect_ratio=increase,"
+                f"split[bg{t}][fg{t}];"
+                f"[bg{t}]scale={ow}:{oh}:force_original_aspect_ratio=increase,"
                 f"crop={ow}:{oh},"
-                f"boxblur={blur}:2[blurred];"
-                f"[fg]scale={final_w}:{final_h}[scaled];"
-                f"[blurred][scaled]overlay={pos_x}:{pos_y}"
+                f"{blur_filter(blur, 2)}[blurred{t}];"
+                f"[fg{t}]scale={final_w}:{final_h}[scaled{t}];"
+                f"[blurred{t}][scaled{t}]overlay={pos_x}:{pos_y}"
             )
         
         elif mode == "gradient":
-            start_color = self.transform.bg_gradient_start
+            start_color = transform.bg_gradient_start
             filter_str = (
-                f"scale={final_w}:{final_h}[v];"
-                f"color=c=0x{start_color}:s={ow}x{oh}:d=1[bg];"
-                f"[bg][v]overlay={pos_x}:{pos_y}:shortest=1"
+                f"scale={final_w}:{final_h}[v{t}];"
+                f"color=c=0x{start_color}:s={ow}x{oh}:d={bg_duration}[bg{t}];"
+                f"[bg{t}][v{t}]overlay={pos_x}:{pos_y}:shortest=1"
             )
         
         elif mode == "color":
-            color = self.transform.bg_color
+            color = transform.bg_color
             filter_str = (
-                f"scale={final_w}:{final_h}[v];"
-                f"color=c=0x{color}:s={ow}x{oh}:d=1[bg];"
-                f"[bg][v]overlay={pos_x}:{pos_y}:shortest=1"
+                f"scale={final_w}:{final_h}[v{t}];"
+                f"color=c=0x{color}:s={ow}x{oh}:d={bg_duration}[bg{t}];"
+                f"[bg{t}][v{t}]overlay={pos_x}:{pos_y}:shortest=1"
             )
         
         else:  # black
             # Siyah arka plan için de color+overlay kullan
             # Böylece video büyük olduğunda da (zoom/kırpma) pad hatası olmaz
             filter_str = (
-                f"scale={final_w}:{final_h}[v];"
-                f"color=c=black:s={ow}x{oh}:d=1[bg];"
-                f"[bg][v]overlay={pos_x}:{pos_y}:shortest=1"
+                f"scale={final_w}:{final_h}[v{t}];"
+                f"color=c=black:s={ow}x{oh}:d={bg_duration}[bg{t}];"
+                f"[bg{t}][v{t}]overlay={pos_x}:{pos_y}:shortest=1"
             )
         
         logger.debug(f"FFmpeg filter ({mode}): {filter_str}")
@@ -512,15 +673,21 @@ class ProVideoEditor:
         output_path: Path,
         start_time: float,
         duration: float,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        cancel: Optional[CancelToken] = None
     ) -> bool:
-        """Short video export et"""
+        """
+        Short video export et
+        
+        Raises:
+            CancelledError: Token iptal edildiyse (yarım çıktı silinir)
+        """
         if self.frame_reader is None:
             logger.error("Video yüklenmemiş!")
             return False
         
         video_path = self.frame_reader.video_path
-        vf = self.build_ffmpeg_filter()
+        vf = self.build_ffmpeg_filter(duration=duration)
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -543,12 +710,14 @@ class ProVideoEditor:
         logger.debug(f"Komut: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            with span("encode", "encode", output=output_path.name, duration=duration):
+                result = run_process(
+                    cmd,
+                    cancel=cancel,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
             
             logger.info(f"✓ Export tamamlandı: {output_path}")
             return True
@@ -556,10 +725,231 @@ class ProVideoEditor:
         except subprocess.CalledProcessError as e:
             logger.error(f"FFmpeg hatası: {e.stderr}")
             return False
+        except CancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
             logger.error(f"Export hatası: {e}")
             return False
     
+    def export_many(
+        self,
+        jobs: List[ExportJob],
+        mode: str = "auto",
+        cost_model: Optional[ExportCostModel] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel: Optional[CancelToken] = None
+    ) -> List[bool]:
+        """
+        Aynı kaynaktan birden fazla short export et
+        
+        Yakın segmentler tek ffmpeg sürecinde (tek decode, trim/split
+        dalları, N çıktı) üretilir; birbirinden uzak segmentler bağımsız
+        süreçlerde paralel çalışır. Gruplama ExportCostModel ile yapılır.
+        
+        Args:
+            jobs: Export işleri
+            mode: auto / single (hepsi tek süreç) / independent (her iş ayrı)
+            cost_model: Maliyet modeli (None ise varsayılan)
+            progress_callback: (tamamlanan_iş, toplam_iş)
+            cancel: İptal token'ı (tüm gruplardaki ffmpeg süreçleri öldürülür)
+            
+        Returns:
+            Her iş için başarı durumu (jobs sırasıyla)
+            
+        Raises:
+            CancelledError: Token iptal edildiyse
+        """
+        if self.frame_reader is None:
+            logger.error("Video yüklenmemiş!")
+            return [False] * len(jobs)
+        if not jobs:
+            return []
+        
+        model = cost_model or ExportCostModel()
+        if mode != "independent" and self._has_audio() is None:
+            # Tek geçiş grafiği ses dallarını açıkça kurar; ses akışı bilinmeden
+            # kurulursa çıktılar sessiz kalır veya ffmpeg hata verir
+            logger.info("Kaynağın ses durumu bilinmiyor (ffprobe yok), işler bağımsız export edilecek")
+            mode = "independent"
+        if mode == "single":
+            groups = [sorted(jobs, key=lambda j: j.start)]
+        elif mode == "independent":
+            groups = [[job] for job in jobs]
+        else:
+            groups = model.plan(jobs)
+        
+        logger.info(
+            f"Çoklu export: {len(jobs)} iş → {len(groups)} ffmpeg süreci "
+            f"(tek geçiş ~{model.single_pass_cost(jobs):.1f}s, "
+            f"bağımsız ~{model.independent_cost(jobs):.1f}s decode maliyeti)"
+        )
+        
+        results = {}
+        done = 0
+        
+        def run(group: List[ExportJob]) -> List[Tuple[ExportJob, bool]]:
+            if len(group) == 1:
+                job = group[0]
+                return [(job, self._export_job(job, cancel))]
+            return self._export_single_pass(group, cancel)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(model.workers, len(groups)))) as pool:
+            for group_results in pool.map(run, groups):
+                for job, ok in group_results:
+                    results[id(job)] = ok
+                done += len(group_results)
+                if progress_callback:
+                    progress_callback(done, len(jobs))
+        
+        return [results.get(id(job), False) for job in jobs]
+    
+    def _export_job(self, job: ExportJob, cancel: Optional[CancelToken] = None) -> bool:
+        """Tek işi kendi ffmpeg sürecinde export et"""
+        transform = job.transform or self.transform
+        vf = self.build_ffmpeg_filter(transform, duration=job.duration)
+        job.output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        cmd = [
+            "ffmpeg",
+            "-ss", f"{job.start:.3f}",
+            "-i", str(self.frame_reader.video_path),
+            "-t", f"{job.duration:.3f}",
+            "-vf", vf,
+            "-c:v", "libx264",
+            "-preset", transform.preset,
+            "-crf", str(transform.crf),
+            "-c:a", "aac",
+            "-b:a", "128k",
+            "-y",
+            str(job.output_path)
+        ]
+        
+        try:
+            with span("encode", "encode", output=job.output_path.name, duration=job.duration):
+                run_process(cmd, cancel=cancel, capture_output=True, text=True, check=True)
+            logger.info(f"✓ Export tamamlandı: {job.output_path.name}")
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"FFmpeg hatası ({job.output_path.name}): {e.stderr}")
+            return False
+        except CancelledError:
+            job.output_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            logger.error(f"Export hatası: {e}")
+            return False
+    
+    def build_multi_output_command(self, jobs: List[ExportJob]) -> List[str]:
+        """
+        Tek decode ile N çıktı üreten ffmpeg komutu
+        
+        Kaynak, grubun kapsadığı aralık için bir kez açılıp decode edilir;
+        video/ses split ile dallara ayrılır, her dal trim/atrim ile kendi
+        segmentini alır ve kendi dönüşüm zincirinden geçip ayrı dosyaya yazılır.
+        
+        Raises:
+            ValueError: Kaynağın ses akışı bilinmiyorsa (ffprobe yok);
+                bu durumda işler bağımsız export edilmelidir
+        """
+        video_path = self.frame_reader.video_path
+        base = min(j.start for j in jobs)
+        covered = max(j.end for j in jobs) - base
+        count = len(jobs)
+        has_audio = self._has_audio()
+        if has_audio is None:
+            raise ValueError("Ses akışı bilinmeden tek geçiş komutu kurulamaz")
+        
+        parts = [f"[0:v]split={count}" + "".join(f"[vin{k}]" for k in range(count))]
+        if has_audio:
+            parts.append(f"[0:a]asplit={count}" + "".join(f"[ain{k}]" for k in range(count)))
+        
+        for k, job in enumerate(jobs):
+            offset = job.start - base
+            transform = job.transform or self.transform
+            chain = self.build_ffmpeg_filter(transform, duration=job.duration, tag=f"_{k}")
+            parts.append(
+                f"[vin{k}]trim=start={offset:.3f}:duration={job.duration:.3f},"
+                f"setpts=PTS-STARTPTS[vtrim{k}];"
+                f"[vtrim{k}]{chain}[vout{k}]"
+            )
+            if has_audio:
+                parts.append(
+                    f"[ain{k}]atrim=start={offset:.3f}:duration={job.duration:.3f},"
+                    f"asetpts=PTS-STARTPTS[aout{k}]"
+                )
+        
+        cmd = [
+            "ffmpeg",
+            "-ss", f"{base:.3f}",
+            "-t", f"{covered:.3f}",
+            "-i", str(video_path),
+            "-filter_complex", ";".join(parts),
+        ]
+        
+        for k, job in enumerate(jobs):
+            transform = job.transform or self.transform
+            cmd += ["-map", f"[vout{k}]"]
+            if has_audio:
+                cmd += ["-map", f"[aout{k}]", "-c:a", "aac", "-b:a", "128k"]
+            cmd += [
+                "-c:v", "libx264",
+                "-preset", transform.preset,
+                "-crf", str(transform.crf),
+                "-y",
+                str(job.output_path)
+            ]
+        return cmd
+    
+    def _export_single_pass(self, jobs: List[ExportJob],
+                            cancel: Optional[CancelToken] = None) -> List[Tuple[ExportJob, bool]]:
+        """Grubu tek ffmpeg sürecinde export et"""
+        if self._has_audio() is None:
+            return [(job, self._export_job(job, cancel)) for job in jobs]
+        
+        for job in jobs:
+            job.output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        cmd = self.build_multi_output_command(jobs)
+        logger.info(f"Tek geçiş export: {len(jobs)} çıktı")
+        logger.debug(f"Komut: {' '.join(cmd)}")
+        
+        try:
+            with span("encode", "encode", outputs=len(jobs)):
+                run_process(cmd, cancel=cancel, capture_output=True, text=True, check=True)
+            return [(job, job.output_path.exists()) for job in jobs]
+        except subprocess.CalledProcessError as e:
+            logger.error(f"FFmpeg hatası (tek geçiş): {e.stderr}")
+            logger.info("Bağımsız export ile tekrar deneniyor...")
+            return [(job, self._export_job(job, cancel)) for job in jobs]
+        except CancelledError:
+            for job in jobs:
+                job.output_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            logger.error(f"Export hatası: {e}")
+            return [(job, False) for job in jobs]
+    
+    def get_filmstrip(self, progress_callback: Callable[[float], None] = None,
+                      cancel: Optional[CancelToken] = None) -> Optional[Filmstrip]:
+        """Yüklü videonun timeline küçük resim şeridi"""
+        if self.frame_reader is None:
+            return None
+        return self.frame_reader.get_filmstrip(progress_callback, cancel)
+    
+    def _has_audio(self) -> Optional[bool]:
+        """
+        Kaynakta ses akışı var mı (paylaşılan ffprobe sonucu)
+        
+        Returns:
+            True/False; bilgi ffprobe'dan gelmediyse (OpenCV yedeği ses
+            akışlarını göremez) None
+        """
+        info = self.frame_reader.info
+        if info is None or info.source != "ffprobe":
+            return None
+        return info.has_audio
+    
     @property
     def video_info(self) -> Optional[dict]:
         """Video bilgileri"""
@@ -572,7 +962,9 @@ class ProVideoEditor:
             "height": self.frame_reader.height,
             "duration": self.frame_reader.duration,
             "fps": self.frame_reader.fps,
-            "total_frames": self.frame_reader.total_frames
+            "total_frames": self.frame_reader.total_frames,
+            "proxy": self.frame_reader.is_proxy,
+            "seek": self.frame_reader.seek_stats.summary(),
         }
     
     def close(self):
@@ -642,3 +1034,69 @@ class ProVideoEditor:
             idx += 1
 
         return segments
+
+
+def _measure_cost_model(video_path: Path, sample: float = 30.0) -> ExportCostModel:
+    """Decode hızını ve süreç başlatma maliyetini ölçer"""
+    start = time.perf_counter()
+    subprocess.run(["ffmpeg", "-v", "error", "-t", str(sample), "-i", str(video_path),
+                    "-f", "null", "-"], check=True)
+    decode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    subprocess.run(["ffmpeg", "-v", "error", "-ss", str(sample), "-t", "0.04", "-i", str(video_path),
+                    "-f", "null", "-"], check=True)
+    overhead = time.perf_counter() - start
+
+    return ExportCostModel(decode_speed=sample / decode_time, process_overhead=overhead,
+                           workers=max(1, min(4, (os.cpu_count() or 2) // 2)))
+
+
+def _benchmark(source_seconds: int = 180):
+    """Tek geçiş / bağımsız export karşılaştırması (sentetik kaynak ile)"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "source.mp4"
+        subprocess.run([
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size=1920x1080:rate=30:duration={source_seconds}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:duration={source_seconds}",
+            "-c:v", "libx264", "-preset", "veryfast", "-g", "60", "-c:a", "aac",
+            "-shortest", "-y", str(source)
+        ], check=True)
+
+        model = _measure_cost_model(source)
+        print(f"Ölçülen model: decode {model.decode_speed:.1f}x gerçek zaman, "
+              f"süreç maliyeti {model.process_overhead:.2f}s, {model.workers} worker")
+
+        editor = ProVideoEditor()
+        editor.load_video(source)
+        editor.transform.preset = "ultrafast"
+
+        scenarios = {
+            "bitişik (4x10s)": [0, 10, 20, 30],
+            "yakın (4x10s, 3s boşluk)": [0, 13, 26, 39],
+            "uzak (4x10s, 40s boşluk)": [0, 50, 100, 150],
+        }
+        for name, starts in scenarios.items():
+            print(f"\n{name}")
+            for mode in ("single", "independent", "auto"):
+                jobs = [ExportJob(tmp / f"{mode}_{i}.mp4", float(s), 10.0) for i, s in enumerate(starts)]
+                start = time.perf_counter()
+                ok = editor.export_many(jobs, mode=mode, cost_model=model)
+                elapsed = time.perf_counter() - start
+                extra = ""
+                if mode == "auto":
+                    extra = f" → {len(model.plan(jobs))} süreç"
+                print(f"  {mode:<12} {elapsed:6.2f}s  {sum(ok)}/{len(ok)} başarılı{extra}")
+            print(f"  model: tek geçiş {model.single_pass_cost(jobs):.2f}s, "
+                  f"bağımsız {model.independent_cost(jobs):.2f}s (decode farkı)")
+
+        editor.close()
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,384 @@
+"""
+LinuxShorts Pro - Waveform
+Timeline için ses dalga formu (min/max piramidi)
+
+- ffmpeg'den mono PCM (s16le) tek sefer stream edilir; bellek kullanımı
+  video süresinden bağımsızdır (parça parça indirgenir)
+- Aynı decode'da silencedetect çalışır: sessizlik analizi ayrıca
+  ffmpeg çalıştırmaz
+- Her seviye bir öncekinin 2'ye indirgenmişi (min/max mip seviyeleri);
+  tümü tek int16 dizide ~/.linuxshorts/waveforms altında saklanır
+- Herhangi bir zoom seviyesi, piksel başına 1-2 bin içeren seviyeden
+  O(piksel) sürede çizilir
+"""
+
+import json
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+from utils.cache import cache_path
+from .cancellation import CancelToken
+from .process_runner import get_runner
+from .capabilities import tool_available
+
+logger = get_logger("LinuxShorts.Waveform")
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# Index formatı değişirse eski cache'ler yeniden üretilir
+WAVEFORM_VERSION = 1
+
+SAMPLE_RATE = 8000      # Dalga formu için yeterli; decode ve pipe maliyetini düşürür
+BLOCK_SIZE = 64         # Seviye 0'da bin başına örnek (8 ms)
+CHUNK_BLOCKS = 1024     # Pipe'tan bir seferde okunan blok sayısı (128 KB)
+
+# Varsayılan silencedetect parametreleri (kesit önerisi ve akıllı analiz ortak)
+SILENCE_THRESHOLD_DB = -35.0
+SILENCE_MIN_DURATION = 0.3
+
+
+def parse_silencedetect(output: str) -> List[Tuple[float, float]]:
+    """
+    ffmpeg silencedetect çıktısını (stderr) sessizlik aralıklarına çevirir
+
+    Returns:
+        [(başlangıç, bitiş), ...]
+    """
+    silences = []
+    silence_start = None
+    for line in output.split("\n"):
+        if "silence_start:" in line:
+            try:
+                silence_start = float(line.split("silence_start:")[1].split()[0])
+            except (IndexError, ValueError):
+                pass
+        elif "silence_end:" in line and silence_start is not None:
+            try:
+                silence_end = float(line.split("silence_end:")[1].split()[0])
+                silences.append((silence_start, silence_end))
+                silence_start = None
+            except (IndexError, ValueError):
+                pass
+    return silences
+
+
+class WaveformPyramid:
+    """
+    Min/max mip seviyeleri
+
+    levels[0]: BLOCK_SIZE örnek başına (min, max); levels[i+1] levels[i]'nin
+    ardışık ikililerinin min/max'ı. Hepsi tek (N, 2) int16 dizide tutulur.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: List[int], sample_rate: int = SAMPLE_RATE,
+                 block_size: int = BLOCK_SIZE):
+        self.data = data
+        self.offsets = offsets
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+
+    @classmethod
+    def from_blocks(cls, base: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                    block_size: int = BLOCK_SIZE) -> "WaveformPyramid":
+        """Seviye 0'dan (N, 2) üst seviyeleri üret"""
+        levels = [base]
+        while len(levels[-1]) > 1:
+            prev = levels[-1]
+            if len(prev) % 2:
+                prev = np.vstack([prev, prev[-1:]])
+            pairs = prev.reshape(-1, 2, 2)
+            levels.append(np.stack([pairs[:, :, 0].min(axis=1), pairs[:, :, 1].max(axis=1)], axis=1))
+
+        offsets = np.cumsum([0] + [len(level) for level in levels]).tolist()
+        return cls(np.vstack(levels).astype(np.int16), offsets, sample_rate, block_size)
+
+    @property
+    def level_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def level(self, i: int) -> np.ndarray:
+        return self.data[self.offsets[i]:self.offsets[i + 1]]
+
+    def bin_duration(self, i: int) -> float:
+        return self.block_size * (2 ** i) / self.sample_rate
+
+    @property
+    def duration(self) -> float:
+        return len(self.level(0)) * self.bin_duration(0)
+
+    def render(self, start: float, end: float, width: int) -> np.ndarray:
+        """
+        [start, end] aralığını width piksele indirger
+
+        Piksel başına en az bir bin düşen en kaba seviye seçilir, bu yüzden
+        iş miktarı zoom'dan bağımsız olarak piksel sayısıyla orantılıdır.
+
+        Returns:
+            (width, 2) int16 (min, max); video dışındaki pikseller 0
+        """
+        width = max(1, int(width))
+        out = np.zeros((width, 2), dtype=np.int16)
+        if end <= start:
+            return out
+
+        px_duration = (end - start) / width
+        lvl = 0
+        while lvl + 1 < self.level_count and self.bin_duration(lvl + 1) <= px_duration:
+            lvl += 1
+        level = self.level(lvl)
+        bin_dur = self.bin_duration(lvl)
+
+        # Her pikselin başladığı bin
+        edges = ((start + np.arange(width + 1) * px_duration) / bin_dur).astype(np.int64)
+        valid = (edges[:-1] >= 0) & (edges[:-1] < len(level))
+        if not valid.any():
+            return out
+
+        lo = np.clip(edges[:-1][valid], 0, len(level) - 1)
+        stop = int(np.clip(max(edges[1:][valid][-1], lo[-1] + 1), 1, len(level)))
+        # reduceat [lo_i, lo_{i+1}) aralıklarını indirger; lo_i == lo_{i+1} ise
+        # (piksel bir binden kısa) tek bini döndürür
+        level = level[:stop]
+        mins = np.minimum.reduceat(level[:, 0], lo)
+        maxs = np.maximum.reduceat(level[:, 1], lo)
+        out[valid, 0] = mins
+        out[valid, 1] = maxs
+        return out
+
+    def render_image(self, start: float, end: float, width: int, height: int,
+                     color: Tuple[int, int, int] = (80, 200, 255),
+                     background: Tuple[int, int, int] = (26, 26, 26)) -> "Image.Image":
+        """Dalga formunu width × height görüntü olarak çiz"""
+        peaks = self.render(start, end, width).astype(np.float32) / 32768.0
+        mid = (height - 1) / 2
+        top = np.floor(mid - peaks[:, 1] * mid)
+        bottom = np.ceil(mid - peaks[:, 0] * mid)
+
+        rows = np.arange(height, dtype=np.float32)[:, None]
+        mask = (rows >= top[None, :]) & (rows <= bottom[None, :])
+        image = np.empty((height, width, 3), dtype=np.uint8)
+        image[:] = background
+        image[mask] = color
+        return Image.fromarray(image)
+
+
+@dataclass
+class Waveform:
+    """Dalga formu + aynı decode'dan çıkan sessizlik aralıkları"""
+    pyramid: WaveformPyramid
+    silences: List[Tuple[float, float]] = field(default_factory=list)
+    silence_params: Tuple[float, float] = (-35.0, 0.3)
+
+    @property
+    def duration(self) -> float:
+        return self.pyramid.duration
+
+    def render(self, start: float, end: float, width: int) -> np.ndarray:
+        return self.pyramid.render(start, end, width)
+
+    def render_image(self, start: float, end: float, width: int, height: int, **kwargs) -> "Image.Image":
+        return self.pyramid.render_image(start, end, width, height, **kwargs)
+
+    # ========================================
+    # DİSK CACHE
+    # ========================================
+
+    def save(self, base_path: Path):
+        """<base>.npy (int16 seviyeler) + <base>.json (meta + sessizlikler)"""
+        base_path = Path(base_path)
+        tmp = base_path.with_suffix(".npy.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.pyramid.data), allow_pickle=False)
+        tmp.replace(base_path.with_suffix(".npy"))
+        meta = {
+            "version": WAVEFORM_VERSION,
+            "sample_rate": self.pyramid.sample_rate,
+            "block_size": self.pyramid.block_size,
+            "offsets": self.pyramid.offsets,
+            "silences": self.silences,
+            "silence_params": list(self.silence_params),
+        }
+        tmp = base_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(base_path.with_suffix(".json"))
+
+    @classmethod
+    def load(cls, base_path: Path) -> Optional["Waveform"]:
+        base_path = Path(base_path)
+        try:
+            meta = json.loads(base_path.with_suffix(".json").read_text(encoding="utf-8"))
+            if meta.get("version") != WAVEFORM_VERSION:
+                return None
+            data = np.load(base_path.with_suffix(".npy"), mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        pyramid = WaveformPyramid(data, meta["offsets"], meta["sample_rate"], meta["block_size"])
+        return cls(pyramid, [tuple(s) for s in meta["silences"]], tuple(meta["silence_params"]))
+
+
+class WaveformBuilder:
+    """PCM stream'inden dalga formu üretici (video başına disk cache'li)"""
+
+    def __init__(self, ffmpeg_path: str = "ffmpeg"):
+        self.ffmpeg_path = ffmpeg_path
+
+    def get(self, video_path: Path, silence_threshold_db: float = SILENCE_THRESHOLD_DB,
+            silence_min_duration: float = SILENCE_MIN_DURATION, duration: float = 0.0,
+            progress_callback: Callable[[float], None] = None,
+            cancel: Optional[CancelToken] = None) -> Optional[Waveform]:
+        """
+        Dalga formunu cache'ten al, yoksa tek decode ile üret
+
+        Cache'teki sessizlikler farklı parametrelerle bulunduysa yeniden
+        decode edilir.
+
+        Args:
+            video_path: Kaynak video
+            silence_threshold_db: silencedetect eşiği
+            silence_min_duration: Minimum sessizlik süresi
+            duration: Video süresi (sadece ilerleme için)
+            progress_callback: İlerleme (0-1)
+            cancel: İptal token'ı (iptalde ffmpeg öldürülür, cache yazılmaz)
+
+        Returns:
+            Waveform veya None (ses yoksa / ffmpeg yoksa)
+        """
+        params = (float(silence_threshold_db), float(silence_min_duration))
+        base_path = cache_path("waveforms", video_path)
+        waveform = Waveform.load(base_path)
+        if waveform is not None and waveform.silence_params == params:
+            return waveform
+
+        waveform = self.build(video_path, params, duration, progress_callback, cancel)
+        if waveform is not None:
+            try:
+                waveform.save(base_path)
+            except OSError as e:
+                logger.warning(f"Dalga formu cache'e yazılamadı: {e}")
+        return waveform
+
+    def build_command(self, video_path: Path, silence_params: Tuple[float, float]) -> List[str]:
+        """Mono PCM'i stdout'a yazan, sessizlikleri stderr'e raporlayan komut"""
+        threshold, min_duration = silence_params
+        return [
+            self.ffmpeg_path, "-hide_banner", "-nostats", "-i", str(video_path),
+            "-vn", "-sn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+            "-af", f"silencedetect=noise={threshold}dB:d={min_duration}",
+            "-f", "s16le", "-acodec", "pcm_s16le", "pipe:1",
+        ]
+
+    def build(self, video_path: Path, silence_params: Tuple[float, float] = (-35.0, 0.3),
+              duration: float = 0.0, progress_callback: Callable[[float], None] = None,
+              cancel: Optional[CancelToken] = None) -> Optional[Waveform]:
+        """Tek ffmpeg decode'u ile piramit + sessizlikler"""
+        if not tool_available(self.ffmpeg_path):
+            logger.warning("Dalga formu için ffmpeg bulunamadı")
+            return None
+
+        # PCM akışı kendi Popen'ı ile okunur; eşzamanlı ffmpeg sınırına yine de dahil
+        with get_runner().slot("ffmpeg"):
+            return self._stream(video_path, silence_params, duration, progress_callback, cancel)
+
+    def _stream(self, video_path: Path, silence_params: Tuple[float, float], duration: float,
+                progress_callback: Optional[Callable[[float], None]],
+                cancel: Optional[CancelToken]) -> Optional[Waveform]:
+        cmd = self.build_command(video_path, silence_params)
+        if cancel is not None:
+            process = cancel.popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        else:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        # stderr ayrı thread'de boşaltılır (dolarsa ffmpeg bloklanır)
+        stderr_lines: List[str] = []
+        reader = threading.Thread(
+            target=lambda: stderr_lines.extend(
+                line.decode("utf-8", "replace") for line in process.stderr
+            ),
+            daemon=True,
+        )
+        reader.start()
+
+        chunk_bytes = BLOCK_SIZE * CHUNK_BLOCKS * 2
+        blocks: List[np.ndarray] = []
+        carry = b""
+        samples = 0
+        while True:
+            chunk = process.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            chunk = carry + chunk
+            usable = len(chunk) - len(chunk) % (BLOCK_SIZE * 2)
+            carry = chunk[usable:]
+            if usable:
+                pcm = np.frombuffer(chunk[:usable], dtype="<i2").reshape(-1, BLOCK_SIZE)
+                blocks.append(np.stack([pcm.min(axis=1), pcm.max(axis=1)], axis=1))
+                samples += usable // 2
+                if progress_callback and duration > 0:
+                    progress_callback(min(1.0, samples / SAMPLE_RATE / duration))
+
+        if len(carry) >= 2:
+            pcm = np.frombuffer(carry[:len(carry) - len(carry) % 2], dtype="<i2")
+            blocks.append(np.array([[pcm.min(), pcm.max()]], dtype=np.int16))
+
+        process.wait()
+        reader.join(timeout=5)
+        if cancel is not None:
+            cancel.unregister(process)
+            cancel.raise_if_cancelled()
+
+        if process.returncode != 0 or not blocks:
+            logger.warning(f"Dalga formu oluşturulamadı (ses akışı yok olabilir): "
+                           f"{''.join(stderr_lines).strip()[-200:]}")
+            return None
+
+        pyramid = WaveformPyramid.from_blocks(np.vstack(blocks))
+        silences = parse_silencedetect("".join(stderr_lines))
+        logger.info(f"Dalga formu: {pyramid.duration:.1f} sn, {pyramid.level_count} seviye, "
+                    f"{pyramid.data.nbytes / 1024:.0f} KB, {len(silences)} sessizlik")
+        return Waveform(pyramid, silences, tuple(silence_params))
+
+
+def _benchmark(duration: float = 3600.0):
+    """Sentetik 1 saatlik ses: piramit oluşturma ve farklı zoom'larda çizim süresi"""
+    import time
+
+    rng = np.random.default_rng(0)
+    samples = int(duration * SAMPLE_RATE)
+    t = np.arange(samples, dtype=np.float32) / SAMPLE_RATE
+    pcm = (np.sin(t * 440) * 12000 * (0.5 + 0.5 * np.sin(t * 0.3))
+           + rng.normal(0, 500, samples)).astype(np.int16)
+
+    start = time.perf_counter()
+    usable = samples - samples % BLOCK_SIZE
+    blocks = pcm[:usable].reshape(-1, BLOCK_SIZE)
+    pyramid = WaveformPyramid.from_blocks(np.stack([blocks.min(axis=1), blocks.max(axis=1)], axis=1))
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Piramit: {pyramid.level_count} seviye, {pyramid.data.nbytes / 1024:.0f} KB "
+          f"(ham PCM {pcm.nbytes / 1024 / 1024:.0f} MB), {build_ms:.0f} ms")
+
+    for span in (duration, 600.0, 60.0, 5.0):
+        start = time.perf_counter()
+        for _ in range(20):
+            pyramid.render_image(100.0, 100.0 + span, 800, 60)
+        render_ms = (time.perf_counter() - start) / 20 * 1000
+        naive_start = time.perf_counter()
+        window = pcm[int(100 * SAMPLE_RATE):int((100 + span) * SAMPLE_RATE)]
+        [(c.min(), c.max()) for c in np.array_split(window, 800)]
+        naive_ms = (time.perf_counter() - naive_start) * 1000
+        print(f"  {span:>6.0f} sn / 800 px: {render_ms:.2f} ms (ham örneklerden bölme: {naive_ms:.1f} ms)")
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()
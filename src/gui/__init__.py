@@ -2,7 +2,10 @@
 
 from .main_window import MainWindow, main
 
-try:
-    from .video_editor_tab import VideoEditorTab
-except ImportError:
-    pass
+
+def __getattr__(name: str):
+    # VideoEditorTab core.video_editor'ı (cv2, numpy) çeker: açılışta yükleme
+    if name == "VideoEditorTab":
+        from .video_editor_tab import VideoEditorTab
+        return VideoEditorTab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,27 +5,24 @@ Tamamen yeniden tasarlanmış, kullanıcı dostu arayüz
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox, colorchooser
-from PIL import Image, ImageTk, ImageEnhance
+from PIL import Image, ImageTk
 from pathlib import Path
 from typing import Optional, List, Callable
+import importlib.util
 import threading
 import sys
 import os
 
-# OpenCV import kontrolü
-try:
-    import cv2
-    import numpy as np
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
-    np = None
+# OpenCV kontrolü: cv2/numpy içe aktarması (~200 ms) ilk önizlemeye bırakılır
+CV2_AVAILABLE = (importlib.util.find_spec("cv2") is not None
+                 and importlib.util.find_spec("numpy") is not None)
 
 # Path ayarları
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from utils.logger import get_logger
+from utils.tracing import span, traced
 from utils.config import (
     APP_NAME, APPEARANCE_MODE, THEME, SUPPORTED_VIDEO_FORMATS,
     OUTPUT_DIR, PRESETS_DIR
@@ -33,6 +30,19 @@ from utils.config import (
 
 logger = get_logger("LinuxShorts.GUI")
 
+# Sayfa → açıldığında arka planda yüklenecek servisler
+PAGE_SERVICES = {
+    "editor": ("ffmpeg",),
+    "analysis": ("smart_analyzer",),
+    "subtitle": ("subtitle",),
+    "thumbnail": ("thumbnail", "smart_analyzer"),
+    "seo": ("seo", "hashtag"),
+    "export": ("ffmpeg",),
+}
+
+# Whisper/ffmpeg kontrolleri için ilk çizimden sonra beklenecek süre
+STARTUP_CHECK_DELAY_MS = 500
+
 # ============================================================
 # RENK TEMASi
 # ============================================================
@@ -212,8 +222,20 @@ class MainWindow(ctk.CTk):
         self.current_page = "home"
         self.sidebar_buttons = {}
         
-        # Modülleri yükle
-        self._load_modules()
+        # Son üretilen altyazı segmentleri (kelime zamanlarıyla) ve SRT metni
+        self.subtitle_segments = []
+        self.subtitle_segments_srt = None
+        
+        # Thumbnail efekt önizlemesi için decode edilmiş frame cache'i
+        self._thumb_frame_key = None
+        self._thumb_frame = None
+        self._thumb_preview_frame = None
+        
+        # Çalışan arka plan işleri (iş adı → iptal token'ı)
+        self._jobs = {}
+        
+        # Modülleri kaydet (ilk kullanımda yüklenir)
+        self._register_services()
         
         # GUI oluştur
         self._create_layout()
@@ -223,66 +245,149 @@ class MainWindow(ctk.CTk):
         # İlk sayfa
         self._show_page("home")
         
+        # Kapanırken ffmpeg/whisper alt süreçleri de sonlansın
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Araç kontrolleri pencere ekrana geldikten sonra
+        self.after(STARTUP_CHECK_DELAY_MS, self._check_capabilities)
+        
         logger.info("LinuxShorts Pro v2.0 hazır!")
     
-    def _load_modules(self):
-        """Core modülleri yükle"""
-        try:
-            from core.ffmpeg_wrapper import FFmpegWrapper, VideoInfo
-            self.ffmpeg = FFmpegWrapper()
-            self.VideoInfo = VideoInfo
-            logger.info("FFmpeg modülü yüklendi")
-        except Exception as e:
-            logger.error(f"FFmpeg modülü yüklenemedi: {e}")
-            self.ffmpeg = None
+    # ============================================================
+    # ARKA PLAN İŞLERİ
+    # ============================================================
+    
+    def _start_job(self, name: str):
+        """Yeni iş için iptal token'ı (aynı isimli eski iş iptal edilir)"""
+        from core.cancellation import CancelToken
         
-        try:
+        previous = self._jobs.get(name)
+        if previous is not None:
+            previous.cancel()
+        token = CancelToken(name)
+        self._jobs[name] = token
+        return token
+    
+    def _finish_job(self, name: str, token):
+        """Worker bitince çağrılır (iptal gecikmesi burada loglanır)"""
+        token.finished()
+        if self._jobs.get(name) is token:
+            del self._jobs[name]
+    
+    def _cancel_jobs(self):
+        """Tüm arka plan işlerini iptal et"""
+        for token in list(self._jobs.values()):
+            token.cancel()
+    
+    def _on_close(self):
+        from core.process_runner import get_runner
+        
+        self._cancel_jobs()
+        # Token'sız çalışan ffmpeg/ffprobe süreçleri de kapanmalı
+        get_runner().shutdown()
+        self.destroy()
+    
+    # ============================================================
+    # SERVİSLER
+    # ============================================================
+    
+    def _register_services(self):
+        """
+        Core modülleri tembel servis olarak kaydet
+        
+        Hiçbiri burada içe aktarılmaz: her modül sayfası ilk açıldığında
+        arka planda (PAGE_SERVICES) ya da ilk kullanımda yüklenir.
+        """
+        from utils.services import ServiceRegistry
+        
+        def ffmpeg():
+            from core.ffmpeg_wrapper import FFmpegWrapper
+            return FFmpegWrapper()
+        
+        def subtitle():
             from core.subtitle_generator import SubtitleGenerator
-            self.subtitle_gen = SubtitleGenerator()
-            logger.info("Altyazı modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"Altyazı modülü yüklenemedi: {e}")
-            self.subtitle_gen = None
+            return SubtitleGenerator()
         
-        try:
+        def video_analyzer():
             from core.video_analyzer import VideoAnalyzer
-            self.video_analyzer = VideoAnalyzer()
-            logger.info("Video analiz modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"Video analiz modülü yüklenemedi: {e}")
-            self.video_analyzer = None
+            return VideoAnalyzer()
         
-        try:
+        def hashtag():
             from core.hashtag_generator import HashtagGenerator
-            self.hashtag_gen = HashtagGenerator()
-            logger.info("Hashtag modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"Hashtag modülü yüklenemedi: {e}")
-            self.hashtag_gen = None
+            return HashtagGenerator()
         
-        try:
+        def smart_analyzer():
             from core.smart_analyzer import SmartVideoAnalyzer
-            self.smart_analyzer = SmartVideoAnalyzer()
-            logger.info("Akıllı analiz modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"Akıllı analiz modülü yüklenemedi: {e}")
-            self.smart_analyzer = None
+            return SmartVideoAnalyzer()
         
-        try:
+        def thumbnail():
             from core.thumbnail_generator import ThumbnailGenerator
-            self.thumbnail_gen = ThumbnailGenerator()
-            logger.info("Thumbnail modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"Thumbnail modülü yüklenemedi: {e}")
-            self.thumbnail_gen = None
+            return ThumbnailGenerator()
         
-        try:
+        def seo():
             from core.seo_generator import SEOGenerator
-            self.seo_gen = SEOGenerator()
-            logger.info("SEO modülü yüklendi")
-        except Exception as e:
-            logger.warning(f"SEO modülü yüklenemedi: {e}")
-            self.seo_gen = None
+            return SEOGenerator()
+        
+        self.services = ServiceRegistry()
+        self.services.register("ffmpeg", ffmpeg, "FFmpeg")
+        self.services.register("subtitle", subtitle, "Altyazı")
+        self.services.register("video_analyzer", video_analyzer, "Video analiz")
+        self.services.register("hashtag", hashtag, "Hashtag")
+        self.services.register("smart_analyzer", smart_analyzer, "Akıllı analiz")
+        self.services.register("thumbnail", thumbnail, "Thumbnail")
+        self.services.register("seo", seo, "SEO")
+    
+    @property
+    def ffmpeg(self):
+        return self.services.get("ffmpeg")
+    
+    @property
+    def subtitle_gen(self):
+        return self.services.get("subtitle")
+    
+    @property
+    def video_analyzer(self):
+        return self.services.get("video_analyzer")
+    
+    @property
+    def hashtag_gen(self):
+        return self.services.get("hashtag")
+    
+    @property
+    def smart_analyzer(self):
+        return self.services.get("smart_analyzer")
+    
+    @property
+    def thumbnail_gen(self):
+        return self.services.get("thumbnail")
+    
+    @property
+    def seo_gen(self):
+        return self.services.get("seo")
+    
+    def _check_capabilities(self):
+        """
+        Harici araç kontrolleri (pencere çizildikten sonra, arka planda)
+        
+        Sonuçlar ~/.linuxshorts/capabilities.json manifestinden gelir; araçlar
+        sadece ilk açılışta veya güncellendiklerinde probe edilir (whisper
+        probe'u alt süreçte torch yüklediği için saniyeler sürer).
+        """
+        from core.capabilities import get_manifest
+        
+        get_manifest().probe_in_background(
+            lambda caps: self.after(0, lambda: self._capabilities_ready(caps))
+        )
+    
+    def _capabilities_ready(self, caps):
+        if not caps.ffmpeg_ok or not caps.ffprobe_ok:
+            missing = " / ".join(name for name, ok in (("FFmpeg", caps.ffmpeg_ok),
+                                                        ("FFprobe", caps.ffprobe_ok)) if not ok)
+            self.export_status.configure(text=f"⚠️ {missing} bulunamadı: sudo apt install ffmpeg")
+        elif not caps.has_filter("subtitles"):
+            self.subtitle_status.configure(text="⚠️ FFmpeg libass olmadan derlenmiş: altyazı yakılamaz")
+        if not caps.whisper_ok:
+            self.subtitle_status.configure(text="⚠️ Whisper bulunamadı: pip install -U openai-whisper")
     
     def _create_layout(self):
         """Ana layout oluştur"""
@@ -394,6 +499,9 @@ class MainWindow(ctk.CTk):
         # Sidebar butonlarını güncelle
         for pid, btn in self.sidebar_buttons.items():
             btn.set_active(pid == page_id)
+        
+        # Sayfanın modüllerini arka planda hazırla (ilk tıklamada bekleme olmasın)
+        self.services.preload(PAGE_SERVICES.get(page_id, ()))
     
     # ============================================================
     # ANA SAYFA
@@ -826,10 +934,11 @@ class MainWindow(ctk.CTk):
         
         # Önizleme canvas
         from tkinter import Canvas
+        # 9:16 önizleme (export çerçevesi 1080x1920 ile aynı oran)
         self.subtitle_preview_canvas = Canvas(
             preview_card.get_content(),
-            width=320,
-            height=180,
+            width=180,
+            height=320,
             bg="#000000",
             highlightthickness=1,
             highlightbackground=COLORS["border"]
@@ -838,7 +947,7 @@ class MainWindow(ctk.CTk):
         
         # Örnek altyazı metni
         self.subtitle_preview_canvas.create_text(
-            160, 160,
+            90, 280,
             text="Örnek Altyazı Metni",
             fill="#FFFFFF",
             font=("Arial", 16, "bold"),
@@ -959,6 +1068,14 @@ class MainWindow(ctk.CTk):
             command=self._update_subtitle_preview
         ).pack(anchor="w")
         
+        # Karaoke (kelime zamanları whisper'dan gelir)
+        self.subtitle_karaoke_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            style_card.get_content(),
+            text="Kelime vurgulama (karaoke)",
+            variable=self.subtitle_karaoke_var
+        ).pack(anchor="w", pady=(5, 0))
+        
         # ============================================================
         # SAĞ TARAF - Altyazı Düzenleme (Tam boy)
         # ============================================================
@@ -1313,6 +1430,8 @@ class MainWindow(ctk.CTk):
         if not file_path:
             return
         
+        # Önceki videonun analiz/altyazı/export işleri artık geçersiz
+        self._cancel_jobs()
         self.current_video_path = Path(file_path)
         
         try:
@@ -1349,6 +1468,7 @@ class MainWindow(ctk.CTk):
                 # Preview'ları güncelle
                 self._update_editor_preview(0)
                 self._update_thumbnail_preview(0)
+                self._start_proxy()
                 
                 logger.info(f"Video seçildi: {self.current_video_path}")
                 messagebox.showinfo("Başarılı", f"Video yüklendi:\n{self.current_video_path.name}")
@@ -1357,15 +1477,59 @@ class MainWindow(ctk.CTk):
             logger.error(f"Video yükleme hatası: {e}")
             messagebox.showerror("Hata", f"Video yüklenemedi:\n{e}")
     
+    def _start_proxy(self):
+        """4K / HEVC / uzun GOP kaynaklar için önizleme proxy'si (arka planda)"""
+        from core.cancellation import CancelledError
+        from core.proxy import get_proxy_manager
+        
+        video_path, info = self.current_video_path, self.current_video_info
+        token = self._start_job("proxy")
+        
+        def worker():
+            try:
+                proxy = get_proxy_manager().ensure(video_path, info, cancel=token)
+                if proxy is not None and self.current_video_path == video_path:
+                    self.after(0, self._proxy_ready)
+            except CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Proxy hatası: {e}")
+            finally:
+                self._finish_job("proxy", token)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _proxy_ready(self):
+        self.video_info_label.configure(
+            text=self.video_info_label.cget("text") + "\n🎞️ Proxy önizleme"
+        )
+        self._update_editor_preview()
+    
+    def _preview_path(self) -> Path:
+        """Önizleme karelerinin okunacağı dosya (proxy hazırsa proxy)"""
+        from core.proxy import preview_path
+        return preview_path(self.current_video_path)
+    
+    def _frame_index(self, time_sec: float, cap) -> int:
+        """Zamandaki frame indexi (VFR videolarda gerçek PTS'lerden)"""
+        try:
+            from core.timestamps import get_timeline
+            timeline = get_timeline(self.current_video_path, self.current_video_info)
+            return timeline.frame_at(time_sec)
+        except Exception as e:
+            import cv2
+            logger.debug("Zaman modeli alınamadı: %s", e)
+            return int(time_sec * (cap.get(cv2.CAP_PROP_FPS) or 30.0))
+    
     def _get_video_frame(self, time_sec: float, width: int = 320, height: int = 568) -> Optional[ImageTk.PhotoImage]:
         """Videodan belirli zamandaki frame'i al"""
         if not CV2_AVAILABLE or not self.current_video_path:
             return None
+        import cv2
         
         try:
-            cap = cv2.VideoCapture(str(self.current_video_path))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_num = int(time_sec * fps)
+            cap = cv2.VideoCapture(str(self._preview_path()))
+            frame_num = self._frame_index(time_sec, cap)
             cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
             
             ret, frame = cap.read()
@@ -1408,13 +1572,24 @@ class MainWindow(ctk.CTk):
     
     def _get_transformed_frame(self, time_sec: float) -> Optional[ImageTk.PhotoImage]:
         """Transform uygulanmış frame al"""
+        canvas_frame = self._get_transformed_array(time_sec)
+        if canvas_frame is None:
+            return None
+        
+        # PIL Image'e çevir
+        img = Image.fromarray(canvas_frame)
+        return ImageTk.PhotoImage(img)
+    
+    def _get_transformed_array(self, time_sec: float) -> Optional["np.ndarray"]:
+        """Transform uygulanmış frame'i RGB dizi olarak al (editor canvas boyutunda)"""
         if not CV2_AVAILABLE or not self.current_video_path:
             return None
+        import cv2
+        import numpy as np
         
         try:
-            cap = cv2.VideoCapture(str(self.current_video_path))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_num = int(time_sec * fps)
+            cap = cv2.VideoCapture(str(self._preview_path()))
+            frame_num = self._frame_index(time_sec, cap)
             cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
             
             ret, frame = cap.read()
@@ -1463,7 +1638,7 @@ class MainWindow(ctk.CTk):
                 ) if False else frame, cv2.COLOR_RGB2BGR)
                 
                 # Blur için orijinal frame'i kullan
-                cap2 = cv2.VideoCapture(str(self.current_video_path))
+                cap2 = cv2.VideoCapture(str(self._preview_path()))
                 cap2.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
                 ret2, blur_frame = cap2.read()
                 cap2.release()
@@ -1514,9 +1689,7 @@ class MainWindow(ctk.CTk):
             if src_x2 > src_x1 and src_y2 > src_y1 and dst_x2 > dst_x1 and dst_y2 > dst_y1:
                 canvas_frame[dst_y1:dst_y2, dst_x1:dst_x2] = frame[src_y1:src_y2, src_x1:src_x2]
             
-            # PIL Image'e çevir
-            img = Image.fromarray(canvas_frame)
-            return ImageTk.PhotoImage(img)
+            return canvas_frame
             
         except Exception as e:
             logger.error(f"Transformed frame hatası: {e}")
@@ -1738,47 +1911,62 @@ class MainWindow(ctk.CTk):
             self.subtitle_color_btn.configure(fg_color=self.subtitle_color, hover_color=self.subtitle_color)
             self._update_subtitle_preview()
     
+    def _get_subtitle_style(self, fontsize: int = None, color: str = None,
+                            position: str = None, background: bool = None):
+        """GUI seçeneklerinden altyazı stilini oluştur (1080x1920 çıktı ölçeğinde)"""
+        from core.subtitle_renderer import SubtitleStyle
+        
+        if fontsize is None:
+            fontsize = int(self.subtitle_fontsize.get()) if hasattr(self, 'subtitle_fontsize') else 16
+        if color is None:
+            color = self.subtitle_color if hasattr(self, 'subtitle_color') else "#FFFFFF"
+        if position is None:
+            position = self.subtitle_position.get() if hasattr(self, 'subtitle_position') else "bottom"
+        if background is None:
+            background = self.subtitle_bg_var.get() if hasattr(self, 'subtitle_bg_var') else True
+        
+        # Slider değeri 640p ölçeğinde, export 1920p → 3x
+        return SubtitleStyle.from_options(fontsize * 3, color, position, background)
+    
     def _update_subtitle_preview(self):
-        """Altyazı önizlemesini güncelle"""
+        """Altyazı önizlemesini güncelle (export ile aynı yerleşim motoru)"""
         # Canvas oluşturulmuş mu kontrol et
         if not hasattr(self, 'subtitle_preview_canvas'):
             return
         
+        preview_w, preview_h = 180, 320
+        
         # Canvas'ı temizle
         self.subtitle_preview_canvas.delete("all")
         
-        # Video frame'i varsa göster
+        if not CV2_AVAILABLE:
+            self.subtitle_preview_canvas.create_text(
+                preview_w // 2, preview_h - 40,
+                text="Örnek Altyazı Metni",
+                fill=self.subtitle_color if hasattr(self, 'subtitle_color') else "#FFFFFF",
+                font=("Arial", 12, "bold")
+            )
+            return
+        
+        import cv2
+        import numpy as np
+        from core.subtitle_renderer import SubtitleRenderer
+        
+        # Export çerçevesinin küçültülmüş hali: transform uygulanmış frame
+        frame = None
         if self.current_video_path and CV2_AVAILABLE:
-            photo = self._get_video_frame(0, 320, 180)
-            if photo:
-                self._sub_preview_photo = photo
-                self.subtitle_preview_canvas.create_image(160, 90, image=photo)
-        
-        # Altyazı pozisyonu
-        pos = self.subtitle_position.get()
-        if pos == "top":
-            y = 30
-        elif pos == "center":
-            y = 90
-        else:  # bottom
-            y = 160
+            frame = self._get_transformed_array(self.time_slider.get() if hasattr(self, 'time_slider') else 0)
+        if frame is not None:
+            frame = cv2.resize(frame, (preview_w, preview_h), interpolation=cv2.INTER_AREA)
+        else:
+            frame = np.zeros((preview_h, preview_w, 3), dtype=np.uint8)
         
-        # Arka plan
-        if hasattr(self, 'subtitle_bg_var') and self.subtitle_bg_var.get():
-            self.subtitle_preview_canvas.create_rectangle(
-                10, y - 15, 310, y + 15,
-                fill="#000000",
-                stipple="gray50"
-            )
+        # Altyazı metni (glyph atlas + NumPy compositing)
+        renderer = SubtitleRenderer(self._get_subtitle_style())
+        renderer.render(frame, "Örnek Altyazı Metni")
         
-        # Altyazı metni
-        font_size = int(self.subtitle_fontsize.get()) if hasattr(self, 'subtitle_fontsize') else 16
-        self.subtitle_preview_canvas.create_text(
-            160, y,
-            text="Örnek Altyazı Metni",
-            fill=self.subtitle_color if hasattr(self, 'subtitle_color') else "#FFFFFF",
-            font=("Arial", font_size, "bold")
-        )
+        self._sub_preview_photo = ImageTk.PhotoImage(Image.fromarray(frame))
+        self.subtitle_preview_canvas.create_image(preview_w // 2, preview_h // 2, image=self._sub_preview_photo)
     
     def _on_subtitle_style_change(self, value):
         """Altyazı stili değiştiğinde"""
@@ -1805,44 +1993,18 @@ class MainWindow(ctk.CTk):
         if not hasattr(self, 'thumb_canvas'):
             return
         
-        time_sec = self.thumb_time.get()
-        
         try:
-            cap = cv2.VideoCapture(str(self.current_video_path))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_num = int(time_sec * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+            import cv2
+            from core.image_effects import apply_effects
             
-            ret, frame = cap.read()
-            cap.release()
-            
-            if not ret:
+            frame = self._get_thumb_frame()
+            if frame is None:
                 return
             
-            # BGR -> RGB
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Boyutlandır
-            frame = cv2.resize(frame, (320, 180))
-            
-            # PIL Image'e çevir
-            img = Image.fromarray(frame)
-            
-            # Parlaklık
-            brightness = self.thumb_brightness.get() / 100.0
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(brightness)
-            
-            # Kontrast
-            contrast = self.thumb_contrast.get() / 100.0
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(contrast)
-            
-            # Doygunluk
-            if hasattr(self, 'thumb_saturation'):
-                saturation = self.thumb_saturation.get() / 100.0
-                enhancer = ImageEnhance.Color(img)
-                img = enhancer.enhance(saturation)
+            # Efektler önizleme boyutundaki cache'li frame'e tek geçişte uygulanır
+            if self._thumb_preview_frame is None:
+                self._thumb_preview_frame = cv2.resize(frame, (320, 180), interpolation=cv2.INTER_AREA)
+            img = Image.fromarray(apply_effects(self._thumb_preview_frame, self._get_thumb_effects()))
             
             # Canvas'a çiz
             photo = ImageTk.PhotoImage(img)
@@ -1854,6 +2016,38 @@ class MainWindow(ctk.CTk):
         except Exception as e:
             logger.error(f"Thumbnail efekt hatası: {e}")
     
+    def _get_thumb_frame(self):
+        """
+        Thumbnail zamanındaki frame (RGB)
+        
+        Video + zaman değişmedikçe tekrar decode edilmez; slider'lar sadece
+        efektleri yeniden uygular.
+        """
+        key = (str(self.current_video_path), round(self.thumb_time.get(), 2))
+        if self._thumb_frame_key == key:
+            return self._thumb_frame
+        
+        import cv2
+        cap = cv2.VideoCapture(str(self.current_video_path))
+        cap.set(cv2.CAP_PROP_POS_FRAMES, self._frame_index(key[1], cap))
+        ret, frame = cap.read()
+        cap.release()
+        
+        self._thumb_frame_key = key
+        self._thumb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) if ret else None
+        self._thumb_preview_frame = None
+        return self._thumb_frame
+    
+    def _get_thumb_effects(self):
+        """Slider değerlerinden efekt ayarları"""
+        from core.image_effects import EffectParams
+        
+        return EffectParams(
+            brightness=self.thumb_brightness.get() / 100.0,
+            contrast=self.thumb_contrast.get() / 100.0,
+            saturation=self.thumb_saturation.get() / 100.0 if hasattr(self, 'thumb_saturation') else 1.0,
+        )
+    
     def _find_best_frames(self):
         """En iyi frame'leri bul"""
         if not self.current_video_path:
@@ -1865,8 +2059,17 @@ class MainWindow(ctk.CTk):
                 # Önce videoyu yükle
                 self.thumbnail_gen.load_video(self.current_video_path)
                 
+                # Akıllı analiz bu video için yapıldıysa frame tablosunu tekrar kullan
+                features = None
+                analyzer = self.smart_analyzer
+                if (analyzer and analyzer.result and analyzer.result.frame_features is not None
+                        and analyzer.video_path == Path(self.current_video_path)):
+                    features = analyzer.result.frame_features
+                
                 # En iyi frame'leri bul (num_candidates parametresi)
-                candidates = self.thumbnail_gen.find_best_frames(num_candidates=5)
+                candidates = self.thumbnail_gen.find_best_frames(
+                    num_candidates=5, keep_images=False, features=features
+                )
                 
                 if candidates:
                     # Frame zamanlarını göster
@@ -1956,6 +2159,9 @@ class MainWindow(ctk.CTk):
         self.analysis_status.configure(text="Analiz başlatılıyor...")
         self.analysis_progress.set(0)
         
+        from core.cancellation import CancelledError
+        token = self._start_job("analysis")
+        
         def worker():
             try:
                 self.smart_analyzer.load_video(self.current_video_path)
@@ -1963,28 +2169,43 @@ class MainWindow(ctk.CTk):
                 def progress(pct, msg):
                     self.after(0, lambda p=pct, m=msg: self._update_analysis_progress(p, m))
                 
-                result = self.smart_analyzer.full_analysis(progress_callback=progress)
+                def partial(result):
+                    self.after(0, lambda r=result: self._show_analysis_results(r, partial=True))
+                
+                result = self.smart_analyzer.full_analysis(
+                    progress_callback=progress, partial_callback=partial, cancel=token
+                )
                 self.after(0, lambda r=result: self._show_analysis_results(r))
                 
+            except CancelledError:
+                self.after(0, lambda: self.analysis_status.configure(text="Analiz iptal edildi"))
             except Exception as e:
                 error_msg = str(e)
                 self.after(0, lambda msg=error_msg: self._analysis_error(msg))
+            finally:
+                self._finish_job("analysis", token)
         
-        threading.Thread(target=worker, daemon=True).start()
+        threading.Thread(target=traced(f"analysis: {self.current_video_path.name}", worker, logger), daemon=True).start()
     
     def _update_analysis_progress(self, pct: int, msg: str):
         self.analysis_progress.set(pct / 100)
         self.analysis_status.configure(text=msg)
     
-    def _show_analysis_results(self, result):
-        self.analysis_progress.set(1)
-        self.analysis_status.configure(text="Analiz tamamlandı!")
+    def _show_analysis_results(self, result, partial: bool = False):
+        if not partial:
+            self.analysis_progress.set(1)
+            self.analysis_status.configure(text="Analiz tamamlandı!")
         
-        # Sonucu kaydet
+        # Sonucu kaydet (kısmi sonuçta analiz edilen kısım için geçerli)
         self.last_analysis_result = result
         
+        title = "📊 Analiz Özeti"
+        if partial:
+            done = int(result.analyzed_until)
+            title += f" (ilk {done // 60:02d}:{done % 60:02d}, devam ediyor...)"
+        
         summary = (
-            f"📊 Analiz Özeti\n\n"
+            f"{title}\n\n"
             f"• Sessizlik bölümleri: {len(result.silence_segments)}\n"
             f"• Konuşma bölümleri: {len(result.speech_segments)}\n"
             f"• Sahne değişiklikleri: {len(result.scene_changes)}\n"
@@ -2087,11 +2308,15 @@ class MainWindow(ctk.CTk):
         self.subtitle_status.configure(text=f"Whisper {model} modeli yükleniyor...")
         self.subtitle_progress.set(0.1)
         
+        from core.cancellation import CancelledError
+        token = self._start_job("subtitles")
+        
         def worker():
             try:
                 segments = self.subtitle_gen.generate_subtitles(
                     self.current_video_path,
-                    model=model
+                    model=model,
+                    cancel=token
                 )
                 
                 # Zaman aralığına göre filtrele
@@ -2102,35 +2327,43 @@ class MainWindow(ctk.CTk):
                         # Segment zaman aralığında mı?
                         if seg.end >= start_time and seg.start <= end_time:
                             # Zamanları offset'le
+                            new_end = min(duration or seg.end, seg.end - start_time)
                             new_seg = type(seg)(
                                 start=max(0, seg.start - start_time),
-                                end=min(duration or seg.end, seg.end - start_time),
-                                text=seg.text
+                                end=new_end,
+                                text=seg.text,
+                                words=seg.words.shifted(-start_time, 0, new_end) if seg.words else None
                             )
+                            # Aralık dışında kalan kelimeler atıldıysa metni de eşitle
+                            if new_seg.words and len(new_seg.words) != len(seg.words):
+                                new_seg.text = new_seg.words.text
                             filtered_segments.append(new_seg)
                     segments = filtered_segments
                 
-                # SRT formatına çevir
-                srt_text = ""
-                for i, seg in enumerate(segments, 1):
-                    start = self._format_srt_time(seg.start)
-                    end = self._format_srt_time(seg.end)
-                    srt_text += f"{i}\n{start} --> {end}\n{seg.text}\n\n"
+                # SRT formatına çevir (satırlar kelime zamanlarına göre kırılır)
+                from core.subtitle_io import SubtitleWriter
+                from io import StringIO
+                buffer = StringIO()
+                with SubtitleWriter(buffer, "srt") as writer:
+                    for seg in segments:
+                        writer.write(seg, self.subtitle_gen.wrap_segment(seg))
+                srt_text = buffer.getvalue()
+                
+                # Kelime zamanları SRT'de tutulamaz: karaoke export için sakla
+                self.subtitle_segments = segments
+                self.subtitle_segments_srt = srt_text.strip()
                 
                 self.after(0, lambda text=srt_text: self._show_subtitles(text))
                 
+            except CancelledError:
+                self.after(0, lambda: self.subtitle_status.configure(text="Altyazı üretimi iptal edildi"))
             except Exception as e:
                 error_msg = str(e)
                 self.after(0, lambda msg=error_msg: self._subtitle_error(msg))
+            finally:
+                self._finish_job("subtitles", token)
         
-        threading.Thread(target=worker, daemon=True).start()
-    
-    def _format_srt_time(self, seconds: float) -> str:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds % 1) * 1000)
-        return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+        threading.Thread(target=traced(f"subtitles: {self.current_video_path.name}", worker, logger), daemon=True).start()
     
     def _show_subtitles(self, srt_text: str):
         self.subtitle_progress.set(1)
@@ -2192,46 +2425,27 @@ class MainWindow(ctk.CTk):
             return
         
         try:
-            # Mevcut önizleme frame'ini al
-            time_sec = self.thumb_time.get()
-            
             if CV2_AVAILABLE:
-                cap = cv2.VideoCapture(str(self.current_video_path))
-                fps = cap.get(cv2.CAP_PROP_FPS)
-                frame_num = int(time_sec * fps)
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+                import cv2
+                from core.image_effects import apply_effects
                 
-                ret, frame = cap.read()
-                cap.release()
+                # Mevcut önizleme frame'ini al (cache'ten)
+                frame = self._get_thumb_frame()
                 
-                if ret:
-                    # BGR -> RGB
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
+                if frame is not None:
                     # YouTube thumbnail boyutu (1280x720)
                     frame = cv2.resize(frame, (1280, 720))
                     
-                    # PIL Image'e çevir
-                    img = Image.fromarray(frame)
-                    
                     # Efektleri uygula
-                    brightness = self.thumb_brightness.get() / 100.0
-                    contrast = self.thumb_contrast.get() / 100.0
-                    saturation = self.thumb_saturation.get() / 100.0 if hasattr(self, 'thumb_saturation') else 1.0
-                    
-                    img = ImageEnhance.Brightness(img).enhance(brightness)
-                    img = ImageEnhance.Contrast(img).enhance(contrast)
-                    img = ImageEnhance.Color(img).enhance(saturation)
+                    img = Image.fromarray(apply_effects(frame, self._get_thumb_effects()))
                     
                     # Başlık metni ekle
                     title_text = self.thumb_title.get().strip()
                     if title_text:
-                        from PIL import ImageDraw, ImageFont
+                        from PIL import ImageDraw
+                        from utils.fonts import load_font
                         draw = ImageDraw.Draw(img)
-                        try:
-                            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
-                        except:
-                            font = ImageFont.load_default()
+                        font = load_font(60)
                         
                         # Metin boyutunu hesapla
                         bbox = draw.textbbox((0, 0), title_text, font=font)
@@ -2366,7 +2580,8 @@ class MainWindow(ctk.CTk):
                     'fontsize': int(self.subtitle_fontsize.get()) if hasattr(self, 'subtitle_fontsize') else 20,
                     'color': self.subtitle_color if hasattr(self, 'subtitle_color') else "#FFFFFF",
                     'position': self.subtitle_position.get() if hasattr(self, 'subtitle_position') else "bottom",
-                    'bg': self.subtitle_bg_var.get() if hasattr(self, 'subtitle_bg_var') else True
+                    'bg': self.subtitle_bg_var.get() if hasattr(self, 'subtitle_bg_var') else True,
+                    'karaoke': self.subtitle_karaoke_var.get() if hasattr(self, 'subtitle_karaoke_var') else False
                 }
         
         # Çıktı dizini
@@ -2376,6 +2591,9 @@ class MainWindow(ctk.CTk):
         self.export_status.configure(text="Export başlatılıyor...")
         self.export_progress.set(0.1)
         
+        from core.cancellation import CancelledError
+        token = self._start_job("export")
+        
         def worker():
             try:
                 # Çıktı dosyası
@@ -2401,7 +2619,8 @@ class MainWindow(ctk.CTk):
                     crf=crf,
                     preset=preset,
                     subtitle_srt=subtitle_srt,
-                    subtitle_style=subtitle_style
+                    subtitle_style=subtitle_style,
+                    cancel=token
                 )
                 
                 if success:
@@ -2409,11 +2628,16 @@ class MainWindow(ctk.CTk):
                 else:
                     self.after(0, lambda: self._export_error("FFmpeg işlemi başarısız"))
                 
+            except CancelledError:
+                self.after(0, lambda: self.export_progress.set(0))
+                self.after(0, lambda: self.export_status.configure(text="Export iptal edildi"))
             except Exception as e:
                 error_msg = str(e)
                 self.after(0, lambda msg=error_msg: self._export_error(msg))
+            finally:
+                self._finish_job("export", token)
         
-        threading.Thread(target=worker, daemon=True).start()
+        threading.Thread(target=traced(f"export: {self.current_video_path.name}", worker, logger), daemon=True).start()
     
     def _export_with_transform(
         self,
@@ -2430,11 +2654,13 @@ class MainWindow(ctk.CTk):
         crf: int,
         preset: str,
         subtitle_srt: str = "",
-        subtitle_style: dict = None
+        subtitle_style: dict = None,
+        cancel=None
     ) -> bool:
-        """Transform uygulanmış video export et"""
-        import subprocess
+        """Transform uygulanmış video export et (iptalde CancelledError)"""
         import tempfile
+        from core.cancellation import CancelledError
+        from core.process_runner import run_process
         
         # Output boyutları (9:16 shorts formatı)
         out_w = 1080
@@ -2455,24 +2681,45 @@ class MainWindow(ctk.CTk):
         export_pos_x = int(pos_x * pos_scale_x)
         export_pos_y = int(pos_y * pos_scale_y)
         
-        # Geçici SRT dosyası (altyazı varsa)
-        temp_srt_path = None
-        if subtitle_srt:
+        # Geçici ASS dosyası (altyazı varsa) - önizlemeyle aynı stil ve satırlar
+        temp_ass_path = None
+        renderer = None
+        if subtitle_srt and subtitle_style:
             try:
-                fd, temp_srt_path = tempfile.mkstemp(suffix='.srt')
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    f.write(subtitle_srt)
+                from io import StringIO
+                from core.subtitle_io import iter_srt
+                from core.subtitle_renderer import SubtitleRenderer
+                
+                renderer = SubtitleRenderer(self._get_subtitle_style(
+                    fontsize=subtitle_style.get('fontsize', 20),
+                    color=subtitle_style.get('color', '#FFFFFF'),
+                    position=subtitle_style.get('position', 'bottom'),
+                    background=subtitle_style.get('bg', False)
+                ))
+                fd, temp_ass_path = tempfile.mkstemp(suffix='.ass')
+                os.close(fd)
+                
+                # Metin kutusu düzenlenmediyse kelime zamanlı segmentleri kullan
+                if self.subtitle_segments_srt == subtitle_srt.strip():
+                    segments = self.subtitle_segments
+                else:
+                    segments = iter_srt(StringIO(subtitle_srt))
+                renderer.write_ass(segments, Path(temp_ass_path),
+                                   karaoke=subtitle_style.get('karaoke', False))
             except Exception as e:
-                logger.error(f"SRT dosyası oluşturulamadı: {e}")
-                temp_srt_path = None
+                logger.error(f"ASS dosyası oluşturulamadı: {e}")
+                if temp_ass_path and os.path.exists(temp_ass_path):
+                    os.remove(temp_ass_path)
+                temp_ass_path = None
         
         # Arka plan modu
         if bg_mode == "blur":
+            from core.capabilities import blur_filter
             blur_val = blur_strength if blur_strength % 2 == 1 else blur_strength + 1
             filter_complex = (
                 # Arka plan: video'yu canvas boyutuna scale et (crop ile doldur), sonra blur
                 f"[0:v]scale={out_w}:{out_h}:force_original_aspect_ratio=increase,"
-                f"crop={out_w}:{out_h},boxblur={blur_val}:1[bg];"
+                f"crop={out_w}:{out_h},{blur_filter(blur_val, 1)}[bg];"
                 # Ön plan: video'yu fit scale ile boyutlandır
                 f"[0:v]scale='trunc(iw*{fit_scale_expr}/2)*2':'trunc(ih*{fit_scale_expr}/2)*2'[fg];"
                 # Overlay: ön planı arka planın üzerine koy
@@ -2494,24 +2741,9 @@ class MainWindow(ctk.CTk):
         # Output stream adı
         output_stream = "[out]"
         
-        # Altyazı varsa filter'a ekle
-        if temp_srt_path and subtitle_style:
-            fontsize = subtitle_style.get('fontsize', 20) * 3  # 1080p için 3x
-            color = subtitle_style.get('color', '#FFFFFF').lstrip('#')
-            position = subtitle_style.get('position', 'bottom')
-            
-            if position == 'top':
-                margin_v = 80
-                alignment = 6  # top-center
-            elif position == 'center':
-                margin_v = 0
-                alignment = 5  # center
-            else:  # bottom
-                margin_v = 80
-                alignment = 2  # bottom-center
-            
-            escaped_srt = temp_srt_path.replace('\\', '/').replace(':', '\\:')
-            filter_complex += f";[out]subtitles='{escaped_srt}':force_style='FontSize={fontsize},PrimaryColour=&H{color}&,Alignment={alignment},MarginV={margin_v}'[final]"
+        # Altyazı varsa filter'a ekle (PlayRes = 1080x1920, force_style gerekmez)
+        if temp_ass_path:
+            filter_complex += f";[out]{renderer.subtitles_filter(temp_ass_path)}[final]"
             output_stream = "[final]"
         
         # FFmpeg komutu
@@ -2534,31 +2766,35 @@ class MainWindow(ctk.CTk):
         
         try:
             logger.info(f"FFmpeg komutu: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            with span("encode", "encode", output=output_path.name, duration=duration):
+                result = run_process(cmd, cancel=cancel, capture_output=True, text=True)
             
             if result.returncode != 0:
                 logger.error(f"FFmpeg hatası: {result.stderr}")
                 # Altyazısız tekrar dene
-                if temp_srt_path:
+                if temp_ass_path:
                     logger.info("Altyazısız tekrar deneniyor...")
                     return self._export_with_transform(
                         input_path, output_path, start_time, duration,
                         scale, pos_x, pos_y, bg_mode, blur_strength,
-                        bg_color, crf, preset, "", None
+                        bg_color, crf, preset, "", None, cancel
                     )
                 return False
             
             return output_path.exists()
             
+        except CancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
             logger.error(f"Export hatası: {e}")
             return False
         
         finally:
-            # Geçici SRT dosyasını sil
-            if temp_srt_path and os.path.exists(temp_srt_path):
+            # Geçici ASS dosyasını sil
+            if temp_ass_path and os.path.exists(temp_ass_path):
                 try:
-                    os.remove(temp_srt_path)
+                    os.remove(temp_ass_path)
                 except:
                     pass
     
@@ -12,6 +12,7 @@ from typing import Optional, Callable, List, TYPE_CHECKING
 import threading
 
 from utils.logger import get_logger
+from utils.tracing import traced
 
 logger = get_logger("LinuxShorts.ProTabs")
 
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
 # Modül kontrolleri
 try:
     from core.smart_analyzer import SmartVideoAnalyzer, Segment, AnalysisResult
+    from core.cancellation import CancelToken, CancelledError
     SMART_ANALYZER_AVAILABLE = True
 except ImportError:
     SMART_ANALYZER_AVAILABLE = False
@@ -55,6 +57,7 @@ class SmartAnalyzerTab:
         self.analyzer = SmartVideoAnalyzer() if SMART_ANALYZER_AVAILABLE else None
         self.video_path: Optional[Path] = None
         self.result: Optional[AnalysisResult] = None
+        self._cancel: Optional[CancelToken] = None
         
         self._create_ui()
     
@@ -114,32 +117,55 @@ class SmartAnalyzerTab:
     def load_video(self, video_path: Path) -> bool:
         if not self.analyzer:
             return False
+        # Önceki videonun analizi sürüyorsa durdur (kaldığı yer diskte kayıtlı)
+        self.cancel_analysis()
         self.video_path = video_path
         return self.analyzer.load_video(video_path)
     
+    def cancel_analysis(self):
+        if self._cancel is not None:
+            self._cancel.cancel()
+    
     def _start_analysis(self):
         if not self.video_path or not self.analyzer:
             messagebox.showwarning("Uyarı", "Önce bir video yükleyin!")
             return
         
         self.analyze_btn.configure(state="disabled", text="⏳ Analiz ediliyor...")
+        self.cancel_analysis()
+        token = self._cancel = CancelToken("smart analysis")
         
         def worker():
             def progress(pct, msg):
                 self.parent.after(0, lambda: self._update_progress(pct, msg))
             
-            result = self.analyzer.full_analysis(progress_callback=progress)
-            self.parent.after(0, lambda: self._show_results(result))
+            def partial(result):
+                self.parent.after(0, lambda: self._show_results(result, partial=True))
+            
+            try:
+                result = self.analyzer.full_analysis(
+                    progress_callback=progress, partial_callback=partial, cancel=token
+                )
+                self.parent.after(0, lambda: self._show_results(result))
+            except CancelledError:
+                self.parent.after(0, self._analysis_cancelled)
+            finally:
+                token.finished()
         
-        threading.Thread(target=worker, daemon=True).start()
+        threading.Thread(target=traced(f"analysis: {self.video_path.name}", worker, logger), daemon=True).start()
     
     def _update_progress(self, percent: int, message: str):
         self.progress_bar.set(percent / 100)
         self.progress_label.configure(text=message)
     
-    def _show_results(self, result: AnalysisResult):
-        self.result = result
+    def _analysis_cancelled(self):
         self.analyze_btn.configure(state="normal", text="🔍 Analizi Başlat")
+        self.progress_label.configure(text="⏹️ Analiz iptal edildi (tamamlanan parçalar kayıtlı)")
+    
+    def _show_results(self, result: AnalysisResult, partial: bool = False):
+        self.result = result
+        if not partial:
+            self.analyze_btn.configure(state="normal", text="🔍 Analizi Başlat")
         
         # Sonuçları temizle
         for widget in self.results_frame.winfo_children():
@@ -149,7 +175,10 @@ class SmartAnalyzerTab:
         summary = ctk.CTkFrame(self.results_frame, fg_color=("gray92", "gray14"), corner_radius=10)
         summary.pack(fill="x", pady=(10, 5))
         
-        ctk.CTkLabel(summary, text="📊 Analiz Özeti", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10, padx=15, anchor="w")
+        title = "📊 Analiz Özeti"
+        if partial:
+            title += f" (ilk {self._format_time(result.analyzed_until)}, devam ediyor...)"
+        ctk.CTkLabel(summary, text=title, font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10, padx=15, anchor="w")
         
         stats = f"• Sessizlik: {len(result.silence_segments)} bölüm\n"
         stats += f"• Konuşma: {len(result.speech_segments)} bölüm\n"
@@ -367,7 +396,7 @@ class ThumbnailTab:
             messagebox.showwarning("Uyarı", "Önce video yükleyin!")
             return
         
-        candidates = self.generator.find_best_frames(5)
+        candidates = self.generator.find_best_frames(5, keep_images=False)
         
         for w in self.candidates_frame.winfo_children():
             w.destroy()
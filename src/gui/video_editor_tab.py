@@ -8,10 +8,12 @@ from tkinter import Canvas, messagebox, colorchooser
 from PIL import Image, ImageTk
 from pathlib import Path
 from typing import Optional, Callable
+import math
 import time
 import threading
 
 from utils.logger import get_logger
+from utils.tracing import traced
 
 logger = get_logger("LinuxShorts.EditorTab")
 
@@ -208,7 +210,18 @@ class VideoEditorTab:
         self.drag_start_x = 0
         self.drag_start_y = 0
         
+        # Timeline küçük resim şeridi ve dalga formu (arka planda üretilir)
+        self.filmstrip = None
+        self._filmstrip_photos = []
+        self.waveform = None
+        self._waveform_photo = None
+        
+        # Arka plan işlerinin iptal token'ları (iş adı → token); video değişince,
+        # yeni export'ta ve pencere kapanırken iptal edilir
+        self._jobs = {}
+        
         self._create_ui()
+        self.parent.bind("<Destroy>", self._on_destroy, add="+")
         logger.info("VideoEditorTab v2.0 oluşturuldu")
     
     def _create_ui(self):
@@ -383,6 +396,18 @@ class VideoEditorTab:
             font=ctk.CTkFont(size=13, weight="bold")
         ).pack(anchor="w", pady=(0, 8))
         
+        # Filmstrip: oynatma kafası ortada, şerit zamanla birlikte kayar
+        self.filmstrip_canvas = Canvas(inner, height=45, bg="#1a1a1a", highlightthickness=0)
+        self.filmstrip_canvas.pack(fill="x", pady=(0, 5))
+        self.filmstrip_canvas.bind("<Configure>", lambda e: self._draw_filmstrip())
+        self.filmstrip_canvas.bind("<Button-1>", self._on_filmstrip_click)
+        
+        # Dalga formu: filmstrip ile aynı zaman ölçeği
+        self.waveform_canvas = Canvas(inner, height=40, bg="#1a1a1a", highlightthickness=0)
+        self.waveform_canvas.pack(fill="x", pady=(0, 5))
+        self.waveform_canvas.bind("<Configure>", lambda e: self._draw_waveform())
+        self.waveform_canvas.bind("<Button-1>", self._on_filmstrip_click)
+        
         self.time_slider = ctk.CTkSlider(
             inner,
             from_=0,
@@ -791,7 +816,13 @@ class VideoEditorTab:
         ctk.CTkLabel(
             self.suggestions_frame, text=f"{len(segments)} öneri bulundu",
             font=ctk.CTkFont(size=9), text_color="gray"
-        ).pack(pady=(5, 8))
+        ).pack(pady=(5, 2))
+        
+        ctk.CTkButton(
+            self.suggestions_frame, text="📦 Tümünü Export Et", height=26,
+            command=lambda segs=segments: self._export_suggestions(segs),
+            font=ctk.CTkFont(size=10)
+        ).pack(fill="x", padx=8, pady=(2, 8))
     
     def _apply_suggestion(self, start: float, duration: float):
         if not self.editor:
@@ -807,6 +838,10 @@ class VideoEditorTab:
         if not OPENCV_AVAILABLE or not self.editor:
             return False
         try:
+            # Önceki videonun filmstrip/dalga formu/proxy üretimi artık gereksiz
+            for name in ("filmstrip", "waveform", "proxy"):
+                self._cancel_job(name)
+            
             if not self.editor.load_video(video_path):
                 return False
             self.video_path = video_path
@@ -818,6 +853,9 @@ class VideoEditorTab:
                 self.editor.preview_height = self.canvas_height
             self.canvas.delete("placeholder")
             self._update_preview()
+            self._load_filmstrip()
+            self._load_waveform()
+            self._load_proxy()
             return True
         except Exception as e:
             logger.error(f"Video yükleme hatası: {e}")
@@ -839,6 +877,148 @@ class VideoEditorTab:
         except Exception as e:
             logger.error(f"Preview hatası: {e}")
     
+    def _load_filmstrip(self):
+        """Filmstrip'i arka planda üret/cache'ten oku"""
+        self.filmstrip = None
+        self._draw_filmstrip()
+        editor, video_path = self.editor, self.video_path
+        token = self._start_job("filmstrip")
+        
+        def worker():
+            from core.cancellation import CancelledError
+            try:
+                strip = editor.get_filmstrip(cancel=token)
+            except CancelledError:
+                return
+            finally:
+                self._finish_job("filmstrip", token)
+            if strip is not None and self.video_path == video_path:
+                self.parent.after(0, lambda: self._filmstrip_ready(strip))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _filmstrip_ready(self, strip):
+        self.filmstrip = strip
+        self._draw_filmstrip()
+        self._draw_waveform()
+    
+    def _load_waveform(self):
+        """Dalga formunu arka planda üret (akıllı analizle aynı cache)"""
+        from core.waveform import WaveformBuilder
+        
+        self.waveform = None
+        self._draw_waveform()
+        video_path = self.video_path
+        info = self.editor.video_info
+        duration = info['duration'] if info else 0.0
+        token = self._start_job("waveform")
+        
+        def worker():
+            from core.cancellation import CancelledError
+            try:
+                waveform = WaveformBuilder().get(video_path, duration=duration, cancel=token)
+            except CancelledError:
+                return
+            finally:
+                self._finish_job("waveform", token)
+            if waveform is not None and self.video_path == video_path:
+                self.parent.after(0, lambda: self._waveform_ready(waveform))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _waveform_ready(self, waveform):
+        self.waveform = waveform
+        self._draw_waveform()
+    
+    def _load_proxy(self):
+        """Ağır kaynaklar (4K, HEVC, uzun GOP) için arka planda proxy üret"""
+        from core.proxy import get_proxy_manager
+        
+        reader = self.editor.frame_reader
+        if reader is None or reader.is_proxy:
+            return
+        video_path, info = self.video_path, reader.info
+        token = self._start_job("proxy")
+        
+        def worker():
+            from core.cancellation import CancelledError
+            try:
+                proxy = get_proxy_manager().ensure(video_path, info, cancel=token)
+            except CancelledError:
+                return
+            finally:
+                self._finish_job("proxy", token)
+            if proxy is not None:
+                self.parent.after(0, lambda: self._proxy_ready(video_path, proxy))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _proxy_ready(self, video_path: Path, proxy_path: Path):
+        if self.video_path != video_path or not self.editor.attach_proxy(video_path, proxy_path):
+            return
+        self._update_preview()
+        self.status_label.configure(text="🎞️ Proxy önizleme aktif")
+    
+    def _timeline_seconds_per_px(self) -> float:
+        """Filmstrip ve dalga formunun ortak zaman ölçeği"""
+        if self.filmstrip is not None:
+            return self.filmstrip.index.interval / self.filmstrip.index.tile_width
+        # Filmstrip hazır değilse: 80 piksellik kare başına 1 saniye
+        return 1 / 80
+    
+    def _draw_waveform(self):
+        """Görünen aralığın dalga formu (piksel sayısıyla orantılı maliyet)"""
+        canvas = self.waveform_canvas
+        canvas.delete("all")
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if self.waveform is None or width <= 1:
+            return
+        
+        half = width / 2 * self._timeline_seconds_per_px()
+        current = self.time_slider.get()
+        image = self.waveform.render_image(current - half, current + half, width, height)
+        self._waveform_photo = ImageTk.PhotoImage(image)
+        canvas.create_image(0, 0, image=self._waveform_photo, anchor="nw")
+        canvas.create_line(width / 2, 0, width / 2, height, fill="#e94560", width=2)
+    
+    def _draw_filmstrip(self):
+        """Sadece görünen küçük resimleri çiz (sayfalar lazy yüklenir)"""
+        canvas = self.filmstrip_canvas
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        if self.filmstrip is None or width <= 1:
+            return
+        
+        tile_w = self.filmstrip.index.tile_width
+        current = self.time_slider.get()
+        center = self.filmstrip.index_at(current)
+        # Oynatma kafasının tam karşısına gelecek kaydırma (tile içindeki konum)
+        offset = (current / self.filmstrip.index.interval - center) * tile_w
+        half = math.ceil(width / tile_w / 2) + 1
+        
+        self._filmstrip_photos = []
+        for i in range(center - half, center + half + 1):
+            tile = self.filmstrip.tile(i)
+            if tile is None:
+                continue
+            photo = ImageTk.PhotoImage(tile)
+            self._filmstrip_photos.append(photo)
+            x = width / 2 + (i - center) * tile_w - offset
+            canvas.create_image(x, 0, image=photo, anchor="n")
+        
+        canvas.create_line(width / 2, 0, width / 2, 45, fill="#e94560", width=2)
+    
+    def _on_filmstrip_click(self, event):
+        """Şeritte / dalga formunda tıklanan ana git"""
+        if not self.video_loaded or not self.editor:
+            return
+        width = event.widget.winfo_width()
+        target = self.time_slider.get() + (event.x - width / 2) * self._timeline_seconds_per_px()
+        info = self.editor.video_info
+        target = max(0.0, min(info['duration'] if info else target, target))
+        self.time_slider.set(target)
+        self._on_time_change(target)
+    
     def _format_time(self, seconds: float) -> str:
         return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
     
@@ -865,14 +1045,75 @@ class VideoEditorTab:
         
         self.export_btn.configure(state="disabled", text="⏳ İşleniyor...")
         self.status_label.configure(text="Export başladı...")
+        token = self._start_job("export")
         
         def worker():
-            success = self.editor.export_short(
-                output_path=output_path, start_time=start_time, duration=duration
+            from core.cancellation import CancelledError
+            try:
+                success = self.editor.export_short(
+                    output_path=output_path, start_time=start_time, duration=duration, cancel=token
+                )
+                self.parent.after(0, lambda: self._export_done(success, output_path))
+            except CancelledError:
+                self.parent.after(0, self._export_cancelled)
+            finally:
+                self._finish_job("export", token)
+        
+        threading.Thread(target=traced(f"export: {output_path.name}", worker, logger), daemon=True).start()
+    
+    def _export_suggestions(self, segments: list):
+        """Tüm önerileri tek seferde export et (yakın segmentler tek decode)"""
+        if not self.video_loaded or not self.editor:
+            messagebox.showerror("Hata", "Önce video yükleyin!")
+            return
+        
+        from core.video_editor import ExportJob
+        from utils.config import OUTPUT_DIR
+        
+        timestamp = int(time.time())
+        jobs = [
+            ExportJob(
+                output_path=OUTPUT_DIR / f"short_{self.video_path.stem}_{timestamp}_{seg['index']}.mp4",
+                start=seg['start'],
+                duration=min(60, seg['duration'])
             )
-            self.parent.after(0, lambda: self._export_done(success, output_path))
+            for seg in segments
+        ]
         
-        threading.Thread(target=worker, daemon=True).start()
+        self.export_btn.configure(state="disabled", text="⏳ İşleniyor...")
+        self.status_label.configure(text=f"{len(jobs)} short export ediliyor...")
+        
+        def progress(done, total):
+            self.parent.after(0, lambda: self.status_label.configure(text=f"Export: {done}/{total}"))
+        
+        token = self._start_job("export")
+        
+        def worker():
+            from core.cancellation import CancelledError
+            try:
+                results = self.editor.export_many(jobs, progress_callback=progress, cancel=token)
+                self.parent.after(0, lambda: self._export_many_done(jobs, results))
+            except CancelledError:
+                self.parent.after(0, self._export_cancelled)
+            finally:
+                self._finish_job("export", token)
+        
+        threading.Thread(target=traced(f"export: {len(jobs)} short", worker, logger), daemon=True).start()
+    
+    def _export_cancelled(self):
+        self.export_btn.configure(state="normal", text="🚀 Short Oluştur")
+        self.status_label.configure(text="⏹️ Export iptal edildi")
+    
+    def _export_many_done(self, jobs: list, results: list):
+        self.export_btn.configure(state="normal", text="🚀 Short Oluştur")
+        ok = sum(results)
+        self.status_label.configure(text=f"{'✅' if ok == len(jobs) else '⚠️'} {ok}/{len(jobs)} short oluşturuldu")
+        if self.on_export:
+            for job, success in zip(jobs, results):
+                if success:
+                    self.on_export(job.output_path)
+        if ok < len(jobs):
+            messagebox.showerror("Hata", f"{len(jobs) - ok} export başarısız oldu!")
     
     def _export_done(self, success: bool, output_path: Path):
         self.export_btn.configure(state="normal", text="🚀 Short Oluştur")
@@ -887,3 +1128,37 @@ class VideoEditorTab:
         else:
             self.status_label.configure(text="❌ Export başarısız!")
             messagebox.showerror("Hata", "Export sırasında bir hata oluştu!")
+    
+    # ============================================================
+    # ARKA PLAN İŞLERİ
+    # ============================================================
+    
+    def _start_job(self, name: str):
+        """Yeni iş için iptal token'ı (aynı isimli eski iş iptal edilir)"""
+        from core.cancellation import CancelToken
+        
+        self._cancel_job(name)
+        token = CancelToken(f"{name}: {self.video_path.name}" if self.video_path else name)
+        self._jobs[name] = token
+        return token
+    
+    def _finish_job(self, name: str, token):
+        """Worker bitince çağrılır (iptal gecikmesi burada loglanır)"""
+        token.finished()
+        if self._jobs.get(name) is token:
+            del self._jobs[name]
+    
+    def _cancel_job(self, name: str):
+        token = self._jobs.get(name)
+        if token is not None:
+            token.cancel()
+    
+    def cancel_jobs(self):
+        """Süren filmstrip/dalga formu/proxy/export işlerini iptal et"""
+        for token in list(self._jobs.values()):
+            token.cancel()
+    
+    def _on_destroy(self, event):
+        # Sekme (veya uygulama penceresi) kapanırken worker'lar ffmpeg'i bırakmalı
+        if event.widget is self.parent:
+            self.cancel_jobs()
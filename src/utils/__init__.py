@@ -1,4 +1,5 @@
 """LinuxShorts Pro - Utils"""
 
-from .logger import get_logger
+from .logger import get_logger, set_level
 from .config import *
+from .tracing import span, trace_job, traced, enable_tracing
@@ -0,0 +1,48 @@
+"""
+LinuxShorts Generator - Disk Cache Yardımcıları
+Video başına üretilen ara dosyalar (filmstrip, waveform, analiz...) için
+içerik değişince otomatik geçersizleşen anahtarlar
+"""
+
+import hashlib
+from pathlib import Path
+
+from .config import DATA_DIR
+
+
+def file_fingerprint(path: Path) -> str:
+    """
+    Dosya parmak izi (mutlak yol + boyut + değiştirilme zamanı)
+
+    Dosya içeriğini okumaz; video yerinde değiştirilirse boyut/mtime
+    değiştiği için cache kendiliğinden geçersiz olur.
+
+    Returns:
+        16 karakterlik hex anahtar
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_dir(kind: str) -> Path:
+    """~/.linuxshorts/<kind> dizini (yoksa oluşturulur)"""
+    path = DATA_DIR / kind
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def cache_path(kind: str, video_path: Path, suffix: str = "") -> Path:
+    """
+    Video için cache yolu
+
+    Args:
+        kind: Cache türü (ör. "filmstrips")
+        video_path: Kaynak video
+        suffix: Dosya uzantısı ("" ise dizin olarak kullanılır)
+
+    Returns:
+        ~/.linuxshorts/<kind>/<parmak izi><suffix>
+    """
+    return cache_dir(kind) / f"{file_fingerprint(video_path)}{suffix}"
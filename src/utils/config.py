@@ -15,6 +15,7 @@ APP_DESCRIPTION = "FFmpeg ile YouTube Shorts üretici"
 BASE_DIR = Path(__file__).parent.parent.parent
 PRESETS_DIR = BASE_DIR / "presets"
 OUTPUT_DIR = Path.home() / "Videos" / "Shorts"
+DATA_DIR = Path.home() / ".linuxshorts"  # Projeler, loglar ve video başına cache'ler
 
 # Video Ayarları
 VIDEO_SETTINGS = {
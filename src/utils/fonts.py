@@ -0,0 +1,52 @@
+"""
+LinuxShorts Generator - Font Yardımcıları
+Fontlar süreç başına bir kez yüklenir ve cache'lenir
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from PIL import ImageFont
+
+# Öncelik sırasıyla denenecek kalın fontlar (fonts-dejavu-core)
+DEFAULT_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
+]
+
+
+@lru_cache(maxsize=1)
+def default_font_path() -> Optional[str]:
+    """Sistemdeki varsayılan font dosyasını bulur (yoksa None)"""
+    for path in DEFAULT_FONT_PATHS:
+        if Path(path).exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=128)
+def load_font(size: int, path: Optional[str] = None) -> ImageFont.ImageFont:
+    """
+    Fontu yükler (aynı path + boyut için tek yükleme)
+
+    Args:
+        size: Piksel cinsinden font boyutu
+        path: Font dosyası (None ise varsayılan font)
+
+    Returns:
+        PIL font objesi (font bulunamazsa Pillow'un varsayılan fontu)
+    """
+    path = path or default_font_path()
+    size = max(1, int(size))
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1: boyut parametresi yok
+        return ImageFont.load_default()
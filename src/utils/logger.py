@@ -1,19 +1,48 @@
 """
 LinuxShorts Generator - Logging Sistemi
 Detaylı hata yakalama ve log yönetimi
+
+- Loglar kuyruk (QueueHandler) üzerinden arka plan thread'ine aktarılır;
+  console/dosya yazımı ve biçimlendirme çağıran thread'i bekletmez
+- Mesajlar tembel biçimlendirilir: logger.debug("x=%s", x) kapalı
+  seviyede sadece seviye kontrolü kadar maliyetlidir (f-string kullanmayın)
+- Çağrı noktası (dosya:satır) başına hız sınırı: sıcak döngüdeki bir satır
+  log'u boğamaz; bastırılan mesaj sayısı bir sonraki kayda eklenir
+- Seviyeler modül başına ve çalışma anında değiştirilebilir:
+    LINUXSHORTS_LOG_LEVEL=DEBUG
+    LINUXSHORTS_LOG_LEVELS="Subtitle=DEBUG,FFmpeg=WARNING"
+    set_level("DEBUG", "Subtitle")
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+import time
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from functools import wraps
+from typing import Dict, List, Optional, Union
+
+ROOT_LOGGER = "LinuxShorts"
+
+LEVEL_ENV = "LINUXSHORTS_LOG_LEVEL"
+MODULE_LEVELS_ENV = "LINUXSHORTS_LOG_LEVELS"
+DEFAULT_LEVEL = logging.INFO
+
+# Çağrı noktası başına hız sınırı (token bucket): önce BURST kayıt,
+# sonra saniyede RATE kayıt. ERROR ve üstü hiç sınırlanmaz.
+RATE_LIMIT_PER_SECOND = 10.0
+RATE_LIMIT_BURST = 20
 
 
 class ColoredFormatter(logging.Formatter):
     """Renkli terminal log formatter"""
-    
+
     # ANSI renk kodları
     COLORS = {
         'DEBUG': '\033[36m',      # Cyan
@@ -23,74 +52,248 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',   # Magenta
     }
     RESET = '\033[0m'
-    
+
+    ICONS = {
+        'DEBUG': '🔍',
+        'INFO': '✓',
+        'WARNING': '⚠️',
+        'ERROR': '✗',
+        'CRITICAL': '💥'
+    }
+
     def format(self, record):
-        # Renk ekle
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        
-        # İkon ekle
-        icons = {
-            'DEBUG': '🔍',
-            'INFO': '✓',
-            'WARNING': '⚠️',
-            'ERROR': '✗',
-            'CRITICAL': '💥'
-        }
-        record.msg = f"{icons.get(record.levelname.strip(), '')} {record.msg}"
-        
+        # Aynı kayıt dosya handler'ına da gider: kopya üzerinde çalış
+        record = logging.makeLogRecord(record.__dict__)
+        levelname = record.levelname
+
+        # Renk ve ikon ekle
+        color = self.COLORS.get(levelname, self.RESET)
+        record.levelname = f"{color}{levelname}{self.RESET}"
+        message = record.getMessage()
+        # Mesaj zaten ikon/çizgiyle başlıyorsa ("✓ ...", "=====") ikinciyi ekleme
+        record.msg = f"{self.ICONS.get(levelname, '')} {message}" if message[:1].isalnum() else message
+        record.args = None
+
         return super().format(record)
 
 
-def setup_logger(name: str = "LinuxShorts", log_file: str = None, level=logging.DEBUG):
+# ========================================
+# HIZ SINIRI
+# ========================================
+
+class RateLimitFilter(logging.Filter):
+    """
+    Çağrı noktası (dosya:satır) başına token bucket
+
+    Kuyruğa girmeden önce, çağıran thread'de çalışır; bastırılan kayıtlar
+    biçimlendirilmez ve kuyruğa girmez.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST,
+                 exempt_level: int = logging.ERROR):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.exempt_level = exempt_level
+        # (dosya, satır) → [token, son zaman, bastırılan]
+        self._buckets: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self.total_suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = [self.burst - 1.0, now, 0]
+                return True
+            tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                bucket[2] += 1
+                self.total_suppressed += 1
+                return False
+            bucket[0] = tokens - 1.0
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} benzer mesaj bastırıldı)"
+        return True
+
+
+# ========================================
+# KUYRUK
+# ========================================
+
+class _AsyncQueueHandler(QueueHandler):
+    """
+    Kaydı biçimlendirmeden kuyruğa koyar
+
+    Varsayılan QueueHandler mesajı çağıran thread'de biçimlendirir (süreçler
+    arası kuyruk için); listener aynı süreçte olduğundan biçimlendirme
+    arka plan thread'ine bırakılır. Args bu arada değiştirilirse log
+    değiştirilmiş değeri gösterir.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_rate_filter: Optional[RateLimitFilter] = None
+_setup_lock = threading.Lock()
+
+
+def _stop_listener():
+    """Kuyrukta bekleyen kayıtları yaz ve arka plan thread'ini durdur"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_listener)
+
+
+def flush_logs():
+    """Kuyruktaki kayıtların yazılmasını bekle (listener açık kalır)"""
+    listener = _listener
+    if listener is None:
+        return
+    listener.stop()
+    listener.start()
+
+
+def setup_logger(name: str = ROOT_LOGGER, log_file: str = None, level=DEFAULT_LEVEL):
     """
     Logger'ı yapılandırır
-    
+
+    Logger'a tek bir kuyruk handler'ı takılır; console ve dosya handler'ları
+    arka plan listener thread'inde çalışır. Önceki listener durdurulur.
+
     Args:
         name: Logger adı
         log_file: Log dosyası yolu (None ise sadece console)
-        level: Log seviyesi
-        
+        level: Log seviyesi (alt modüller set_level ile ayrıca ayarlanabilir)
+
     Returns:
         Yapılandırılmış logger
     """
+    global _listener, _rate_filter
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+    logger.propagate = False
+
     # Mevcut handler'ları temizle
+    _stop_listener()
     logger.handlers = []
-    
-    # Console handler (renkli)
+
+    handlers: List[logging.Handler] = []
+
+    # Console handler (renkli); seviye logger'lardan gelir
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
     console_formatter = ColoredFormatter(
         '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+    handlers.append(console_handler)
+
     # File handler (detaylı)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(filename)s:%(lineno)d | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    queue_handler = _AsyncQueueHandler(queue.SimpleQueue())
+    _rate_filter = RateLimitFilter()
+    queue_handler.addFilter(_rate_filter)
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     return logger
 
 
+# ========================================
+# SEVİYELER
+# ========================================
+
+def _parse_level(value: Union[str, int, None]) -> Optional[int]:
+    """"DEBUG" / "debug" / 10 → logging seviyesi (geçersizse None)"""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else None
+
+
+def _full_name(name: str) -> str:
+    """"Subtitle" → "LinuxShorts.Subtitle" """
+    if name == ROOT_LOGGER or name.startswith(ROOT_LOGGER + "."):
+        return name
+    return f"{ROOT_LOGGER}.{name}"
+
+
+def set_level(level: Union[str, int], module: Optional[str] = None):
+    """
+    Log seviyesini çalışma anında değiştir
+
+    Args:
+        level: "DEBUG", "INFO"... veya logging sabiti
+        module: "Subtitle" / "LinuxShorts.Subtitle" (None ise tüm uygulama)
+
+    Raises:
+        ValueError: Bilinmeyen seviye
+    """
+    parsed = _parse_level(level)
+    if parsed is None:
+        raise ValueError(f"Bilinmeyen log seviyesi: {level}")
+    logging.getLogger(_full_name(module) if module else ROOT_LOGGER).setLevel(parsed)
+
+
+def reset_level(module: str):
+    """Modülün kendi seviyesini kaldır (üst logger'ın seviyesine döner)"""
+    logging.getLogger(_full_name(module)).setLevel(logging.NOTSET)
+
+
+def _apply_env_levels():
+    """LINUXSHORTS_LOG_LEVEL ve LINUXSHORTS_LOG_LEVELS ortam değişkenleri"""
+    level = _parse_level(os.environ.get(LEVEL_ENV))
+    if level is not None:
+        logging.getLogger(ROOT_LOGGER).setLevel(level)
+
+    for item in os.environ.get(MODULE_LEVELS_ENV, "").split(","):
+        module, _, value = item.partition("=")
+        level = _parse_level(value) if module.strip() else None
+        if level is not None:
+            logging.getLogger(_full_name(module.strip())).setLevel(level)
+
+
 def log_exception(logger):
     """
     Decorator: Fonksiyon hatalarını loglar
-    
+
     Usage:
         @log_exception(logger)
         def my_function():
@@ -102,8 +305,8 @@ def log_exception(logger):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Hata: {func.__name__}() içinde: {str(e)}")
-                logger.debug(f"Traceback:\n{traceback.format_exc()}")
+                logger.error("Hata: %s() içinde: %s", func.__name__, e)
+                logger.debug("Traceback:\n%s", traceback.format_exc())
                 raise
         return wrapper
     return decorator
@@ -112,7 +315,7 @@ def log_exception(logger):
 def log_function_call(logger, log_args=False):
     """
     Decorator: Fonksiyon çağrılarını loglar
-    
+
     Usage:
         @log_function_call(logger, log_args=True)
         def my_function(x, y):
@@ -122,16 +325,16 @@ def log_function_call(logger, log_args=False):
         @wraps(func)
         def wrapper(*args, **kwargs):
             if log_args:
-                logger.debug(f"Çağrılıyor: {func.__name__}(args={args}, kwargs={kwargs})")
+                logger.debug("Çağrılıyor: %s(args=%r, kwargs=%r)", func.__name__, args, kwargs)
             else:
-                logger.debug(f"Çağrılıyor: {func.__name__}()")
-            
+                logger.debug("Çağrılıyor: %s()", func.__name__)
+
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"Tamamlandı: {func.__name__}()")
+                logger.debug("Tamamlandı: %s()", func.__name__)
                 return result
             except Exception as e:
-                logger.error(f"Hata: {func.__name__}() - {str(e)}")
+                logger.error("Hata: %s() - %s", func.__name__, e)
                 raise
         return wrapper
     return decorator
@@ -139,16 +342,16 @@ def log_function_call(logger, log_args=False):
 
 class ExceptionLogger:
     """Global exception handler"""
-    
+
     def __init__(self, logger):
         self.logger = logger
-        
+
     def __call__(self, exc_type, exc_value, exc_traceback):
         """Yakalanmamış exception'ları logla"""
         if issubclass(exc_type, KeyboardInterrupt):
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
-        
+
         self.logger.critical("="*70)
         self.logger.critical("💥 YAKALANMAMIŞ İSTİSNA!")
         self.logger.critical("="*70)
@@ -156,57 +359,108 @@ class ExceptionLogger:
         self.logger.critical(f"Mesaj: {exc_value}")
         self.logger.critical("")
         self.logger.critical("Traceback:")
-        
+
         # Traceback'i satır satır logla
         tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
         for line in tb_lines:
             for subline in line.strip().split('\n'):
                 self.logger.critical(f"  {subline}")
-        
+
         self.logger.critical("="*70)
+        # Süreç birazdan kapanabilir: kuyruğu boşalt
+        flush_logs()
 
 
 # Global logger instance
 _global_logger = None
 
 
-def get_logger(name: str = "LinuxShorts") -> logging.Logger:
-    """Global logger'ı döndürür"""
+def get_logger(name: str = ROOT_LOGGER) -> logging.Logger:
+    """
+    Modül logger'ını döndürür
+
+    İlk çağrıda kök "LinuxShorts" logger'ı (kuyruk, console, dosya)
+    kurulur; "LinuxShorts.Subtitle" gibi adlar onun altına bağlanır ve
+    seviyeleri ayrı ayrı ayarlanabilir.
+    """
     global _global_logger
-    
+
     if _global_logger is None:
-        # Log dizini
-        log_dir = Path.home() / ".linuxshorts" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Log dosyası adı (timestamp ile)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = log_dir / f"linuxshorts_{timestamp}.log"
-        
-        # Logger'ı kur
-        _global_logger = setup_logger(name, str(log_file))
-        
-        # Global exception handler'ı kur
-        sys.excepthook = ExceptionLogger(_global_logger)
-        
-        _global_logger.info(f"Logger başlatıldı. Log dosyası: {log_file}")
-    
-    return _global_logger
+        with _setup_lock:
+            if _global_logger is None:
+                # Log dizini
+                log_dir = Path.home() / ".linuxshorts" / "logs"
+                log_dir.mkdir(parents=True, exist_ok=True)
+
+                # Log dosyası adı (timestamp ile)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                log_file = log_dir / f"linuxshorts_{timestamp}.log"
+
+                # Logger'ı kur
+                root = setup_logger(ROOT_LOGGER, str(log_file))
+                _apply_env_levels()
+
+                # Global exception handler'ı kur
+                sys.excepthook = ExceptionLogger(root)
+
+                root.info("Logger başlatıldı. Log dosyası: %s (seviye %s)",
+                          log_file, logging.getLevelName(root.level))
+                _global_logger = root
+
+    return logging.getLogger(_full_name(name))
+
+
+def _benchmark(iterations: int = 1_000_000):
+    """Kapalı DEBUG'ın sıcak döngü maliyeti ve hız sınırı"""
+    logger = get_logger("LinuxShorts.Benchmark")
+    set_level("INFO", "Benchmark")
+    text, result = "Bu çok uzun bir altyazı cümlesidir", "Bu çok uzun\nbir altyazı cümlesidir"
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pass
+    baseline_ns = (time.perf_counter() - start) / iterations * 1e9
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        logger.debug("wrap_text: '%s' → '%s'", text, result)
+    lazy_ns = (time.perf_counter() - start) / iterations * 1e9 - baseline_ns
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        logger.debug(f"wrap_text: '{text}' → '{result}'")
+    fstring_ns = (time.perf_counter() - start) / iterations * 1e9 - baseline_ns
+
+    print(f"Kapalı DEBUG (çağrı başına): tembel {lazy_ns:.0f} ns, f-string {fstring_ns:.0f} ns")
+
+    # Açık seviye: tek çağrı noktasından yoğun log, çoğu kuyruğa girmeden bastırılır
+    set_level("DEBUG", "Benchmark")
+    count = iterations // 20
+    start = time.perf_counter()
+    for i in range(count):
+        logger.debug("Sıcak döngü %d", i)
+    enabled_us = (time.perf_counter() - start) / count * 1e6
+    flush_logs()
+    print(f"Açık DEBUG (çağrı başına): {enabled_us:.2f} µs, "
+          f"{_rate_filter.total_suppressed} / {count} kayıt bastırıldı")
+    reset_level("Benchmark")
 
 
 # Test kodu
 if __name__ == "__main__":
     logger = get_logger()
-    
+
     logger.debug("Bu bir debug mesajı")
     logger.info("Bu bir info mesajı")
     logger.warning("Bu bir warning mesajı")
     logger.error("Bu bir error mesajı")
-    
+
     # Exception test
     try:
         x = 1 / 0
     except Exception as e:
         logger.exception("Bir hata oluştu!")
-    
+
+    _benchmark()
+
     print("\n✅ Logger test başarılı!")
@@ -0,0 +1,126 @@
+"""
+LinuxShorts Generator - Servis Kayıt Defteri
+Ağır alt sistemleri (cv2, numpy, whisper...) ilk kullanımda yükler
+
+- register() sadece fabrika fonksiyonunu kaydeder; içe aktarma ve
+  nesne oluşturma get() ile ilk erişimde yapılır
+- Yüklenemeyen servis None döner, hata bir kez loglanır
+- preload() servisleri arka plan thread'inde hazırlar (ör. sayfa açılınca),
+  böylece ilk tıklamada bekleme olmaz
+- Aynı servis iki thread'den istenirse bir kez oluşturulur; ikinci çağıran
+  ilkini bekler
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .logger import get_logger
+
+logger = get_logger("LinuxShorts.Services")
+
+
+class _Service:
+    __slots__ = ("label", "factory", "lock", "instance", "error", "loaded", "seconds")
+
+    def __init__(self, label: str, factory: Callable[[], Any]):
+        self.label = label
+        self.factory = factory
+        self.lock = threading.Lock()
+        self.instance = None
+        self.error: Optional[str] = None
+        self.loaded = False
+        self.seconds = 0.0
+
+
+class ServiceRegistry:
+    """Ad → tembel oluşturulan servis"""
+
+    def __init__(self):
+        self._services: Dict[str, _Service] = {}
+
+    def register(self, name: str, factory: Callable[[], Any], label: Optional[str] = None):
+        """
+        Servis fabrikasını kaydet (hiçbir şey yüklenmez)
+
+        Args:
+            name: Servis adı ("ffmpeg", "subtitle"...)
+            factory: İçe aktarmayı da içeren, servisi döndüren fonksiyon
+            label: Log mesajlarındaki ad
+        """
+        self._services[name] = _Service(label or name, factory)
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Servisi döndür (gerekirse şimdi yükle)
+
+        Returns:
+            Servis nesnesi; yüklenemediyse None
+
+        Raises:
+            KeyError: Kayıtlı olmayan servis
+        """
+        service = self._services[name]
+        if service.loaded:
+            return service.instance
+
+        with service.lock:
+            if not service.loaded:
+                start = time.perf_counter()
+                try:
+                    service.instance = service.factory()
+                    logger.info("%s modülü yüklendi (%.0f ms)", service.label,
+                                (time.perf_counter() - start) * 1000)
+                except Exception as e:
+                    service.error = str(e)
+                    logger.warning("%s modülü yüklenemedi: %s", service.label, e)
+                service.seconds = time.perf_counter() - start
+                service.loaded = True
+        return service.instance
+
+    def is_loaded(self, name: str) -> bool:
+        return self._services[name].loaded
+
+    def error(self, name: str) -> Optional[str]:
+        """Yükleme hatası (yüklenmediyse veya başarılıysa None)"""
+        return self._services[name].error
+
+    def preload(self, names: Iterable[str], callback: Optional[Callable[[], None]] = None):
+        """
+        Henüz yüklenmemiş servisleri arka planda yükle
+
+        Args:
+            names: Servis adları
+            callback: Hepsi yüklenince (arka plan thread'inde) çağrılır
+        """
+        pending = [name for name in names if not self._services[name].loaded]
+        if not pending:
+            if callback:
+                callback()
+            return
+
+        def worker():
+            for name in pending:
+                self.get(name)
+            if callback:
+                callback()
+
+        threading.Thread(target=worker, name="service-preload", daemon=True).start()
+
+    def load_times(self) -> Dict[str, float]:
+        """Yüklenmiş servislerin yükleme süreleri (sn)"""
+        return {name: s.seconds for name, s in self._services.items() if s.loaded}
+
+
+# Test kodu
+if __name__ == "__main__":
+    registry = ServiceRegistry()
+    registry.register("slow", lambda: time.sleep(0.2) or "hazır", "Yavaş")
+    registry.register("broken", lambda: 1 / 0, "Bozuk")
+
+    done = threading.Event()
+    registry.preload(["slow"], done.set)
+    print("slow (ana thread, preload'u bekler):", registry.get("slow"))
+    done.wait(1)
+    print("broken:", registry.get("broken"), registry.error("broken"))
+    print("Süreler:", registry.load_times())
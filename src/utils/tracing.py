@@ -0,0 +1,281 @@
+"""
+LinuxShorts Generator - Tracing
+Sıcak yollar için hafif span/trace API'si
+
+- Kapalıyken span() paylaşılan boş bir context manager döndürür
+  (maliyeti tek fonksiyon çağrısı + boş nullcontext kadar)
+- Açmak için: LINUXSHORTS_TRACE=1 ortam değişkeni veya enable_tracing()
+- Her iş (analiz, export, altyazı...) trace_job() ile kendi Trace'ini açar;
+  iş süresince bu thread'de (ve copy_context ile gönderilen görevlerde)
+  açılan span'ler o Trace'e yazılır
+- İş bitince:
+    ~/.linuxshorts/traces/<zaman>_<iş>.json  (chrome://tracing / Perfetto)
+    aşama özeti log'a (decode, score, composite, encode, subprocess...)
+"""
+
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import DATA_DIR
+
+TRACE_ENV = "LINUXSHORTS_TRACE"
+
+_enabled = os.environ.get(TRACE_ENV, "").lower() in ("1", "true", "yes", "on")
+_current: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("linuxshorts_trace", default=None)
+
+
+def tracing_enabled() -> bool:
+    return _enabled
+
+
+def enable_tracing(enabled: bool = True):
+    """Tracing'i çalışma anında aç/kapat (yeni işlerden itibaren geçerli)"""
+    global _enabled
+    _enabled = enabled
+
+
+# (ad, kategori, başlangıç ns, süre ns, thread id, args)
+Event = Tuple[str, str, int, int, int, Optional[dict]]
+
+
+class Trace:
+    """Bir işin span kayıtları"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start_ns = time.perf_counter_ns()
+        self.wall_start = datetime.now()
+        self.end_ns: Optional[int] = None
+        self.events: List[Event] = []
+        self.thread_names: Dict[int, str] = {}
+
+    def add(self, name: str, cat: str, start_ns: int, duration_ns: int, args: Optional[dict]):
+        tid = threading.get_native_id()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        # list.append GIL altında atomik; kilit gerekmez
+        self.events.append((name, cat, start_ns, duration_ns, tid, args))
+
+    @property
+    def duration(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aşama başına {count, total_ms, mean_ms, max_ms, share}
+
+        Süreler kapsayıcıdır (iç içe span'ler üst aşamada da sayılır);
+        share, işin duvar saati süresine oranıdır. Thread havuzunda paralel
+        çalışan aşamalarda toplam duvar saatini aşabilir.
+        """
+        stages: Dict[str, List[int]] = {}
+        for name, _, _, duration, _, _ in self.events:
+            stages.setdefault(name, []).append(duration)
+        wall_ms = self.duration * 1000
+        result = {}
+        for name, durations in stages.items():
+            total_ms = sum(durations) / 1e6
+            result[name] = {
+                "count": len(durations),
+                "total_ms": total_ms,
+                "mean_ms": total_ms / len(durations),
+                "max_ms": max(durations) / 1e6,
+                "share": total_ms / wall_ms if wall_ms else 0.0,
+            }
+        return dict(sorted(result.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+    def format_summary(self) -> str:
+        lines = [f"Trace: {self.name} ({self.duration:.2f} sn, {len(self.events)} span)"]
+        for name, stage in self.summary().items():
+            lines.append(f"  {name:<22} {stage['total_ms']:10.1f} ms  {stage['count']:6d}x  "
+                         f"ort {stage['mean_ms']:8.2f} ms  maks {stage['max_ms']:8.1f} ms  "
+                         f"%{stage['share'] * 100:5.1f}")
+        return "\n".join(lines)
+
+    def to_chrome(self) -> dict:
+        """Chrome trace event formatı ("X" tam olaylar, µs)"""
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        for name, cat, start, duration, tid, args in self.events:
+            event = {
+                "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                "ts": (start - self.start_ns) / 1000, "dur": duration / 1000,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"job": self.name, "started": self.wall_start.isoformat(timespec="seconds"),
+                          "summary": self.summary()},
+        }
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Chrome trace JSON'u yaz (varsayılan ~/.linuxshorts/traces)"""
+        if path is None:
+            slug = re.sub(r"[^\w.-]+", "_", self.name).strip("_")[:60] or "job"
+            path = DATA_DIR / "traces" / f"{self.wall_start:%Y%m%d_%H%M%S}_{slug}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome(), ensure_ascii=False))
+        return path
+
+
+class Span:
+    """Açık span (with bloğu); set() ile sonradan argüman eklenebilir"""
+
+    __slots__ = ("trace", "name", "cat", "args", "start_ns")
+
+    def __init__(self, trace: Trace, name: str, cat: str, args: Optional[dict]):
+        self.trace = trace
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def set(self, **args):
+        if self.args is None:
+            self.args = {}
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.set(error=exc_type.__name__)
+        self.trace.add(self.name, self.cat, self.start_ns, end - self.start_ns, self.args)
+        return False
+
+
+class _NullSpan:
+    """Kapalı tracing: hiçbir şey yapmayan, paylaşılan span"""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, cat: str = "stage", **args):
+    """
+    Aşama süresi ölç
+
+    Kullanım:
+        with span("decode"):
+            ret, frame = cap.read()
+
+    Tracing kapalıysa veya aktif iş yoksa hiçbir şey kaydetmez.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    trace = _current.get()
+    if trace is None:
+        return _NULL_SPAN
+    return Span(trace, name, cat, args or None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get() if _enabled else None
+
+
+@contextmanager
+def trace_job(name: str, logger=None, save: bool = True) -> Iterator[Optional[Trace]]:
+    """
+    İş boyunca Trace topla; bitince JSON'a yaz ve özeti logla
+
+    Tracing kapalıysa None verir ve hiçbir şey yapmaz. İç içe çağrılırsa
+    (ör. export içinde analiz) mevcut Trace kullanılır.
+    """
+    if not _enabled or _current.get() is not None:
+        yield _current.get() if _enabled else None
+        return
+
+    trace = Trace(name)
+    token = _current.set(trace)
+    try:
+        with Span(trace, name, "job", None):
+            yield trace
+    finally:
+        _current.reset(token)
+        trace.end_ns = time.perf_counter_ns()
+        if save:
+            try:
+                path = trace.save()
+            except OSError as e:
+                path = None
+                if logger is not None:
+                    logger.warning(f"Trace yazılamadı: {e}")
+            if logger is not None:
+                logger.info(trace.format_summary() + (f"\n  → {path}" if path else ""))
+
+
+def traced(name: str, fn: Callable[[], None], logger=None) -> Callable[[], None]:
+    """
+    Worker fonksiyonunu trace_job içinde çalıştıran sarmalayıcı
+
+    Kullanım:
+        threading.Thread(target=traced(f"export: {name}", worker, logger)).start()
+    """
+    def run():
+        with trace_job(name, logger):
+            fn()
+    return run
+
+
+def _benchmark(iterations: int = 1_000_000):
+    """Kapalı / açık span maliyeti (boş nullcontext ile karşılaştırmalı)"""
+    from contextlib import nullcontext
+
+    empty = nullcontext()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with empty:
+            pass
+    baseline_ns = (time.perf_counter() - start) / iterations * 1e9
+
+    enable_tracing(False)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with span("decode"):
+            pass
+    disabled_ns = (time.perf_counter() - start) / iterations * 1e9
+
+    enable_tracing(True)
+    with trace_job("benchmark", save=False) as trace:
+        start = time.perf_counter()
+        for _ in range(iterations // 10):
+            with span("decode"):
+                pass
+        enabled_ns = (time.perf_counter() - start) / (iterations // 10) * 1e9
+    print(f"Span maliyeti: nullcontext {baseline_ns:.0f} ns, kapalı {disabled_ns:.0f} ns, "
+          f"açık {enabled_ns:.0f} ns "
+          f"({len(trace.events)} olay)")
+    print(trace.format_summary())
+
+
+# Test kodu
+if __name__ == "__main__":
+    _benchmark()